@@ -0,0 +1,115 @@
+"""In-memory index over the files of a bash events directory.
+
+Bash events are stored one per file, named
+`<timestamp>_<kind>[_<command_id>]_<event_id>`, and listed in file name order.
+The index keeps the file names sorted globally, per kind and per command, plus
+a map from event id to file name. Lookups, filtering and resuming a page are
+then dictionary lookups and bisections, and the directory is only scanned once.
+"""
+
+import os
+from bisect import bisect_left, bisect_right, insort
+from pathlib import Path
+
+
+class BashEventIndex:
+    """Index of bash event file names.
+
+    File names sort in timestamp order, and double as the cursors used to
+    resume a search, so a page may start at a file name that has since been
+    deleted.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self._names: list[str] = []
+        self._name_by_id: dict[str, str] = {}
+        self._names_by_kind: dict[str, list[str]] = {}
+        self._names_by_command: dict[str, list[str]] = {}
+
+    @classmethod
+    def scan(cls, directory: Path) -> "BashEventIndex":
+        """Build an index of the event files in `directory`."""
+        index = cls()
+        if directory.is_dir():
+            with os.scandir(directory) as entries:
+                names = sorted(entry.name for entry in entries if entry.is_file())
+            for name in names:
+                index.add(name)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str) -> None:
+        """Index the event file `name`. Names not in the event format are
+        ignored."""
+        parts = name.split("_")
+        if len(parts) not in (3, 4):
+            return
+        kind, event_id = parts[1], parts[-1]
+        if event_id in self._name_by_id:
+            return
+        self._name_by_id[event_id] = name
+        # Events are written in (almost) timestamp order, so insort is cheap
+        insort(self._names, name)
+        insort(self._names_by_kind.setdefault(kind, []), name)
+        if len(parts) == 4:
+            insort(self._names_by_command.setdefault(parts[2], []), name)
+
+    def get(self, event_id: str) -> str | None:
+        """Return the file name of the event with the (hex) id given."""
+        return self._name_by_id.get(event_id)
+
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    def search(
+        self,
+        kind: str | None = None,
+        command_id: str | None = None,
+        timestamp_gte: str | None = None,
+        timestamp_lt: str | None = None,
+        page_id: str | None = None,
+        limit: int = 100,
+        descending: bool = False,
+    ) -> tuple[list[str], str | None]:
+        """Return the file names of one page of matching events, and the
+        page_id of the next page (None if this is the last page).
+
+        `page_id` is the file name of the first event of the page (inclusive).
+        Timestamps are compared against the timestamp prefix of file names.
+        """
+        names = self._names_for(kind, command_id)
+        lo = bisect_left(names, timestamp_gte) if timestamp_gte else 0
+        hi = bisect_left(names, timestamp_lt) if timestamp_lt else len(names)
+        hi = max(lo, hi)
+
+        if descending:
+            end = hi
+            if page_id:
+                end = max(lo, min(hi, bisect_right(names, page_id)))
+            page = names[max(lo, end - limit) : end][::-1]
+            next_index = end - len(page) - 1
+            next_page_id = names[next_index] if next_index >= lo else None
+        else:
+            begin = lo
+            if page_id:
+                begin = min(hi, max(lo, bisect_left(names, page_id)))
+            page = names[begin : min(hi, begin + limit)]
+            next_index = begin + len(page)
+            next_page_id = names[next_index] if next_index < hi else None
+        return page, next_page_id
+
+    def _names_for(self, kind: str | None, command_id: str | None) -> list[str]:
+        if command_id is None:
+            if kind is None:
+                return self._names
+            return self._names_by_kind.get(kind, [])
+        # Only outputs carry a command id
+        names = self._names_by_command.get(command_id, [])
+        if kind is not None:
+            names = [name for name in names if name.split("_")[1] == kind]
+        return names
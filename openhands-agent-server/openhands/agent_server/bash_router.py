@@ -11,6 +11,7 @@ from fastapi import (
     Query,
     status,
 )
+from fastapi.responses import FileResponse, StreamingResponse
 
 from openhands.agent_server.bash_service import get_default_bash_event_service
 from openhands.agent_server.models import (
@@ -81,6 +82,25 @@ async def batch_get_bash_events(
     return events
 
 
+@bash_router.get(
+    "/output_blobs/{name}",
+    response_class=FileResponse,
+    responses={
+        200: {
+            "description": "The gzip compressed output",
+            "content": {"application/gzip": {}},
+        },
+        404: {"description": "Item not found"},
+    },
+)
+async def get_output_blob(name: str) -> FileResponse:
+    """Get output of a bash command which was too large to include in its events"""
+    path = bash_event_service.get_output_blob_path(name)
+    if path is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND)
+    return FileResponse(path, media_type="application/gzip", filename=name)
+
+
 @bash_router.post("/start_bash_command")
 async def start_bash_command(request: ExecuteBashRequest) -> BashCommand:
     """Execute a bash command in the background"""
@@ -98,6 +118,27 @@ async def execute_bash_command(request: ExecuteBashRequest) -> BashOutput:
     return result
 
 
+@bash_router.post(
+    "/stream_bash_command",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "The BashCommand followed by BashOutputChunk items as "
+            "newline delimited JSON",
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+)
+async def stream_bash_command(request: ExecuteBashRequest) -> StreamingResponse:
+    """Execute a bash command, streaming its output as it is produced"""
+
+    async def stream_lines():
+        async for item in bash_event_service.stream_bash_command(request):
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(stream_lines(), media_type="application/x-ndjson")
+
+
 @bash_router.delete("/bash_events")
 async def clear_all_bash_events() -> dict[str, int]:
     """Clear all bash events from storage"""
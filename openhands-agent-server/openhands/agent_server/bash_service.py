@@ -1,25 +1,105 @@
 import asyncio
-import glob
-import json
+import codecs
+import gzip
+import re
+import shutil
+import threading
+import time
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
 
+from openhands.agent_server.bash_event_index import BashEventIndex
 from openhands.agent_server.models import (
     BashCommand,
     BashEventBase,
     BashEventPage,
     BashEventSortOrder,
     BashOutput,
+    BashOutputChunk,
     ExecuteBashRequest,
 )
-from openhands.agent_server.pub_sub import PubSub, Subscriber
+from openhands.agent_server.pub_sub import OverflowPolicy, PubSub, Subscriber
 from openhands.sdk.logger import get_logger
 
 
 logger = get_logger(__name__)
+# Max size in bytes of the output of a stream in a single BashOutput event
 MAX_CONTENT_CHAR_LENGTH = 1024 * 1024
+# Output is also flushed to an event when it has been pending this long (seconds)
+OUTPUT_FLUSH_INTERVAL = 1.0
+# Past this many bytes, the rest of a stream is spilled to a compressed blob
+MAX_INLINE_OUTPUT_LENGTH = 16 * MAX_CONTENT_CHAR_LENGTH
+OUTPUT_BLOBS_DIR = "output_blobs"
+# Max number of output chunks (of up to _READ_SIZE bytes) held for a streaming
+# client; past it, reading the output of the command waits for the client
+MAX_LIVE_OUTPUT_CHUNKS = 16
+_OUTPUT_BLOB_NAME = re.compile(r"[0-9a-f]{32}_(stdout|stderr)\.gz")
+_READ_SIZE = 64 * 1024
+
+
+@dataclass
+class _StreamOutput:
+    """Pending output of one stream of a running command.
+
+    Output is kept as bytes until it is flushed, and decoded incrementally so
+    that characters split across reads or chunks are not mangled. Once more
+    than MAX_INLINE_OUTPUT_LENGTH bytes were flushed to events, the rest of the
+    stream is appended to a gzip compressed blob instead.
+    """
+
+    blob_path: Path
+    buffer: bytearray = field(default_factory=bytearray)
+    inline_length: int = 0
+    blob: gzip.GzipFile | None = None
+    pending_since: float | None = None
+    # Spilling runs in worker threads, which may outlive a cancelled reader
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _decoder: codecs.IncrementalDecoder = field(
+        default_factory=lambda: codecs.getincrementaldecoder("utf-8")("replace")
+    )
+
+    def append(self, data: bytes) -> None:
+        if not self.buffer:
+            self.pending_since = time.monotonic()
+        self.buffer += data
+
+    def flush_timeout(self) -> float | None:
+        """Seconds until the pending output is due to be flushed."""
+        if not self.buffer or self.pending_since is None:
+            return None
+        return max(0.0, self.pending_since + OUTPUT_FLUSH_INTERVAL - time.monotonic())
+
+    def take_text(self, final: bool = False) -> str:
+        """Remove up to MAX_CONTENT_CHAR_LENGTH bytes from the buffer and decode
+        them."""
+        size = min(len(self.buffer), MAX_CONTENT_CHAR_LENGTH)
+        with memoryview(self.buffer) as view:
+            text = self._decoder.decode(view[:size], final=final)
+        del self.buffer[:size]
+        self.inline_length += size
+        self.pending_since = time.monotonic() if self.buffer else None
+        return text
+
+    def spill(self) -> None:
+        """Move the buffered output to the blob. Blocking."""
+        with self._lock:
+            if self.blob is None:
+                self.blob_path.parent.mkdir(parents=True, exist_ok=True)
+                self.blob = gzip.GzipFile(self.blob_path, "wb")
+            if not self.blob.closed:
+                self.blob.write(self.buffer)
+            self.buffer.clear()
+            self.pending_since = None
+
+    def close(self) -> None:
+        """Spill any remaining output and close the blob. Blocking."""
+        self.spill()
+        with self._lock:
+            assert self.blob is not None
+            self.blob.close()
 
 
 @dataclass
@@ -31,6 +111,12 @@ class BashEventService:
     _pub_sub: PubSub[BashEventBase] = field(
         default_factory=lambda: PubSub[BashEventBase](), init=False
     )
+    _live_outputs: dict[UUID, asyncio.Queue[BashOutputChunk]] = field(
+        default_factory=dict, init=False
+    )
+
+    _index: BashEventIndex | None = field(default=None, init=False)
+    _index_lock: threading.Lock = field(default_factory=threading.Lock, init=False)
 
     def _ensure_bash_events_dir(self) -> None:
         """Ensure the bash events directory exists."""
@@ -49,16 +135,14 @@ class BashEventService:
         result.append(event.id.hex)
         return "_".join(result)
 
-    def _save_event_to_file(self, event: BashEventBase) -> None:
-        """Save an event to a file."""
+    def _save_event_to_file(self, event: BashEventBase) -> str:
+        """Save an event to a file, returning the file name."""
         self._ensure_bash_events_dir()
         filename = self._get_event_filename(event)
         filepath = self.bash_events_dir / filename
 
-        with open(filepath, "w") as f:
-            # Use model_dump with mode='json' to handle UUID serialization
-            data = event.model_dump(mode="json")
-            f.write(json.dumps(data, indent=2))
+        filepath.write_text(event.model_dump_json())
+        return filename
 
     def _load_event_from_file(self, filepath: Path) -> BashEventBase | None:
         """Load an event from a file."""
@@ -69,23 +153,48 @@ class BashEventService:
             logger.error(f"Error loading event from {filepath}: {e}")
             return None
 
-    def _get_event_files_by_pattern(self, pattern: str) -> list[Path]:
-        """Get event files matching a glob pattern, sorted by timestamp."""
-        self._ensure_bash_events_dir()
-        files = glob.glob(str(self.bash_events_dir / pattern))
-        return sorted([Path(f) for f in files])
+    def _load_index(self) -> BashEventIndex:
+        """Return the index of the bash events directory, scanning it the first
+        time. Blocking; call from a worker thread."""
+        with self._index_lock:
+            if self._index is None:
+                self._index = BashEventIndex.scan(self.bash_events_dir)
+                logger.debug(f"Indexed {len(self._index)} bash events")
+            return self._index
+
+    async def _get_index(self) -> BashEventIndex:
+        index = self._index
+        if index is None:
+            index = await asyncio.to_thread(self._load_index)
+        return index
+
+    async def _save_event(self, event: BashEventBase) -> None:
+        """Persist and index an event, without blocking the event loop."""
+        index = await self._get_index()
+        filename = await asyncio.to_thread(self._save_event_to_file, event)
+        index.add(filename)
+
+    def _load_events(self, filenames: list[str]) -> list[BashEventBase]:
+        events = []
+        for filename in filenames:
+            event = self._load_event_from_file(self.bash_events_dir / filename)
+            if event is not None:
+                events.append(event)
+        return events
 
     async def get_bash_event(self, event_id: str) -> BashEventBase | None:
         """Get the event with the id given, or None if there was no such event."""
-        # Use glob pattern to find files ending with the event_id
-        pattern = f"*_{event_id}"
-        files = self._get_event_files_by_pattern(pattern)
-
-        if not files:
+        try:
+            event_id = UUID(event_id).hex
+        except ValueError:
+            pass
+        index = await self._get_index()
+        filename = index.get(event_id)
+        if filename is None:
             return None
-
-        # Load and return the first matching event
-        return self._load_event_from_file(files[0])
+        return await asyncio.to_thread(
+            self._load_event_from_file, self.bash_events_dir / filename
+        )
 
     async def batch_get_bash_events(
         self, event_ids: list[str]
@@ -108,67 +217,27 @@ class BashEventService:
         limit: int = 100,
     ) -> BashEventPage:
         """Search for events. If an command_id is given, only the observations for the
-        action are returned."""
-
-        # Build the search pattern based on filename format:
-        # - BashCommand: <timestamp>_<kind>_<event_id>
-        # - BashOutput: <timestamp>_<kind>_<command_id>_<event_id>
-        search_parts = ["*"]  # Start with wildcard for timestamp
-
-        if kind__eq:
-            search_parts.append(kind__eq)
-        else:
-            search_parts.append("*")  # Wildcard for kind if not specified
-
-        if command_id__eq:
-            search_parts.append(command_id__eq.hex)
-
-        # Always end with wildcard for event_id
-        search_parts.append("*")
-
-        search_pattern = "_".join(search_parts)
-        files = self._get_event_files_by_pattern(search_pattern)
-        files.sort(
-            key=lambda f: f.name,
-            reverse=(sort_order == BashEventSortOrder.TIMESTAMP_DESC),
+        action are returned.
+
+        Pages are resumed from `page_id`, the file name of the first event of the
+        page, as returned in `next_page_id`."""
+        index = await self._get_index()
+        page_files, next_page_id = index.search(
+            kind=kind__eq,
+            command_id=command_id__eq.hex if command_id__eq else None,
+            timestamp_gte=(
+                self._timestamp_to_str(timestamp__gte) if timestamp__gte else None
+            ),
+            timestamp_lt=(
+                self._timestamp_to_str(timestamp__lt) if timestamp__lt else None
+            ),
+            page_id=page_id,
+            limit=limit,
+            descending=sort_order == BashEventSortOrder.TIMESTAMP_DESC,
         )
 
-        # Timestamp filtering.
-        if timestamp__gte:
-            timestamp_gte_str = self._timestamp_to_str(timestamp__gte)
-            files = [file for file in files if file.name >= timestamp_gte_str]
-        if timestamp__lt:
-            timestamp_lt_str = self._timestamp_to_str(timestamp__lt)
-            files = [file for file in files if file.name < timestamp_lt_str]
-
-        # Handle pagination
-        page_files = []
-        start_index = 0
-
-        # Find the starting point if page_id is provided
-        if page_id:
-            for i, file in enumerate(files):
-                if str(file.name) == page_id:
-                    start_index = i
-                    break
-
-        # Collect items for this page
-        next_page_id = None
-        for i in range(start_index, len(files)):
-            if len(page_files) >= limit:
-                # We have collected enough items for this page
-                # Set next_page_id to the current file for next page
-                next_page_id = str(files[i].name)
-                break
-            page_files.append(files[i])
-
         # Load only the page files (not all files)
-        page_events = []
-        for file_path in page_files:
-            event = self._load_event_from_file(file_path)
-            if event is not None:
-                page_events.append(event)
-
+        page_events = await asyncio.to_thread(self._load_events, page_files)
         return BashEventPage(items=page_events, next_page_id=next_page_id)
 
     async def start_bash_command(
@@ -176,7 +245,7 @@ class BashEventService:
     ) -> tuple[BashCommand, asyncio.Task]:
         """Execute a bash command. The output will be published separately."""
         command = BashCommand(**request.model_dump())
-        self._save_event_to_file(command)
+        await self._save_event(command)
         await self._pub_sub(command)
 
         # Execute the bash command in a background task
@@ -184,6 +253,39 @@ class BashEventService:
 
         return command, task
 
+    async def stream_bash_command(
+        self, request: ExecuteBashRequest
+    ) -> AsyncGenerator[BashCommand | BashOutputChunk, None]:
+        """Execute a bash command, yielding the command followed by its output as
+        it is produced. The last chunk yielded carries the exit code. Events are
+        still persisted and published as for start_bash_command."""
+        command = BashCommand(**request.model_dump())
+        queue: asyncio.Queue[BashOutputChunk] = asyncio.Queue(MAX_LIVE_OUTPUT_CHUNKS)
+        self._live_outputs[command.id] = queue
+        try:
+            await self._save_event(command)
+            await self._pub_sub(command)
+            task = asyncio.create_task(self._execute_bash_command(command))
+            yield command
+            while True:
+                chunk = await queue.get()
+                yield chunk
+                if chunk.exit_code is not None:
+                    break
+            await task
+        finally:
+            self._live_outputs.pop(command.id, None)
+            # Release the readers waiting for room if the client went away
+            while not queue.empty():
+                queue.get_nowait()
+
+    async def _send_live_output(self, chunk: BashOutputChunk) -> None:
+        """Hand a chunk to the stream following its command, if any, waiting
+        for the client to catch up if too many chunks are pending."""
+        queue = self._live_outputs.get(chunk.command_id)
+        if queue is not None:
+            await queue.put(chunk)
+
     async def _execute_bash_command(self, command: BashCommand) -> None:
         """Execute the bash event and create an observation event."""
         try:
@@ -196,55 +298,66 @@ class BashEventService:
                 shell=True,
             )
 
-            # Track output order and buffers
+            # Track output order, shared by both streams
             output_order = 0
-            stdout_buffer = ""
-            stderr_buffer = ""
+            blobs_dir = self.bash_events_dir / OUTPUT_BLOBS_DIR
+            stdout = _StreamOutput(blobs_dir / f"{command.id.hex}_stdout.gz")
+            stderr = _StreamOutput(blobs_dir / f"{command.id.hex}_stderr.gz")
+
+            async def flush(output: _StreamOutput, is_stderr: bool) -> None:
+                nonlocal output_order
+                if output.blob is not None:
+                    await asyncio.to_thread(output.spill)
+                    return
+                text = output.take_text()
+                output_event = BashOutput(
+                    command_id=command.id,
+                    order=output_order,
+                    stdout=text if not is_stderr else None,
+                    stderr=text if is_stderr else None,
+                )
+                output_order += 1
+                await self._save_event(output_event)
+                await self._pub_sub(output_event)
+                if output.inline_length >= MAX_INLINE_OUTPUT_LENGTH:
+                    # Any further output goes to the blob
+                    await asyncio.to_thread(output.spill)
+
+            async def send_live_output(text: str, is_stderr: bool) -> None:
+                if text:
+                    await self._send_live_output(
+                        BashOutputChunk(
+                            command_id=command.id,
+                            stdout=text if not is_stderr else None,
+                            stderr=text if is_stderr else None,
+                        )
+                    )
 
             async def read_stream(stream, is_stderr=False):
-                nonlocal output_order, stdout_buffer, stderr_buffer
-
-                buffer = stderr_buffer if is_stderr else stdout_buffer
-
+                output = stderr if is_stderr else stdout
+                # Characters may be split across reads
+                live_decoder = codecs.getincrementaldecoder("utf-8")("replace")
                 while True:
                     try:
-                        # Read data from stream
-                        data = await stream.read(8192)  # Read in chunks
+                        try:
+                            data = await asyncio.wait_for(
+                                stream.read(_READ_SIZE), output.flush_timeout()
+                            )
+                        except TimeoutError:
+                            # Output has been pending for a while; publish it
+                            await flush(output, is_stderr)
+                            continue
                         if not data:
-                            break
-
-                        text = data.decode("utf-8", errors="replace")
-                        buffer += text
-
-                        # Update the appropriate buffer
-                        if is_stderr:
-                            stderr_buffer = buffer
-                        else:
-                            stdout_buffer = buffer
-
-                        # Check if we need to split the output
-                        while len(buffer) > MAX_CONTENT_CHAR_LENGTH:
-                            # Split at the max length
-                            chunk = buffer[:MAX_CONTENT_CHAR_LENGTH]
-                            buffer = buffer[MAX_CONTENT_CHAR_LENGTH:]
-
-                            # Create and publish BashOutput event
-                            output_event = BashOutput(
-                                command_id=command.id,
-                                order=output_order,
-                                stdout=chunk if not is_stderr else None,
-                                stderr=chunk if is_stderr else None,
+                            await send_live_output(
+                                live_decoder.decode(b"", final=True), is_stderr
                             )
+                            break
 
-                            self._save_event_to_file(output_event)
-                            await self._pub_sub(output_event)
-                            output_order += 1
+                        output.append(data)
+                        await send_live_output(live_decoder.decode(data), is_stderr)
 
-                            # Update the appropriate buffer
-                            if is_stderr:
-                                stderr_buffer = buffer
-                            else:
-                                stdout_buffer = buffer
+                        while len(output.buffer) >= MAX_CONTENT_CHAR_LENGTH:
+                            await flush(output, is_stderr)
 
                     except Exception as e:
                         logger.error(f"Error reading from stream: {e}")
@@ -284,9 +397,19 @@ class BashEventService:
                     f"{command.command}"
                 )
 
-            # Create final output event with any remaining buffer content and exit code
-            final_stdout = stdout_buffer if stdout_buffer else None
-            final_stderr = stderr_buffer if stderr_buffer else None
+            # Create final output event with any remaining output and exit code
+            final_stdout = final_stderr = None
+            stdout_blob = stderr_blob = None
+            if stdout.blob is not None:
+                await asyncio.to_thread(stdout.close)
+                stdout_blob = stdout.blob_path.name
+            elif stdout.buffer:
+                final_stdout = stdout.take_text(final=True)
+            if stderr.blob is not None:
+                await asyncio.to_thread(stderr.close)
+                stderr_blob = stderr.blob_path.name
+            elif stderr.buffer:
+                final_stderr = stderr.take_text(final=True)
 
             # Only create final event if there's remaining content or we need to report
             # exit code
@@ -297,10 +420,18 @@ class BashEventService:
                     exit_code=exit_code,
                     stdout=final_stdout,
                     stderr=final_stderr,
+                    stdout_blob=stdout_blob,
+                    stderr_blob=stderr_blob,
                 )
 
-                self._save_event_to_file(final_output)
+                await self._save_event(final_output)
                 await self._pub_sub(final_output)
+            await self._send_live_output(
+                BashOutputChunk(
+                    command_id=command.id,
+                    exit_code=-1 if exit_code is None else exit_code,
+                )
+            )
 
         except Exception as e:
             logger.error(f"Error executing bash command '{command.command}': {e}")
@@ -312,39 +443,62 @@ class BashEventService:
                 stderr=f"Error executing command: {str(e)}",
             )
 
-            self._save_event_to_file(error_output)
+            await self._save_event(error_output)
             await self._pub_sub(error_output)
+            await self._send_live_output(
+                BashOutputChunk(
+                    command_id=command.id, exit_code=-1, stderr=error_output.stderr
+                )
+            )
 
-    async def subscribe_to_events(self, subscriber: Subscriber[BashEventBase]) -> UUID:
+    async def subscribe_to_events(
+        self,
+        subscriber: Subscriber[BashEventBase],
+        overflow_policy: OverflowPolicy | None = None,
+    ) -> UUID:
         """Subscribe to bash events.
 
         The subscriber will receive BashEventBase instances.
         """
-        return self._pub_sub.subscribe(subscriber)
+        return self._pub_sub.subscribe(subscriber, overflow_policy)
 
     async def unsubscribe_from_events(self, subscriber_id: UUID) -> bool:
         return self._pub_sub.unsubscribe(subscriber_id)
 
+    def _delete_event_files(self, filenames: list[str]) -> None:
+        for filename in filenames:
+            file_path = self.bash_events_dir / filename
+            try:
+                file_path.unlink()
+            except Exception as e:
+                logger.error(f"Error deleting event file {file_path}: {e}")
+
+    def get_output_blob_path(self, name: str) -> Path | None:
+        """Get the path of the output blob with the name given (As referenced by
+        BashOutput.stdout_blob / stderr_blob), or None if there is no such blob."""
+        if not _OUTPUT_BLOB_NAME.fullmatch(name):
+            return None
+        path = self.bash_events_dir / OUTPUT_BLOBS_DIR / name
+        return path if path.is_file() else None
+
     async def clear_all_events(self) -> int:
         """Clear all bash events from storage.
 
         Returns:
             int: The number of events that were cleared.
         """
-        self._ensure_bash_events_dir()
-
-        # Get all event files
-        files = self._get_event_files_by_pattern("*")
+        index = await self._get_index()
+        filenames = index.names()
+        index.clear()
 
         # Count files before deletion
-        count = len(files)
+        count = len(filenames)
 
         # Remove all event files
-        for file_path in files:
-            try:
-                file_path.unlink()
-            except Exception as e:
-                logger.error(f"Error deleting event file {file_path}: {e}")
+        await asyncio.to_thread(self._delete_event_files, filenames)
+        await asyncio.to_thread(
+            shutil.rmtree, self.bash_events_dir / OUTPUT_BLOBS_DIR, ignore_errors=True
+        )
 
         logger.info(f"Cleared {count} bash events from storage")
         return count
@@ -355,7 +509,7 @@ class BashEventService:
 
     async def __aenter__(self):
         """Start using this task service"""
-        # No special initialization needed for bash event service
+        await self._get_index()
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
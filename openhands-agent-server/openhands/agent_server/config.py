@@ -6,6 +6,7 @@ from typing import ClassVar
 from pydantic import BaseModel, ConfigDict, Field, SecretStr
 
 from openhands.agent_server.env_parser import from_env
+from openhands.agent_server.pub_sub import OverflowPolicy
 from openhands.sdk.utils.cipher import Cipher
 
 
@@ -100,6 +101,48 @@ class Config(BaseModel):
             "Defaults to 'workspace/bash_events'."
         ),
     )
+    conversation_idle_ttl: float | None = Field(
+        default=3600.0,
+        description=(
+            "Seconds after which an idle conversation is stopped and unloaded "
+            "from memory. Conversations are loaded again on next access. Running "
+            "conversations and conversations with connected clients are never "
+            "unloaded. None disables unloading."
+        ),
+    )
+    event_journal: bool = Field(
+        default=False,
+        description=(
+            "Whether to store conversation events in a segmented append-only "
+            "journal instead of one file per event. Existing per-file "
+            "conversations are migrated when they are opened."
+        ),
+    )
+    delta_state: bool = Field(
+        default=False,
+        description=(
+            "Whether to persist the conversation state fields which change during "
+            "a run (execution status, stats...) apart from the agent spec, saving "
+            "them once per agent step rather than rewriting the whole state on "
+            "every change."
+        ),
+    )
+    async_agent_loop: bool = Field(
+        default=False,
+        description=(
+            "Whether to drive conversations with the async agent loop, awaiting "
+            "LLM calls on the server's event loop instead of running each "
+            "conversation in a worker thread. Tools still run in worker threads."
+        ),
+    )
+    file_transfer_chunk_size: int = Field(
+        default=1024 * 1024,
+        gt=0,
+        description=(
+            "The size in bytes of the chunks in which uploaded files are written "
+            "to disk."
+        ),
+    )
     static_files_path: Path | None = Field(
         default=None,
         description=(
@@ -112,6 +155,25 @@ class Config(BaseModel):
         default_factory=list,
         description="Webhooks to invoke in response to events",
     )
+    websocket_overflow_policy: OverflowPolicy = Field(
+        default=OverflowPolicy.COALESCE,
+        description=(
+            "What to do when a websocket client falls too far behind on events: "
+            "'drop_oldest' discards its oldest queued events, 'coalesce' first "
+            "replaces queued state updates with newer ones, 'disconnect' "
+            "closes the websocket so the client reconnects and resyncs, and "
+            "'block' never discards events but slows down publishing. Webhooks "
+            "and other internal subscribers always use 'block'."
+        ),
+    )
+    webhook_outbox_path: Path | None = Field(
+        default=Path("workspace/webhook_outbox"),
+        description=(
+            "The location of the directory where webhook payloads are kept until "
+            "they are delivered, so that they are retried after a restart. None "
+            "keeps undelivered payloads in memory only."
+        ),
+    )
     enable_vscode: bool = Field(
         default=True,
         description="Whether to enable VSCode server functionality",
@@ -1,11 +1,11 @@
 import asyncio
 import logging
+import time
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from uuid import UUID, uuid4
 
-import httpx
-
 from openhands.agent_server.config import Config, WebhookSpec
 from openhands.agent_server.event_service import EventService
 from openhands.agent_server.models import (
@@ -19,6 +19,7 @@ from openhands.agent_server.models import (
 from openhands.agent_server.pub_sub import Subscriber
 from openhands.agent_server.server_details_router import update_last_execution_time
 from openhands.agent_server.utils import safe_rmtree, utc_now
+from openhands.agent_server.webhook_dispatcher import WebhookDispatcher
 from openhands.sdk import LLM, Event, Message
 from openhands.sdk.conversation.state import (
     ConversationExecutionStatus,
@@ -46,26 +47,110 @@ def _compose_conversation_info(
 class ConversationService:
     """
     Conversation service which stores to a local file store. When the context starts
-    all event_services are loaded into memory, and stored when it stops.
+    only the metadata of stored conversations is loaded into a catalog; an
+    event_service is started the first time a conversation is accessed, and
+    event_services idle for longer than `idle_ttl` seconds are stopped and returned
+    to the catalog. All active event_services are stored when the context stops.
+    Listings are filtered and sorted from the catalog, which keeps the title,
+    timestamps and execution status saved with each conversation's metadata; the
+    persisted states of the most recently listed inactive conversations (up to
+    `persisted_state_cache_size`) are kept to fill in the listed pages.
     """
 
     conversations_dir: Path = field()
     webhook_specs: list[WebhookSpec] = field(default_factory=list)
     session_api_key: str | None = field(default=None)
     cipher: Cipher | None = None
+    event_journal: bool = False
+    delta_state: bool = False
+    async_agent_loop: bool = False
+    idle_ttl: float | None = None
+    persisted_state_cache_size: int = 128
+    webhook_outbox_dir: Path | None = None
+    _webhook_dispatcher: WebhookDispatcher = field(init=False)
     _event_services: dict[UUID, EventService] | None = field(default=None, init=False)
+    _catalog: dict[UUID, StoredConversation] = field(default_factory=dict, init=False)
+    _persisted_states: OrderedDict[UUID, ConversationState] = field(
+        default_factory=OrderedDict, init=False
+    )
+    _last_access: dict[UUID, float] = field(default_factory=dict, init=False)
+    _hydration_locks: defaultdict[UUID, asyncio.Lock] = field(
+        default_factory=lambda: defaultdict(asyncio.Lock), init=False
+    )
+    _eviction_task: asyncio.Task | None = field(default=None, init=False)
     _conversation_webhook_subscribers: list["ConversationWebhookSubscriber"] = field(
         default_factory=list, init=False
     )
 
+    def __post_init__(self):
+        self._webhook_dispatcher = WebhookDispatcher(
+            outbox_dir=self.webhook_outbox_dir,
+            session_api_key=self.session_api_key,
+        )
+
     async def get_conversation(self, conversation_id: UUID) -> ConversationInfo | None:
         if self._event_services is None:
             raise ValueError("inactive_service")
         event_service = self._event_services.get(conversation_id)
-        if event_service is None:
+        if event_service is not None:
+            state = await event_service.get_state()
+            return _compose_conversation_info(event_service.stored, state)
+        stored = self._catalog.get(conversation_id)
+        if stored is None:
             return None
-        state = await event_service.get_state()
-        return _compose_conversation_info(event_service.stored, state)
+        state = await self._get_persisted_state(stored)
+        if state is None:
+            # No persisted state to report from; start the conversation instead
+            event_service = await self._get_event_service(conversation_id)
+            if event_service is None:
+                return None
+            state = await event_service.get_state()
+            return _compose_conversation_info(event_service.stored, state)
+        return _compose_conversation_info(stored, state)
+
+    def _conversation_ids(self) -> list[UUID]:
+        """Ids of all known conversations, active or not."""
+        assert self._event_services is not None
+        return list(dict.fromkeys([*self._event_services, *self._catalog]))
+
+    async def _execution_status(
+        self, conversation_id: UUID
+    ) -> ConversationExecutionStatus | None:
+        """Execution status of a conversation, from its live state when active and
+        from the catalog otherwise."""
+        assert self._event_services is not None
+        event_service = self._event_services.get(conversation_id)
+        if event_service is not None:
+            return (await event_service.get_state()).execution_status
+        stored = self._catalog.get(conversation_id)
+        if stored is None:
+            return None
+        if stored.execution_status is None:
+            # Metadata saved before statuses were recorded: look it up once
+            conversation_info = await self.get_conversation(conversation_id)
+            if conversation_info is None:
+                return None
+            stored.execution_status = conversation_info.execution_status
+        return stored.execution_status
+
+    async def _list_conversations(
+        self, execution_status: ConversationExecutionStatus | None
+    ) -> list[StoredConversation]:
+        """Catalog entries of the conversations matching the status filter."""
+        assert self._event_services is not None
+        matches = []
+        for id in self._conversation_ids():
+            event_service = self._event_services.get(id)
+            stored = event_service.stored if event_service else self._catalog.get(id)
+            if stored is None:
+                continue
+            if (
+                execution_status is not None
+                and await self._execution_status(id) != execution_status
+            ):
+                continue
+            matches.append(stored)
+        return matches
 
     async def search_conversations(
         self,
@@ -77,29 +162,18 @@ class ConversationService:
         if self._event_services is None:
             raise ValueError("inactive_service")
 
-        # Collect all conversations with their info
-        all_conversations = []
-        for id, event_service in self._event_services.items():
-            state = await event_service.get_state()
-            conversation_info = _compose_conversation_info(event_service.stored, state)
-            # Apply status filter if provided
-            if (
-                execution_status is not None
-                and conversation_info.execution_status != execution_status
-            ):
-                continue
-
-            all_conversations.append((id, conversation_info))
+        # Filter and sort from the catalog; only the page is loaded in full
+        all_conversations = await self._list_conversations(execution_status)
 
         # Sort conversations based on sort_order
         if sort_order == ConversationSortOrder.CREATED_AT:
-            all_conversations.sort(key=lambda x: x[1].created_at)
+            all_conversations.sort(key=lambda x: x.created_at)
         elif sort_order == ConversationSortOrder.CREATED_AT_DESC:
-            all_conversations.sort(key=lambda x: x[1].created_at, reverse=True)
+            all_conversations.sort(key=lambda x: x.created_at, reverse=True)
         elif sort_order == ConversationSortOrder.UPDATED_AT:
-            all_conversations.sort(key=lambda x: x[1].updated_at)
+            all_conversations.sort(key=lambda x: x.updated_at)
         elif sort_order == ConversationSortOrder.UPDATED_AT_DESC:
-            all_conversations.sort(key=lambda x: x[1].updated_at, reverse=True)
+            all_conversations.sort(key=lambda x: x.updated_at, reverse=True)
 
         # Handle pagination
         items = []
@@ -107,8 +181,8 @@ class ConversationService:
 
         # Find the starting point if page_id is provided
         if page_id:
-            for i, (id, _) in enumerate(all_conversations):
-                if id.hex == page_id:
+            for i, stored in enumerate(all_conversations):
+                if stored.id.hex == page_id:
                     start_index = i
                     break
 
@@ -117,10 +191,11 @@ class ConversationService:
         for i in range(start_index, len(all_conversations)):
             if len(items) >= limit:
                 # We have more items, set next_page_id
-                if i < len(all_conversations):
-                    next_page_id = all_conversations[i][0].hex
+                next_page_id = all_conversations[i].id.hex
                 break
-            items.append(all_conversations[i][1])
+            conversation_info = await self.get_conversation(all_conversations[i].id)
+            if conversation_info is not None:
+                items.append(conversation_info)
 
         return ConversationPage(items=items, next_page_id=next_page_id)
 
@@ -131,21 +206,7 @@ class ConversationService:
         """Count conversations matching the given filters."""
         if self._event_services is None:
             raise ValueError("inactive_service")
-
-        count = 0
-        for event_service in self._event_services.values():
-            state = await event_service.get_state()
-
-            # Apply status filter if provided
-            if (
-                execution_status is not None
-                and state.execution_status != execution_status
-            ):
-                continue
-
-            count += 1
-
-        return count
+        return len(await self._list_conversations(execution_status))
 
     async def batch_get_conversations(
         self, conversation_ids: list[UUID]
@@ -184,12 +245,9 @@ class ConversationService:
             raise ValueError("inactive_service")
         conversation_id = request.conversation_id or uuid4()
 
-        if conversation_id in self._event_services:
-            existing_event_service = self._event_services[conversation_id]
-            state = await existing_event_service.get_state()
-            conversation_info = _compose_conversation_info(
-                existing_event_service.stored, state
-            )
+        if conversation_id in self._event_services or conversation_id in self._catalog:
+            conversation_info = await self.get_conversation(conversation_id)
+            assert conversation_info is not None
             return conversation_info, False
 
         stored = StoredConversation(id=conversation_id, **request.model_dump())
@@ -212,7 +270,7 @@ class ConversationService:
     async def pause_conversation(self, conversation_id: UUID) -> bool:
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service:
             await event_service.pause()
             # Notify conversation webhooks about the paused conversation
@@ -226,27 +284,45 @@ class ConversationService:
             raise ValueError("inactive_service")
         event_service = self._event_services.get(conversation_id)
         if event_service:
+            self._last_access[conversation_id] = time.monotonic()
             await event_service.start()
-        return bool(event_service)
+            return True
+        # Hydrating a catalog entry starts its event_service
+        return await self._get_event_service(conversation_id) is not None
 
     async def delete_conversation(self, conversation_id: UUID) -> bool:
         if self._event_services is None:
             raise ValueError("inactive_service")
         event_service = self._event_services.pop(conversation_id, None)
-        if event_service:
-            # Notify conversation webhooks about the stopped conversation before closing
-            try:
+        stored = self._catalog.pop(conversation_id, None)
+        persisted_state = self._persisted_states.pop(conversation_id, None)
+        self._last_access.pop(conversation_id, None)
+        if event_service is None and stored is None:
+            return False
+
+        # Notify conversation webhooks about the stopped conversation before closing.
+        # Inactive conversations are reported from their persisted state, without
+        # starting them.
+        try:
+            if event_service is not None:
+                stored = event_service.stored
                 state = await event_service.get_state()
-                conversation_info = _compose_conversation_info(
-                    event_service.stored, state
-                )
-                await self._notify_conversation_webhooks(conversation_info)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to notify webhooks for conversation {conversation_id}: {e}"
+            else:
+                assert stored is not None
+                state = persisted_state or await asyncio.to_thread(
+                    ConversationState.load_persisted,
+                    str(self.conversations_dir / stored.id.hex),
                 )
+                assert state is not None, "no persisted state"
+            conversation_info = _compose_conversation_info(stored, state)
+            await self._notify_conversation_webhooks(conversation_info)
+        except Exception as e:
+            logger.warning(
+                f"Failed to notify webhooks for conversation {conversation_id}: {e}"
+            )
 
-            # Close the event service
+        # Close the event service
+        if event_service is not None:
             try:
                 await event_service.close()
             except Exception as e:
@@ -255,17 +331,21 @@ class ConversationService:
                     f"{conversation_id}: {e}"
                 )
 
-            # Safely remove only the conversation directory (workspace is preserved).
-            # This operation may fail due to permission issues, but we don't want that
-            # to prevent the conversation from being marked as deleted.
-            safe_rmtree(
-                event_service.conversation_dir,
-                f"conversation directory for {conversation_id}",
-            )
+        # Safely remove only the conversation directory (workspace is preserved).
+        # This operation may fail due to permission issues, but we don't want that
+        # to prevent the conversation from being marked as deleted.
+        conversation_dir = (
+            event_service.conversation_dir
+            if event_service is not None
+            else self.conversations_dir / conversation_id.hex
+        )
+        safe_rmtree(
+            conversation_dir,
+            f"conversation directory for {conversation_id}",
+        )
 
-            logger.info(f"Successfully deleted conversation {conversation_id}")
-            return True
-        return False
+        logger.info(f"Successfully deleted conversation {conversation_id}")
+        return True
 
     async def update_conversation(
         self, conversation_id: UUID, request: UpdateConversationRequest
@@ -281,7 +361,7 @@ class ConversationService:
         """
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service is None:
             return False
 
@@ -304,7 +384,7 @@ class ConversationService:
     async def get_event_service(self, conversation_id: UUID) -> EventService | None:
         if self._event_services is None:
             raise ValueError("inactive_service")
-        return self._event_services.get(conversation_id)
+        return await self._get_event_service(conversation_id)
 
     async def generate_conversation_title(
         self, conversation_id: UUID, max_length: int = 50, llm: LLM | None = None
@@ -312,7 +392,7 @@ class ConversationService:
         """Generate a title for the conversation using LLM."""
         if self._event_services is None:
             raise ValueError("inactive_service")
-        event_service = self._event_services.get(conversation_id)
+        event_service = await self._get_event_service(conversation_id)
         if event_service is None:
             return None
 
@@ -320,9 +400,88 @@ class ConversationService:
         title = await event_service.generate_title(llm=llm, max_length=max_length)
         return title
 
+    async def _get_event_service(self, conversation_id: UUID) -> EventService | None:
+        """Return the active event_service, starting it from the catalog if needed."""
+        assert self._event_services is not None
+        event_service = self._event_services.get(conversation_id)
+        if event_service is None and conversation_id in self._catalog:
+            async with self._hydration_locks[conversation_id]:
+                event_service = self._event_services.get(conversation_id)
+                stored = self._catalog.get(conversation_id)
+                if event_service is None and stored is not None:
+                    logger.debug(f"Hydrating conversation {conversation_id}")
+                    self._persisted_states.pop(conversation_id, None)
+                    event_service = await self._start_event_service(stored)
+        if event_service is not None:
+            self._last_access[conversation_id] = time.monotonic()
+        return event_service
+
+    async def _get_persisted_state(
+        self, stored: StoredConversation
+    ) -> ConversationState | None:
+        """Load the base state of an inactive conversation without its events."""
+        state = self._persisted_states.get(stored.id)
+        if state is not None:
+            self._persisted_states.move_to_end(stored.id)
+            return state
+        state = await asyncio.to_thread(
+            ConversationState.load_persisted,
+            str(self.conversations_dir / stored.id.hex),
+        )
+        if state is None:
+            return None
+        # The conversation may have been started or deleted meanwhile
+        if stored.id in self._catalog and stored.id not in (self._event_services or {}):
+            self._persisted_states[stored.id] = state
+            while len(self._persisted_states) > self.persisted_state_cache_size:
+                self._persisted_states.popitem(last=False)
+        return state
+
+    async def evict_idle_conversations(self) -> list[UUID]:
+        """Stop event_services idle for longer than `idle_ttl`, keeping them in the
+        catalog. Running conversations and conversations with external subscribers
+        (e.g. open websockets) are never evicted."""
+        if self._event_services is None or self.idle_ttl is None:
+            return []
+        now = time.monotonic()
+        internal_subscribers = 1 + len(self.webhook_specs)
+        evicted = []
+        for conversation_id, event_service in list(self._event_services.items()):
+            last_access = self._last_access.get(conversation_id, now)
+            if now - last_access < self.idle_ttl:
+                continue
+            if event_service.subscriber_count > internal_subscribers:
+                continue
+            state = await event_service.get_state()
+            if state.execution_status == ConversationExecutionStatus.RUNNING:
+                continue
+            async with self._hydration_locks[conversation_id]:
+                if self._event_services.pop(conversation_id, None) is None:
+                    continue
+                self._catalog[conversation_id] = event_service.stored
+                self._last_access.pop(conversation_id, None)
+                try:
+                    await event_service.__aexit__(None, None, None)
+                except Exception:
+                    logger.exception(f"error_evicting_event_service:{conversation_id}")
+            evicted.append(conversation_id)
+            logger.debug(f"Evicted idle conversation {conversation_id}")
+        return evicted
+
+    async def _evict_idle_periodically(self):
+        assert self.idle_ttl is not None
+        interval = min(self.idle_ttl / 2, 60.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle_conversations()
+            except Exception:
+                logger.exception("error_evicting_idle_conversations")
+
     async def __aenter__(self):
         self.conversations_dir.mkdir(parents=True, exist_ok=True)
         self._event_services = {}
+        self._catalog = {}
         for conversation_dir in self.conversations_dir.iterdir():
             try:
                 meta_file = conversation_dir / "meta.json"
@@ -335,7 +494,7 @@ class ConversationService:
                         "cipher": self.cipher,
                     },
                 )
-                await self._start_event_service(stored)
+                self._catalog[stored.id] = stored
             except Exception:
                 logger.exception(
                     f"error_loading_event_service:{conversation_dir}", stack_info=True
@@ -346,13 +505,21 @@ class ConversationService:
             ConversationWebhookSubscriber(
                 spec=webhook_spec,
                 session_api_key=self.session_api_key,
+                dispatcher=self._webhook_dispatcher,
             )
             for webhook_spec in self.webhook_specs
         ]
+        await self._webhook_dispatcher.recover(self.webhook_specs)
+
+        if self.idle_ttl is not None:
+            self._eviction_task = asyncio.create_task(self._evict_idle_periodically())
 
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            self._eviction_task = None
         event_services = self._event_services
         if event_services is None:
             return
@@ -364,6 +531,8 @@ class ConversationService:
                 for event_service in event_services.values()
             ]
         )
+        # Undelivered webhook payloads stay in the outbox for the next start
+        await self._webhook_dispatcher.close()
 
     @classmethod
     def get_instance(cls, config: Config) -> "ConversationService":
@@ -374,6 +543,11 @@ class ConversationService:
                 config.session_api_keys[0] if config.session_api_keys else None
             ),
             cipher=config.cipher,
+            event_journal=config.event_journal,
+            delta_state=config.delta_state,
+            async_agent_loop=config.async_agent_loop,
+            idle_ttl=config.conversation_idle_ttl,
+            webhook_outbox_dir=config.webhook_outbox_path,
         )
 
     async def _start_event_service(self, stored: StoredConversation) -> EventService:
@@ -385,6 +559,9 @@ class ConversationService:
             stored=stored,
             conversations_dir=self.conversations_dir,
             cipher=self.cipher,
+            event_journal=self.event_journal,
+            delta_state=self.delta_state,
+            async_agent_loop=self.async_agent_loop,
         )
         # Create subscribers...
         await event_service.subscribe_to_events(_EventSubscriber(service=event_service))
@@ -396,6 +573,7 @@ class ConversationService:
                         service=event_service,
                         spec=webhook_spec,
                         session_api_key=self.session_api_key,
+                        dispatcher=self._webhook_dispatcher,
                     )
                 )
                 for webhook_spec in self.webhook_specs
@@ -403,6 +581,8 @@ class ConversationService:
         )
 
         event_services[stored.id] = event_service
+        self._catalog[stored.id] = stored
+        self._last_access[stored.id] = time.monotonic()
         await event_service.start()
         return event_service
 
@@ -422,6 +602,7 @@ class WebhookSubscriber(Subscriber):
     service: EventService
     spec: WebhookSpec
     session_api_key: str | None = None
+    dispatcher: WebhookDispatcher = field(default_factory=WebhookDispatcher)
     queue: list[Event] = field(default_factory=list)
     _flush_timer: asyncio.Task | None = field(default=None, init=False)
 
@@ -445,7 +626,7 @@ class WebhookSubscriber(Subscriber):
             await self._post_events()
 
     async def _post_events(self):
-        """Post queued events to the webhook with retry logic."""
+        """Hand queued events to the dispatcher, which delivers them with retries."""
         if not self.queue:
             return
 
@@ -457,45 +638,14 @@ class WebhookSubscriber(Subscriber):
         if self.session_api_key:
             headers["X-Session-API-Key"] = self.session_api_key
 
-        # Convert events to serializable format
-        event_data = [
-            event.model_dump() if hasattr(event, "model_dump") else event.__dict__
-            for event in events_to_post
-        ]
-
         # Construct events URL
         events_url = (
             f"{self.spec.base_url.rstrip('/')}/events/{self.conversation_id.hex}"
         )
 
-        # Retry logic
-        for attempt in range(self.spec.num_retries + 1):
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.request(
-                        method="POST",
-                        url=events_url,
-                        json=event_data,
-                        headers=headers,
-                        timeout=30.0,
-                    )
-                    response.raise_for_status()
-                    logger.debug(
-                        f"Successfully posted {len(event_data)} events "
-                        f"to webhook {events_url}"
-                    )
-                    return
-            except Exception as e:
-                logger.warning(f"Webhook post attempt {attempt + 1} failed: {e}")
-                if attempt < self.spec.num_retries:
-                    await asyncio.sleep(self.spec.retry_delay)
-                else:
-                    logger.error(
-                        f"Failed to post events to webhook {events_url} "
-                        f"after {self.spec.num_retries + 1} attempts"
-                    )
-                    # Re-queue events for potential retry later
-                    self.queue.extend(events_to_post)
+        await self.dispatcher.post_events(
+            self.spec, events_url, events_to_post, headers
+        )
 
     def _cancel_flush_timer(self):
         """Cancel the current flush timer if it exists."""
@@ -523,6 +673,7 @@ class ConversationWebhookSubscriber:
 
     spec: WebhookSpec
     session_api_key: str | None = None
+    dispatcher: WebhookDispatcher = field(default_factory=WebhookDispatcher)
 
     async def post_conversation_info(self, conversation_info: ConversationInfo):
         """Post conversation info to the webhook immediately (no batching)."""
@@ -535,37 +686,13 @@ class ConversationWebhookSubscriber:
         conversations_url = f"{self.spec.base_url.rstrip('/')}/conversations"
 
         # Convert conversation info to serializable format
-        conversation_data = conversation_info.model_dump(mode="json")
+        conversation_data = (
+            await asyncio.to_thread(conversation_info.model_dump_json)
+        ).encode()
 
-        # Retry logic
-        for attempt in range(self.spec.num_retries + 1):
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.request(
-                        method="POST",
-                        url=conversations_url,
-                        json=conversation_data,
-                        headers=headers,
-                        timeout=30.0,
-                    )
-                    response.raise_for_status()
-                    logger.debug(
-                        f"Successfully posted conversation info "
-                        f"to webhook {conversations_url}"
-                    )
-                    return
-            except Exception as e:
-                logger.warning(
-                    f"Conversation webhook post attempt {attempt + 1} failed: {e}"
-                )
-                if attempt < self.spec.num_retries:
-                    await asyncio.sleep(self.spec.retry_delay)
-                else:
-                    logger.error(
-                        f"Failed to post conversation info to webhook "
-                        f"{conversations_url} after {self.spec.num_retries + 1} "
-                        "attempts"
-                    )
+        await self.dispatcher.post_json(
+            self.spec, conversations_url, conversation_data, headers
+        )
 
 
 _conversation_service: ConversationService | None = None
@@ -0,0 +1,188 @@
+"""Secondary index over the events of a conversation.
+
+The index keeps, for every event position, its id and timestamp, plus
+(timestamp, position) keys sorted globally and per event kind. Filtering by
+kind and timestamp range, counting and resuming a page are then bisections
+over these keys, and only the events on the requested page are read from the
+event log.
+
+Events are indexed when the index is synced with the event log, from their
+stored JSON when the event log provides it, without deserializing them.
+"""
+
+import base64
+import json
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Sequence
+from functools import cache
+
+from openhands.sdk import Event
+
+
+type _Key = tuple[str, int]
+
+
+def event_kind(event: Event) -> str:
+    return _class_kind(event.__class__)
+
+
+def _class_kind(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__name__}"
+
+
+@cache
+def _stored_kind(kind: str) -> str:
+    """Return the kind of an event from the `kind` field of its JSON."""
+    return _class_kind(Event.resolve_kind(kind))
+
+
+class EventIndex:
+    """Append-only index of a conversation's events by kind and timestamp.
+
+    The index follows one event sequence; `sync` indexes events appended since
+    the last call and rebuilds from scratch if the sequence was replaced or the
+    events indexed are no longer its first ones.
+    """
+
+    def __init__(self) -> None:
+        self._reset(None)
+
+    def _reset(self, events: Sequence[Event] | None) -> None:
+        self._events = events
+        self._ids: list[str] = []
+        self._timestamps: list[str] = []
+        self._id_to_pos: dict[str, int] = {}
+        self._keys: list[_Key] = []
+        self._keys_by_kind: dict[str, list[_Key]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def sync(self, events: Sequence[Event]) -> None:
+        """Index events appended to `events` since the last sync."""
+        if events is not self._events or not self._is_prefix_of(events):
+            self._reset(events)
+        read_event_json = getattr(events, "read_event_json", None)
+        for pos in range(len(self._ids), len(events)):
+            if read_event_json is not None:
+                data = json.loads(read_event_json(pos))
+                try:
+                    kind = _stored_kind(data["kind"])
+                except ValueError:
+                    kind = event_kind(events[pos])
+                self._add(data["id"], data["timestamp"], kind)
+            else:
+                event = events[pos]
+                self._add(event.id, event.timestamp, event_kind(event))
+
+    def _is_prefix_of(self, events: Sequence[Event]) -> bool:
+        """Whether the events indexed are still the first ones of `events`.
+        Events are only ever appended, so checking the last id is enough."""
+        n = len(self._ids)
+        if n == 0:
+            return True
+        if len(events) < n:
+            return False
+        get_id = getattr(events, "get_id", None)
+        last_id = get_id(n - 1) if get_id is not None else events[n - 1].id
+        return last_id == self._ids[-1]
+
+    def count(
+        self,
+        kind: str | None = None,
+        timestamp_gte: str | None = None,
+        timestamp_lt: str | None = None,
+        before: str | None = None,
+    ) -> int:
+        """Count the matching events; with `before` (a cursor or an event id),
+        only those sorted before it, i.e. its index in an ascending search.
+        Unknown cursors count nothing, as they would start from the beginning."""
+        keys = self._keys_for(kind)
+        lo, hi = self._bounds(keys, timestamp_gte, timestamp_lt)
+        if before is not None:
+            before_key = self._decode_cursor(before)
+            if before_key is None:
+                return 0
+            hi = max(lo, min(hi, bisect_left(keys, before_key)))
+        return hi - lo
+
+    def search(
+        self,
+        cursor: str | None = None,
+        limit: int = 100,
+        kind: str | None = None,
+        timestamp_gte: str | None = None,
+        timestamp_lt: str | None = None,
+        descending: bool = False,
+    ) -> tuple[list[int], str | None]:
+        """Return the positions of one page of matching events and the cursor
+        of the next page (None if this is the last page).
+
+        `cursor` is a cursor returned by a previous search or an event id; the
+        page starts at that event (inclusive). Unknown cursors start from the
+        beginning.
+        """
+        keys = self._keys_for(kind)
+        lo, hi = self._bounds(keys, timestamp_gte, timestamp_lt)
+        start_key = self._decode_cursor(cursor) if cursor else None
+
+        if descending:
+            end = hi
+            if start_key is not None:
+                end = max(lo, min(hi, bisect_right(keys, start_key)))
+            page = keys[max(lo, end - limit) : end][::-1]
+            remaining = end - lo - len(page)
+            next_key = keys[end - len(page) - 1] if remaining > 0 else None
+        else:
+            begin = lo
+            if start_key is not None:
+                begin = min(hi, max(lo, bisect_left(keys, start_key)))
+            page = keys[begin : min(hi, begin + limit)]
+            next_index = begin + len(page)
+            next_key = keys[next_index] if next_index < hi else None
+
+        next_cursor = self._encode_cursor(next_key) if next_key else None
+        return [pos for _, pos in page], next_cursor
+
+    def _add(self, event_id: str, timestamp: str, kind: str) -> None:
+        pos = len(self._ids)
+        key = (timestamp, pos)
+        self._ids.append(event_id)
+        self._timestamps.append(timestamp)
+        self._id_to_pos.setdefault(event_id, pos)
+        # Events are appended in (almost) timestamp order, so insort is cheap
+        insort(self._keys, key)
+        insort(self._keys_by_kind.setdefault(kind, []), key)
+
+    def _keys_for(self, kind: str | None) -> list[_Key]:
+        if kind is None:
+            return self._keys
+        return self._keys_by_kind.get(kind, [])
+
+    @staticmethod
+    def _bounds(
+        keys: list[_Key], timestamp_gte: str | None, timestamp_lt: str | None
+    ) -> tuple[int, int]:
+        # Positions are never negative, so (ts, -1) sorts before every key at ts
+        lo = bisect_left(keys, (timestamp_gte, -1)) if timestamp_gte else 0
+        hi = bisect_left(keys, (timestamp_lt, -1)) if timestamp_lt else len(keys)
+        return lo, max(lo, hi)
+
+    def _encode_cursor(self, key: _Key) -> str:
+        timestamp, pos = key
+        raw = f"{pos}:{timestamp}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def _decode_cursor(self, cursor: str) -> _Key | None:
+        pos = self._id_to_pos.get(cursor)
+        if pos is None:
+            try:
+                padded = cursor + "=" * (-len(cursor) % 4)
+                raw = base64.urlsafe_b64decode(padded).decode()
+                pos_str, timestamp = raw.split(":", 1)
+                pos = int(pos_str)
+            except ValueError:
+                return None
+            if not 0 <= pos < len(self._ids) or self._timestamps[pos] != timestamp:
+                return None
+        return self._timestamps[pos], pos
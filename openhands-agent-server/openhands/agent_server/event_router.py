@@ -23,6 +23,7 @@ from openhands.agent_server.models import (
     SendMessageRequest,
     Success,
 )
+from openhands.agent_server.pub_sub import SubscriberStats
 from openhands.sdk import Message
 from openhands.sdk.event import Event
 
@@ -122,6 +123,13 @@ async def count_conversation_events(
         datetime | None,
         Query(title="Filter: event timestamp < this datetime"),
     ] = None,
+    before_id: Annotated[
+        str | None,
+        Query(
+            title="Filter: events listed before this event id or page id, in "
+            "timestamp order"
+        ),
+    ] = None,
     event_service: EventService = Depends(get_event_service),
 ) -> int:
     """Count local events matching the given filters"""
@@ -135,11 +143,24 @@ async def count_conversation_events(
         normalize_datetime_to_server_timezone(timestamp__lt) if timestamp__lt else None
     )
 
-    count = await event_service.count_events(kind, normalized_gte, normalized_lt)
+    count = await event_service.count_events(
+        kind, normalized_gte, normalized_lt, before_id
+    )
 
     return count
 
 
+@event_router.get(
+    "/subscribers", responses={404: {"description": "Conversation not found"}}
+)
+async def get_event_subscriber_stats(
+    event_service: EventService = Depends(get_event_service),
+) -> list[SubscriberStats]:
+    """Get delivery metrics (queue size, lag, dropped events) for each subscriber
+    to the events of this conversation"""
+    return event_service.get_subscriber_stats()
+
+
 @event_router.get("/{event_id}", responses={404: {"description": "Item not found"}})
 async def get_conversation_event(
     event_id: str,
@@ -1,16 +1,28 @@
 import asyncio
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
 
+from openhands.agent_server.event_index import EventIndex
 from openhands.agent_server.models import (
     ConfirmationResponseRequest,
     EventPage,
     EventSortOrder,
     StoredConversation,
+    TrajectoryArchiveFormat,
+)
+from openhands.agent_server.pub_sub import (
+    OverflowPolicy,
+    PubSub,
+    Subscriber,
+    SubscriberStats,
+)
+from openhands.agent_server.trajectory_archive import (
+    iter_archive,
+    iter_trajectory_members,
 )
-from openhands.agent_server.pub_sub import PubSub, Subscriber
 from openhands.agent_server.utils import utc_now
 from openhands.sdk import LLM, Agent, Event, Message, get_logger
 from openhands.sdk.conversation.impl.local_conversation import LocalConversation
@@ -20,6 +32,7 @@ from openhands.sdk.conversation.state import (
     ConversationState,
 )
 from openhands.sdk.event.conversation_state import ConversationStateUpdateEvent
+from openhands.sdk.io import LocalFileStore
 from openhands.sdk.security.analyzer import SecurityAnalyzerBase
 from openhands.sdk.security.confirmation_policy import ConfirmationPolicyBase
 from openhands.sdk.utils.async_utils import AsyncCallbackWrapper
@@ -30,6 +43,18 @@ from openhands.sdk.workspace import LocalWorkspace
 logger = get_logger(__name__)
 
 
+def _state_update_key(event: Event) -> str | None:
+    """Queued state updates for the same field can be replaced by newer ones."""
+    if isinstance(event, ConversationStateUpdateEvent):
+        return event.key
+    return None
+
+
+def _log_run_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Error running conversation: {task.exception()}")
+
+
 @dataclass
 class EventService:
     """
@@ -40,14 +65,25 @@ class EventService:
     stored: StoredConversation
     conversations_dir: Path
     cipher: Cipher | None = None
+    event_journal: bool = False
+    delta_state: bool = False
+    async_agent_loop: bool = False
     _conversation: LocalConversation | None = field(default=None, init=False)
-    _pub_sub: PubSub[Event] = field(default_factory=lambda: PubSub[Event](), init=False)
+    _pub_sub: PubSub[Event] = field(
+        default_factory=lambda: PubSub[Event](coalesce_key=_state_update_key),
+        init=False,
+    )
     _run_task: asyncio.Task | None = field(default=None, init=False)
+    _event_index: EventIndex = field(default_factory=EventIndex, init=False)
 
     @property
     def conversation_dir(self):
         return self.conversations_dir / self.stored.id.hex
 
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._pub_sub)
+
     async def load_meta(self):
         meta_file = self.conversation_dir / "meta.json"
         self.stored = StoredConversation.model_validate_json(
@@ -59,6 +95,8 @@ class EventService:
 
     async def save_meta(self):
         self.stored.updated_at = utc_now()
+        if self._conversation:
+            self.stored.execution_status = self._conversation.state.execution_status
         meta_file = self.conversation_dir / "meta.json"
         meta_file.write_text(
             self.stored.model_dump_json(
@@ -97,55 +135,18 @@ class EventService:
         timestamp_gte_str = timestamp__gte.isoformat() if timestamp__gte else None
         timestamp_lt_str = timestamp__lt.isoformat() if timestamp__lt else None
 
-        # Collect all events
-        all_events = []
+        # Only the new events and the events on this page are read under the lock
         with self._conversation._state as state:
-            for event in state.events:
-                # Apply kind filter if provided
-                if (
-                    kind is not None
-                    and f"{event.__class__.__module__}.{event.__class__.__name__}"
-                    != kind
-                ):
-                    continue
-
-                # Apply timestamp filters if provided (ISO string comparison)
-                if (
-                    timestamp_gte_str is not None
-                    and event.timestamp < timestamp_gte_str
-                ):
-                    continue
-                if timestamp_lt_str is not None and event.timestamp >= timestamp_lt_str:
-                    continue
-
-                all_events.append(event)
-
-        # Sort events based on sort_order
-        if sort_order == EventSortOrder.TIMESTAMP:
-            all_events.sort(key=lambda x: x.timestamp)
-        elif sort_order == EventSortOrder.TIMESTAMP_DESC:
-            all_events.sort(key=lambda x: x.timestamp, reverse=True)
-
-        # Handle pagination
-        items = []
-        start_index = 0
-
-        # Find the starting point if page_id is provided
-        if page_id:
-            for i, event in enumerate(all_events):
-                if event.id == page_id:
-                    start_index = i
-                    break
-
-        # Collect items for this page
-        next_page_id = None
-        for i in range(start_index, len(all_events)):
-            if len(items) >= limit:
-                # We have more items, set next_page_id
-                if i < len(all_events):
-                    next_page_id = all_events[i].id
-                break
-            items.append(all_events[i])
+            self._event_index.sync(state.events)
+            positions, next_page_id = self._event_index.search(
+                cursor=page_id,
+                limit=limit,
+                kind=kind,
+                timestamp_gte=timestamp_gte_str,
+                timestamp_lt=timestamp_lt_str,
+                descending=sort_order == EventSortOrder.TIMESTAMP_DESC,
+            )
+            items = [state.events[pos] for pos in positions]
 
         return EventPage(items=items, next_page_id=next_page_id)
 
@@ -154,8 +155,10 @@ class EventService:
         kind: str | None = None,
         timestamp__gte: datetime | None = None,
         timestamp__lt: datetime | None = None,
+        before_id: str | None = None,
     ) -> int:
-        """Count events matching the given filters."""
+        """Count events matching the given filters. With `before_id`, only the
+        events listed before that event id or page id are counted."""
         if not self._conversation:
             raise ValueError("inactive_service")
 
@@ -163,29 +166,14 @@ class EventService:
         timestamp_gte_str = timestamp__gte.isoformat() if timestamp__gte else None
         timestamp_lt_str = timestamp__lt.isoformat() if timestamp__lt else None
 
-        count = 0
         with self._conversation._state as state:
-            for event in state.events:
-                # Apply kind filter if provided
-                if (
-                    kind is not None
-                    and f"{event.__class__.__module__}.{event.__class__.__name__}"
-                    != kind
-                ):
-                    continue
-
-                # Apply timestamp filters if provided (ISO string comparison)
-                if (
-                    timestamp_gte_str is not None
-                    and event.timestamp < timestamp_gte_str
-                ):
-                    continue
-                if timestamp_lt_str is not None and event.timestamp >= timestamp_lt_str:
-                    continue
-
-                count += 1
-
-        return count
+            self._event_index.sync(state.events)
+            return self._event_index.count(
+                kind=kind,
+                timestamp_gte=timestamp_gte_str,
+                timestamp_lt=timestamp_lt_str,
+                before=before_id,
+            )
 
     async def batch_get_events(self, event_ids: list[str]) -> list[Event | None]:
         """Given a list of ids, get events (Or none for any which were not found)"""
@@ -194,6 +182,29 @@ class EventService:
         )
         return results
 
+    async def export_trajectory(
+        self,
+        format: TrajectoryArchiveFormat = TrajectoryArchiveFormat.ZIP,
+        since_event_id: str | None = None,
+    ) -> tuple[Iterator[bytes], str | None]:
+        """Get a streaming archive of the trajectory, and the id of its last event.
+
+        With `since_event_id`, only the events after that one are archived, so
+        that exports can be incremental. Raises KeyError if there is no such
+        event. Events appended while the archive is streamed are left out.
+        """
+        if not self._conversation:
+            raise ValueError("inactive_service")
+        with self._conversation._state as state:
+            events = state.events
+            stop = len(events)
+            start = events.get_index(since_event_id) + 1 if since_event_id else 0
+            last_event_id = events.get_id(stop - 1) if stop else None
+        members = iter_trajectory_members(
+            LocalFileStore(str(self.conversation_dir)), events, start, stop
+        )
+        return iter_archive(members, format, self.stored.id.hex), last_event_id
+
     async def send_message(self, message: Message, run: bool = False):
         if not self._conversation:
             raise ValueError("inactive_service")
@@ -203,10 +214,17 @@ class EventService:
             with self._conversation.state as state:
                 run = state.execution_status != ConversationExecutionStatus.RUNNING
         if run:
-            loop.run_in_executor(None, self._conversation.run)
+            if self.async_agent_loop:
+                self._start_async_run()
+            else:
+                loop.run_in_executor(None, self._conversation.run)
 
-    async def subscribe_to_events(self, subscriber: Subscriber[Event]) -> UUID:
-        subscriber_id = self._pub_sub.subscribe(subscriber)
+    async def subscribe_to_events(
+        self,
+        subscriber: Subscriber[Event],
+        overflow_policy: OverflowPolicy | None = None,
+    ) -> UUID:
+        subscriber_id = self._pub_sub.subscribe(subscriber, overflow_policy)
 
         # Send current state to the new subscriber immediately
         if self._conversation:
@@ -217,20 +235,18 @@ class EventService:
                     ConversationStateUpdateEvent.from_conversation_state(state)
                 )
 
-                # Send state update directly to the new subscriber
-                try:
-                    await subscriber(state_update_event)
-                except Exception as e:
-                    logger.error(
-                        f"Error sending initial state to subscriber "
-                        f"{subscriber_id}: {e}"
-                    )
+                # Queue the state update for the new subscriber only
+                await self._pub_sub.send_to(subscriber_id, state_update_event)
 
         return subscriber_id
 
     async def unsubscribe_from_events(self, subscriber_id: UUID) -> bool:
         return self._pub_sub.unsubscribe(subscriber_id)
 
+    def get_subscriber_stats(self) -> list[SubscriberStats]:
+        """Delivery metrics (queue size, lag, dropped events) per subscriber."""
+        return self._pub_sub.stats()
+
     async def start(self):
         # Store the main event loop for cross-thread communication
         self._main_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
@@ -247,12 +263,14 @@ class EventService:
             persistence_dir=str(self.conversations_dir),
             conversation_id=self.stored.id,
             callbacks=[
-                AsyncCallbackWrapper(self._pub_sub, loop=asyncio.get_running_loop())
+                AsyncCallbackWrapper(self._pub_sub, loop=asyncio.get_running_loop()),
             ],
             max_iteration_per_run=self.stored.max_iterations,
             stuck_detection=self.stored.stuck_detection,
             visualizer=None,
             secrets=self.stored.secrets,
+            event_journal=self.event_journal,
+            delta_state=self.delta_state,
         )
 
         # Set confirmation mode if enabled
@@ -262,18 +280,36 @@ class EventService:
         # Register state change callback to automatically publish updates
         self._conversation._state.set_on_state_change(self._conversation._on_event)
 
+        # Index the stored events; later events are indexed on each search
+        await asyncio.to_thread(self._sync_event_index)
+
         # Publish initial state update
         await self._publish_state_update()
 
+    def _sync_event_index(self) -> None:
+        assert self._conversation is not None
+        with self._conversation._state as state:
+            self._event_index.sync(state.events)
+
     async def run(self):
         """Run the conversation asynchronously."""
         if not self._conversation:
             raise ValueError("inactive_service")
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._conversation.run)
+        if self.async_agent_loop:
+            await self._conversation.arun()
+        else:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._conversation.run)
         # Publish state update after run completes to ensure stats are updated
         await self._publish_state_update()
 
+    def _start_async_run(self) -> None:
+        """Run the conversation on the event loop in the background."""
+        assert self._conversation is not None
+        task = asyncio.create_task(self._conversation.arun())
+        task.add_done_callback(_log_run_error)
+        self._run_task = task
+
     async def respond_to_confirmation(self, request: ConfirmationResponseRequest):
         if request.accept:
             await self.run()
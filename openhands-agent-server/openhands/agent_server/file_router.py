@@ -1,22 +1,29 @@
+import asyncio
+import hashlib
+import os
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, BinaryIO
 from uuid import UUID
 
 from fastapi import (
     APIRouter,
     File,
+    Form,
     HTTPException,
     Path as FastApiPath,
+    Query,
     UploadFile,
     status,
 )
-from fastapi.responses import FileResponse
-from starlette.background import BackgroundTask
+from fastapi.responses import FileResponse, StreamingResponse
 
-from openhands.agent_server.bash_service import get_default_bash_event_service
 from openhands.agent_server.config import get_default_config
 from openhands.agent_server.conversation_service import get_default_conversation_service
-from openhands.agent_server.models import ExecuteBashRequest, Success
+from openhands.agent_server.models import (
+    FileInfo,
+    FileUploadResult,
+    TrajectoryArchiveFormat,
+)
 from openhands.sdk.logger import get_logger
 
 
@@ -24,14 +31,27 @@ logger = get_logger(__name__)
 file_router = APIRouter(prefix="/file", tags=["Files"])
 config = get_default_config()
 conversation_service = get_default_conversation_service()
-bash_event_service = get_default_bash_event_service()
 
 
 @file_router.post("/upload/{path:path}")
 async def upload_file(
     path: Annotated[str, FastApiPath(alias="path", description="Absolute file path.")],
     file: Annotated[UploadFile, File(...)],
-) -> Success:
+    offset: Annotated[
+        int,
+        Form(
+            ge=0,
+            description=(
+                "Write the upload at this offset, keeping the existing content "
+                "before it. Used to resume an interrupted upload."
+            ),
+        ),
+    ] = 0,
+    mtime: Annotated[
+        float | None,
+        Form(description="Modification time to set on the file after the upload"),
+    ] = None,
+) -> FileUploadResult:
     """Upload a file to the workspace."""
     logger.info(f"Uploading file: {path}")
     try:
@@ -45,14 +65,33 @@ async def upload_file(
         # Ensure target directory exists
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Stream the file to disk to avoid memory issues with large files
-        with open(target_path, "wb") as f:
-            while chunk := await file.read(8192):  # Read in 8KB chunks
-                f.write(chunk)
+        existing_size = target_path.stat().st_size if target_path.is_file() else 0
+        if offset > existing_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Offset {offset} is past the end of the file",
+            )
+
+        # Stream the file to disk without blocking the event loop
+        f: BinaryIO = await asyncio.to_thread(
+            open, target_path, "r+b" if offset else "wb"
+        )
+        try:
+            await asyncio.to_thread(f.truncate, offset)
+            f.seek(offset)
+            while chunk := await file.read(config.file_transfer_chunk_size):
+                await asyncio.to_thread(f.write, chunk)
+            file_size = f.tell()
+        finally:
+            await asyncio.to_thread(f.close)
+        if mtime is not None:
+            os.utime(target_path, (mtime, mtime))
 
         logger.info(f"Uploaded file to {target_path}")
-        return Success()
+        return FileUploadResult(file_size=file_size)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to upload file: {e}")
         raise HTTPException(
@@ -61,6 +100,66 @@ async def upload_file(
         )
 
 
+@file_router.get(
+    "/info/{path:path}", responses={404: {"description": "Item not found"}}
+)
+async def get_file_info(
+    path: Annotated[str, FastApiPath(description="Absolute file path.")],
+    sha256: Annotated[
+        bool, Query(description="Whether to include the SHA-256 of the content")
+    ] = False,
+) -> FileInfo:
+    """Get the size and modification time of a file in the workspace."""
+    target_path = Path(path)
+    if not target_path.is_absolute():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Path must be absolute",
+        )
+    if not target_path.is_file():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return await asyncio.to_thread(_file_info, target_path, str(target_path), sha256)
+
+
+@file_router.get("/manifest/{path:path}")
+async def get_directory_manifest(
+    path: Annotated[str, FastApiPath(description="Absolute directory path.")],
+    sha256: Annotated[
+        bool, Query(description="Whether to include the SHA-256 of each file")
+    ] = False,
+) -> list[FileInfo]:
+    """List the files under a directory in the workspace, with paths relative to
+    it. Used to transfer only the files which changed. A missing directory has
+    no files."""
+    target_path = Path(path)
+    if not target_path.is_absolute():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Path must be absolute",
+        )
+    return await asyncio.to_thread(_directory_manifest, target_path, sha256)
+
+
+def _file_info(path: Path, name: str, sha256: bool) -> FileInfo:
+    stat = path.stat()
+    digest = None
+    if sha256:
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+    return FileInfo(path=name, size=stat.st_size, mtime=stat.st_mtime, sha256=digest)
+
+
+def _directory_manifest(root: Path, sha256: bool) -> list[FileInfo]:
+    result = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            if path.is_symlink() or not path.is_file():
+                continue
+            result.append(_file_info(path, path.relative_to(root).as_posix(), sha256))
+    return result
+
+
 @file_router.get("/download/{path:path}")
 async def download_file(
     path: Annotated[str, FastApiPath(description="Absolute file path.")],
@@ -101,21 +200,55 @@ async def download_file(
         )
 
 
-@file_router.get("/download-trajectory/{conversation_id}")
+@file_router.get(
+    "/download-trajectory/{conversation_id}",
+    responses={404: {"description": "Item not found"}},
+)
 async def download_trajectory(
     conversation_id: UUID,
-) -> FileResponse:
-    """Download a file from the workspace."""
-    config = get_default_config()
-    temp_file = config.conversations_path / f"{conversation_id.hex}.zip"
-    conversation_dir = config.conversations_path / conversation_id.hex
-    _, task = await bash_event_service.start_bash_command(
-        ExecuteBashRequest(command=f"zip -r {temp_file} {conversation_dir}")
-    )
-    await task
-    return FileResponse(
-        path=temp_file,
-        filename=temp_file.name,
-        media_type="application/octet-stream",
-        background=BackgroundTask(temp_file.unlink),
+) -> StreamingResponse:
+    """Download the trajectory of a conversation as a zip archive."""
+    return await export_trajectory(conversation_id)
+
+
+@file_router.get(
+    "/trajectory/{conversation_id}",
+    responses={404: {"description": "Item not found"}},
+)
+async def export_trajectory(
+    conversation_id: UUID,
+    format: Annotated[
+        TrajectoryArchiveFormat, Query(description="Format of the archive")
+    ] = TrajectoryArchiveFormat.ZIP,
+    since_event_id: Annotated[
+        str | None,
+        Query(description="Only include the events after the event with this id"),
+    ] = None,
+) -> StreamingResponse:
+    """Stream an archive of the trajectory of a conversation: its state files
+    and its events, one JSON file each.
+
+    The id of the last event archived is returned in the `X-Last-Event-Id`
+    header, to pass as `since_event_id` for the next incremental export."""
+    event_service = await conversation_service.get_event_service(conversation_id)
+    if event_service is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND)
+    try:
+        chunks, last_event_id = await event_service.export_trajectory(
+            format, since_event_id
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event not found: {since_event_id}",
+        )
+    filename = f"{conversation_id.hex}.{format.value}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if last_event_id is not None:
+        headers["X-Last-Event-Id"] = last_event_id
+    media_type = (
+        "application/zip"
+        if format == TrajectoryArchiveFormat.ZIP
+        else "application/gzip"
     )
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
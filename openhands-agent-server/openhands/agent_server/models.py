@@ -110,6 +110,11 @@ class StoredConversation(StartConversationRequest):
     metrics: MetricsSnapshot | None = None
     created_at: datetime = Field(default_factory=utc_now)
     updated_at: datetime = Field(default_factory=utc_now)
+    execution_status: ConversationExecutionStatus | None = Field(
+        default=None,
+        description="Execution status when the metadata was last saved, used to "
+        "list conversations that are not loaded",
+    )
 
 
 class ConversationInfo(ConversationState):
@@ -147,6 +152,21 @@ class Success(BaseModel):
     success: bool = True
 
 
+class FileUploadResult(Success):
+    file_size: int = Field(description="The size of the file after the upload")
+
+
+class FileInfo(BaseModel):
+    path: str = Field(
+        description="The path of the file (Relative to the directory, in a manifest)"
+    )
+    size: int = Field(description="The size of the file in bytes")
+    mtime: float = Field(description="The modification time of the file")
+    sha256: str | None = Field(
+        default=None, description="The SHA-256 of the content, if requested"
+    )
+
+
 class EventPage(OpenHandsModel):
     items: list[Event]
     next_page_id: str | None = None
@@ -238,6 +258,48 @@ class BashOutput(BashEventBase):
     stderr: str | None = Field(
         default=None, description="The error output from the command"
     )
+    stdout_blob: str | None = Field(
+        default=None,
+        description=(
+            "Name of a gzip compressed blob holding standard output that was too "
+            "large to include in events. It follows the stdout of all the events "
+            "of the command, and is available from /api/bash/output_blobs/{name}"
+        ),
+    )
+    stderr_blob: str | None = Field(
+        default=None,
+        description=(
+            "Name of a gzip compressed blob holding error output that was too "
+            "large to include in events. It follows the stderr of all the events "
+            "of the command, and is available from /api/bash/output_blobs/{name}"
+        ),
+    )
+
+
+class BashOutputChunk(BaseModel):
+    """
+    A piece of output streamed while a bash command runs. Chunks are delivered as
+    soon as the process writes them and are not persisted; the final chunk for a
+    command carries its exit code.
+    """
+
+    command_id: OpenHandsUUID
+    stdout: str | None = Field(
+        default=None, description="Standard output written since the last chunk"
+    )
+    stderr: str | None = Field(
+        default=None, description="Error output written since the last chunk"
+    )
+    exit_code: int | None = Field(
+        default=None, description="Exit code None implies the command is still running."
+    )
+
+
+class TrajectoryArchiveFormat(str, Enum):
+    """Enum for trajectory archive formats."""
+
+    ZIP = "zip"
+    TAR_GZ = "tar.gz"
 
 
 class BashEventSortOrder(Enum):
@@ -1,9 +1,15 @@
 import asyncio
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import TypeVar
 from uuid import UUID, uuid4
 
+from pydantic import BaseModel
+
 from openhands.sdk.logger import get_logger
 
 
@@ -11,6 +17,9 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+DEFAULT_MAX_QUEUE_SIZE = 1024
+DEFAULT_CLOSE_TIMEOUT = 5.0
+
 
 class Subscriber[T](ABC):
     @abstractmethod
@@ -21,30 +30,104 @@ class Subscriber[T](ABC):
         """Clean up this subscriber"""
 
 
+class OverflowPolicy(str, Enum):
+    """What to do when a subscriber's queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest queued event."""
+
+    COALESCE = "coalesce"
+    """Replace a queued event with the same coalesce key (e.g. a state update
+    for the same field); otherwise discard the oldest queued event."""
+
+    DISCONNECT = "disconnect"
+    """Close and remove the subscriber."""
+
+    BLOCK = "block"
+    """Never discard events: the queue grows past its size, and publishing
+    waits until the subscriber caught up."""
+
+
+class SubscriberStats(BaseModel):
+    """Delivery metrics for a single subscriber."""
+
+    subscriber_id: UUID
+    queue_size: int
+    max_queue_size: int
+    overflow_policy: OverflowPolicy
+    delivered: int
+    dropped: int
+    coalesced: int
+    lag: float = 0.0
+    """Seconds the oldest queued event has been waiting."""
+
+
+@dataclass
+class _Subscription[T]:
+    subscriber: Subscriber[T]
+    max_queue_size: int
+    overflow_policy: OverflowPolicy
+    # (event, enqueue time) pairs
+    queue: deque[tuple[T, float]] = field(default_factory=deque)
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    # Set when the queue is back within its size, for BLOCK subscribers
+    room: asyncio.Event = field(default_factory=asyncio.Event)
+    drain_task: asyncio.Task | None = None
+    busy: bool = False
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+
+
 @dataclass
 class PubSub[T]:
     """A subscription service that extends ConversationCallbackType functionality.
     This class maintains a dictionary of UUIDs to ConversationCallbackType instances
-    and provides methods to subscribe/unsubscribe callbacks. When invoked, it calls
-    all registered callbacks with proper error handling.
+    and provides methods to subscribe/unsubscribe callbacks.
+
+    Each subscriber has its own bounded queue, drained by its own task, so a
+    slow subscriber only delays itself. When a queue is full the subscriber's
+    overflow policy decides which event is discarded, or whether the subscriber
+    is disconnected. Subscribers default to the BLOCK policy, which never
+    discards events: publishing then waits for subscribers that fell behind.
+    Lossy policies are meant for clients that can resync, like websockets.
     """
 
+    max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE
+    overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK
+    coalesce_key: Callable[[T], Hashable | None] | None = None
     _subscribers: dict[UUID, Subscriber[T]] = field(default_factory=dict)
+    _subscriptions: dict[UUID, _Subscription[T]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
 
-    def subscribe(self, subscriber: Subscriber[T]) -> UUID:
+    def subscribe(
+        self,
+        subscriber: Subscriber[T],
+        overflow_policy: OverflowPolicy | None = None,
+        max_queue_size: int | None = None,
+    ) -> UUID:
         """Subscribe a subscriber and return its UUID for later unsubscription.
         Args:
             subscriber: The callback function to register
+            overflow_policy: Overrides the default overflow policy
+            max_queue_size: Overrides the default queue size
         Returns:
             UUID: UUID that can be used to unsubscribe this callback
         """
         subscriber_id = uuid4()
         self._subscribers[subscriber_id] = subscriber
+        self._subscriptions[subscriber_id] = _Subscription(
+            subscriber=subscriber,
+            max_queue_size=max_queue_size or self.max_queue_size,
+            overflow_policy=overflow_policy or self.overflow_policy,
+        )
         logger.debug(f"Subscribed subscriber with ID: {subscriber_id}")
         return subscriber_id
 
     def unsubscribe(self, subscriber_id: UUID) -> bool:
-        """Unsubscribe a subscriber by its UUID.
+        """Unsubscribe a subscriber by its UUID. Queued events are discarded.
         Args:
             subscriber_id: The UUID returned by subscribe()
         Returns:
@@ -52,6 +135,11 @@ class PubSub[T]:
         """
         if subscriber_id in self._subscribers:
             del self._subscribers[subscriber_id]
+            subscription = self._subscriptions.pop(subscriber_id)
+            if subscription.drain_task is not None:
+                subscription.drain_task.cancel()
+            # Release publishers waiting for this subscriber
+            subscription.room.set()
             logger.debug(f"Unsubscribed subscriber with ID: {subscriber_id}")
             return True
         else:
@@ -61,20 +149,168 @@ class PubSub[T]:
             return False
 
     async def __call__(self, event: T) -> None:
-        """Invoke all registered callbacks with the given event.
-        Each callback is invoked in its own try/catch block to prevent
-        one failing callback from affecting others.
+        """Queue the given event for every registered subscriber.
+        Each subscriber's queue is drained by its own task, which invokes the
+        subscriber in its own try/catch block to prevent one failing subscriber
+        from affecting others.
         Args:
             event: The event to pass to all callbacks
         """
-        for subscriber_id, subscriber in list(self._subscribers.items()):
-            try:
-                await subscriber(event)
-            except Exception as e:
-                logger.error(f"Error in subscriber {subscriber_id}: {e}", exc_info=True)
+        now = time.monotonic()
+        subscriptions = list(self._subscriptions.items())
+        for subscriber_id, subscription in subscriptions:
+            self._enqueue(subscriber_id, subscription, event, now)
+        # The event is queued for everyone before waiting, which keeps ordering
+        for subscriber_id, subscription in subscriptions:
+            await self._wait_for_room(subscriber_id, subscription)
+
+    async def send_to(self, subscriber_id: UUID, event: T) -> bool:
+        """Queue an event for a single subscriber.
+        Returns:
+            bool: False if the subscriber is unknown
+        """
+        subscription = self._subscriptions.get(subscriber_id)
+        if subscription is None:
+            return False
+        self._enqueue(subscriber_id, subscription, event, time.monotonic())
+        await self._wait_for_room(subscriber_id, subscription)
+        return True
+
+    def stats(self) -> list[SubscriberStats]:
+        """Return delivery metrics for every subscriber."""
+        now = time.monotonic()
+        return [
+            SubscriberStats(
+                subscriber_id=subscriber_id,
+                queue_size=len(subscription.queue),
+                max_queue_size=subscription.max_queue_size,
+                overflow_policy=subscription.overflow_policy,
+                delivered=subscription.delivered,
+                dropped=subscription.dropped,
+                coalesced=subscription.coalesced,
+                lag=now - subscription.queue[0][1] if subscription.queue else 0.0,
+            )
+            for subscriber_id, subscription in self._subscriptions.items()
+        ]
+
+    async def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event was delivered.
+        Returns:
+            bool: False if the timeout expired first
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while any(s.queue or s.busy for s in self._subscriptions.values()):
+            if deadline is not None and loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
 
     async def close(self):
+        if not await self.flush(timeout=DEFAULT_CLOSE_TIMEOUT):
+            logger.warning("Closing subscribers with undelivered events")
+        for subscription in self._subscriptions.values():
+            if subscription.drain_task is not None:
+                subscription.drain_task.cancel()
+            subscription.room.set()
         await asyncio.gather(
             *[subscriber.close() for subscriber in self._subscribers.values()]
         )
         self._subscribers.clear()
+        self._subscriptions.clear()
+
+    def _enqueue(
+        self,
+        subscriber_id: UUID,
+        subscription: _Subscription[T],
+        event: T,
+        now: float,
+    ) -> None:
+        if len(subscription.queue) >= subscription.max_queue_size:
+            if not self._handle_overflow(subscriber_id, subscription, event, now):
+                return
+        subscription.queue.append((event, now))
+        subscription.ready.set()
+        if subscription.drain_task is None:
+            subscription.drain_task = asyncio.create_task(
+                self._drain(subscriber_id, subscription)
+            )
+
+    def _handle_overflow(
+        self,
+        subscriber_id: UUID,
+        subscription: _Subscription[T],
+        event: T,
+        now: float,
+    ) -> bool:
+        """Make room for `event` in a full queue.
+        Returns:
+            bool: True if the event should still be appended to the queue
+        """
+        policy = subscription.overflow_policy
+        if policy == OverflowPolicy.BLOCK:
+            return True
+
+        if policy == OverflowPolicy.DISCONNECT:
+            logger.warning(
+                f"Disconnecting subscriber {subscriber_id}: "
+                f"{len(subscription.queue)} events queued"
+            )
+            self.unsubscribe(subscriber_id)
+            task = asyncio.create_task(subscription.subscriber.close())
+            task.add_done_callback(_log_close_error)
+            return False
+
+        if policy == OverflowPolicy.COALESCE and self.coalesce_key is not None:
+            key = self.coalesce_key(event)
+            if key is not None:
+                for i, (queued, _) in enumerate(subscription.queue):
+                    if self.coalesce_key(queued) == key:
+                        # The queued event is superseded; keep its place in line
+                        subscription.queue[i] = (event, now)
+                        subscription.coalesced += 1
+                        return False
+
+        subscription.queue.popleft()
+        subscription.dropped += 1
+        if subscription.dropped == 1 or subscription.dropped % 100 == 0:
+            logger.warning(
+                f"Subscriber {subscriber_id} is lagging: "
+                f"{subscription.dropped} events dropped"
+            )
+        return True
+
+    async def _wait_for_room(
+        self, subscriber_id: UUID, subscription: _Subscription[T]
+    ) -> None:
+        if subscription.overflow_policy != OverflowPolicy.BLOCK:
+            return
+        while (
+            len(subscription.queue) > subscription.max_queue_size
+            and subscriber_id in self._subscriptions
+        ):
+            subscription.room.clear()
+            await subscription.room.wait()
+
+    async def _drain(self, subscriber_id: UUID, subscription: _Subscription[T]):
+        while True:
+            if not subscription.queue:
+                subscription.ready.clear()
+                await subscription.ready.wait()
+                continue
+            event, _ = subscription.queue.popleft()
+            if len(subscription.queue) <= subscription.max_queue_size:
+                subscription.room.set()
+            subscription.busy = True
+            try:
+                await subscription.subscriber(event)
+            except Exception as e:
+                logger.error(f"Error in subscriber {subscriber_id}: {e}", exc_info=True)
+            finally:
+                subscription.busy = False
+            subscription.delivered += 1
+
+
+def _log_close_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Error closing subscriber: {task.exception()}")
@@ -58,7 +58,8 @@ async def events_socket(
         return
 
     subscriber_id = await event_service.subscribe_to_events(
-        _WebSocketSubscriber(websocket)
+        _WebSocketSubscriber(websocket),
+        overflow_policy=config.websocket_overflow_policy,
     )
 
     try:
@@ -112,7 +113,8 @@ async def bash_events_socket(
     await websocket.accept()
     logger.info("Bash Websocket Connected")
     subscriber_id = await bash_event_service.subscribe_to_events(
-        _BashWebSocketSubscriber(websocket)
+        _BashWebSocketSubscriber(websocket),
+        overflow_policy=config.websocket_overflow_policy,
     )
     try:
         # Resend all existing events if requested
@@ -165,6 +167,9 @@ class _WebSocketSubscriber(Subscriber):
     async def __call__(self, event: Event):
         await _send_event(event, self.websocket)
 
+    async def close(self):
+        await _close_websocket(self.websocket)
+
 
 async def _send_bash_event(event: BashEventBase, websocket: WebSocket):
     try:
@@ -182,3 +187,16 @@ class _BashWebSocketSubscriber(Subscriber[BashEventBase]):
 
     async def __call__(self, event: BashEventBase):
         await _send_bash_event(event, self.websocket)
+
+    async def close(self):
+        await _close_websocket(self.websocket)
+
+
+async def _close_websocket(websocket: WebSocket):
+    """Close a websocket whose subscriber was disconnected or shut down. The
+    client is expected to reconnect and resend missed events."""
+    try:
+        await websocket.close(code=1013, reason="Event delivery stopped")
+    except Exception:
+        # Already closed by the client
+        logger.debug("error_closing_websocket", exc_info=True)
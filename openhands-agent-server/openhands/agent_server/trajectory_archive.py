@@ -0,0 +1,96 @@
+"""Streaming archives of conversation trajectories.
+
+Archives are generated on the fly, one member at a time, so a trajectory can be
+downloaded without a temporary file and without holding it in memory. The
+archive holds the files of the conversation's FileStore (base state, metadata),
+and the events as one JSON file each, in the per-file event layout, whichever
+backend stores them. An incremental archive only holds the events after a
+given one.
+"""
+
+import io
+import tarfile
+import time
+import zipfile
+from collections.abc import Buffer, Iterator
+
+from openhands.agent_server.models import TrajectoryArchiveFormat
+from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.persistence_const import (
+    EVENT_FILE_PATTERN,
+    EVENTS_DIR,
+    EVENTS_JOURNAL_DIR,
+)
+from openhands.sdk.io import FileStore
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, unseekable file collecting the bytes written to it."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Buffer) -> int:
+        self._buffer += data
+        return memoryview(data).nbytes
+
+    def take(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def _store_files(fs: FileStore, path: str = "") -> Iterator[str]:
+    """List the files of the FileStore recursively, except events."""
+    for name in sorted(fs.list(path)):
+        if name.endswith("/"):
+            if name.rstrip("/") not in (EVENTS_DIR, EVENTS_JOURNAL_DIR):
+                yield from _store_files(fs, name)
+        else:
+            yield name
+
+
+def iter_trajectory_members(
+    fs: FileStore, events: EventLog, start: int, stop: int
+) -> Iterator[tuple[str, bytes]]:
+    """Yield the (relative path, content) of each file of the trajectory, with
+    the events from index `start` (inclusive) to `stop` (exclusive)."""
+    for name in _store_files(fs):
+        yield name, fs.read(name).encode("utf-8")
+    for idx in range(start, stop):
+        name = EVENT_FILE_PATTERN.format(idx=idx, event_id=events.get_id(idx))
+        yield f"{EVENTS_DIR}/{name}", events.read_event_json(idx).encode("utf-8")
+
+
+def iter_archive(
+    members: Iterator[tuple[str, bytes]],
+    format: TrajectoryArchiveFormat,
+    prefix: str,
+) -> Iterator[bytes]:
+    """Compress the members into an archive, yielding it as it is produced.
+    Member names are put under the `prefix` directory."""
+    sink = _ChunkSink()
+    mtime = time.time()
+    if format == TrajectoryArchiveFormat.ZIP:
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            date_time = time.localtime(mtime)[:6]
+            for name, content in members:
+                info = zipfile.ZipInfo(f"{prefix}/{name}", date_time)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, content)
+                if data := sink.take():
+                    yield data
+    else:
+        with tarfile.open(fileobj=sink, mode="w|gz") as archive:
+            for name, content in members:
+                info = tarfile.TarInfo(f"{prefix}/{name}")
+                info.size = len(content)
+                info.mtime = int(mtime)
+                archive.addfile(info, io.BytesIO(content))
+                if data := sink.take():
+                    yield data
+    if data := sink.take():
+        yield data
@@ -0,0 +1,338 @@
+"""Shared, pooled delivery of webhook payloads.
+
+All webhook subscribers of a ConversationService post through one
+WebhookDispatcher, which owns a single pooled `httpx.AsyncClient`. Payloads are
+delivered by one worker per URL (so events of a conversation arrive in order),
+and the number of requests in flight to each webhook is bounded. Batches that
+queue up behind a slow webhook are merged into larger posts.
+
+Every payload is written to an on-disk outbox before it is queued and removed
+once delivered, so payloads that could not be delivered are retried after a
+restart.
+
+When a webhook keeps failing, its payloads are held and retried on a timer
+with exponential backoff, new payloads queueing up behind them. At most
+`max_failed_payloads_per_destination` payloads are held in memory; beyond
+that they are read back from the outbox when retried, or the oldest are
+dropped if there is no outbox.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import httpx
+
+from openhands.agent_server.config import WebhookSpec
+from openhands.sdk import get_logger
+
+
+logger = get_logger(__name__)
+
+WEBHOOK_TIMEOUT = 30.0
+DEFAULT_MAX_CONCURRENCY_PER_DESTINATION = 4
+# Queued event batches are merged up to this multiple of event_buffer_size
+MAX_BATCH_FACTOR = 4
+DEFAULT_MAX_FAILED_PAYLOADS_PER_DESTINATION = 1000
+DEFAULT_RETRY_BACKOFF = 1.0
+DEFAULT_MAX_RETRY_BACKOFF = 300.0
+
+
+def serialize_event(event: Any) -> bytes:
+    if hasattr(event, "model_dump"):
+        return event.model_dump_json().encode()
+    return json.dumps(event.__dict__).encode()
+
+
+@dataclass
+class _Delivery:
+    spec: WebhookSpec
+    url: str
+    headers: dict[str, str]
+    # Serialized events for mergeable batch posts, otherwise a single body
+    items: list[bytes] | None = None
+    body: bytes | None = None
+    outbox_file: Path | None = None
+
+    @property
+    def payload(self) -> bytes:
+        if self.items is not None:
+            return b"[" + b",".join(self.items) + b"]"
+        assert self.body is not None
+        return self.body
+
+
+@dataclass
+class WebhookDispatcher:
+    """Delivers webhook payloads over a shared connection pool.
+
+    Args:
+        outbox_dir: Directory in which undelivered payloads are persisted, or
+            None to keep them in memory only.
+        session_api_key: Sent as X-Session-API-Key with payloads recovered
+            from the outbox.
+        max_concurrency_per_destination: Maximum number of requests in flight
+            to a single webhook base_url.
+        max_failed_payloads_per_destination: Maximum number of undelivered
+            payloads held in memory per webhook URL.
+        retry_backoff: Delay in seconds before retrying the payloads of a
+            failing webhook, doubled after each failed retry.
+        max_retry_backoff: Maximum delay in seconds between retries.
+    """
+
+    outbox_dir: Path | None = None
+    session_api_key: str | None = None
+    max_concurrency_per_destination: int = DEFAULT_MAX_CONCURRENCY_PER_DESTINATION
+    max_failed_payloads_per_destination: int = (
+        DEFAULT_MAX_FAILED_PAYLOADS_PER_DESTINATION
+    )
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF
+    max_retry_backoff: float = DEFAULT_MAX_RETRY_BACKOFF
+    _client: httpx.AsyncClient | None = field(default=None, init=False)
+    _pending: dict[str, deque[_Delivery]] = field(default_factory=dict, init=False)
+    _failed: dict[str, deque[_Delivery]] = field(default_factory=dict, init=False)
+    # URLs whose failed payloads are only kept in the outbox
+    _spilled: set[str] = field(default_factory=set, init=False)
+    _retries: dict[str, asyncio.Task] = field(default_factory=dict, init=False)
+    _backoff: dict[str, float] = field(default_factory=dict, init=False)
+    _writing: set[Path] = field(default_factory=set, init=False)
+    _workers: dict[str, asyncio.Task] = field(default_factory=dict, init=False)
+    _limits: dict[str, asyncio.Semaphore] = field(default_factory=dict, init=False)
+
+    async def post_events(
+        self,
+        spec: WebhookSpec,
+        url: str,
+        events: Sequence[Any],
+        headers: dict[str, str],
+    ) -> None:
+        """Queue a batch of events for delivery as a JSON array."""
+        items = await asyncio.to_thread(lambda: [serialize_event(e) for e in events])
+        await self._enqueue(_Delivery(spec=spec, url=url, headers=headers, items=items))
+
+    async def post_json(
+        self, spec: WebhookSpec, url: str, body: bytes, headers: dict[str, str]
+    ) -> None:
+        """Queue a single serialized JSON document for delivery."""
+        await self._enqueue(_Delivery(spec=spec, url=url, headers=headers, body=body))
+
+    async def recover(self, specs: Sequence[WebhookSpec]) -> int:
+        """Queue the payloads left in the outbox by a previous run.
+
+        Payloads for webhooks no longer configured are discarded.
+        """
+        if self.outbox_dir is None or not self.outbox_dir.exists():
+            return 0
+        specs_by_url = {spec.base_url: spec for spec in specs}
+        records = await asyncio.to_thread(self._read_outbox)
+        count = 0
+        for outbox_file, record, body in records:
+            spec = specs_by_url.get(record.get("base_url", ""))
+            if spec is None:
+                logger.info(f"Discarding webhook outbox entry {outbox_file.name}")
+                outbox_file.unlink(missing_ok=True)
+                continue
+            delivery = _Delivery(
+                spec=spec,
+                url=record["url"],
+                headers=self._headers(spec),
+                body=body,
+                outbox_file=outbox_file,
+            )
+            self._queue(delivery)
+            count += 1
+        if count:
+            logger.info(f"Recovered {count} undelivered webhook payloads")
+        return count
+
+    async def flush(self) -> None:
+        """Wait until every queued payload was delivered or failed."""
+        while self._workers:
+            await asyncio.gather(*self._workers.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.flush()
+        # Payloads still failing are left in the outbox for the next run
+        for task in self._retries.values():
+            task.cancel()
+        await asyncio.gather(*self._retries.values(), return_exceptions=True)
+        self._retries.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _headers(self, spec: WebhookSpec) -> dict[str, str]:
+        headers = spec.headers.copy()
+        if self.session_api_key:
+            headers["X-Session-API-Key"] = self.session_api_key
+        return headers
+
+    async def _enqueue(self, delivery: _Delivery) -> None:
+        if self.outbox_dir is not None:
+            # Names sort in enqueue order so recovery preserves ordering
+            outbox_file = self.outbox_dir / f"{time.time_ns():020d}-{uuid4().hex}.json"
+            # Retries reading the outbox skip the payloads not queued yet
+            self._writing.add(outbox_file)
+            try:
+                await asyncio.to_thread(self._write_outbox, delivery, outbox_file)
+            finally:
+                self._writing.discard(outbox_file)
+            delivery.outbox_file = outbox_file
+        self._queue(delivery)
+
+    def _queue(self, delivery: _Delivery) -> None:
+        if delivery.url in self._retries:
+            # Queue up behind the payloads waiting for a retry
+            self._hold(delivery.url, [delivery])
+            return
+        pending = self._pending.setdefault(delivery.url, deque())
+        pending.append(delivery)
+        if delivery.url not in self._workers:
+            self._workers[delivery.url] = asyncio.create_task(
+                self._deliver_pending(delivery.url)
+            )
+
+    async def _deliver_pending(self, url: str) -> None:
+        try:
+            pending = self._pending[url]
+            while pending:
+                batch = [pending.popleft()]
+                if batch[0].items is not None:
+                    max_items = batch[0].spec.event_buffer_size * MAX_BATCH_FACTOR
+                    item_count = len(batch[0].items)
+                    while (
+                        pending
+                        and pending[0].items is not None
+                        and item_count + len(pending[0].items) <= max_items
+                    ):
+                        item_count += len(pending[0].items)
+                        batch.append(pending.popleft())
+                if await self._send(batch):
+                    self._backoff.pop(url, None)
+                    for delivery in batch:
+                        if delivery.outbox_file is not None:
+                            delivery.outbox_file.unlink(missing_ok=True)
+                else:
+                    # Keep the payloads (and their outbox files) for a later retry
+                    self._hold(url, [*batch, *pending])
+                    pending.clear()
+                    self._schedule_retry(batch[0])
+        finally:
+            self._pending.pop(url, None)
+            self._workers.pop(url, None)
+
+    def _hold(self, url: str, deliveries: list[_Delivery]) -> None:
+        """Keep undelivered payloads until the next retry of their webhook."""
+        if url in self._spilled:
+            return
+        failed = self._failed.setdefault(url, deque())
+        failed.extend(deliveries)
+        excess = len(failed) - self.max_failed_payloads_per_destination
+        if excess <= 0:
+            return
+        if self.outbox_dir is not None:
+            # Every payload is in the outbox, from which the retry reads them
+            del self._failed[url]
+            self._spilled.add(url)
+        else:
+            for _ in range(excess):
+                failed.popleft()
+            logger.warning(f"Dropped {excess} undelivered webhook payloads for {url}")
+
+    def _schedule_retry(self, template: _Delivery) -> None:
+        url = template.url
+        delay = self._backoff.get(url, self.retry_backoff)
+        self._backoff[url] = min(delay * 2, self.max_retry_backoff)
+        logger.info(f"Retrying webhook payloads for {url} in {delay:.0f}s")
+        self._retries[url] = asyncio.create_task(self._retry(template, delay))
+
+    async def _retry(self, template: _Delivery, delay: float) -> None:
+        url = template.url
+        await asyncio.sleep(delay)
+        deliveries = list(self._failed.pop(url, ()))
+        if url in self._spilled:
+            # Payloads queued while reading the outbox are held in memory
+            self._spilled.discard(url)
+            records = await asyncio.to_thread(self._read_outbox, url)
+            stored = [
+                replace(template, items=None, body=body, outbox_file=outbox_file)
+                for outbox_file, _, body in records
+                if outbox_file not in self._writing
+            ]
+            outbox_files = {delivery.outbox_file for delivery in stored}
+            deliveries = stored + [
+                delivery
+                for delivery in self._failed.pop(url, ())
+                if delivery.outbox_file not in outbox_files
+            ]
+        del self._retries[url]
+        for delivery in deliveries:
+            self._queue(delivery)
+
+    async def _send(self, batch: list[_Delivery]) -> bool:
+        first = batch[0]
+        if len(batch) == 1:
+            payload = first.payload
+        else:
+            payload = b"[" + b",".join(i for d in batch for i in d.items or []) + b"]"
+        headers = httpx.Headers({"Content-Type": "application/json"})
+        headers.update(first.headers)
+        spec = first.spec
+        limit = self._limits.setdefault(
+            spec.base_url, asyncio.Semaphore(self.max_concurrency_per_destination)
+        )
+        for attempt in range(spec.num_retries + 1):
+            try:
+                async with limit:
+                    response = await self._get_client().post(
+                        first.url, content=payload, headers=headers
+                    )
+                response.raise_for_status()
+                logger.debug(f"Successfully posted webhook payload to {first.url}")
+                return True
+            except Exception as e:
+                logger.warning(f"Webhook post attempt {attempt + 1} failed: {e}")
+                if attempt < spec.num_retries:
+                    await asyncio.sleep(spec.retry_delay)
+        logger.error(
+            f"Failed to post to webhook {first.url} "
+            f"after {spec.num_retries + 1} attempts"
+        )
+        return False
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT)
+        return self._client
+
+    def _write_outbox(self, delivery: _Delivery, outbox_file: Path) -> None:
+        outbox_file.parent.mkdir(parents=True, exist_ok=True)
+        # Headers are not persisted; they are rebuilt from the webhook spec
+        record = {"base_url": delivery.spec.base_url, "url": delivery.url}
+        tmp_file = outbox_file.with_suffix(".tmp")
+        tmp_file.write_bytes(json.dumps(record).encode() + b"\n" + delivery.payload)
+        os.replace(tmp_file, outbox_file)
+
+    def _read_outbox(
+        self, url: str | None = None
+    ) -> list[tuple[Path, dict[str, Any], bytes]]:
+        """Read the outbox entries, only those posted to `url` if given."""
+        assert self.outbox_dir is not None
+        records = []
+        for outbox_file in sorted(self.outbox_dir.glob("*.json")):
+            try:
+                with open(outbox_file, "rb") as f:
+                    record = json.loads(f.readline())
+                    if url is not None and record.get("url") != url:
+                        continue
+                    records.append((outbox_file, record, f.read()))
+            except (OSError, ValueError):
+                logger.warning(f"Skipping invalid webhook outbox entry {outbox_file}")
+        return records
@@ -1,4 +1,6 @@
+import asyncio
 import json
+import logging
 
 from pydantic import ValidationError, model_validator
 
@@ -24,6 +26,7 @@ from openhands.sdk.event import (
 )
 from openhands.sdk.event.condenser import Condensation, CondensationRequest
 from openhands.sdk.llm import (
+    LLMResponse,
     Message,
     MessageToolCall,
     ReasoningItemModel,
@@ -124,8 +127,87 @@ class Agent(AgentBase):
         action_events: list[ActionEvent],
         on_event: ConversationCallbackType,
     ):
+        for batch in self._batch_action_events(action_events):
+            if len(batch) == 1:
+                self._execute_action_event(conversation, batch[0], on_event=on_event)
+                continue
+            pool = conversation.tool_call_pool
+            futures = [
+                pool.submit(self._run_tool, conversation, action_event)
+                for action_event in batch
+            ]
+            # Record every observation of the batch before raising a failure
+            error: BaseException | None = None
+            for action_event, future in zip(batch, futures):
+                exc = future.exception()
+                if exc is not None:
+                    error = error or exc
+                    continue
+                self._emit_observation(
+                    conversation, action_event, future.result(), on_event
+                )
+            if error is not None:
+                raise error
+
+    async def _aexecute_actions(
+        self,
+        conversation: LocalConversation,
+        action_events: list[ActionEvent],
+        on_event: ConversationCallbackType,
+    ):
+        """Async counterpart of `_execute_actions`, using the executors'
+        `acall`. The state lock is released while the tools run, and held to
+        emit their observations."""
+        state = conversation.state
+        for batch in self._batch_action_events(action_events):
+            semaphore = asyncio.Semaphore(self.max_parallel_tool_calls)
+
+            async def run(action_event: ActionEvent) -> Observation:
+                async with semaphore:
+                    return await self._arun_tool(conversation, action_event)
+
+            tasks = [asyncio.ensure_future(run(event)) for event in batch]
+            error: BaseException | None = None
+            try:
+                for action_event, task in zip(batch, tasks):
+                    async with state.unlocked():
+                        await asyncio.wait([task])
+                    exc = task.exception()
+                    if exc is not None:
+                        error = error or exc
+                        continue
+                    self._emit_observation(
+                        conversation, action_event, task.result(), on_event
+                    )
+            finally:
+                # Let the rest of the batch finish if this step is cancelled
+                async with state.unlocked():
+                    await asyncio.gather(*tasks, return_exceptions=True)
+            if error is not None:
+                raise error
+
+    def _batch_action_events(
+        self, action_events: list[ActionEvent]
+    ) -> list[list[ActionEvent]]:
+        """Split actions into batches executed one after the other: runs of
+        consecutive parallel-safe actions, executed concurrently, and single
+        other actions."""
+        batches: list[list[ActionEvent]] = []
+        batch_is_parallel = False
         for action_event in action_events:
-            self._execute_action_event(conversation, action_event, on_event=on_event)
+            tool = self.tools_map.get(action_event.tool_name)
+            parallel = (
+                self.max_parallel_tool_calls > 1
+                and tool is not None
+                and action_event.action is not None
+                and tool.is_parallel_safe(action_event.action)
+            )
+            if parallel and batch_is_parallel:
+                batches[-1].append(action_event)
+            else:
+                batches.append([action_event])
+            batch_is_parallel = parallel
+        return batches
 
     @observe(name="agent.step", ignore_inputs=["state", "on_event"])
     def step(
@@ -136,12 +218,8 @@ class Agent(AgentBase):
         state = conversation.state
         # Check for pending actions (implicit confirmation)
         # and execute them before sampling new actions.
-        pending_actions = ConversationState.get_unmatched_actions(state.events)
+        pending_actions = self._get_pending_actions(state)
         if pending_actions:
-            logger.info(
-                "Confirmation mode: Executing %d pending action(s)",
-                len(pending_actions),
-            )
             self._execute_actions(conversation, pending_actions, on_event)
             return
 
@@ -149,34 +227,18 @@ class Agent(AgentBase):
         # opportunity to transform the events. This will either produce a list
         # of events, exactly as expected, or a new condensation that needs to be
         # processed before the agent can sample another action.
-        if self.condenser is not None:
-            view = View.from_events(state.events)
-            condensation_result = self.condenser.condense(view)
-
-            match condensation_result:
-                case View():
-                    llm_convertible_events = condensation_result.events
-
-                case Condensation():
-                    on_event(condensation_result)
-                    return None
-
-        else:
-            llm_convertible_events = [
-                e for e in state.events if isinstance(e, LLMConvertibleEvent)
-            ]
-
-        # Get LLM Response (Action)
-        _messages = LLMConvertibleEvent.events_to_messages(llm_convertible_events)
-        logger.debug(
-            "Sending messages to LLM: "
-            f"{json.dumps([m.model_dump() for m in _messages[1:]], indent=2)}"
+        condensation_result = (
+            self.condenser.condense(state.view) if self.condenser is not None else None
         )
+        messages = self._get_llm_messages(state, condensation_result, on_event)
+        if messages is None:
+            return
 
+        # Get LLM Response (Action)
         try:
             if self.llm.uses_responses_api():
                 llm_response = self.llm.responses(
-                    messages=_messages,
+                    messages=messages,
                     tools=list(self.tools_map.values()),
                     include=None,
                     store=False,
@@ -184,35 +246,168 @@ class Agent(AgentBase):
                 )
             else:
                 llm_response = self.llm.completion(
-                    messages=_messages,
+                    messages=messages,
                     tools=list(self.tools_map.values()),
                     add_security_risk_prediction=True,
                 )
         except FunctionCallValidationError as e:
-            logger.warning(f"LLM generated malformed function call: {e}")
-            error_message = MessageEvent(
-                source="user",
-                llm_message=Message(
-                    role="user",
-                    content=[TextContent(text=str(e))],
-                ),
-            )
-            on_event(error_message)
+            self._on_malformed_function_call(e, on_event)
             return
         except LLMContextWindowExceedError:
-            # If condenser is available and handles requests, trigger condensation
-            if (
-                self.condenser is not None
-                and self.condenser.handles_condensation_requests()
-            ):
-                logger.warning(
-                    "LLM raised context window exceeded error, triggering condensation"
-                )
-                on_event(CondensationRequest())
+            if self._request_condensation(on_event):
                 return
             # No condenser available; re-raise for client handling
             raise
 
+        action_events = self._handle_llm_response(state, llm_response, on_event)
+        if action_events is None:
+            # Actions await user confirmation
+            return
+        if action_events:
+            self._execute_actions(conversation, action_events, on_event)
+        self._emit_token_event(llm_response, on_event)
+
+    @observe(name="agent.step", ignore_inputs=["state", "on_event"])
+    async def astep(
+        self,
+        conversation: LocalConversation,
+        on_event: ConversationCallbackType,
+    ) -> None:
+        """Async counterpart of `step`.
+
+        The LLM is awaited on the event loop via `LLM.acompletion` /
+        `LLM.aresponses`; the condenser and tool executors, which are
+        synchronous, run in worker threads.
+        """
+        state = conversation.state
+        pending_actions = self._get_pending_actions(state)
+        if pending_actions:
+            await self._aexecute_actions(conversation, pending_actions, on_event)
+            return
+
+        condensation_result = None
+        if self.condenser is not None:
+            view = state.view
+            async with state.unlocked():
+                condensation_result = await asyncio.to_thread(
+                    self.condenser.condense, view
+                )
+        messages = self._get_llm_messages(state, condensation_result, on_event)
+        if messages is None:
+            return
+
+        try:
+            # Other coroutines and threads may use the state meanwhile
+            async with state.unlocked():
+                if self.llm.uses_responses_api():
+                    llm_response = await self.llm.aresponses(
+                        messages=messages,
+                        tools=list(self.tools_map.values()),
+                        include=None,
+                        store=False,
+                        add_security_risk_prediction=True,
+                    )
+                else:
+                    llm_response = await self.llm.acompletion(
+                        messages=messages,
+                        tools=list(self.tools_map.values()),
+                        add_security_risk_prediction=True,
+                    )
+        except FunctionCallValidationError as e:
+            self._on_malformed_function_call(e, on_event)
+            return
+        except LLMContextWindowExceedError:
+            if self._request_condensation(on_event):
+                return
+            raise
+
+        action_events = self._handle_llm_response(state, llm_response, on_event)
+        if action_events is None:
+            # Actions await user confirmation
+            return
+        if (
+            action_events
+            and state.execution_status != ConversationExecutionStatus.PAUSED
+        ):
+            await self._aexecute_actions(conversation, action_events, on_event)
+        # Actions of a conversation paused while awaiting the LLM stay pending,
+        # and are executed when it resumes
+        self._emit_token_event(llm_response, on_event)
+
+    def _get_pending_actions(self, state: ConversationState) -> list[ActionEvent]:
+        pending_actions = ConversationState.get_unmatched_actions(state.events)
+        if pending_actions:
+            logger.info(
+                "Confirmation mode: Executing %d pending action(s)",
+                len(pending_actions),
+            )
+        return pending_actions
+
+    def _get_llm_messages(
+        self,
+        state: ConversationState,
+        condensation_result: View | Condensation | None,
+        on_event: ConversationCallbackType,
+    ) -> list[Message] | None:
+        """Return the messages to send to the LLM, or None if a condensation
+        was emitted instead and the step is over."""
+        match condensation_result:
+            case View():
+                llm_convertible_events = condensation_result.events
+
+            case Condensation():
+                on_event(condensation_result)
+                return None
+
+            case _:
+                llm_convertible_events = [
+                    e for e in state.events if isinstance(e, LLMConvertibleEvent)
+                ]
+
+        messages = LLMConvertibleEvent.events_to_messages(llm_convertible_events)
+        if logger.isEnabledFor(logging.DEBUG):
+            # Dumping the whole history is expensive; skip it unless logged
+            logger.debug(
+                "Sending messages to LLM: "
+                f"{json.dumps([m.model_dump() for m in messages[1:]], indent=2)}"
+            )
+        return messages
+
+    def _on_malformed_function_call(
+        self, e: FunctionCallValidationError, on_event: ConversationCallbackType
+    ) -> None:
+        logger.warning(f"LLM generated malformed function call: {e}")
+        error_message = MessageEvent(
+            source="user",
+            llm_message=Message(
+                role="user",
+                content=[TextContent(text=str(e))],
+            ),
+        )
+        on_event(error_message)
+
+    def _request_condensation(self, on_event: ConversationCallbackType) -> bool:
+        """Handle a context window error; False if it should be re-raised."""
+        # If condenser is available and handles requests, trigger condensation
+        if (
+            self.condenser is not None
+            and self.condenser.handles_condensation_requests()
+        ):
+            logger.warning(
+                "LLM raised context window exceeded error, triggering condensation"
+            )
+            on_event(CondensationRequest())
+            return True
+        return False
+
+    def _handle_llm_response(
+        self,
+        state: ConversationState,
+        llm_response: LLMResponse,
+        on_event: ConversationCallbackType,
+    ) -> list[ActionEvent] | None:
+        """Emit the events for an LLM response and return the actions to
+        execute, or None if they await user confirmation."""
         # LLMResponse already contains the converted message and metrics snapshot
         message: Message = llm_response.message
 
@@ -250,21 +445,22 @@ class Agent(AgentBase):
 
             # Handle confirmation mode - exit early if actions need confirmation
             if self._requires_user_confirmation(state, action_events):
-                return
-
-            if action_events:
-                self._execute_actions(conversation, action_events, on_event)
-
-        else:
-            logger.debug("LLM produced a message response - awaits user input")
-            state.execution_status = ConversationExecutionStatus.FINISHED
-            msg_event = MessageEvent(
-                source="agent",
-                llm_message=message,
-                llm_response_id=llm_response.id,
-            )
-            on_event(msg_event)
+                return None
+            return action_events
+
+        logger.debug("LLM produced a message response - awaits user input")
+        state.execution_status = ConversationExecutionStatus.FINISHED
+        msg_event = MessageEvent(
+            source="agent",
+            llm_message=message,
+            llm_response_id=llm_response.id,
+        )
+        on_event(msg_event)
+        return []
 
+    def _emit_token_event(
+        self, llm_response: LLMResponse, on_event: ConversationCallbackType
+    ) -> None:
         # If using VLLM, we can get the raw prompt and response tokens
         # that can be useful for RL training.
         if (
@@ -470,13 +666,23 @@ class Agent(AgentBase):
         It will call the tool's executor and update the state & call callback fn
         with the observation.
         """
-        state = conversation.state
+        observation = self._run_tool(conversation, action_event)
+        return self._emit_observation(conversation, action_event, observation, on_event)
+
+    def _get_tool(self, action_event: ActionEvent):
         tool = self.tools_map.get(action_event.tool_name, None)
         if tool is None:
             raise RuntimeError(
                 f"Tool '{action_event.tool_name}' not found. This should not happen "
                 "as it was checked earlier."
             )
+        return tool
+
+    def _run_tool(
+        self, conversation: LocalConversation, action_event: ActionEvent
+    ) -> Observation:
+        """Call the tool's executor with the action event's action."""
+        tool = self._get_tool(action_event)
 
         # Execute actions!
         if should_enable_observability():
@@ -489,6 +695,37 @@ class Agent(AgentBase):
         assert isinstance(observation, Observation), (
             f"Tool '{tool.name}' executor must return an Observation"
         )
+        return observation
+
+    async def _arun_tool(
+        self, conversation: LocalConversation, action_event: ActionEvent
+    ) -> Observation:
+        """Async counterpart of `_run_tool`."""
+        tool = self._get_tool(action_event)
+
+        if should_enable_observability():
+            tool_name = extract_action_name(action_event)
+            observation: Observation = await observe(name=tool_name, span_type="TOOL")(
+                tool.acall
+            )(action_event.action, conversation)
+        else:
+            observation = await tool.acall(action_event.action, conversation)
+        assert isinstance(observation, Observation), (
+            f"Tool '{tool.name}' executor must return an Observation"
+        )
+        return observation
+
+    def _emit_observation(
+        self,
+        conversation: LocalConversation,
+        action_event: ActionEvent,
+        observation: Observation,
+        on_event: ConversationCallbackType,
+    ) -> ObservationEvent:
+        """Emit the observation of an action event and update the conversation
+        state."""
+        state = conversation.state
+        tool = self._get_tool(action_event)
 
         obs_event = ObservationEvent(
             observation=observation,
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 import sys
@@ -154,6 +155,17 @@ class AgentBase(DiscriminatedUnionMixin, ABC):
         ],
     )
 
+    max_parallel_tool_calls: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Maximum number of tool calls from one LLM response executed "
+            "concurrently. Only consecutive calls whose tools declare them "
+            "parallel-safe run concurrently; observations are emitted in call "
+            "order either way."
+        ),
+    )
+
     # Runtime materialized tools; private and non-serializable
     _tools: dict[str, ToolDefinition] = PrivateAttr(default_factory=dict)
 
@@ -295,6 +307,28 @@ class AgentBase(DiscriminatedUnionMixin, ABC):
         NOTE: state will be mutated in-place.
         """
 
+    async def astep(
+        self,
+        conversation: "LocalConversation",
+        on_event: "ConversationCallbackType",
+    ) -> None:
+        """Async counterpart of `step`, used by `LocalConversation.arun`.
+
+        The default implementation runs `step` in a worker thread, which holds
+        the state lock instead of the event loop thread meanwhile; agents that
+        can await the LLM natively should override it.
+        """
+        async with conversation.state.unlocked():
+            await asyncio.to_thread(self._step_with_lock, conversation, on_event)
+
+    def _step_with_lock(
+        self,
+        conversation: "LocalConversation",
+        on_event: "ConversationCallbackType",
+    ) -> None:
+        with conversation.state:
+            self.step(conversation, on_event)
+
     def resolve_diff_from_deserialized(self, persisted: "AgentBase") -> "AgentBase":
         """
         Return a new AgentBase instance equivalent to `persisted` but with
@@ -1,4 +1,5 @@
-from collections.abc import Sequence
+from collections import Counter
+from collections.abc import Collection, Sequence
 from logging import getLogger
 from typing import overload
 
@@ -168,8 +169,8 @@ class View(BaseModel):
     @staticmethod
     def _should_keep_event(
         event: LLMConvertibleEvent,
-        action_tool_call_ids: set[ToolCallID],
-        observation_tool_call_ids: set[ToolCallID],
+        action_tool_call_ids: Collection[ToolCallID],
+        observation_tool_call_ids: Collection[ToolCallID],
     ) -> bool:
         """Determine if an event should be kept based on tool call matching."""
         if isinstance(event, ObservationBaseEvent):
@@ -241,3 +242,158 @@ class View(BaseModel):
             unhandled_condensation_request=unhandled_condensation_request,
             condensations=condensations,
         )
+
+
+class IncrementalView:
+    """Incrementally maintained equivalent of `View.from_events`.
+
+    `View.from_events` rescans the whole history every time it is called. This
+    class instead consumes events as they are appended and keeps the forgotten
+    ids, batch membership, kept events and tool call pairing up to date, so that
+    applying an event is O(1) amortized and `get_view` only has to materialize
+    the kept events.
+
+    Events must be fed in log order, either one at a time via `append` or by
+    calling `sync` with the full (growing) event sequence.
+    """
+
+    def __init__(self, events: Sequence[Event] | None = None) -> None:
+        self._num_applied: int = 0
+        self._kept: dict[EventID, LLMConvertibleEvent] = {}
+        self._forgotten: set[EventID] = set()
+        self._batches: dict[EventID, list[EventID]] = {}
+        self._event_batch: dict[EventID, EventID] = {}
+        self._forgotten_batches: set[EventID] = set()
+        self._action_tool_call_ids: Counter[ToolCallID] = Counter()
+        self._observation_tool_call_ids: Counter[ToolCallID] = Counter()
+        self._condensations: list[Condensation] = []
+        self._summary_condensation: Condensation | None = None
+        self._summary_event: CondensationSummaryEvent | None = None
+        self._unhandled_condensation_request: bool = False
+        if events is not None:
+            self.sync(events)
+
+    def __len__(self) -> int:
+        """Number of events applied so far."""
+        return self._num_applied
+
+    def sync(self, events: Sequence[Event]) -> None:
+        """Apply any events from `events` that have not been applied yet.
+
+        `events` must be the same append-only sequence previously synced, so only
+        the suffix past the last applied position is read.
+        """
+        if len(events) < self._num_applied:
+            raise ValueError(
+                f"Event sequence shrank from {self._num_applied} to {len(events)} "
+                "events; incremental views only support appends"
+            )
+        for event in events[self._num_applied :]:
+            self.append(event)
+
+    def append(self, event: Event) -> None:
+        """Apply a single event appended to the end of the history."""
+        self._num_applied += 1
+
+        if isinstance(event, Condensation):
+            self._condensations.append(event)
+            self._forget(event.id)
+            for event_id in event.forgotten_event_ids:
+                self._forget(event_id)
+            if event.summary is not None and event.summary_offset is not None:
+                self._summary_condensation = event
+                self._summary_event = None
+            self._unhandled_condensation_request = False
+            return
+
+        if isinstance(event, CondensationRequest):
+            self._forget(event.id)
+            self._unhandled_condensation_request = True
+            return
+
+        if isinstance(event, ActionEvent):
+            batch_id = event.llm_response_id
+            self._batches.setdefault(batch_id, []).append(event.id)
+            self._event_batch[event.id] = batch_id
+            if event.id in self._forgotten:
+                # Forgotten before it was seen: forget the rest of its batch too
+                self._forget_batch(batch_id)
+                return
+            if batch_id in self._forgotten_batches:
+                self._forgotten.add(event.id)
+                return
+
+        if event.id in self._forgotten or not isinstance(event, LLMConvertibleEvent):
+            return
+
+        self._kept[event.id] = event
+        self._count_tool_call(event, 1)
+
+    def get_view(self) -> View:
+        """Return the `View` that `View.from_events` would produce."""
+        kept_events = list(self._kept.values())
+
+        if self._summary_condensation is not None:
+            summary_offset = self._summary_condensation.summary_offset
+            assert summary_offset is not None
+            if self._summary_event is None:
+                summary = self._summary_condensation.summary
+                assert summary is not None
+                self._summary_event = CondensationSummaryEvent(summary=summary)
+            logger.debug(f"Inserting summary at offset {summary_offset}")
+            kept_events.insert(summary_offset, self._summary_event)
+
+        return View(
+            events=[
+                event
+                for event in kept_events
+                if View._should_keep_event(
+                    event,
+                    self._action_tool_call_ids.keys(),
+                    self._observation_tool_call_ids.keys(),
+                )
+            ],
+            unhandled_condensation_request=self._unhandled_condensation_request,
+            condensations=list(self._condensations),
+        )
+
+    def _forget(self, event_id: EventID) -> None:
+        self._forgotten.add(event_id)
+        batch_id = self._event_batch.get(event_id)
+        if batch_id is not None:
+            self._forget_batch(batch_id)
+        else:
+            self._drop(event_id)
+
+    def _forget_batch(self, batch_id: EventID) -> None:
+        """Enforce batch atomicity: forgetting one action forgets its batch."""
+        if batch_id in self._forgotten_batches:
+            return
+        self._forgotten_batches.add(batch_id)
+        batch_event_ids = self._batches[batch_id]
+        logger.debug(
+            f"Enforcing batch atomicity: forgetting entire batch "
+            f"with llm_response_id={batch_id} "
+            f"({len(batch_event_ids)} events)"
+        )
+        for event_id in batch_event_ids:
+            self._forgotten.add(event_id)
+            self._drop(event_id)
+
+    def _drop(self, event_id: EventID) -> None:
+        event = self._kept.pop(event_id, None)
+        if event is not None:
+            self._count_tool_call(event, -1)
+
+    def _count_tool_call(self, event: LLMConvertibleEvent, delta: int) -> None:
+        if isinstance(event, ActionEvent):
+            counter = self._action_tool_call_ids
+        elif isinstance(event, ObservationBaseEvent):
+            counter = self._observation_tool_call_ids
+        else:
+            return
+        if event.tool_call_id is None:
+            return
+        counter[event.tool_call_id] += delta
+        if counter[event.tool_call_id] <= 0:
+            del counter[event.tool_call_id]
@@ -0,0 +1,303 @@
+"""Segmented, append-only journal backend for EventLog.
+
+Instead of one JSON file per event, events are appended to rolling segment
+files as length-prefixed JSON lines (``b"<length> <json>\\n"``). A compact
+sidecar index records, for every event, the segment, payload offset, payload
+length and event id, so opening a conversation reads a single index file
+instead of listing and parsing thousands of file names, and any event can be
+read with one seek.
+"""
+
+import json
+import os
+import struct
+from array import array
+
+from openhands.sdk.conversation.event_store import (
+    DEFAULT_EVENT_CACHE_MAX_BYTES,
+    EventLog,
+)
+from openhands.sdk.conversation.persistence_const import (
+    EVENTS_DIR,
+    EVENTS_JOURNAL_DIR,
+    JOURNAL_INDEX_FILE,
+    JOURNAL_SEGMENT_PATTERN,
+    JOURNAL_SEGMENT_RE,
+)
+from openhands.sdk.event import EventID
+from openhands.sdk.io import LocalFileStore
+from openhands.sdk.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_FSYNC_BATCH_SIZE = 32
+
+# segment number, payload offset, payload length, event id length (+ id bytes)
+_INDEX_ENTRY = struct.Struct("<IQIH")
+
+
+class JournalEventLog(EventLog):
+    """EventLog persisted as a segmented append-only journal.
+
+    Records are written with ``O_APPEND`` so they reach the OS on every append;
+    ``fsync`` is batched every ``fsync_batch_size`` events (and whenever a
+    segment is sealed or ``flush`` is called). On open, entries pointing past
+    the end of their segment are dropped, and records that made it into the
+    last segment without an index entry are recovered.
+
+    If the journal is empty and per-file events exist under ``legacy_dir``,
+    they are imported on open so existing conversations keep their history.
+    The legacy files are left untouched.
+    """
+
+    _root: str
+    _segment_max_bytes: int
+    _fsync_batch_size: int
+    _current_segment: int
+    _current_segment_size: int
+    _unsynced_count: int
+
+    def __init__(
+        self,
+        fs: LocalFileStore,
+        dir_path: str = EVENTS_JOURNAL_DIR,
+        cache_max_bytes: int = DEFAULT_EVENT_CACHE_MAX_BYTES,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        fsync_batch_size: int = DEFAULT_FSYNC_BATCH_SIZE,
+        legacy_dir: str | None = EVENTS_DIR,
+    ) -> None:
+        """Open or create a journal under ``dir_path`` inside ``fs``.
+
+        Args:
+            fs: Local file store; the journal needs real files to append to.
+            dir_path: Directory inside ``fs`` holding segments and the index.
+            cache_max_bytes: Memory budget for deserialized events.
+            segment_max_bytes: Size after which a new segment file is started.
+            fsync_batch_size: Number of appended events between fsyncs.
+            legacy_dir: Directory of per-file events to import when the journal
+                is empty, or None to skip migration.
+        """
+        self._root = fs.get_full_path(dir_path)
+        os.makedirs(self._root, exist_ok=True)
+        self._segment_max_bytes = segment_max_bytes
+        self._fsync_batch_size = max(1, fsync_batch_size)
+        self._legacy_dir = legacy_dir
+        self._segments = array("I")
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._current_segment = 0
+        self._current_segment_size = 0
+        self._unsynced: set[str] = set()
+        self._unsynced_count = 0
+        super().__init__(fs, dir_path=dir_path, cache_max_bytes=cache_max_bytes)
+
+    def flush(self) -> None:
+        """Fsync every segment and index write since the last flush."""
+        for path in self._unsynced:
+            fd = os.open(path, os.O_WRONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        self._unsynced.clear()
+        self._unsynced_count = 0
+
+    # ===== EventLog storage hooks =====
+    def _read_event_text(self, idx: int) -> str:
+        with open(self._segment_path(self._segments[idx]), "rb") as f:
+            f.seek(self._offsets[idx])
+            return f.read(self._lengths[idx]).decode("utf-8")
+
+    def _write_event_text(
+        self,
+        idx: int,  # noqa: ARG002
+        event_id: EventID,
+        payload: str,
+    ) -> None:
+        self._append_record(event_id, payload.encode("utf-8"))
+
+    def _scan_and_build_index(self) -> int:
+        event_ids = self._load_index()
+        event_ids.extend(self._recover_unindexed_records())
+        if not event_ids and self._legacy_dir is not None:
+            event_ids = self._import_legacy_events(self._legacy_dir)
+
+        self._id_to_idx.clear()
+        self._idx_to_id.clear()
+        for i, evt_id in enumerate(event_ids):
+            self._idx_to_id[i] = evt_id
+            if evt_id in self._id_to_idx:
+                logger.warning(
+                    f"Duplicate event ID '{evt_id}' found in journal. "
+                    f"Keeping first occurrence at index {self._id_to_idx[evt_id]}, "
+                    f"ignoring duplicate at index {i}"
+                )
+            else:
+                self._id_to_idx[evt_id] = i
+        return len(event_ids)
+
+    # ===== Journal internals =====
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self._root, JOURNAL_INDEX_FILE)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self._root, JOURNAL_SEGMENT_PATTERN.format(segment=segment))
+
+    def _append_bytes(self, path: str, data: bytes) -> None:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        self._unsynced.add(path)
+
+    def _append_record(self, event_id: EventID, data: bytes) -> None:
+        prefix = b"%d " % len(data)
+        record_size = len(prefix) + len(data) + 1
+        if (
+            self._current_segment_size > 0
+            and self._current_segment_size + record_size > self._segment_max_bytes
+        ):
+            # Seal the full segment durably before rolling over
+            self.flush()
+            self._current_segment += 1
+            self._current_segment_size = 0
+
+        offset = self._current_segment_size + len(prefix)
+        self._append_bytes(
+            self._segment_path(self._current_segment), prefix + data + b"\n"
+        )
+        self._current_segment_size += record_size
+        self._index_entry(self._current_segment, offset, len(data), event_id)
+
+        self._unsynced_count += 1
+        if self._unsynced_count >= self._fsync_batch_size:
+            self.flush()
+
+    def _index_entry(
+        self, segment: int, offset: int, length: int, event_id: EventID
+    ) -> None:
+        id_bytes = event_id.encode("utf-8")
+        self._append_bytes(
+            self._index_path,
+            _INDEX_ENTRY.pack(segment, offset, length, len(id_bytes)) + id_bytes,
+        )
+        self._segments.append(segment)
+        self._offsets.append(offset)
+        self._lengths.append(length)
+
+    def _load_index(self) -> list[EventID]:
+        try:
+            with open(self._index_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+
+        segment_sizes: dict[int, int] = {}
+        event_ids: list[EventID] = []
+        pos = 0
+        while pos + _INDEX_ENTRY.size <= len(data):
+            segment, offset, length, id_len = _INDEX_ENTRY.unpack_from(data, pos)
+            end = pos + _INDEX_ENTRY.size + id_len
+            if end > len(data):
+                break
+            if segment not in segment_sizes:
+                try:
+                    segment_sizes[segment] = os.path.getsize(
+                        self._segment_path(segment)
+                    )
+                except FileNotFoundError:
+                    segment_sizes[segment] = 0
+            if offset + length + 1 > segment_sizes[segment]:
+                # The record this entry points to never reached disk
+                break
+            event_ids.append(data[pos + _INDEX_ENTRY.size : end].decode("utf-8"))
+            self._segments.append(segment)
+            self._offsets.append(offset)
+            self._lengths.append(length)
+            pos = end
+
+        if pos < len(data):
+            logger.warning(
+                f"Truncating event journal index {self._index_path} "
+                f"from {len(data)} to {pos} bytes"
+            )
+            os.truncate(self._index_path, pos)
+        return event_ids
+
+    def _recover_unindexed_records(self) -> list[EventID]:
+        """Index complete records written after the last index entry."""
+        segments = sorted(
+            int(m.group("segment"))
+            for name in os.listdir(self._root)
+            if (m := JOURNAL_SEGMENT_RE.match(name))
+        )
+        if len(self._segments):
+            start_segment = self._segments[-1]
+            start_pos = self._offsets[-1] + self._lengths[-1] + 1
+        else:
+            start_segment, start_pos = 0, 0
+
+        recovered: list[EventID] = []
+        self._current_segment = start_segment
+        self._current_segment_size = start_pos
+        for segment in segments:
+            if segment < start_segment:
+                continue
+            path = self._segment_path(segment)
+            base = start_pos if segment == start_segment else 0
+            with open(path, "rb") as f:
+                f.seek(base)
+                data = f.read()
+
+            pos = 0
+            while True:
+                space = data.find(b" ", pos, pos + 21)
+                if space == -1:
+                    break
+                try:
+                    length = int(data[pos:space])
+                    end = space + 1 + length
+                    if data[end : end + 1] != b"\n":
+                        break
+                    event_id = json.loads(data[space + 1 : end])["id"]
+                except (ValueError, KeyError, TypeError):
+                    break
+                self._index_entry(segment, base + space + 1, length, event_id)
+                recovered.append(event_id)
+                pos = space + 2 + length
+
+            if pos < len(data):
+                logger.warning(
+                    f"Truncating torn record at offset {base + pos} in {path}"
+                )
+                os.truncate(path, base + pos)
+            self._current_segment = segment
+            self._current_segment_size = base + pos
+
+        if recovered:
+            logger.info(f"Recovered {len(recovered)} unindexed journal records")
+            self.flush()
+        return recovered
+
+    def _import_legacy_events(self, legacy_dir: str) -> list[EventID]:
+        """Copy per-file events from ``legacy_dir`` into the journal."""
+        legacy = EventLog(self._fs, dir_path=legacy_dir, cache_max_bytes=0)
+        event_ids: list[EventID] = []
+        for i in range(len(legacy)):
+            event_id = legacy.get_id(i)
+            self._append_record(event_id, legacy._read_event_text(i).encode("utf-8"))
+            event_ids.append(event_id)
+        if event_ids:
+            self.flush()
+            logger.info(
+                f"Migrated {len(event_ids)} events from {legacy_dir} "
+                f"into event journal {self._root}"
+            )
+        return event_ids
@@ -1,5 +1,8 @@
 # state.py
+import heapq
 import operator
+import threading
+from collections import OrderedDict
 from collections.abc import Iterator
 from typing import SupportsIndex, overload
 
@@ -16,17 +19,116 @@ from openhands.sdk.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Default memory budget for deserialized events kept by EventLog. Sizes are
+# estimated from the length of each event's JSON payload.
+DEFAULT_EVENT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _EventCache:
+    """Bounded LRU cache of deserialized events keyed by their log index.
+
+    Events are immutable once appended, so cached entries never need to be
+    invalidated; they are only evicted when the memory budget is exceeded.
+    The least recently used entries go first, which for an append-only log
+    is the cold prefix of the conversation. Sequential scans instead admit
+    events by recency, evicting the earliest positions, so that scanning a
+    history larger than the budget leaves its most recent part cached.
+    """
+
+    _max_bytes: int
+    _size: int
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max(0, max_bytes)
+        self._entries: OrderedDict[int, tuple[Event, int]] = OrderedDict()
+        # Min-heap of the cached positions, with stale entries skipped lazily
+        self._positions: list[int] = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, idx: int) -> Event | None:
+        with self._lock:
+            entry = self._entries.get(idx)
+            if entry is None:
+                return None
+            self._entries.move_to_end(idx)
+            return entry[0]
+
+    def put(self, idx: int, event: Event, size: int, *, evict: bool = True) -> None:
+        """Insert an event, evicting least recently used entries if needed.
+
+        With ``evict=False`` only entries at earlier positions are evicted to
+        make room, and the event is not admitted if that is not enough.
+        Sequential scans use this so that a full pass over a history larger
+        than the budget keeps its most recent events rather than the oldest.
+        """
+        with self._lock:
+            if idx in self._entries or size > self._max_bytes:
+                return
+            if not evict:
+                while self._size + size > self._max_bytes:
+                    if not self._evict_earliest(before=idx):
+                        return
+            self._entries[idx] = (event, size)
+            heapq.heappush(self._positions, idx)
+            self._size += size
+            while self._size > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+            if len(self._positions) > 2 * len(self._entries) + 64:
+                self._positions = list(self._entries)
+                heapq.heapify(self._positions)
+
+    def _evict_earliest(self, before: int) -> bool:
+        """Evict the entry at the earliest position, if before ``before``."""
+        while self._positions:
+            idx = self._positions[0]
+            if idx not in self._entries:
+                heapq.heappop(self._positions)
+                continue
+            if idx >= before:
+                return False
+            heapq.heappop(self._positions)
+            _, size = self._entries.pop(idx)
+            self._size -= size
+            return True
+        return False
+
 
 class EventLog(EventsListBase):
     _fs: FileStore
     _dir: str
     _length: int
+    _cache: _EventCache
 
-    def __init__(self, fs: FileStore, dir_path: str = EVENTS_DIR) -> None:
+    def __init__(
+        self,
+        fs: FileStore,
+        dir_path: str = EVENTS_DIR,
+        cache_max_bytes: int = DEFAULT_EVENT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Create an event log backed by ``fs``.
+
+        Args:
+            fs: File store holding one JSON file per event.
+            dir_path: Directory inside ``fs`` where event files live.
+            cache_max_bytes: Memory budget for deserialized events kept in
+                memory. Appended events are written through to the cache, so
+                repeated history scans only hit storage for evicted events.
+                Use 0 to disable caching.
+        """
         self._fs = fs
         self._dir = dir_path
         self._id_to_idx: dict[EventID, int] = {}
         self._idx_to_id: dict[int, EventID] = {}
+        self._cache = _EventCache(cache_max_bytes)
         self._length = self._scan_and_build_index()
 
     def get_index(self, event_id: EventID) -> int:
@@ -63,17 +165,35 @@ class EventLog(EventsListBase):
             i += self._length
         if i < 0 or i >= self._length:
             raise IndexError("Event index out of range")
-        txt = self._fs.read(self._path(i))
+        cached = self._cache.get(i)
+        if cached is not None:
+            return cached
+        txt = self._read_event_text(i)
         if not txt:
             raise FileNotFoundError(f"Missing event file: {self._path(i)}")
-        return Event.model_validate_json(txt)
+        evt = Event.model_validate_json(txt)
+        self._cache.put(i, evt, len(txt))
+        return evt
+
+    def read_event_json(self, idx: int) -> str:
+        """Return the stored JSON of the event at ``idx``, without deserializing
+        or caching it. Safe to call from another thread for events already
+        appended."""
+        if idx < 0 or idx >= self._length:
+            raise IndexError("Event index out of range")
+        return self._read_event_text(idx)
 
     def __iter__(self) -> Iterator[Event]:
         for i in range(self._length):
-            txt = self._fs.read(self._path(i))
+            cached = self._cache.get(i)
+            if cached is not None:
+                yield cached
+                continue
+            txt = self._read_event_text(i)
             if not txt:
                 continue
             evt = Event.model_validate_json(txt)
+            self._cache.put(i, evt, len(txt), evict=False)
             evt_id = evt.id
             # only backfill mapping if missing
             if i not in self._idx_to_id:
@@ -90,8 +210,9 @@ class EventLog(EventsListBase):
                 f"Event with ID '{evt_id}' already exists at index {existing_idx}"
             )
 
-        path = self._path(self._length, event_id=evt_id)
-        self._fs.write(path, event.model_dump_json(exclude_none=True))
+        payload = event.model_dump_json(exclude_none=True)
+        self._write_event_text(self._length, evt_id, payload)
+        self._cache.put(self._length, event, len(payload))
         self._idx_to_id[self._length] = evt_id
         self._id_to_idx[evt_id] = self._length
         self._length += 1
@@ -99,6 +220,17 @@ class EventLog(EventsListBase):
     def __len__(self) -> int:
         return self._length
 
+    def flush(self) -> None:
+        """Make appended events durable. Per-file writes are not buffered."""
+
+    def _read_event_text(self, idx: int) -> str:
+        """Read the serialized event stored at ``idx``."""
+        return self._fs.read(self._path(idx))
+
+    def _write_event_text(self, idx: int, event_id: EventID, payload: str) -> None:
+        """Persist the serialized event that will live at ``idx``."""
+        self._fs.write(self._path(idx, event_id=event_id), payload)
+
     def _path(self, idx: int, *, event_id: EventID | None = None) -> str:
         return f"{self._dir}/{
             EVENT_FILE_PATTERN.format(
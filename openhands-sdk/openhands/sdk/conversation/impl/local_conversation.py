@@ -1,6 +1,8 @@
+import asyncio
 import atexit
 import uuid
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from openhands.sdk.agent.base import AgentBase
@@ -48,6 +50,8 @@ class LocalConversation(BaseConversation):
     _stuck_detector: StuckDetector | None
     llm_registry: LLMRegistry
     _cleanup_initiated: bool
+    _arun_lock: asyncio.Lock
+    _tool_call_pool: ThreadPoolExecutor | None
 
     def __init__(
         self,
@@ -62,6 +66,8 @@ class LocalConversation(BaseConversation):
             type[ConversationVisualizerBase] | ConversationVisualizerBase | None
         ) = DefaultConversationVisualizer,
         secrets: Mapping[str, SecretValue] | None = None,
+        event_journal: bool = False,
+        delta_state: bool = False,
         **_: object,
     ):
         """Initialize the conversation.
@@ -83,11 +89,16 @@ class LocalConversation(BaseConversation):
                        - ConversationVisualizerBase instance: Use custom visualizer
                        - None: No visualization
             stuck_detection: Whether to enable stuck detection
+            event_journal: Store events in a segmented append-only journal
+                instead of one file per event (requires persistence_dir)
+            delta_state: Persist the state fields which change during a run
+                apart from the agent spec, saving them once per step
         """
         super().__init__()  # Initialize with span tracking
         # Mark cleanup as initiated as early as possible to avoid races or partially
         # initialized instances during interpreter shutdown.
         self._cleanup_initiated = False
+        self._tool_call_pool = None
 
         self.agent = agent
         if isinstance(workspace, (str, Path)):
@@ -112,6 +123,8 @@ class LocalConversation(BaseConversation):
             else None,
             max_iterations=max_iteration_per_run,
             stuck_detection=stuck_detection,
+            event_journal=event_journal,
+            delta_state=delta_state,
         )
 
         # Default callback: persist every event to state
@@ -142,6 +155,7 @@ class LocalConversation(BaseConversation):
 
         self._on_event = BaseConversation.compose_callbacks(composed_list)
         self.max_iteration_per_run = max_iteration_per_run
+        self._arun_lock = asyncio.Lock()
 
         # Initialize stuck detector
         self._stuck_detector = StuckDetector(self._state) if stuck_detection else None
@@ -259,85 +273,133 @@ class LocalConversation(BaseConversation):
 
         Can be paused between steps
         """
-
-        with self._state:
-            if self._state.execution_status in [
-                ConversationExecutionStatus.IDLE,
-                ConversationExecutionStatus.PAUSED,
-                ConversationExecutionStatus.ERROR,
-            ]:
-                self._state.execution_status = ConversationExecutionStatus.RUNNING
-
+        self._start_run()
         iteration = 0
         try:
             while True:
                 logger.debug(f"Conversation run iteration {iteration}")
-                with self._state:
+                with self._state, self._state.deferred_persistence():
                     # Pause attempts to acquire the state lock
                     # Before value can be modified step can be taken
                     # Ensure step conditions are checked when lock is already acquired
-                    if self._state.execution_status in [
-                        ConversationExecutionStatus.FINISHED,
-                        ConversationExecutionStatus.PAUSED,
-                        ConversationExecutionStatus.STUCK,
-                    ]:
+                    if not self._ready_for_step():
                         break
 
-                    # Check for stuck patterns if enabled
-                    if self._stuck_detector:
-                        is_stuck = self._stuck_detector.is_stuck()
-
-                        if is_stuck:
-                            logger.warning("Stuck pattern detected.")
-                            self._state.execution_status = (
-                                ConversationExecutionStatus.STUCK
-                            )
-                            continue
-
-                    # clear the flag before calling agent.step() (user approved)
-                    if (
-                        self._state.execution_status
-                        == ConversationExecutionStatus.WAITING_FOR_CONFIRMATION
-                    ):
-                        self._state.execution_status = (
-                            ConversationExecutionStatus.RUNNING
-                        )
-
                     # step must mutate the SAME state object
                     self.agent.step(self, on_event=self._on_event)
                     iteration += 1
 
-                    # Check for non-finished terminal conditions
-                    # Note: We intentionally do NOT check for FINISHED status here.
-                    # This allows concurrent user messages to be processed:
-                    # 1. Agent finishes and sets status to FINISHED
-                    # 2. User sends message concurrently via send_message()
-                    # 3. send_message() waits for FIFO lock, then sets status to IDLE
-                    # 4. Run loop continues to next iteration and processes the message
-                    # 5. Without this design, concurrent messages would be lost
-                    if (
-                        self.state.execution_status
-                        == ConversationExecutionStatus.WAITING_FOR_CONFIRMATION
-                        or iteration >= self.max_iteration_per_run
-                    ):
+                    if self._should_stop_after_step(iteration):
                         break
         except Exception as e:
-            self._state.execution_status = ConversationExecutionStatus.ERROR
-
-            # Add an error event
-            self._on_event(
-                ConversationErrorEvent(
-                    source="environment",
-                    code=e.__class__.__name__,
-                    detail=str(e),
-                )
-            )
-
             # Re-raise with conversation id for better UX; include original traceback
-            raise ConversationRunError(self._state.id, e) from e
+            raise self._run_error(e) from e
         finally:
             self._end_observability_span()
 
+    @observe(name="conversation.run")
+    async def arun(self) -> None:
+        """Async counterpart of `run`, driving the agent with `AgentBase.astep`.
+
+        The agent awaits the LLM on the event loop instead of holding a thread,
+        so a single event loop can drive many conversations concurrently. The
+        state lock is taken without blocking the event loop, and held by the
+        event loop thread during each step, like `run` holds it in its own
+        thread, except while the step awaits (the LLM, the condenser or
+        tools): the lock does not exclude other coroutines of the same thread,
+        so it is released then and `pause` or `send_message` may take effect
+        in the middle of a step. Actions returned by the LLM after a pause are
+        left pending until the conversation resumes. Concurrent `arun` calls
+        on the same conversation are serialized.
+        """
+        async with self._arun_lock:
+            async with self._state.alocked():
+                self._start_run()
+            iteration = 0
+            try:
+                while True:
+                    logger.debug(f"Conversation arun iteration {iteration}")
+                    async with self._state.alocked():
+                        with self._state.deferred_persistence():
+                            if not self._ready_for_step():
+                                break
+
+                            await self.agent.astep(self, on_event=self._on_event)
+                            iteration += 1
+
+                            if self._should_stop_after_step(iteration):
+                                break
+            except Exception as e:
+                raise self._run_error(e) from e
+            finally:
+                self._end_observability_span()
+
+    def _start_run(self) -> None:
+        with self._state:
+            if self._state.execution_status in [
+                ConversationExecutionStatus.IDLE,
+                ConversationExecutionStatus.PAUSED,
+                ConversationExecutionStatus.ERROR,
+            ]:
+                self._state.execution_status = ConversationExecutionStatus.RUNNING
+
+    def _ready_for_step(self) -> bool:
+        """Check whether the run loop should take another step.
+
+        Must be called with the state lock held.
+        """
+        if self._state.execution_status in [
+            ConversationExecutionStatus.FINISHED,
+            ConversationExecutionStatus.PAUSED,
+            ConversationExecutionStatus.STUCK,
+        ]:
+            return False
+
+        # Check for stuck patterns if enabled
+        if self._stuck_detector:
+            is_stuck = self._stuck_detector.is_stuck()
+
+            if is_stuck:
+                logger.warning("Stuck pattern detected.")
+                self._state.execution_status = ConversationExecutionStatus.STUCK
+                return False
+
+        # clear the flag before calling agent.step() (user approved)
+        if (
+            self._state.execution_status
+            == ConversationExecutionStatus.WAITING_FOR_CONFIRMATION
+        ):
+            self._state.execution_status = ConversationExecutionStatus.RUNNING
+        return True
+
+    def _should_stop_after_step(self, iteration: int) -> bool:
+        # Check for non-finished terminal conditions
+        # Note: We intentionally do NOT check for FINISHED status here.
+        # This allows concurrent user messages to be processed:
+        # 1. Agent finishes and sets status to FINISHED
+        # 2. User sends message concurrently via send_message()
+        # 3. send_message() waits for FIFO lock, then sets status to IDLE
+        # 4. Run loop continues to next iteration and processes the message
+        # 5. Without this design, concurrent messages would be lost
+        return (
+            self.state.execution_status
+            == ConversationExecutionStatus.WAITING_FOR_CONFIRMATION
+            or iteration >= self.max_iteration_per_run
+        )
+
+    def _run_error(self, e: Exception) -> ConversationRunError:
+        self._state.execution_status = ConversationExecutionStatus.ERROR
+
+        # Add an error event
+        self._on_event(
+            ConversationErrorEvent(
+                source="environment",
+                code=e.__class__.__name__,
+                detail=str(e),
+            )
+        )
+        return ConversationRunError(self._state.id, e)
+
     def set_confirmation_policy(self, policy: ConfirmationPolicyBase) -> None:
         """Set the confirmation policy and store it in conversation state."""
         with self._state:
@@ -418,6 +480,17 @@ class LocalConversation(BaseConversation):
         with self._state:
             self._state.security_analyzer = analyzer
 
+    @property
+    def tool_call_pool(self) -> ThreadPoolExecutor:
+        """Worker threads running parallel-safe tool calls, shared by all steps
+        of the conversation and shut down when it is closed."""
+        if self._tool_call_pool is None:
+            self._tool_call_pool = ThreadPoolExecutor(
+                max_workers=self.agent.max_parallel_tool_calls,
+                thread_name_prefix="tool-call",
+            )
+        return self._tool_call_pool
+
     def close(self) -> None:
         """Close the conversation and clean up all tool executors."""
         if self._cleanup_initiated:
@@ -429,6 +502,15 @@ class LocalConversation(BaseConversation):
         except AttributeError:
             # Object may be partially constructed; span fields may be missing.
             pass
+        try:
+            self._state.events.flush()
+        except AttributeError:
+            pass
+        except Exception as e:
+            logger.warning(f"Error flushing conversation events: {e}")
+        pool = getattr(self, "_tool_call_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
         for tool in self.agent.tools_map.values():
             try:
                 executable_tool = tool.as_executable()
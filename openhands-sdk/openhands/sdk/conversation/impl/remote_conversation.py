@@ -2,7 +2,8 @@ import asyncio
 import json
 import threading
 import uuid
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from pathlib import Path
 from typing import SupportsIndex, overload
 from urllib.parse import urlparse
 
@@ -72,12 +73,17 @@ def _send_request(
 
 
 class WebSocketCallbackClient:
-    """Minimal WS client: connects, forwards events, retries on error."""
+    """Minimal WS client: connects, forwards events, retries on error.
+
+    `on_connect` is called on every (re)connection, before any event is
+    forwarded, so events missed while disconnected can be fetched first.
+    """
 
     host: str
     conversation_id: str
     callback: ConversationCallbackType
     api_key: str | None
+    on_connect: Callable[[], None] | None
     _thread: threading.Thread | None
     _stop: threading.Event
 
@@ -87,11 +93,13 @@ class WebSocketCallbackClient:
         conversation_id: str,
         callback: ConversationCallbackType,
         api_key: str | None = None,
+        on_connect: Callable[[], None] | None = None,
     ):
         self.host = host
         self.conversation_id = conversation_id
         self.callback = callback
         self.api_key = api_key
+        self.on_connect = on_connect
         self._thread = None
         self._stop = threading.Event()
 
@@ -134,6 +142,11 @@ class WebSocketCallbackClient:
             try:
                 async with websockets.connect(ws_url) as ws:
                     delay = 1.0
+                    if self.on_connect:
+                        try:
+                            self.on_connect()
+                        except Exception:
+                            logger.exception("ws_on_connect_error", stack_info=True)
                     async for message in ws:
                         if self._stop.is_set():
                             break
@@ -156,7 +169,14 @@ class RemoteEventsList(EventsListBase):
     """A list-like, read-only view of remote conversation events.
 
     On first access it fetches existing events from the server. Afterwards,
-    it relies on the WebSocket stream to incrementally append new events.
+    it relies on the WebSocket stream to incrementally append new events, and
+    `sync` fetches the events after the last one known (e.g. on reconnection).
+
+    With a `cache_dir`, events are also appended to a JSONL file named after
+    the conversation, and only the events after the cached ones are fetched
+    when attaching again. With `lazy`, only the most recent page of events is
+    fetched up front, and older events are fetched a page at a time when they
+    are first accessed.
     """
 
     _client: httpx.Client
@@ -164,45 +184,177 @@ class RemoteEventsList(EventsListBase):
     _cached_events: list[Event]
     _cached_event_ids: set[str]
     _lock: threading.RLock
+    _cache_path: Path | None
+    _lazy: bool
+    _unloaded_count: int
+    _older_page_id: str | None
 
-    def __init__(self, client: httpx.Client, conversation_id: str):
+    def __init__(
+        self,
+        client: httpx.Client,
+        conversation_id: str,
+        cache_dir: str | Path | None = None,
+        lazy: bool = False,
+    ):
         self._client = client
         self._conversation_id = conversation_id
         self._cached_events: list[Event] = []
         self._cached_event_ids: set[str] = set()
         self._lock = threading.RLock()
+        self._cache_path = (
+            Path(cache_dir) / f"{conversation_id}.jsonl" if cache_dir else None
+        )
+        self._lazy = lazy
+        # Number of events before the first cached one, not fetched yet
+        self._unloaded_count = 0
+        self._older_page_id = None
+        self._load_cache()
         # Initial fetch to sync existing events
-        self._do_full_sync()
+        if self._cached_events or not lazy:
+            self.sync()
+        else:
+            self._load_latest_page()
 
-    def _do_full_sync(self) -> None:
-        """Perform a full sync with the remote API."""
-        logger.debug(f"Performing full sync for conversation {self._conversation_id}")
+    @property
+    def _events_url(self) -> str:
+        return f"/api/conversations/{self._conversation_id}/events"
 
-        events = []
-        page_id = None
+    def _search(self, **params) -> tuple[list[Event], str | None]:
+        resp = _send_request(
+            self._client, "GET", f"{self._events_url}/search", params=params
+        )
+        data = resp.json()
+        events = [Event.model_validate(item) for item in data["items"]]
+        return events, data.get("next_page_id")
+
+    def _load_cache(self) -> None:
+        if self._cache_path is None or not self._cache_path.exists():
+            return
+        with self._cache_path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = Event.model_validate_json(line)
+                except ValueError:
+                    # A line cut short by an interrupted write, and what follows
+                    break
+                self._cached_events.append(event)
+                self._cached_event_ids.add(event.id)
+        logger.debug(f"Loaded {len(self._cached_events)} events from cache")
 
+    def _write_cache(self, events: list[Event], rewrite: bool = False) -> None:
+        if self._cache_path is None or not (events or rewrite):
+            return
+        if self._unloaded_count or self._older_page_id:
+            # The cache only ever holds all events from the first one
+            return
+        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._cache_path.open("w" if rewrite else "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(event.model_dump_json() + "\n")
+
+    def _do_full_sync(self) -> list[Event]:
+        """Perform a full sync with the remote API, and return the events that
+        were not known before."""
+        logger.debug(f"Performing full sync for conversation {self._conversation_id}")
+        with self._lock:
+            known_ids = self._cached_event_ids
+            self._cached_events = []
+            self._cached_event_ids = set()
+            self._unloaded_count = 0
+            self._older_page_id = None
+            self._fetch_after(None)
+            self._write_cache(self._cached_events, rewrite=True)
+            new_events = [e for e in self._cached_events if e.id not in known_ids]
+        logger.debug(f"Full sync completed, {len(self._cached_events)} events cached")
+        return new_events
+
+    def sync(self) -> list[Event]:
+        """Fetch the events after the last event known, or all events if none
+        is known, and return the events fetched that were not known before.
+        If the server does not know the last event (e.g. the cache is stale),
+        a full sync is performed instead."""
+        with self._lock:
+            last_event_id = self._cached_events[-1].id if self._cached_events else None
+            if last_event_id is None and not self._unloaded_count:
+                return self._do_full_sync()
+            new_events = self._fetch_after(last_event_id)
+            if new_events is None:
+                logger.debug(f"Event {last_event_id} not found on server, resyncing")
+                return self._do_full_sync()
+            self._write_cache(new_events)
+            logger.debug(f"Incremental sync completed, {len(new_events)} new events")
+            return new_events
+
+    def _fetch_after(self, last_event_id: str | None) -> list[Event] | None:
+        """Append the events after `last_event_id` (all events if None), and
+        return them, or None if the server does not know `last_event_id`."""
+        new_events: list[Event] = []
+        page_id = last_event_id
+        first_page = True
         while True:
-            params = {"limit": 100}
+            params: dict = {"limit": 100}
             if page_id:
                 params["page_id"] = page_id
+            events, page_id = self._search(**params)
+            if last_event_id is not None and first_page:
+                # The page starts at the last event known (inclusive)
+                if not events or events[0].id != last_event_id:
+                    return None
+                events = events[1:]
+            first_page = False
+            for event in events:
+                if event.id not in self._cached_event_ids:
+                    self._cached_events.append(event)
+                    self._cached_event_ids.add(event.id)
+                    new_events.append(event)
+            if not page_id:
+                break
+        return new_events
 
-            resp = _send_request(
-                self._client,
-                "GET",
-                f"/api/conversations/{self._conversation_id}/events/search",
-                params=params,
+    def _load_latest_page(self) -> None:
+        """Fetch the most recent page of events, leaving older events to be
+        fetched on access."""
+        with self._lock:
+            events, self._older_page_id = self._search(
+                limit=100, sort_order="TIMESTAMP_DESC"
+            )
+            events.reverse()
+            self._cached_events = events
+            self._cached_event_ids = {e.id for e in events}
+            self._write_cache(events, rewrite=True)
+            if self._older_page_id and events:
+                # The server counts by index position, so events sharing the
+                # timestamp of the first one fetched are counted correctly
+                resp = _send_request(
+                    self._client,
+                    "GET",
+                    f"{self._events_url}/count",
+                    params={"before_id": events[0].id},
+                )
+                self._unloaded_count = int(resp.json())
+            logger.debug(
+                f"Fetched {len(events)} recent events, "
+                f"{self._unloaded_count} older events not fetched"
             )
-            data = resp.json()
-
-            events.extend([Event.model_validate(item) for item in data["items"]])
-
-            if not data.get("next_page_id"):
-                break
-            page_id = data["next_page_id"]
 
-        self._cached_events = events
-        self._cached_event_ids.update(e.id for e in events)
-        logger.debug(f"Full sync completed, {len(events)} events cached")
+    def _load_older(self, index: int) -> None:
+        """Fetch older events until the event at `index` is fetched."""
+        with self._lock:
+            older: list[Event] = []
+            while self._older_page_id and len(older) < self._unloaded_count - index:
+                events, self._older_page_id = self._search(
+                    limit=100, sort_order="TIMESTAMP_DESC", page_id=self._older_page_id
+                )
+                older.extend(e for e in events if e.id not in self._cached_event_ids)
+            older.reverse()
+            self._cached_events[:0] = older
+            self._cached_event_ids.update(e.id for e in older)
+            if self._older_page_id:
+                self._unloaded_count -= len(older)
+            else:
+                # Every event is fetched now, whatever the count said
+                self._unloaded_count = 0
+                self._write_cache(self._cached_events, rewrite=True)
 
     def add_event(self, event: Event) -> None:
         """Add a new event to the local cache (called by WebSocket callback)."""
@@ -211,6 +363,7 @@ class RemoteEventsList(EventsListBase):
             if event.id not in self._cached_event_ids:
                 self._cached_events.append(event)
                 self._cached_event_ids.add(event.id)
+                self._write_cache([event])
                 logger.debug(f"Added event {event.id} to local cache")
 
     def append(self, event: Event) -> None:
@@ -226,7 +379,7 @@ class RemoteEventsList(EventsListBase):
         return callback
 
     def __len__(self) -> int:
-        return len(self._cached_events)
+        return self._unloaded_count + len(self._cached_events)
 
     @overload
     def __getitem__(self, index: int) -> Event: ...
@@ -236,10 +389,20 @@ class RemoteEventsList(EventsListBase):
 
     def __getitem__(self, index: SupportsIndex | slice) -> Event | list[Event]:
         with self._lock:
-            return self._cached_events[index]
+            if isinstance(index, slice):
+                indices = range(len(self))[index]
+                if indices and min(indices[0], indices[-1]) < self._unloaded_count:
+                    self._load_older(min(indices[0], indices[-1]))
+                return [self._cached_events[i - self._unloaded_count] for i in indices]
+            position = range(len(self))[index]
+            if position < self._unloaded_count:
+                self._load_older(position)
+            return self._cached_events[position - self._unloaded_count]
 
     def __iter__(self):
         with self._lock:
+            if self._unloaded_count:
+                self._load_older(0)
             return iter(self._cached_events)
 
 
@@ -252,10 +415,18 @@ class RemoteState(ConversationStateProtocol):
     _cached_state: dict | None
     _lock: threading.RLock
 
-    def __init__(self, client: httpx.Client, conversation_id: str):
+    def __init__(
+        self,
+        client: httpx.Client,
+        conversation_id: str,
+        events_cache_dir: str | Path | None = None,
+        lazy_events: bool = False,
+    ):
         self._client = client
         self._conversation_id = conversation_id
-        self._events = RemoteEventsList(client, conversation_id)
+        self._events = RemoteEventsList(
+            client, conversation_id, cache_dir=events_cache_dir, lazy=lazy_events
+        )
 
         # Cache for state information to avoid REST calls
         self._cached_state = None
@@ -436,6 +607,8 @@ class RemoteConversation(BaseConversation):
             type[ConversationVisualizerBase] | ConversationVisualizerBase | None
         ) = DefaultConversationVisualizer,
         secrets: Mapping[str, SecretValue] | None = None,
+        events_cache_dir: str | Path | None = None,
+        lazy_events: bool = False,
         **_: object,
     ) -> None:
         """Remote conversation proxy that talks to an agent server.
@@ -453,6 +626,10 @@ class RemoteConversation(BaseConversation):
                        - ConversationVisualizerBase instance: Use custom visualizer
                        - None: No visualization
             secrets: Optional secrets to initialize the conversation with
+            events_cache_dir: Optional directory where events are cached, so
+                       only new events are fetched when attaching again
+            lazy_events: Fetch only the most recent events when attaching, and
+                       older events when they are accessed
         """
         super().__init__()  # Initialize base class with span tracking
         self.agent = agent
@@ -492,7 +669,12 @@ class RemoteConversation(BaseConversation):
             _send_request(self._client, "GET", f"/api/conversations/{self._id}")
 
         # Initialize the remote state
-        self._state = RemoteState(self._client, str(self._id))
+        self._state = RemoteState(
+            self._client,
+            str(self._id),
+            events_cache_dir=events_cache_dir,
+            lazy_events=lazy_events,
+        )
 
         # Add default callback to maintain local event state
         default_callback = self._state.events.create_default_callback()
@@ -521,8 +703,10 @@ class RemoteConversation(BaseConversation):
             # No visualization (visualizer is None)
             self._visualizer = None
 
-        # Compose all callbacks into a single callback
-        composed_callback = BaseConversation.compose_callbacks(self._callbacks)
+        # Compose all callbacks into a single callback, called once per event
+        composed_callback = self._dispatch_once(
+            BaseConversation.compose_callbacks(self._callbacks)
+        )
 
         # Initialize WebSocket client for callbacks
         self._ws_client = WebSocketCallbackClient(
@@ -530,6 +714,7 @@ class RemoteConversation(BaseConversation):
             conversation_id=str(self._id),
             callback=composed_callback,
             api_key=self.workspace.api_key,
+            on_connect=lambda: self._dispatch_missed_events(composed_callback),
         )
         self._ws_client.start()
 
@@ -541,6 +726,31 @@ class RemoteConversation(BaseConversation):
 
         self._start_observability_span(str(self._id))
 
+    def _dispatch_once(
+        self, callback: ConversationCallbackType
+    ) -> ConversationCallbackType:
+        """Wrap `callback` to skip events it was already called with, as the
+        websocket may forward events also fetched on (re)connection."""
+        dispatched_ids: set[str] = set()
+
+        # Only ever called from the websocket thread
+        def dispatch(event: Event) -> None:
+            if event.id in dispatched_ids:
+                return
+            dispatched_ids.add(event.id)
+            callback(event)
+
+        return dispatch
+
+    def _dispatch_missed_events(self, callback: ConversationCallbackType) -> None:
+        """Fetch the events missed before (re)connecting, and pass them to the
+        callbacks before the events forwarded by the websocket."""
+        for event in self._state.events.sync():
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("ws_event_processing_error", stack_info=True)
+
     @property
     def id(self) -> ConversationID:
         return self._id
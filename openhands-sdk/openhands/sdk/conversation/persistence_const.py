@@ -2,8 +2,16 @@ import re
 
 
 BASE_STATE = "base_state.json"
+# Frequently changing state fields, when persisted apart from the base state
+HOT_STATE = "hot_state.json"
 EVENTS_DIR = "events"
 EVENT_NAME_RE = re.compile(
     r"^event-(?P<idx>\d{5})-(?P<event_id>[0-9a-fA-F\-]{8,})\.json$"
 )
 EVENT_FILE_PATTERN = "event-{idx:05d}-{event_id}.json"
+
+# Segmented event journal (see JournalEventLog)
+EVENTS_JOURNAL_DIR = "events_journal"
+JOURNAL_INDEX_FILE = "index.bin"
+JOURNAL_SEGMENT_RE = re.compile(r"^segment-(?P<segment>\d{6})\.jsonl$")
+JOURNAL_SEGMENT_PATTERN = "segment-{segment:06d}.jsonl"
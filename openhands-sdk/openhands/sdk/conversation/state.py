@@ -1,16 +1,26 @@
 # state.py
+import asyncio
 import json
-from collections.abc import Sequence
+import os
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
 from enum import Enum
 from typing import Any, Self
 
 from pydantic import AliasChoices, Field, PrivateAttr
 
 from openhands.sdk.agent.base import AgentBase
+from openhands.sdk.context.view import IncrementalView, View
 from openhands.sdk.conversation.conversation_stats import ConversationStats
+from openhands.sdk.conversation.event_journal import JournalEventLog
 from openhands.sdk.conversation.event_store import EventLog
 from openhands.sdk.conversation.fifo_lock import FIFOLock
-from openhands.sdk.conversation.persistence_const import BASE_STATE, EVENTS_DIR
+from openhands.sdk.conversation.persistence_const import (
+    BASE_STATE,
+    EVENTS_DIR,
+    EVENTS_JOURNAL_DIR,
+    HOT_STATE,
+)
 from openhands.sdk.conversation.secret_registry import SecretRegistry
 from openhands.sdk.conversation.types import ConversationCallbackType, ConversationID
 from openhands.sdk.event import ActionEvent, ObservationEvent, UserRejectObservation
@@ -28,6 +38,12 @@ from openhands.sdk.workspace.base import BaseWorkspace
 
 logger = get_logger(__name__)
 
+# Fields which change many times during a run. With delta persistence they are
+# saved to HOT_STATE, so that changing them does not rewrite the agent spec.
+HOT_STATE_FIELDS = frozenset(
+    {"execution_status", "activated_knowledge_skills", "stats"}
+)
+
 
 class ConversationExecutionStatus(str, Enum):
     """Enum representing the current execution state of the conversation."""
@@ -118,12 +134,34 @@ class ConversationState(OpenHandsModel):
     _lock: FIFOLock = PrivateAttr(
         default_factory=FIFOLock
     )  # FIFO lock for thread safety
+    _view: IncrementalView = PrivateAttr(
+        default_factory=IncrementalView
+    )  # incrementally maintained view over events
+    _delta_state: bool = PrivateAttr(
+        default=False
+    )  # persist hot fields apart from the base state
+    _persistence_depth: int = PrivateAttr(
+        default=0
+    )  # nesting of deferred_persistence blocks
+    _unsaved_fields: set[str] = PrivateAttr(
+        default_factory=set
+    )  # fields changed in a deferred_persistence block
 
     # ===== Public "events" facade (Sequence[Event]) =====
     @property
     def events(self) -> EventLog:
         return self._events
 
+    @property
+    def view(self) -> View:
+        """The condensation-aware `View` of the current events.
+
+        Equivalent to `View.from_events(self.events)`, but only events appended
+        since the previous access are processed.
+        """
+        self._view.sync(self._events)
+        return self._view.get_view()
+
     def set_on_state_change(self, callback: ConversationCallbackType | None) -> None:
         """Set a callback to be called when state changes.
 
@@ -137,9 +175,83 @@ class ConversationState(OpenHandsModel):
     def _save_base_state(self, fs: FileStore) -> None:
         """
         Persist base state snapshot (no events; events are file-backed).
+        With delta persistence, the hot fields are left out.
+        """
+        exclude = set(HOT_STATE_FIELDS) if self._delta_state else None
+        payload = self.model_dump_json(exclude_none=True, exclude=exclude)
+        fs.write_atomic(BASE_STATE, payload)
+
+    def _save_hot_state(self, fs: FileStore) -> None:
+        """Persist the hot fields (delta persistence only)."""
+        payload = self.model_dump_json(exclude_none=True, include=set(HOT_STATE_FIELDS))
+        fs.write_atomic(HOT_STATE, payload)
+
+    def _save_fields(self, fs: FileStore, fields: set[str]) -> None:
+        """Persist the files holding the fields given."""
+        if not self._delta_state:
+            self._save_base_state(fs)
+            return
+        if not fields <= HOT_STATE_FIELDS:
+            self._save_base_state(fs)
+        if fields & HOT_STATE_FIELDS:
+            self._save_hot_state(fs)
+
+    @contextmanager
+    def deferred_persistence(self) -> Iterator[None]:
+        """With delta persistence, save the fields changed in the block once, when
+        it exits, rather than on every change. Blocks may be nested; the changes
+        are saved when the outermost one exits. Without delta persistence, fields
+        are saved on every change as usual.
         """
-        payload = self.model_dump_json(exclude_none=True)
-        fs.write(BASE_STATE, payload)
+        self._persistence_depth += 1
+        try:
+            yield
+        finally:
+            self._persistence_depth -= 1
+            fs = getattr(self, "_fs", None)
+            if self._persistence_depth == 0 and self._unsaved_fields and fs:
+                fields = self._unsaved_fields
+                self._unsaved_fields = set()
+                self._save_fields(fs, fields)
+
+    @staticmethod
+    def _read_persisted(file_store: FileStore) -> dict[str, Any] | None:
+        """Read the persisted state, with the hot fields overlaid if they are
+        persisted apart. Returns None if nothing is persisted."""
+        try:
+            base_text = file_store.read(BASE_STATE)
+        except FileNotFoundError:
+            return None
+        if not base_text:
+            return None
+        data = json.loads(base_text)
+        try:
+            data.update(json.loads(file_store.read(HOT_STATE)))
+        except FileNotFoundError:
+            pass
+        return data
+
+    @classmethod
+    def load_persisted(cls, persistence_dir: str) -> "ConversationState | None":
+        """Load the persisted state of a conversation, without its events and
+        without enabling autosave. Returns None if nothing is persisted."""
+        if not os.path.isdir(persistence_dir):
+            return None
+        data = cls._read_persisted(LocalFileStore(persistence_dir))
+        if data is None:
+            return None
+        return cls.model_validate(data)
+
+    @staticmethod
+    def _open_event_log(file_store: FileStore, event_journal: bool) -> EventLog:
+        """Open the event log, preferring the journal when enabled or present."""
+        if isinstance(file_store, LocalFileStore) and (
+            event_journal or os.path.isdir(file_store.get_full_path(EVENTS_JOURNAL_DIR))
+        ):
+            return JournalEventLog(file_store, dir_path=EVENTS_JOURNAL_DIR)
+        if event_journal:
+            logger.debug("Event journal requires a local file store; using files")
+        return EventLog(file_store, dir_path=EVENTS_DIR)
 
     # ===== Factory: open-or-create (no load/save methods needed) =====
     @classmethod
@@ -151,24 +263,34 @@ class ConversationState(OpenHandsModel):
         persistence_dir: str | None = None,
         max_iterations: int = 500,
         stuck_detection: bool = True,
+        event_journal: bool = False,
+        delta_state: bool = False,
     ) -> "ConversationState":
         """
         If base_state.json exists: resume (attach EventLog,
             reconcile agent, enforce id).
         Else: create fresh (agent required), persist base, and return.
+
+        With ``event_journal=True`` events are stored in a segmented journal
+        (see ``JournalEventLog``) instead of one file per event; existing
+        per-file events are migrated on first open. Conversations that already
+        have a journal always reopen it.
+
+        With ``delta_state=True`` the fields which change during a run
+        (``HOT_STATE_FIELDS``) are saved to their own file, so that changing
+        them does not rewrite the agent spec, and the run loop saves them once
+        per step (see ``deferred_persistence``). Conversations already
+        persisted that way always keep it.
         """
         file_store = (
             LocalFileStore(persistence_dir) if persistence_dir else InMemoryFileStore()
         )
 
-        try:
-            base_text = file_store.read(BASE_STATE)
-        except FileNotFoundError:
-            base_text = None
+        persisted = cls._read_persisted(file_store)
 
         # ---- Resume path ----
-        if base_text:
-            state = cls.model_validate(json.loads(base_text))
+        if persisted is not None:
+            state = cls.model_validate(persisted)
 
             # Enforce conversation id match
             if state.id != id:
@@ -182,7 +304,11 @@ class ConversationState(OpenHandsModel):
 
             # Attach runtime handles and commit reconciled agent (may autosave)
             state._fs = file_store
-            state._events = EventLog(file_store, dir_path=EVENTS_DIR)
+            state._events = cls._open_event_log(file_store, event_journal)
+            if delta_state or file_store.exists(HOT_STATE):
+                state._delta_state = True
+                # The hot fields may only be in the base state so far
+                state._save_hot_state(file_store)
             state._autosave_enabled = True
             state.agent = resolved
 
@@ -212,10 +338,11 @@ class ConversationState(OpenHandsModel):
         # Record existing analyzer configuration in state
         state.security_analyzer = state.security_analyzer
         state._fs = file_store
-        state._events = EventLog(file_store, dir_path=EVENTS_DIR)
+        state._events = cls._open_event_log(file_store, event_journal)
         state.stats = ConversationStats()
+        state._delta_state = delta_state
 
-        state._save_base_state(file_store)  # initial snapshot
+        state._save_fields(file_store, set(cls.model_fields))  # initial snapshot
         state._autosave_enabled = True
         logger.info(
             f"Created new conversation {state.id}\n"
@@ -243,7 +370,10 @@ class ConversationState(OpenHandsModel):
 
         if old is _sentinel or old != value:
             try:
-                self._save_base_state(fs)
+                if self._delta_state and self._persistence_depth > 0:
+                    self._unsaved_fields.add(name)
+                else:
+                    self._save_fields(fs, {name})
             except Exception as e:
                 logger.exception("Auto-persist base_state failed", exc_info=True)
                 raise e
@@ -341,3 +471,62 @@ class ConversationState(OpenHandsModel):
         Return True if the lock is currently held by the calling thread.
         """
         return self._lock.owned()
+
+    @asynccontextmanager
+    async def alocked(self) -> AsyncIterator[Self]:
+        """Async counterpart of `with state:`, taking the lock without blocking
+        the event loop.
+
+        The lock is reentrant per thread, so held from the event loop thread it
+        does not exclude the other coroutines of that loop: holders must
+        release it around every await, with `unlocked`, and check the state
+        again after each.
+        """
+        await self._acquire_async()
+        try:
+            yield self
+        finally:
+            self._lock.release()
+
+    @asynccontextmanager
+    async def unlocked(self) -> AsyncIterator[None]:
+        """Release the lock held by the calling thread for the duration of the
+        block, then take it back without blocking the event loop.
+
+        Async steps hold the lock from the event loop thread, and release it
+        while awaiting, e.g. the LLM or tools, so that other coroutines and
+        threads can use the state meanwhile; the state must be checked again
+        after the block. Does nothing if the calling thread does not hold the
+        lock.
+        """
+        count = 0
+        while self._lock.owned():
+            self._lock.release()
+            count += 1
+        try:
+            yield
+        finally:
+            if count:
+                try:
+                    # The caller expects to hold the lock again when unwinding
+                    await self._acquire_async(hold_on_cancel=True)
+                finally:
+                    for _ in range(count - 1):
+                        self._lock.acquire()
+
+    async def _acquire_async(self, hold_on_cancel: bool = False) -> None:
+        """Poll the lock until it is free, then take it. If cancelled
+        meanwhile, keep polling until it is taken if `hold_on_cancel`, and
+        raise the cancellation then."""
+        delay = 0.001
+        cancelled = False
+        while not self._lock.acquire(blocking=False):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                if not hold_on_cancel:
+                    raise
+                cancelled = True
+            delay = min(delay * 2, 0.05)
+        if cancelled:
+            raise asyncio.CancelledError
@@ -8,6 +8,7 @@ from rich.text import Text
 
 from openhands.sdk.event.types import EventID, SourceType
 from openhands.sdk.llm import ImageContent, Message, TextContent
+from openhands.sdk.llm.utils.message_cache import message_cache
 from openhands.sdk.utils.models import DiscriminatedUnionMixin
 
 
@@ -89,7 +90,12 @@ class LLMConvertibleEvent(Event, ABC):
 
     @staticmethod
     def events_to_messages(events: list["LLMConvertibleEvent"]) -> list[Message]:
-        """Convert event stream to LLM message stream, handling multi-action batches"""
+        """Convert event stream to LLM message stream, handling multi-action batches
+
+        Events are immutable, so converted messages are cached by event id and
+        the same Message objects are returned on later calls. They are shared
+        and must not be mutated.
+        """
         # TODO: We should add extensive tests for this
         from openhands.sdk.event.llm_convertible import ActionEvent
 
@@ -116,11 +122,21 @@ class LLMConvertibleEvent(Event, ABC):
                     j += 1
 
                 # Create combined message for the response
-                messages.append(_combine_action_events(batch_events))
+                messages.append(
+                    message_cache.get_message(
+                        tuple(e.id for e in batch_events),
+                        batch_events,
+                        lambda: _combine_action_events(batch_events),
+                    )
+                )
                 i = j
             else:
                 # Regular event - direct conversion
-                messages.append(event.to_llm_message())
+                messages.append(
+                    message_cache.get_message(
+                        (event.id,), (event,), event.to_llm_message
+                    )
+                )
                 i += 1
 
         return messages
@@ -17,6 +17,16 @@ class FileStore(ABC):
             contents: The data to write, either as string or bytes.
         """
 
+    def write_atomic(self, path: str, contents: str | bytes) -> None:
+        """Write contents to a file so that readers see either the previous
+        contents or the new ones, never a partial write.
+
+        Args:
+            path: The file path where contents should be written.
+            contents: The data to write, either as string or bytes.
+        """
+        self.write(path, contents)
+
     @abstractmethod
     def read(self, path: str) -> str:
         """Read and return the contents of a file as a string.
@@ -28,6 +38,18 @@ class FileStore(ABC):
             The file contents as a string.
         """
 
+    def exists(self, path: str) -> bool:
+        """Return whether a file exists at the specified path.
+
+        Args:
+            path: The file path to check.
+        """
+        try:
+            self.read(path)
+        except FileNotFoundError:
+            return False
+        return True
+
     @abstractmethod
     def list(self, path: str) -> list[str]:
         """List all files and directories at the specified path.
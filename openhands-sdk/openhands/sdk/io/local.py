@@ -1,5 +1,7 @@
+import contextlib
 import os
 import shutil
+import tempfile
 
 from openhands.sdk.logger import get_logger
 from openhands.sdk.observability.laminar import observe
@@ -45,6 +47,32 @@ class LocalFileStore(FileStore):
             with open(full_path, "wb") as f:
                 f.write(contents)
 
+    @observe(name="LocalFileStore.write_atomic", span_type="TOOL")
+    def write_atomic(self, path: str, contents: str | bytes) -> None:
+        full_path = self.get_full_path(path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        if isinstance(contents, str):
+            contents = contents.encode("utf-8")
+        # A unique temp file, so concurrent writers never share one
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(full_path),
+            prefix=f".{os.path.basename(full_path)}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(contents)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, full_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    def exists(self, path: str) -> bool:
+        return os.path.isfile(self.get_full_path(path))
+
     def read(self, path: str) -> str:
         full_path = self.get_full_path(path)
         with open(full_path, encoding="utf-8") as f:
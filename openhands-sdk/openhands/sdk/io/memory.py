@@ -25,6 +25,9 @@ class InMemoryFileStore(FileStore):
             raise FileNotFoundError(path)
         return self.files[path]
 
+    def exists(self, path: str) -> bool:
+        return path in self.files
+
     def list(self, path: str) -> list[str]:
         files = []
         for file in self.files:
@@ -6,7 +6,17 @@ import os
 import warnings
 from collections.abc import Callable, Sequence
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, get_args, get_origin
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Literal,
+    NoReturn,
+    get_args,
+    get_origin,
+)
 
 import httpx  # noqa: F401
 from pydantic import (
@@ -38,13 +48,14 @@ from openhands.sdk.utils.pydantic_diff import pretty_pydantic_diff
 
 with warnings.catch_warnings():
     warnings.simplefilter("ignore")
-    import litellm
+    import litellm  # noqa: F401
 
 from typing import cast
 
 from litellm import (
     ChatCompletionToolParam,
     ResponseInputParam,
+    acompletion as litellm_acompletion,
     completion as litellm_completion,
 )
 from litellm.exceptions import (
@@ -54,7 +65,10 @@ from litellm.exceptions import (
     ServiceUnavailableError,
     Timeout as LiteLLMTimeout,
 )
-from litellm.responses.main import responses as litellm_responses
+from litellm.responses.main import (
+    aresponses as litellm_aresponses,
+    responses as litellm_responses,
+)
 from litellm.types.llms.openai import ResponsesAPIResponse
 from litellm.types.utils import ModelResponse
 from litellm.utils import (
@@ -76,6 +90,11 @@ from openhands.sdk.llm.message import (
 from openhands.sdk.llm.mixins.non_native_fc import NonNativeToolCallingMixin
 from openhands.sdk.llm.options.chat_options import select_chat_options
 from openhands.sdk.llm.options.responses_options import select_responses_options
+from openhands.sdk.llm.utils.litellm_context import (
+    alitellm_modify_params,
+    litellm_modify_params,
+)
+from openhands.sdk.llm.utils.message_cache import message_cache
 from openhands.sdk.llm.utils.metrics import Metrics, MetricsSnapshot
 from openhands.sdk.llm.utils.model_features import get_default_temperature, get_features
 from openhands.sdk.llm.utils.retry_mixin import RetryMixin
@@ -98,6 +117,26 @@ LLM_RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
     LLMNoResponseError,
 )
 
+
+@dataclass
+class _CompletionRequest:
+    """A formatted Completion API request, shared by sync and async calls."""
+
+    messages: list[dict[str, Any]]
+    cc_tools: list[ChatCompletionToolParam]
+    use_mock_tools: bool
+    call_kwargs: dict[str, Any]
+    log_ctx: dict[str, Any] | None
+
+
+@dataclass
+class _ResponsesRequest:
+    """A formatted Responses API request, shared by sync and async calls."""
+
+    transport_kwargs: dict[str, Any]
+    call_kwargs: dict[str, Any]
+
+
 SERVICE_ID_DEPRECATION_DETAILS = "Use LLM.usage_id instead of LLM.service_id."
 
 
@@ -485,6 +524,80 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
             >>> response = llm.completion(messages)
             >>> print(response.content)
         """
+        request = self._prepare_completion(
+            messages, tools, add_security_risk_prediction, kwargs
+        )
+
+        # 5) do the call with retries
+        @self.retry_decorator(
+            num_retries=self.num_retries,
+            retry_exceptions=LLM_RETRY_EXCEPTIONS,
+            retry_min_wait=self.retry_min_wait,
+            retry_max_wait=self.retry_max_wait,
+            retry_multiplier=self.retry_multiplier,
+            retry_listener=self.retry_listener,
+        )
+        def _one_attempt(**retry_kwargs) -> ModelResponse:
+            assert self._telemetry is not None
+            self._telemetry.on_request(log_ctx=request.log_ctx)
+            # Merge retry-modified kwargs (like temperature) with call_kwargs
+            final_kwargs = {**request.call_kwargs, **retry_kwargs}
+            resp = self._transport_call(messages=request.messages, **final_kwargs)
+            return self._process_completion_response(resp, request)
+
+        try:
+            return self._completion_llm_response(_one_attempt())
+        except Exception as e:
+            self._raise_mapped_error(e)
+
+    async def acompletion(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolDefinition] | None = None,
+        _return_metrics: bool = False,
+        add_security_risk_prediction: bool = False,
+        **kwargs,
+    ) -> LLMResponse:
+        """Async counterpart of `completion`, built on litellm's async API.
+
+        Message formatting, retries, telemetry and function-call mocking behave
+        exactly as in `completion`, but no thread is held while waiting for the
+        model, so many calls can be in flight on a single event loop.
+        """
+        request = self._prepare_completion(
+            messages, tools, add_security_risk_prediction, kwargs
+        )
+
+        @self.retry_decorator(
+            num_retries=self.num_retries,
+            retry_exceptions=LLM_RETRY_EXCEPTIONS,
+            retry_min_wait=self.retry_min_wait,
+            retry_max_wait=self.retry_max_wait,
+            retry_multiplier=self.retry_multiplier,
+            retry_listener=self.retry_listener,
+        )
+        async def _one_attempt(**retry_kwargs) -> ModelResponse:
+            assert self._telemetry is not None
+            self._telemetry.on_request(log_ctx=request.log_ctx)
+            final_kwargs = {**request.call_kwargs, **retry_kwargs}
+            resp = await self._atransport_call(
+                messages=request.messages, **final_kwargs
+            )
+            return self._process_completion_response(resp, request)
+
+        try:
+            return self._completion_llm_response(await _one_attempt())
+        except Exception as e:
+            self._raise_mapped_error(e)
+
+    def _prepare_completion(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolDefinition] | None,
+        add_security_risk_prediction: bool,
+        kwargs: dict[str, Any],
+    ) -> _CompletionRequest:
+        """Build the request shared by `completion` and `acompletion`."""
         # Check if streaming is requested
         if kwargs.get("stream", False):
             raise ValueError("Streaming is not supported")
@@ -494,7 +607,9 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
 
         # 2) choose function-calling strategy
         use_native_fc = self.native_tool_calling
-        original_fncall_msgs = copy.deepcopy(formatted_messages)
+        # pre_request_prompt_mock returns new messages, so the function-calling
+        # messages can be logged as-is without a defensive copy
+        original_fncall_msgs = formatted_messages
 
         # Convert Tool objects to ChatCompletionToolParam once here
         cc_tools: list[ChatCompletionToolParam] = []
@@ -536,65 +651,69 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
             if tools and not use_native_fc:
                 log_ctx["raw_messages"] = original_fncall_msgs
 
-        # 5) do the call with retries
-        @self.retry_decorator(
-            num_retries=self.num_retries,
-            retry_exceptions=LLM_RETRY_EXCEPTIONS,
-            retry_min_wait=self.retry_min_wait,
-            retry_max_wait=self.retry_max_wait,
-            retry_multiplier=self.retry_multiplier,
-            retry_listener=self.retry_listener,
+        return _CompletionRequest(
+            messages=formatted_messages,
+            cc_tools=cc_tools,
+            use_mock_tools=use_mock_tools,
+            call_kwargs=call_kwargs,
+            log_ctx=log_ctx,
         )
-        def _one_attempt(**retry_kwargs) -> ModelResponse:
-            assert self._telemetry is not None
-            self._telemetry.on_request(log_ctx=log_ctx)
-            # Merge retry-modified kwargs (like temperature) with call_kwargs
-            final_kwargs = {**call_kwargs, **retry_kwargs}
-            resp = self._transport_call(messages=formatted_messages, **final_kwargs)
-            raw_resp: ModelResponse | None = None
-            if use_mock_tools:
-                raw_resp = copy.deepcopy(resp)
-                resp = self.post_response_prompt_mock(
-                    resp, nonfncall_msgs=formatted_messages, tools=cc_tools
-                )
-            # 6) telemetry
-            self._telemetry.on_response(resp, raw_resp=raw_resp)
-
-            # Ensure at least one choice.
-            # Gemini sometimes returns empty choices; we raise LLMNoResponseError here
-            # inside the retry boundary so it is retried.
-            if not resp.get("choices") or len(resp["choices"]) < 1:
-                raise LLMNoResponseError(
-                    "Response choices is less than 1. Response: " + str(resp)
-                )
 
-            return resp
+    def _process_completion_response(
+        self, resp: ModelResponse, request: _CompletionRequest
+    ) -> ModelResponse:
+        """Convert mocked tool calls, record telemetry and validate `resp`.
 
-        try:
-            resp = _one_attempt()
-
-            # Convert the first choice to an OpenHands Message
-            first_choice = resp["choices"][0]
-            message = Message.from_llm_chat_message(first_choice["message"])
-
-            # Get current metrics snapshot
-            metrics_snapshot = MetricsSnapshot(
-                model_name=self.metrics.model_name,
-                accumulated_cost=self.metrics.accumulated_cost,
-                max_budget_per_task=self.metrics.max_budget_per_task,
-                accumulated_token_usage=self.metrics.accumulated_token_usage,
+        Runs inside the retry boundary of `completion` and `acompletion`.
+        """
+        assert self._telemetry is not None
+        raw_resp: ModelResponse | None = None
+        if request.use_mock_tools:
+            # The raw response is only needed for the telemetry log
+            if self._telemetry.log_enabled:
+                raw_resp = copy.deepcopy(resp)
+            resp = self.post_response_prompt_mock(
+                resp, nonfncall_msgs=request.messages, tools=request.cc_tools
             )
-
-            # Create and return LLMResponse
-            return LLMResponse(
-                message=message, metrics=metrics_snapshot, raw_response=resp
+        # 6) telemetry
+        self._telemetry.on_response(resp, raw_resp=raw_resp)
+
+        # Ensure at least one choice.
+        # Gemini sometimes returns empty choices; we raise LLMNoResponseError here
+        # inside the retry boundary so it is retried.
+        if not resp.get("choices") or len(resp["choices"]) < 1:
+            raise LLMNoResponseError(
+                "Response choices is less than 1. Response: " + str(resp)
             )
-        except Exception as e:
-            self._telemetry.on_error(e)
-            mapped = map_provider_exception(e)
-            if mapped is not e:
-                raise mapped from e
-            raise
+
+        return resp
+
+    def _completion_llm_response(self, resp: ModelResponse) -> LLMResponse:
+        # Convert the first choice to an OpenHands Message
+        first_choice = resp["choices"][0]
+        message = Message.from_llm_chat_message(first_choice["message"])
+
+        # Create and return LLMResponse
+        return LLMResponse(
+            message=message, metrics=self._metrics_snapshot(), raw_response=resp
+        )
+
+    def _metrics_snapshot(self) -> MetricsSnapshot:
+        return MetricsSnapshot(
+            model_name=self.metrics.model_name,
+            accumulated_cost=self.metrics.accumulated_cost,
+            max_budget_per_task=self.metrics.max_budget_per_task,
+            accumulated_token_usage=self.metrics.accumulated_token_usage,
+        )
+
+    def _raise_mapped_error(self, e: Exception) -> NoReturn:
+        """Record a failed call and re-raise it as an OpenHands LLM error."""
+        assert self._telemetry is not None
+        self._telemetry.on_error(e)
+        mapped = map_provider_exception(e)
+        if mapped is not e:
+            raise mapped from e
+        raise e
 
     # =========================================================================
     # Responses API (non-stream, v1)
@@ -614,6 +733,80 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
         Maps Message[] -> (instructions, input[]) and returns LLMResponse.
         Non-stream only for v1.
         """
+        request = self._prepare_responses(
+            messages, tools, include, store, add_security_risk_prediction, kwargs
+        )
+
+        # Perform call with retries
+        @self.retry_decorator(
+            num_retries=self.num_retries,
+            retry_exceptions=LLM_RETRY_EXCEPTIONS,
+            retry_min_wait=self.retry_min_wait,
+            retry_max_wait=self.retry_max_wait,
+            retry_multiplier=self.retry_multiplier,
+            retry_listener=self.retry_listener,
+        )
+        def _one_attempt(**retry_kwargs) -> ResponsesAPIResponse:
+            final_kwargs = {**request.call_kwargs, **retry_kwargs}
+            with litellm_modify_params(self.modify_params):
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore", category=DeprecationWarning)
+                    ret = litellm_responses(**request.transport_kwargs, **final_kwargs)
+                    return self._process_responses_response(ret)
+
+        try:
+            return self._responses_llm_response(_one_attempt())
+        except Exception as e:
+            self._raise_mapped_error(e)
+
+    async def aresponses(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolDefinition] | None = None,
+        include: list[str] | None = None,
+        store: bool | None = None,
+        _return_metrics: bool = False,
+        add_security_risk_prediction: bool = False,
+        **kwargs,
+    ) -> LLMResponse:
+        """Async counterpart of `responses`, built on litellm's async API."""
+        request = self._prepare_responses(
+            messages, tools, include, store, add_security_risk_prediction, kwargs
+        )
+
+        @self.retry_decorator(
+            num_retries=self.num_retries,
+            retry_exceptions=LLM_RETRY_EXCEPTIONS,
+            retry_min_wait=self.retry_min_wait,
+            retry_max_wait=self.retry_max_wait,
+            retry_multiplier=self.retry_multiplier,
+            retry_listener=self.retry_listener,
+        )
+        async def _one_attempt(**retry_kwargs) -> ResponsesAPIResponse:
+            final_kwargs = {**request.call_kwargs, **retry_kwargs}
+            async with alitellm_modify_params(self.modify_params):
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore", category=DeprecationWarning)
+                    ret = await litellm_aresponses(
+                        **request.transport_kwargs, **final_kwargs
+                    )
+                    return self._process_responses_response(ret)
+
+        try:
+            return self._responses_llm_response(await _one_attempt())
+        except Exception as e:
+            self._raise_mapped_error(e)
+
+    def _prepare_responses(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolDefinition] | None,
+        include: list[str] | None,
+        store: bool | None,
+        add_security_risk_prediction: bool,
+        kwargs: dict[str, Any],
+    ) -> _ResponsesRequest:
+        """Build the request shared by `responses` and `aresponses`."""
         # Streaming not yet supported
         if kwargs.get("stream", False):
             raise ValueError("Streaming is not supported for Responses API yet")
@@ -652,75 +845,44 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
             }
         self._telemetry.on_request(log_ctx=log_ctx)
 
-        # Perform call with retries
-        @self.retry_decorator(
-            num_retries=self.num_retries,
-            retry_exceptions=LLM_RETRY_EXCEPTIONS,
-            retry_min_wait=self.retry_min_wait,
-            retry_max_wait=self.retry_max_wait,
-            retry_multiplier=self.retry_multiplier,
-            retry_listener=self.retry_listener,
+        typed_input: ResponseInputParam | str = (
+            cast(ResponseInputParam, input_items) if input_items else ""
+        )
+        return _ResponsesRequest(
+            transport_kwargs={
+                "model": self.model,
+                "input": typed_input,
+                "instructions": instructions,
+                "tools": resp_tools,
+                "api_key": self._api_key_value(),
+                "api_base": self.base_url,
+                "api_version": self.api_version,
+                "timeout": self.timeout,
+                "drop_params": self.drop_params,
+                "seed": self.seed,
+            },
+            call_kwargs=call_kwargs,
         )
-        def _one_attempt(**retry_kwargs) -> ResponsesAPIResponse:
-            final_kwargs = {**call_kwargs, **retry_kwargs}
-            with self._litellm_modify_params_ctx(self.modify_params):
-                with warnings.catch_warnings():
-                    warnings.filterwarnings("ignore", category=DeprecationWarning)
-                    typed_input: ResponseInputParam | str = (
-                        cast(ResponseInputParam, input_items) if input_items else ""
-                    )
-                    # Extract api_key value with type assertion for type checker
-                    api_key_value: str | None = None
-                    if self.api_key:
-                        assert isinstance(self.api_key, SecretStr)
-                        api_key_value = self.api_key.get_secret_value()
-
-                    ret = litellm_responses(
-                        model=self.model,
-                        input=typed_input,
-                        instructions=instructions,
-                        tools=resp_tools,
-                        api_key=api_key_value,
-                        api_base=self.base_url,
-                        api_version=self.api_version,
-                        timeout=self.timeout,
-                        drop_params=self.drop_params,
-                        seed=self.seed,
-                        **final_kwargs,
-                    )
-                    assert isinstance(ret, ResponsesAPIResponse), (
-                        f"Expected ResponsesAPIResponse, got {type(ret)}"
-                    )
-                    # telemetry (latency, cost). Token usage mapping we handle after.
-                    assert self._telemetry is not None
-                    self._telemetry.on_response(ret)
-                    return ret
-
-        try:
-            resp: ResponsesAPIResponse = _one_attempt()
-
-            # Parse output -> Message (typed)
-            # Cast to a typed sequence
-            # accepted by from_llm_responses_output
-            output_seq = cast(Sequence[Any], resp.output or [])
-            message = Message.from_llm_responses_output(output_seq)
-
-            metrics_snapshot = MetricsSnapshot(
-                model_name=self.metrics.model_name,
-                accumulated_cost=self.metrics.accumulated_cost,
-                max_budget_per_task=self.metrics.max_budget_per_task,
-                accumulated_token_usage=self.metrics.accumulated_token_usage,
-            )
 
-            return LLMResponse(
-                message=message, metrics=metrics_snapshot, raw_response=resp
-            )
-        except Exception as e:
-            self._telemetry.on_error(e)
-            mapped = map_provider_exception(e)
-            if mapped is not e:
-                raise mapped from e
-            raise
+    def _process_responses_response(self, ret: Any) -> ResponsesAPIResponse:
+        assert isinstance(ret, ResponsesAPIResponse), (
+            f"Expected ResponsesAPIResponse, got {type(ret)}"
+        )
+        # telemetry (latency, cost). Token usage mapping we handle after.
+        assert self._telemetry is not None
+        self._telemetry.on_response(ret)
+        return ret
+
+    def _responses_llm_response(self, resp: ResponsesAPIResponse) -> LLMResponse:
+        # Parse output -> Message (typed)
+        # Cast to a typed sequence
+        # accepted by from_llm_responses_output
+        output_seq = cast(Sequence[Any], resp.output or [])
+        message = Message.from_llm_responses_output(output_seq)
+
+        return LLMResponse(
+            message=message, metrics=self._metrics_snapshot(), raw_response=resp
+        )
 
     # =========================================================================
     # Transport + helpers
@@ -728,57 +890,72 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
     def _transport_call(
         self, *, messages: list[dict[str, Any]], **kwargs
     ) -> ModelResponse:
-        # litellm.modify_params is GLOBAL; guard it for thread-safety
-        with self._litellm_modify_params_ctx(self.modify_params):
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore", category=DeprecationWarning, module="httpx.*"
-                )
-                warnings.filterwarnings(
-                    "ignore",
-                    message=r".*content=.*upload.*",
-                    category=DeprecationWarning,
-                )
-                warnings.filterwarnings(
-                    "ignore",
-                    message=r"There is no current event loop",
-                    category=DeprecationWarning,
+        with litellm_modify_params(self.modify_params):
+            with self._suppress_transport_warnings():
+                # Some providers need renames handled in _normalize_call_kwargs.
+                ret = litellm_completion(
+                    **self._completion_transport_kwargs(messages), **kwargs
                 )
-                warnings.filterwarnings(
-                    "ignore",
-                    category=UserWarning,
+                assert isinstance(ret, ModelResponse), (
+                    f"Expected ModelResponse, got {type(ret)}"
                 )
-                # Extract api_key value with type assertion for type checker
-                api_key_value: str | None = None
-                if self.api_key:
-                    assert isinstance(self.api_key, SecretStr)
-                    api_key_value = self.api_key.get_secret_value()
+                return ret
 
-                # Some providers need renames handled in _normalize_call_kwargs.
-                ret = litellm_completion(
-                    model=self.model,
-                    api_key=api_key_value,
-                    api_base=self.base_url,
-                    api_version=self.api_version,
-                    timeout=self.timeout,
-                    drop_params=self.drop_params,
-                    seed=self.seed,
-                    messages=messages,
-                    **kwargs,
+    async def _atransport_call(
+        self, *, messages: list[dict[str, Any]], **kwargs
+    ) -> ModelResponse:
+        async with alitellm_modify_params(self.modify_params):
+            with self._suppress_transport_warnings():
+                ret = await litellm_acompletion(
+                    **self._completion_transport_kwargs(messages), **kwargs
                 )
                 assert isinstance(ret, ModelResponse), (
                     f"Expected ModelResponse, got {type(ret)}"
                 )
                 return ret
 
+    def _completion_transport_kwargs(
+        self, messages: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "api_key": self._api_key_value(),
+            "api_base": self.base_url,
+            "api_version": self.api_version,
+            "timeout": self.timeout,
+            "drop_params": self.drop_params,
+            "seed": self.seed,
+            "messages": messages,
+        }
+
+    def _api_key_value(self) -> str | None:
+        # Extract api_key value with type assertion for type checker
+        if not self.api_key:
+            return None
+        assert isinstance(self.api_key, SecretStr)
+        return self.api_key.get_secret_value()
+
     @contextmanager
-    def _litellm_modify_params_ctx(self, flag: bool):
-        old = getattr(litellm, "modify_params", None)
-        try:
-            litellm.modify_params = flag
+    def _suppress_transport_warnings(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore", category=DeprecationWarning, module="httpx.*"
+            )
+            warnings.filterwarnings(
+                "ignore",
+                message=r".*content=.*upload.*",
+                category=DeprecationWarning,
+            )
+            warnings.filterwarnings(
+                "ignore",
+                message=r"There is no current event loop",
+                category=DeprecationWarning,
+            )
+            warnings.filterwarnings(
+                "ignore",
+                category=UserWarning,
+            )
             yield
-        finally:
-            litellm.modify_params = old
 
     # =========================================================================
     # Capabilities, formatting, and info
@@ -885,42 +1062,58 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
     # =========================================================================
     # Utilities preserved from previous class
     # =========================================================================
-    def _apply_prompt_caching(self, messages: list[Message]) -> None:
-        """Applies caching breakpoints to the messages.
+    def _prompt_caching_breakpoints(self, messages: list[Message]) -> set[int]:
+        """Returns the indices of the messages to mark as cacheable.
 
         For new Anthropic API, we only need to mark the last user or
           tool message as cacheable.
         """
+        breakpoints: set[int] = set()
         if len(messages) > 0 and messages[0].role == "system":
-            messages[0].content[-1].cache_prompt = True
+            breakpoints.add(0)
         # NOTE: this is only needed for anthropic
-        for message in reversed(messages):
-            if message.role in ("user", "tool"):
-                message.content[
-                    -1
-                ].cache_prompt = True  # Last item inside the message content
+        for index in range(len(messages) - 1, -1, -1):
+            if messages[index].role in ("user", "tool"):
+                breakpoints.add(index)
                 break
+        return breakpoints
 
     def format_messages_for_llm(self, messages: list[Message]) -> list[dict]:
-        """Formats Message objects for LLM consumption."""
-
-        messages = copy.deepcopy(messages)
-        if self.is_caching_prompt_active():
-            self._apply_prompt_caching(messages)
-
-        for message in messages:
-            message.cache_enabled = self.is_caching_prompt_active()
-            message.vision_enabled = self.vision_is_active()
-            message.function_calling_enabled = self.native_tool_calling
-            model_features = get_features(self.model)
-            message.force_string_serializer = (
+        """Formats Message objects for LLM consumption.
+
+        The messages are not modified: serialization flags and caching
+        breakpoints are passed to `Message.to_chat_dict` for this call only.
+        Serialized messages built from events are memoized per flags; only the
+        messages carrying a caching breakpoint are serialized on every call.
+        """
+        cache_enabled = self.is_caching_prompt_active()
+        breakpoints = (
+            self._prompt_caching_breakpoints(messages) if cache_enabled else set()
+        )
+        model_features = get_features(self.model)
+        flags = {
+            "cache_enabled": cache_enabled,
+            "vision_enabled": self.vision_is_active(),
+            "function_calling_enabled": self.native_tool_calling,
+            "force_string_serializer": (
                 self.force_string_serializer
                 if self.force_string_serializer is not None
                 else model_features.force_string_serializer
-            )
-            message.send_reasoning_content = model_features.send_reasoning_content
+            ),
+            "send_reasoning_content": model_features.send_reasoning_content,
+        }
 
-        formatted_messages = [message.to_chat_dict() for message in messages]
+        flags_key = ("chat", *flags.values())
+
+        formatted_messages: list[dict] = []
+        for index, message in enumerate(messages):
+            if index in breakpoints:
+                formatted = message.to_chat_dict(**flags, cache_last_content=True)
+            else:
+                formatted = message_cache.get_payload(
+                    message, flags_key, partial(message.to_chat_dict, **flags)
+                )
+            formatted_messages.append(formatted)
 
         return formatted_messages
 
@@ -934,18 +1127,20 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
          or input items (others)
         - Concatenates system instructions into a single instructions string
         """
-        msgs = copy.deepcopy(messages)
-
-        # Set only vision flag; skip cache_enabled and force_string_serializer
+        # Only the vision flag applies; it is passed through rather than set on
+        # the messages, so they need not be copied
         vision_active = self.vision_is_active()
-        for m in msgs:
-            m.vision_enabled = vision_active
 
         # Assign system instructions as a string, collect input items
         instructions: str | None = None
         input_items: list[dict[str, Any]] = []
-        for m in msgs:
-            val = m.to_responses_value(vision_enabled=vision_active)
+        flags_key = ("responses", vision_active)
+        for m in messages:
+            val = message_cache.get_payload(
+                m,
+                flags_key,
+                partial(m.to_responses_value, vision_enabled=vision_active),
+            )
             if isinstance(val, str):
                 s = val.strip()
                 if not s:
@@ -153,11 +153,16 @@ class BaseContent(BaseModel):
     cache_prompt: bool = False
 
     @abstractmethod
-    def to_llm_dict(self) -> list[dict[str, str | dict[str, str]]]:
+    def to_llm_dict(
+        self, cache_prompt: bool | None = None
+    ) -> list[dict[str, str | dict[str, str]]]:
         """Convert to LLM API format. Always returns a list of dictionaries.
 
         Subclasses should implement this method to return a list of dictionaries,
         even if they only have a single item.
+
+        Args:
+            cache_prompt: Overrides `self.cache_prompt` when not None.
         """
 
 
@@ -170,7 +175,9 @@ class TextContent(BaseContent):
         extra="forbid", populate_by_name=True
     )
 
-    def to_llm_dict(self) -> list[dict[str, str | dict[str, str]]]:
+    def to_llm_dict(
+        self, cache_prompt: bool | None = None
+    ) -> list[dict[str, str | dict[str, str]]]:
         """Convert to LLM API format."""
         text = self.text
         if len(text) > DEFAULT_TEXT_CONTENT_LIMIT:
@@ -184,7 +191,7 @@ class TextContent(BaseContent):
             "type": self.type,
             "text": text,
         }
-        if self.cache_prompt:
+        if self.cache_prompt if cache_prompt is None else cache_prompt:
             data["cache_control"] = {"type": "ephemeral"}
         return [data]
 
@@ -193,12 +200,16 @@ class ImageContent(BaseContent):
     type: Literal["image"] = "image"
     image_urls: list[str]
 
-    def to_llm_dict(self) -> list[dict[str, str | dict[str, str]]]:
+    def to_llm_dict(
+        self, cache_prompt: bool | None = None
+    ) -> list[dict[str, str | dict[str, str]]]:
         """Convert to LLM API format."""
         images: list[dict[str, str | dict[str, str]]] = []
         for url in self.image_urls:
             images.append({"type": "image_url", "image_url": {"url": url}})
-        if self.cache_prompt and images:
+        if cache_prompt is None:
+            cache_prompt = self.cache_prompt
+        if cache_prompt and images:
             images[-1]["cache_control"] = {"type": "ephemeral"}
         return images
 
@@ -263,17 +274,44 @@ class Message(BaseModel):
             return [TextContent(text=v)]
         return v
 
-    def to_chat_dict(self) -> dict[str, Any]:
+    def to_chat_dict(
+        self,
+        *,
+        cache_enabled: bool | None = None,
+        vision_enabled: bool | None = None,
+        function_calling_enabled: bool | None = None,
+        force_string_serializer: bool | None = None,
+        send_reasoning_content: bool | None = None,
+        cache_last_content: bool = False,
+    ) -> dict[str, Any]:
         """Serialize message for OpenAI Chat Completions.
 
         Chooses the appropriate content serializer and then injects threading keys:
         - Assistant tool call turn: role == "assistant" and self.tool_calls
         - Tool result turn: role == "tool" and self.tool_call_id (with name)
+
+        The serialization flags default to the fields of this message; passing
+        them explicitly lets callers format shared messages without mutating
+        (or copying) them. `cache_last_content` marks the last content item as
+        a prompt caching breakpoint for this call only.
         """
-        if not self.force_string_serializer and (
-            self.cache_enabled or self.vision_enabled or self.function_calling_enabled
+        if cache_enabled is None:
+            cache_enabled = self.cache_enabled
+        if vision_enabled is None:
+            vision_enabled = self.vision_enabled
+        if function_calling_enabled is None:
+            function_calling_enabled = self.function_calling_enabled
+        if force_string_serializer is None:
+            force_string_serializer = self.force_string_serializer
+        if send_reasoning_content is None:
+            send_reasoning_content = self.send_reasoning_content
+
+        if not force_string_serializer and (
+            cache_enabled or vision_enabled or function_calling_enabled
         ):
-            message_dict = self._list_serializer()
+            message_dict = self._list_serializer(
+                vision_enabled=vision_enabled, cache_last_content=cache_last_content
+            )
         else:
             # some providers, like HF and Groq/llama, don't support a list here, but a
             # single string
@@ -293,7 +331,7 @@ class Message(BaseModel):
             message_dict["name"] = self.name
 
         # Required for model like kimi-k2-thinking
-        if self.send_reasoning_content and self.reasoning_content:
+        if send_reasoning_content and self.reasoning_content:
             message_dict["reasoning_content"] = self.reasoning_content
 
         return message_dict
@@ -308,7 +346,11 @@ class Message(BaseModel):
         # tool call keys are added in to_chat_dict to centralize behavior
         return message_dict
 
-    def _list_serializer(self) -> dict[str, Any]:
+    def _list_serializer(
+        self, vision_enabled: bool | None = None, cache_last_content: bool = False
+    ) -> dict[str, Any]:
+        if vision_enabled is None:
+            vision_enabled = self.vision_enabled
         content: list[dict[str, Any]] = []
         role_tool_with_prompt_caching = False
 
@@ -323,20 +365,24 @@ class Message(BaseModel):
                 thinking_dict = thinking_block.model_dump()
                 thinking_blocks_dicts.append(thinking_dict)
 
-        for item in self.content:
+        last_index = len(self.content) - 1
+        for index, item in enumerate(self.content):
+            cache_prompt = item.cache_prompt or (
+                cache_last_content and index == last_index
+            )
             # All content types now return list[dict[str, Any]]
-            item_dicts = item.to_llm_dict()
+            item_dicts = item.to_llm_dict(cache_prompt=cache_prompt)
 
             # We have to remove cache_prompt for tool content and move it up to the
             # message level
             # See discussion here for details: https://github.com/BerriAI/litellm/issues/6422#issuecomment-2438765472
-            if self.role == "tool" and item.cache_prompt:
+            if self.role == "tool" and cache_prompt:
                 role_tool_with_prompt_caching = True
                 for d in item_dicts:
                     d.pop("cache_control", None)
 
             # Handle vision-enabled filtering for ImageContent
-            if isinstance(item, ImageContent) and self.vision_enabled:
+            if isinstance(item, ImageContent) and vision_enabled:
                 content.extend(item_dicts)
             elif not isinstance(item, ImageContent):
                 # Add non-image content (TextContent, etc.)
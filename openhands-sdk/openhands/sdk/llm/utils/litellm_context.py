@@ -0,0 +1,77 @@
+"""Per-call values of litellm's module-level settings.
+
+litellm only reads `modify_params` from a module global, so an LLM setting it
+for the duration of a call would leak the value to the calls of other LLMs
+running concurrently in other threads or coroutines. Calls are admitted
+through a gate instead: any number of calls wanting the same value run
+concurrently, while a call wanting the other value waits until they are done.
+Outside of calls the global keeps the value it had before them.
+"""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
+import litellm
+
+
+class _ModifyParamsGate:
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._active = 0
+        self._outside = False
+
+    def _try_enter(self, flag: bool) -> bool:
+        # Caller holds self._cond.
+        if self._active == 0:
+            self._outside = litellm.modify_params
+            litellm.modify_params = flag
+        elif litellm.modify_params != flag:
+            return False
+        self._active += 1
+        return True
+
+    def _exit(self) -> None:
+        with self._cond:
+            self._active -= 1
+            if self._active == 0:
+                litellm.modify_params = self._outside
+                self._cond.notify_all()
+
+    @contextmanager
+    def scope(self, flag: bool) -> Iterator[None]:
+        with self._cond:
+            self._cond.wait_for(lambda: self._try_enter(flag))
+        try:
+            yield
+        finally:
+            self._exit()
+
+    @asynccontextmanager
+    async def ascope(self, flag: bool) -> AsyncIterator[None]:
+        # Poll rather than wait on the condition so the event loop never blocks.
+        delay = 0.001
+        while True:
+            with self._cond:
+                if self._try_enter(flag):
+                    break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        try:
+            yield
+        finally:
+            self._exit()
+
+
+_gate = _ModifyParamsGate()
+
+
+def litellm_modify_params(flag: bool):
+    """Set litellm's `modify_params` for the synchronous call made in this context."""
+    return _gate.scope(flag)
+
+
+def alitellm_modify_params(flag: bool):
+    """Async counterpart of `litellm_modify_params`."""
+    return _gate.ascope(flag)
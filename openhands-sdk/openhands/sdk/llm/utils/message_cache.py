@@ -0,0 +1,203 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from openhands.sdk.llm.message import Message
+
+
+# Default number of messages kept by the shared cache. An agent step touches
+# every message of the history in order, so this should comfortably exceed
+# the length of long conversations: an LRU smaller than the working set
+# misses on every access.
+DEFAULT_MESSAGE_CACHE_MAX_ENTRIES = 20_000
+# Default memory budget of the shared cache, which also keeps the events the
+# messages were built from alive, whether or not EventLog still caches them.
+# Sizes are estimated from the strings of each message.
+DEFAULT_MESSAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _estimate_size(message: "Message") -> int:
+    size = len(message.reasoning_content or "")
+    for content in message.content:
+        size += len(getattr(content, "text", ""))
+        size += sum(map(len, getattr(content, "image_urls", ())))
+    for tool_call in message.tool_calls or ():
+        size += len(tool_call.arguments)
+    for block in message.thinking_blocks:
+        size += len(getattr(block, "thinking", "") or getattr(block, "data", ""))
+    return size
+
+
+def _copy_payload(payload: Any) -> Any:
+    """Copy the dicts and lists of a serialized message; the strings and
+    other leaves are immutable and shared."""
+    if isinstance(payload, dict):
+        return {key: _copy_payload(value) for key, value in payload.items()}
+    if isinstance(payload, list):
+        return [_copy_payload(value) for value in payload]
+    return payload
+
+
+class _Entry:
+    __slots__ = ("key", "sources", "message", "payloads", "message_size", "size")
+
+    def __init__(
+        self, key: tuple[str, ...], sources: tuple[object, ...], message: "Message"
+    ) -> None:
+        self.key = key
+        self.sources = sources
+        self.message = message
+        self.payloads: dict[Hashable, Any] = {}
+        # The message and its events each hold the contents, as does every
+        # payload once memoized
+        self.message_size = _estimate_size(message)
+        self.size = 2 * self.message_size
+
+
+class MessageCache:
+    """Bounded LRU cache of LLM messages built from events and their
+    serialized forms.
+
+    Events are immutable, so the `Message` built from an event (or from a
+    batch of action events) is reused across agent steps, keyed by the event
+    ids. Each cached message also memoizes its serialized payloads (chat
+    dicts, Responses items) keyed by the formatting flags, so building a
+    request only serializes messages that are new since the previous step.
+
+    Cached messages are shared and must not be mutated, while payloads are
+    returned as copies that callers may modify. Messages that did not come
+    from `get_message` are never cached, since callers may mutate them
+    between calls. The cache is bounded both by number of messages and by the
+    estimated memory of the messages, their events and payloads.
+    """
+
+    _max_entries: int
+    _max_bytes: int
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MESSAGE_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MESSAGE_CACHE_MAX_BYTES,
+    ) -> None:
+        self._max_entries = max(0, max_entries)
+        self._max_bytes = max(0, max_bytes)
+        self._size = 0
+        self._entries: OrderedDict[tuple[str, ...], _Entry] = OrderedDict()
+        # id(message) -> entry; entries hold the message, so ids are not reused
+        self._by_message: dict[int, _Entry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_message.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get_message(
+        self,
+        key: tuple[str, ...],
+        sources: Sequence[object],
+        build: Callable[[], "Message"],
+    ) -> "Message":
+        """Return the cached message for `key`, building it on a miss.
+
+        Args:
+            key: Ids of the events the message is built from.
+            sources: The events themselves. A cached message is only reused
+                if it was built from these very objects, so events that were
+                reloaded or recreated with a reused id are converted again.
+            build: Creates the message on a cache miss.
+        """
+        sources = tuple(sources)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and _same_objects(entry.sources, sources):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.message
+            self.misses += 1
+
+        message = build()
+        if self._max_entries == 0:
+            return message
+        entry = _Entry(key, sources, message)
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                self._remove(previous)
+            if entry.size > self._max_bytes:
+                return message
+            self._entries[key] = entry
+            self._by_message[id(message)] = entry
+            self._size += entry.size
+            self._evict()
+        return message
+
+    def get_payload[T](
+        self, message: "Message", flags: Hashable, serialize: Callable[[], T]
+    ) -> T:
+        """Return the serialized form of `message` for the given flags.
+
+        Payloads are only memoized for messages returned by `get_message`;
+        any other message is serialized on every call. The payload returned
+        is a copy of the memoized one, which callers may modify.
+        """
+        with self._lock:
+            entry = self._by_message.get(id(message))
+            if entry is not None and entry.message is message:
+                payload = entry.payloads.get(flags)
+                if payload is not None:
+                    return _copy_payload(payload)
+            else:
+                entry = None
+
+        payload = serialize()
+        if entry is not None:
+            with self._lock:
+                # The entry may have been evicted meanwhile
+                if (
+                    self._by_message.get(id(message)) is entry
+                    and flags not in entry.payloads
+                ):
+                    entry.payloads[flags] = payload
+                    entry.size += entry.message_size
+                    self._size += entry.message_size
+                    self._evict()
+            payload = _copy_payload(payload)
+        return payload
+
+    def _remove(self, entry: _Entry) -> None:
+        del self._entries[entry.key]
+        self._by_message.pop(id(entry.message), None)
+        self._size -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._size > self._max_bytes
+        ):
+            self._remove(next(iter(self._entries.values())))
+
+
+def _same_objects(a: tuple[object, ...], b: tuple[object, ...]) -> bool:
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+message_cache = MessageCache()
+"""Process-wide cache shared by `LLMConvertibleEvent.events_to_messages` and
+`LLM.format_messages_for_llm` / `LLM.format_messages_for_responses`."""
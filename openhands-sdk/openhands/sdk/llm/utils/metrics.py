@@ -1,4 +1,5 @@
 import copy
+import math
 import time
 from typing import final
 
@@ -73,6 +74,97 @@ class TokenUsage(BaseModel):
         )
 
 
+# Number of most recent per-call records kept by default
+DEFAULT_MAX_RECORDS = 1000
+
+# Latency histogram buckets: bucket 0 holds latencies below the minimum, and
+# each following bucket is 10% wider than the previous one
+_LATENCY_BUCKET_MIN = 0.001
+_LATENCY_BUCKET_GROWTH = 1.1
+
+
+class LatencyHistogram(BaseModel):
+    """Streaming summary of response latencies, in constant space.
+
+    Latencies are counted in logarithmic buckets, so quantiles are estimated
+    within 10% whatever the number of calls recorded.
+    """
+
+    count: int = Field(default=0, ge=0, description="Number of latencies recorded")
+    total: float = Field(default=0.0, ge=0.0, description="Sum of the latencies")
+    max_latency: float = Field(default=0.0, ge=0.0, description="Largest latency")
+    buckets: dict[int, int] = Field(
+        default_factory=dict, description="Number of latencies per (non-empty) bucket"
+    )
+
+    @staticmethod
+    def _bucket(latency: float) -> int:
+        if latency < _LATENCY_BUCKET_MIN:
+            return 0
+        return 1 + int(
+            math.log(latency / _LATENCY_BUCKET_MIN) / math.log(_LATENCY_BUCKET_GROWTH)
+        )
+
+    @staticmethod
+    def _bucket_upper_bound(bucket: int) -> float:
+        return _LATENCY_BUCKET_MIN * _LATENCY_BUCKET_GROWTH**bucket
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, latency: float) -> None:
+        self.count += 1
+        self.total += latency
+        self.max_latency = max(self.max_latency, latency)
+        bucket = self._bucket(latency)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.max_latency = max(self.max_latency, other.max_latency)
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+
+    def diff(self, baseline: "LatencyHistogram") -> "LatencyHistogram":
+        """The latencies recorded since `baseline`, a previous state of this
+        histogram. The largest latency is the one of all latencies."""
+        buckets = {}
+        for bucket, count in self.buckets.items():
+            count -= baseline.buckets.get(bucket, 0)
+            if count > 0:
+                buckets[bucket] = count
+        return LatencyHistogram(
+            count=max(0, self.count - baseline.count),
+            total=max(0.0, self.total - baseline.total),
+            max_latency=self.max_latency,
+            buckets=buckets,
+        )
+
+    def quantile(self, q: float) -> float:
+        """Estimate the latency below which a fraction `q` of latencies fall."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self._bucket_upper_bound(bucket), self.max_latency)
+        return self.max_latency
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max_latency,
+        }
+
+
 class MetricsSnapshot(BaseModel):
     """A snapshot of metrics at a point in time.
 
@@ -97,18 +189,39 @@ class Metrics(MetricsSnapshot):
     We track:
       - accumulated_cost and costs
       - max_budget_per_task (budget limit)
-      - A list of ResponseLatency
-      - A list of TokenUsage (one per call).
+      - A list of ResponseLatency, and a histogram of all latencies
+      - A list of TokenUsage (one per call), and token totals per model.
+
+    Only the `max_records` most recent costs, latencies and token usages are
+    kept, so that metrics stay the same size however many calls are made.
     """
 
     costs: list[Cost] = Field(
-        default_factory=list, description="List of individual costs"
+        default_factory=list, description="List of the most recent individual costs"
     )
     response_latencies: list[ResponseLatency] = Field(
-        default_factory=list, description="List of response latencies"
+        default_factory=list, description="List of the most recent response latencies"
     )
     token_usages: list[TokenUsage] = Field(
-        default_factory=list, description="List of token usage records"
+        default_factory=list, description="List of the most recent token usage records"
+    )
+    max_records: int | None = Field(
+        default=DEFAULT_MAX_RECORDS,
+        ge=0,
+        description=(
+            "Number of most recent records kept in costs, response_latencies and "
+            "token_usages. None keeps every record."
+        ),
+    )
+    latency_histogram: LatencyHistogram = Field(
+        default_factory=LatencyHistogram,
+        description="Summary of all response latencies",
+    )
+    token_usage_count: int = Field(
+        default=0, ge=0, description="Number of token usage records ever added"
+    )
+    token_usage_by_model: dict[str, TokenUsage] = Field(
+        default_factory=dict, description="Accumulated token usage per model"
     )
 
     @field_validator("accumulated_cost")
@@ -133,6 +246,37 @@ class Metrics(MetricsSnapshot):
             )
         return self
 
+    @model_validator(mode="after")
+    def summarize_records(self) -> "Metrics":
+        """Summarize the records of metrics persisted without summaries, and
+        drop the records past `max_records`."""
+        if not self.latency_histogram.count:
+            for latency in self.response_latencies:
+                self.latency_histogram.add(latency.latency)
+        if not self.token_usage_count and self.token_usages:
+            self.token_usage_count = len(self.token_usages)
+            for usage in self.token_usages:
+                self._add_model_token_usage(usage)
+        self._trim_records()
+        return self
+
+    def _trim(self, records: list) -> None:
+        if self.max_records is not None and len(records) > self.max_records:
+            del records[: len(records) - self.max_records]
+
+    def _trim_records(self) -> None:
+        self._trim(self.costs)
+        self._trim(self.response_latencies)
+        self._trim(self.token_usages)
+
+    def _add_model_token_usage(self, usage: TokenUsage) -> None:
+        total = self.token_usage_by_model.get(usage.model)
+        if total is None:
+            total = TokenUsage(model=usage.model)
+        self.token_usage_by_model[usage.model] = total + usage.model_copy(
+            update={"response_id": ""}
+        )
+
     def get_snapshot(self) -> MetricsSnapshot:
         """Get a snapshot of the current metrics without the detailed lists."""
         return MetricsSnapshot(
@@ -149,13 +293,17 @@ class Metrics(MetricsSnapshot):
             raise ValueError("Added cost cannot be negative.")
         self.accumulated_cost += value
         self.costs.append(Cost(cost=value, model=self.model_name))
+        self._trim(self.costs)
 
     def add_response_latency(self, value: float, response_id: str) -> None:
+        latency = max(0.0, value)
         self.response_latencies.append(
             ResponseLatency(
-                latency=max(0.0, value), model=self.model_name, response_id=response_id
+                latency=latency, model=self.model_name, response_id=response_id
             )
         )
+        self._trim(self.response_latencies)
+        self.latency_histogram.add(latency)
 
     def add_token_usage(
         self,
@@ -183,6 +331,9 @@ class Metrics(MetricsSnapshot):
             response_id=response_id,
         )
         self.token_usages.append(usage)
+        self._trim(self.token_usages)
+        self.token_usage_count += 1
+        self._add_model_token_usage(usage)
 
         # Update accumulated token usage using the __add__ operator
         new_usage = TokenUsage(
@@ -212,6 +363,11 @@ class Metrics(MetricsSnapshot):
         self.costs += other.costs
         self.token_usages += other.token_usages
         self.response_latencies += other.response_latencies
+        self._trim_records()
+        self.latency_histogram.merge(other.latency_histogram)
+        self.token_usage_count += other.token_usage_count
+        for usage in other.token_usage_by_model.values():
+            self._add_model_token_usage(usage)
 
         # Merge accumulated token usage using the __add__ operator
         if self.accumulated_token_usage is None:
@@ -234,6 +390,11 @@ class Metrics(MetricsSnapshot):
                 latency.model_dump() for latency in self.response_latencies
             ],
             "token_usages": [usage.model_dump() for usage in self.token_usages],
+            "response_latency_summary": self.latency_histogram.summary(),
+            "token_usage_by_model": {
+                model: usage.model_dump()
+                for model, usage in self.token_usage_by_model.items()
+            },
         }
 
     def log(self) -> str:
@@ -259,7 +420,7 @@ class Metrics(MetricsSnapshot):
         Returns:
             A new Metrics object containing only the differences since the baseline
         """
-        result = Metrics(model_name=self.model_name)
+        result = Metrics(model_name=self.model_name, max_records=self.max_records)
 
         # Calculate cost difference
         result.accumulated_cost = self.accumulated_cost - baseline.accumulated_cost
@@ -274,33 +435,45 @@ class Metrics(MetricsSnapshot):
             result.costs = self.costs.copy()
 
         # Include only response latencies that were added after the baseline
-        result.response_latencies = self.response_latencies[
-            len(baseline.response_latencies) :
-        ]
+        result.latency_histogram = self.latency_histogram.diff(
+            baseline.latency_histogram
+        )
+        result.response_latencies = self._last(
+            self.response_latencies, result.latency_histogram.count
+        )
 
         # Include only token usages that were added after the baseline
-        result.token_usages = self.token_usages[len(baseline.token_usages) :]
+        result.token_usage_count = max(
+            0, self.token_usage_count - baseline.token_usage_count
+        )
+        result.token_usages = self._last(self.token_usages, result.token_usage_count)
+        # The records may be trimmed: diff the per-model totals instead
+        for model, total in self.token_usage_by_model.items():
+            base_total = baseline.token_usage_by_model.get(model)
+            usage = (
+                total.model_copy()
+                if base_total is None
+                else self._token_usage_diff(total, base_total)
+            )
+            if any(
+                (
+                    usage.prompt_tokens,
+                    usage.completion_tokens,
+                    usage.cache_read_tokens,
+                    usage.cache_write_tokens,
+                    usage.reasoning_tokens,
+                )
+            ):
+                result.token_usage_by_model[model] = usage
 
         # Calculate accumulated token usage difference
         base_usage = baseline.accumulated_token_usage
         current_usage = self.accumulated_token_usage
 
         if current_usage is not None and base_usage is not None:
-            result.accumulated_token_usage = TokenUsage(
-                model=self.model_name,
-                prompt_tokens=current_usage.prompt_tokens - base_usage.prompt_tokens,
-                completion_tokens=current_usage.completion_tokens
-                - base_usage.completion_tokens,
-                cache_read_tokens=current_usage.cache_read_tokens
-                - base_usage.cache_read_tokens,
-                cache_write_tokens=current_usage.cache_write_tokens
-                - base_usage.cache_write_tokens,
-                reasoning_tokens=current_usage.reasoning_tokens
-                - base_usage.reasoning_tokens,
-                context_window=current_usage.context_window,
-                per_turn_token=0,
-                response_id="",
-            )
+            result.accumulated_token_usage = self._token_usage_diff(
+                current_usage, base_usage
+            ).model_copy(update={"model": self.model_name})
         elif current_usage is not None:
             result.accumulated_token_usage = current_usage
         else:
@@ -308,5 +481,23 @@ class Metrics(MetricsSnapshot):
 
         return result
 
+    @staticmethod
+    def _token_usage_diff(current: TokenUsage, base: TokenUsage) -> TokenUsage:
+        return TokenUsage(
+            model=current.model,
+            prompt_tokens=current.prompt_tokens - base.prompt_tokens,
+            completion_tokens=current.completion_tokens - base.completion_tokens,
+            cache_read_tokens=current.cache_read_tokens - base.cache_read_tokens,
+            cache_write_tokens=current.cache_write_tokens - base.cache_write_tokens,
+            reasoning_tokens=current.reasoning_tokens - base.reasoning_tokens,
+            context_window=current.context_window,
+            per_turn_token=0,
+            response_id="",
+        )
+
+    @staticmethod
+    def _last(records: list, count: int) -> list:
+        return records[len(records) - count :] if count else []
+
     def __repr__(self) -> str:
         return f"Metrics({self.get()}"
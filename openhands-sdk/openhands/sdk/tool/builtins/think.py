@@ -70,6 +70,9 @@ The tool simply logs your thought process for better transparency and does not e
 
 
 class ThinkExecutor(ToolExecutor):
+    def is_parallel_safe(self, action: ThinkAction) -> bool:  # noqa: ARG002
+        return True
+
     def __call__(
         self,
         _: ThinkAction,
@@ -1,3 +1,4 @@
+import asyncio
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
@@ -117,6 +118,25 @@ class ToolExecutor[ActionT, ObservationT](ABC):
             An observation containing the results of the tool execution.
         """
 
+    async def acall(
+        self, action: ActionT, conversation: "LocalConversation | None" = None
+    ) -> ObservationT:
+        """Async counterpart of `__call__`, used by async agent steps.
+
+        The default implementation runs `__call__` in a worker thread.
+        Executors that can execute without blocking should override it.
+        """
+        return await asyncio.to_thread(self, action, conversation)
+
+    def is_parallel_safe(self, action: ActionT) -> bool:  # noqa: ARG002
+        """Whether the action can be executed concurrently with other
+        parallel-safe actions, e.g. from the same LLM response.
+
+        This holds for actions without side effects, on executors that can
+        serve concurrent calls. Default implementation returns False.
+        """
+        return False
+
     def close(self) -> None:
         """Close the executor and clean up resources.
 
@@ -306,7 +326,24 @@ class ToolDefinition[ActionT, ObservationT](DiscriminatedUnionMixin, ABC):
 
         # Execute
         result = self.executor(action, conversation)
+        return self._coerce_observation(result)
+
+    async def acall(
+        self, action: ActionT, conversation: "LocalConversation | None" = None
+    ) -> Observation:
+        """Async counterpart of `__call__`."""
+        if self.executor is None:
+            raise NotImplementedError(f"Tool '{self.name}' has no executor")
+
+        result = await self.executor.acall(action, conversation)
+        return self._coerce_observation(result)
+
+    def is_parallel_safe(self, action: ActionT) -> bool:
+        """Whether the action can be executed concurrently with other
+        parallel-safe actions (see `ToolExecutor.is_parallel_safe`)."""
+        return self.executor is not None and self.executor.is_parallel_safe(action)
 
+    def _coerce_observation(self, result: Any) -> Observation:
         # Coerce output only if we declared a model; else wrap in base Observation
         if self.observation_type:
             if isinstance(result, self.observation_type):
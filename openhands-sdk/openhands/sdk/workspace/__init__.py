@@ -1,14 +1,22 @@
 from .base import BaseWorkspace
 from .local import LocalWorkspace
-from .models import CommandResult, FileOperationResult
-from .remote import RemoteWorkspace
+from .models import (
+    CommandOutputChunk,
+    CommandResult,
+    DirectorySyncResult,
+    FileOperationResult,
+)
+from .remote import HTTPPoolConfig, RemoteWorkspace
 from .workspace import Workspace
 
 
 __all__ = [
     "BaseWorkspace",
+    "CommandOutputChunk",
     "CommandResult",
+    "DirectorySyncResult",
     "FileOperationResult",
+    "HTTPPoolConfig",
     "LocalWorkspace",
     "RemoteWorkspace",
     "Workspace",
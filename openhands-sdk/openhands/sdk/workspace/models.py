@@ -15,6 +15,17 @@ class CommandResult(BaseModel):
     )
 
 
+class CommandOutputChunk(BaseModel):
+    """Output produced by a running command since the previous chunk."""
+
+    stdout: str = Field(default="", description="Standard output in this chunk")
+    stderr: str = Field(default="", description="Standard error in this chunk")
+    exit_code: int | None = Field(
+        default=None,
+        description="Exit code of the command, set only on the final chunk",
+    )
+
+
 class FileOperationResult(BaseModel):
     """Result of a file upload or download operation."""
 
@@ -27,3 +38,24 @@ class FileOperationResult(BaseModel):
     error: str | None = Field(
         default=None, description="Error message (if operation failed)"
     )
+
+
+class DirectorySyncResult(BaseModel):
+    """Result of synchronizing a local directory to the workspace."""
+
+    success: bool = Field(description="Whether every changed file was transferred")
+    source_path: str = Field(description="Path to the source directory")
+    destination_path: str = Field(description="Path to the destination directory")
+    uploaded: list[str] = Field(
+        default_factory=list,
+        description="Paths, relative to the directory, of the files uploaded",
+    )
+    unchanged: int = Field(
+        default=0, description="Number of files which were already up to date"
+    )
+    failed: list[FileOperationResult] = Field(
+        default_factory=list, description="Results of the failed uploads"
+    )
+    error: str | None = Field(
+        default=None, description="Error message (if the sync could not be done)"
+    )
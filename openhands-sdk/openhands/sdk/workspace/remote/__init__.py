@@ -1,8 +1,11 @@
 """Remote workspace implementations."""
 
 from .base import RemoteWorkspace
+from .transport import HTTPPoolConfig, close_shared_transports
 
 
 __all__ = [
+    "HTTPPoolConfig",
     "RemoteWorkspace",
+    "close_shared_transports",
 ]
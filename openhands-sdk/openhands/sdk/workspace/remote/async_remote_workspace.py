@@ -1,13 +1,24 @@
-from collections.abc import Generator
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Generator, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import httpx
 from pydantic import PrivateAttr
 
 from openhands.sdk.git.models import GitChange, GitDiff
-from openhands.sdk.workspace.models import CommandResult, FileOperationResult
+from openhands.sdk.workspace.models import (
+    CommandOutputChunk,
+    CommandResult,
+    DirectorySyncResult,
+    FileOperationResult,
+)
 from openhands.sdk.workspace.remote.remote_workspace_mixin import RemoteWorkspaceMixin
+from openhands.sdk.workspace.remote.transport import (
+    create_async_transport,
+    shared_async_transport,
+)
 
 
 class AsyncRemoteWorkspace(RemoteWorkspaceMixin):
@@ -19,7 +30,17 @@ class AsyncRemoteWorkspace(RemoteWorkspaceMixin):
     def client(self) -> httpx.AsyncClient:
         client = self._client
         if client is None:
-            client = httpx.AsyncClient(base_url=self.host)
+            pool = self.http_pool
+            if self.share_connections:
+                transport = shared_async_transport(pool)
+            else:
+                transport = create_async_transport(pool)
+            client = httpx.AsyncClient(
+                base_url=self.host,
+                timeout=pool.timeout,
+                headers=self._headers,
+                transport=transport,
+            )
             self._client = client
         return client
 
@@ -40,8 +61,8 @@ class AsyncRemoteWorkspace(RemoteWorkspaceMixin):
     ) -> CommandResult:
         """Execute a bash command on the remote system.
 
-        This method starts a bash command via the remote agent server API,
-        then polls for the output until the command completes.
+        The output is streamed back by the remote agent server as the command
+        runs. Agent servers without the streaming endpoint are polled instead.
 
         Args:
             command: The bash command to execute
@@ -51,27 +72,74 @@ class AsyncRemoteWorkspace(RemoteWorkspaceMixin):
         Returns:
             CommandResult: Result with stdout, stderr, exit_code, and other metadata
         """
-        generator = self._execute_command_generator(command, cwd, timeout)
-        result = await self._execute(generator)
-        return result
+        start_time = time.time()
+        chunks: list[CommandOutputChunk] = []
+        try:
+            async for chunk in self.stream_command(command, cwd, timeout):
+                chunks.append(chunk)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                return self._command_error_result(command, e)
+            generator = self._execute_command_generator(command, cwd, timeout)
+            return await self._execute(generator)
+        except httpx.TimeoutException:
+            # Keep the output received so far; it is reported as a timeout
+            pass
+        except Exception as e:
+            return self._command_error_result(command, e)
+        return self._command_result_from_chunks(
+            command, chunks, timeout, time.time() - start_time
+        )
+
+    async def stream_command(
+        self,
+        command: str,
+        cwd: str | Path | None = None,
+        timeout: float = 30.0,
+    ) -> AsyncGenerator[CommandOutputChunk, None]:
+        """Execute a bash command on the remote system, yielding its output as
+        it is produced.
+
+        Args:
+            command: The bash command to execute
+            cwd: Working directory (optional)
+            timeout: Timeout in seconds
+
+        Yields:
+            CommandOutputChunk: Output written since the previous chunk. The
+            last chunk carries the exit code.
+
+        Raises:
+            httpx.HTTPError: If the request fails or the stream is interrupted
+        """
+        request = self._stream_command_request(command, cwd, timeout)
+        async with self.client.stream(**request) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                chunk = self._parse_command_stream_line(line)
+                if chunk is not None:
+                    yield chunk
 
     async def file_upload(
         self,
         source_path: str | Path,
         destination_path: str | Path,
+        resume: bool = False,
     ) -> FileOperationResult:
         """Upload a file to the remote system.
 
-        Reads the local file and sends it to the remote system via HTTP API.
+        Streams the local file to the remote system via HTTP API, in chunks of
+        `file_transfer_chunk_size` bytes.
 
         Args:
             source_path: Path to the local source file
             destination_path: Path where the file should be uploaded on remote system
+            resume: Whether to continue an interrupted upload rather than start over
 
         Returns:
             FileOperationResult: Result with success status and metadata
         """
-        generator = self._file_upload_generator(source_path, destination_path)
+        generator = self._file_upload_generator(source_path, destination_path, resume)
         result = await self._execute(generator)
         return result
 
@@ -79,19 +147,80 @@ class AsyncRemoteWorkspace(RemoteWorkspaceMixin):
         self,
         source_path: str | Path,
         destination_path: str | Path,
+        resume: bool = False,
     ) -> FileOperationResult:
         """Download a file from the remote system.
 
-        Requests the file from the remote system via HTTP API and saves it locally.
+        Streams the file from the remote system via HTTP API and saves it locally,
+        in chunks of `file_transfer_chunk_size` bytes.
 
         Args:
             source_path: Path to the source file on remote system
             destination_path: Path where the file should be saved locally
+            resume: Whether to continue an interrupted download, requesting only
+                the bytes past the end of the local file if the remote file did
+                not change since. Downloaded files get the modification time of
+                the remote file.
 
         Returns:
             FileOperationResult: Result with success status and metadata
         """
-        generator = self._file_download_generator(source_path, destination_path)
+        source = Path(source_path)
+        destination = Path(destination_path)
+        offset = self._download_offset(destination, resume)
+        try:
+            async with self.client.stream(
+                **self._file_download_request(source, destination, offset)
+            ) as response:
+                if response.status_code == 416 and offset:
+                    restart = not self._download_is_complete(response, offset)
+                else:
+                    restart = False
+                    f = await asyncio.to_thread(
+                        self._open_download, destination, response
+                    )
+                    try:
+                        async for chunk in response.aiter_bytes(
+                            self.file_transfer_chunk_size
+                        ):
+                            await asyncio.to_thread(f.write, chunk)
+                    finally:
+                        await asyncio.to_thread(self._close_download, f, response)
+            if restart:
+                # The local file is longer than the remote one: start over
+                return await self.file_download(source, destination)
+            return FileOperationResult(
+                success=True,
+                source_path=str(source),
+                destination_path=str(destination),
+                file_size=destination.stat().st_size,
+            )
+        except Exception as e:
+            return self._file_transfer_error(source, destination, e)
+
+    async def sync_directory(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        compare: Literal["mtime", "sha256"] = "mtime",
+        exclude: Sequence[str] = (),
+    ) -> DirectorySyncResult:
+        """Upload the files of a local directory which are missing or differ on
+        the remote system.
+
+        Args:
+            source_dir: Path to the local directory
+            destination_dir: Path to the directory on the remote system
+            compare: Compare files by size and modification time ("mtime"), or by
+                size and content hash ("sha256")
+            exclude: Glob patterns of files and directories not to upload
+
+        Returns:
+            DirectorySyncResult: The files uploaded and the number unchanged
+        """
+        generator = self._sync_directory_generator(
+            source_dir, destination_dir, compare, exclude
+        )
         result = await self._execute(generator)
         return result
 
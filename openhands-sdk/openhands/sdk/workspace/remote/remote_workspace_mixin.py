@@ -1,18 +1,72 @@
+import hashlib
+import json
 import logging
+import os
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
+from email.utils import formatdate, parsedate_to_datetime
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Literal
 
 import httpx
 from pydantic import BaseModel, Field, TypeAdapter
 
 from openhands.sdk.git.models import GitChange, GitDiff
-from openhands.sdk.workspace.models import CommandResult, FileOperationResult
+from openhands.sdk.workspace.models import (
+    CommandOutputChunk,
+    CommandResult,
+    DirectorySyncResult,
+    FileOperationResult,
+)
+from openhands.sdk.workspace.remote.transport import HTTPPoolConfig
 
 
 _logger = logging.getLogger(__name__)
 
+# Modification times are compared with this tolerance (seconds), as they may lose
+# precision on the way to the remote file system
+_MTIME_TOLERANCE = 0.01
+
+
+class _FileSlice:
+    """The part of a binary file from `offset` to its end.
+
+    Positions are relative to `offset`, so that httpx sends the slice (With its
+    length) when uploading it, and reads return `chunk_size` bytes whatever the
+    size requested.
+    """
+
+    def __init__(self, file: BinaryIO, offset: int, chunk_size: int):
+        self._file = file
+        self._offset = offset
+        self._chunk_size = chunk_size
+        file.seek(offset)
+
+    def read(self, size: int = -1) -> bytes:  # noqa: ARG002
+        return self._file.read(self._chunk_size)
+
+    def seek(self, pos: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            pos += self._offset
+        return self._file.seek(pos, whence) - self._offset
+
+    def tell(self) -> int:
+        return self._file.tell() - self._offset
+
+
+def _prefix_sha256(path: Path, size: int, chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 of the first `size` bytes of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while size > 0:
+            chunk = f.read(min(chunk_size, size))
+            if not chunk:
+                break
+            digest.update(chunk)
+            size -= len(chunk)
+    return digest.hexdigest()
+
 
 class RemoteWorkspaceMixin(BaseModel):
     """Mixin providing remote workspace operations.
@@ -25,6 +79,25 @@ class RemoteWorkspaceMixin(BaseModel):
     working_dir: str = Field(
         description="The working directory for agent operations and tool execution."
     )
+    file_transfer_chunk_size: int = Field(
+        default=1024 * 1024,
+        gt=0,
+        description="Size in bytes of the chunks in which files are transferred.",
+    )
+    http_pool: HTTPPoolConfig = Field(
+        default_factory=HTTPPoolConfig,
+        description="Connection pool limits and timeouts of the HTTP client.",
+    )
+    share_connections: bool = Field(
+        default=False,
+        description=(
+            "Send requests through the connection pool shared by all workspaces "
+            "with the same http_pool configuration, rather than a pool of their own. "
+            "The pool limits then apply to all these workspaces together, "
+            "including their streamed commands and file transfers, which hold a "
+            "connection until they complete."
+        ),
+    )
 
     def model_post_init(self, context: Any) -> None:
         # Set up remote host
@@ -87,6 +160,7 @@ class RemoteWorkspaceMixin(BaseModel):
             stdout_parts = []
             stderr_parts = []
             exit_code = None
+            seen_event_ids: set[str] = set()
 
             while time.time() - start_time < timeout:
                 # Search for all events
@@ -106,6 +180,12 @@ class RemoteWorkspaceMixin(BaseModel):
 
                 # Filter for BashOutput events for this command
                 for event in search_result.get("items", []):
+                    # Each poll returns every event for the command so far
+                    event_id = event.get("id")
+                    if event_id is not None:
+                        if event_id in seen_event_ids:
+                            continue
+                        seen_event_ids.add(event_id)
                     if event.get("kind") == "BashOutput":
                         if event.get("stdout"):
                             stdout_parts.append(event["stdout"])
@@ -149,18 +229,104 @@ class RemoteWorkspaceMixin(BaseModel):
                 timeout_occurred=False,
             )
 
+    def _stream_command_request(
+        self,
+        command: str,
+        cwd: str | Path | None,
+        timeout: float,
+    ) -> dict[str, Any]:
+        """Build the request for running a command with its output streamed back.
+
+        The agent server responds with newline delimited JSON: the started
+        command, followed by output chunks as the process writes them. The
+        last chunk carries the exit code.
+        """
+        payload: dict[str, Any] = {
+            "command": command,
+            "timeout": int(timeout),
+        }
+        if cwd is not None:
+            payload["cwd"] = str(cwd)
+        return {
+            "method": "POST",
+            "url": f"{self.host}/api/bash/stream_bash_command",
+            "json": payload,
+            "headers": self._headers,
+            "timeout": timeout + 5.0,  # Add buffer to HTTP timeout
+        }
+
+    def _parse_command_stream_line(self, line: str) -> CommandOutputChunk | None:
+        """Parse a line of a command output stream, or None if it holds no output."""
+        if not line.strip():
+            return None
+        item = json.loads(line)
+        if "command_id" not in item:
+            # The started command itself
+            return None
+        return CommandOutputChunk(
+            stdout=item.get("stdout") or "",
+            stderr=item.get("stderr") or "",
+            exit_code=item.get("exit_code"),
+        )
+
+    def _command_result_from_chunks(
+        self,
+        command: str,
+        chunks: list[CommandOutputChunk],
+        timeout: float,
+        elapsed: float,
+    ) -> CommandResult:
+        """Combine the streamed output of a command into a CommandResult.
+
+        The agent server kills commands running past their timeout and reports
+        an exit code of -1; a stream that ends without an exit code is treated
+        the same way.
+        """
+        stdout = "".join(chunk.stdout for chunk in chunks)
+        stderr = "".join(chunk.stderr for chunk in chunks)
+        exit_code = chunks[-1].exit_code if chunks else None
+        timeout_occurred = exit_code is None or (exit_code == -1 and elapsed >= timeout)
+        if timeout_occurred:
+            _logger.warning(f"Command timed out after {timeout} seconds: {command}")
+            exit_code = -1
+            stderr += f"Command timed out after {timeout} seconds"
+        assert exit_code is not None
+        return CommandResult(
+            command=command,
+            exit_code=exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            timeout_occurred=timeout_occurred,
+        )
+
+    def _command_error_result(self, command: str, error: Exception) -> CommandResult:
+        _logger.error(f"Remote command execution failed: {error}")
+        return CommandResult(
+            command=command,
+            exit_code=-1,
+            stdout="",
+            stderr=f"Remote execution error: {str(error)}",
+            timeout_occurred=False,
+        )
+
     def _file_upload_generator(
         self,
         source_path: str | Path,
         destination_path: str | Path,
+        resume: bool = False,
     ) -> Generator[dict[str, Any], httpx.Response, FileOperationResult]:
         """Upload a file to the remote system.
 
-        Reads the local file and sends it to the remote system via HTTP API.
+        The local file is streamed to the remote system in chunks, so memory use
+        does not depend on its size. The modification time of the local file is
+        kept.
 
         Args:
             source_path: Path to the local source file
             destination_path: Path where the file should be uploaded on remote system
+            resume: Whether to continue an interrupted upload, sending only the
+                part of the file past the end of the remote file if the remote
+                file has the same content as the start of the local file
 
         Returns:
             FileOperationResult: Result with success status and metadata
@@ -171,23 +337,43 @@ class RemoteWorkspaceMixin(BaseModel):
         _logger.debug(f"Remote file upload: {source} -> {destination}")
 
         try:
-            # Read the file content
-            with open(source, "rb") as f:
-                file_content = f.read()
+            stat = source.stat()
+            offset = 0
+            if resume:
+                response: httpx.Response = yield {
+                    "method": "GET",
+                    "url": f"{self.host}/api/file/info/{destination}",
+                    "params": {"sha256": True},
+                    "headers": self._headers,
+                    "timeout": 60.0,
+                }
+                if response.status_code != 404:
+                    response.raise_for_status()
+                    remote = response.json()
+                    if remote["size"] <= stat.st_size and remote[
+                        "sha256"
+                    ] == _prefix_sha256(source, remote["size"]):
+                        offset = remote["size"]
 
-            # Prepare the upload
-            files = {"file": (source.name, file_content)}
-            data = {"destination_path": str(destination)}
+            with open(source, "rb") as f:
+                # Prepare the upload
+                content = _FileSlice(f, offset, self.file_transfer_chunk_size)
+                files = {"file": (source.name, content)}
+                data = {
+                    "destination_path": str(destination),
+                    "offset": str(offset),
+                    "mtime": str(stat.st_mtime),
+                }
 
-            # Make HTTP call
-            response: httpx.Response = yield {
-                "method": "POST",
-                "url": f"{self.host}/api/file/upload/{destination}",
-                "files": files,
-                "data": data,
-                "headers": self._headers,
-                "timeout": 60.0,
-            }
+                # Make HTTP call
+                response = yield {
+                    "method": "POST",
+                    "url": f"{self.host}/api/file/upload/{destination}",
+                    "files": files,
+                    "data": data,
+                    "headers": self._headers,
+                    "timeout": 60.0,
+                }
             response.raise_for_status()
             result_data = response.json()
 
@@ -209,63 +395,156 @@ class RemoteWorkspaceMixin(BaseModel):
                 error=str(e),
             )
 
-    def _file_download_generator(
-        self,
-        source_path: str | Path,
-        destination_path: str | Path,
-    ) -> Generator[dict[str, Any], httpx.Response, FileOperationResult]:
-        """Download a file from the remote system.
+    def _file_download_request(
+        self, source: Path, destination: Path, offset: int
+    ) -> dict[str, Any]:
+        """Build the request for downloading a file, from `offset` onwards."""
+        headers = dict(self._headers)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            # The partial download has the modification time of the remote file
+            # it came from: the server sends the whole file if it changed since
+            headers["If-Range"] = formatdate(destination.stat().st_mtime, usegmt=True)
+        return {
+            "method": "GET",
+            "url": f"{self.host}/api/file/download/{source}",
+            "headers": headers,
+            "timeout": 60.0,
+        }
 
-        Requests the file from the remote system via HTTP API and saves it locally.
+    def _download_offset(self, destination: Path, resume: bool) -> int:
+        """Return the offset to download from: the size of a partial download of
+        the file being resumed, or 0."""
+        if resume and destination.is_file():
+            return destination.stat().st_size
+        return 0
+
+    def _download_is_complete(self, response: httpx.Response, offset: int) -> bool:
+        """Whether a 416 response to a resumed download means the local file is
+        already complete, rather than longer than the remote file."""
+        content_range = response.headers.get("content-range", "")
+        return content_range == f"bytes */{offset}"
+
+    def _open_download(self, destination: Path, response: httpx.Response) -> BinaryIO:
+        """Open the destination for writing the body of a download response,
+        appending to it if the response is the rest of a partial download."""
+        response.raise_for_status()
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        return open(destination, "ab" if response.status_code == 206 else "wb")
+
+    def _close_download(self, f: BinaryIO, response: httpx.Response) -> None:
+        """Close a downloaded file, even partially written, and give it the
+        modification time of the remote file, which resumed downloads send as
+        their If-Range validator."""
+        f.close()
+        last_modified = response.headers.get("last-modified")
+        if last_modified:
+            mtime = parsedate_to_datetime(last_modified).timestamp()
+            os.utime(f.name, (mtime, mtime))
+
+    def _file_transfer_error(
+        self, source: Path, destination: Path, error: Exception
+    ) -> FileOperationResult:
+        _logger.error(f"Remote file transfer failed: {error}")
+        return FileOperationResult(
+            success=False,
+            source_path=str(source),
+            destination_path=str(destination),
+            error=str(error),
+        )
+
+    def _sync_directory_generator(
+        self,
+        source_dir: str | Path,
+        destination_dir: str | Path,
+        compare: Literal["mtime", "sha256"] = "mtime",
+        exclude: Sequence[str] = (),
+    ) -> Generator[dict[str, Any], httpx.Response, DirectorySyncResult]:
+        """Upload the files of a local directory which differ from the files in
+        the remote directory.
 
         Args:
-            source_path: Path to the source file on remote system
-            destination_path: Path where the file should be saved locally
+            source_dir: Path to the local directory
+            destination_dir: Path to the directory on the remote system
+            compare: How files are compared. "mtime" compares size and modification
+                time, "sha256" compares size and content hash.
+            exclude: Glob patterns of files and directories to skip, matched
+                against the relative path and each of its components
 
         Returns:
-            FileOperationResult: Result with success status and metadata
+            DirectorySyncResult: The files uploaded and the number unchanged
         """
-        source = Path(source_path)
-        destination = Path(destination_path)
-
-        _logger.debug(f"Remote file download: {source} -> {destination}")
+        source = Path(source_dir)
+        destination = Path(destination_dir)
+        result = DirectorySyncResult(
+            success=False, source_path=str(source), destination_path=str(destination)
+        )
 
         try:
-            # Request the file from remote system
-            params = {"file_path": str(source)}
-
-            # Make HTTP call
-            response = yield {
+            response: httpx.Response = yield {
                 "method": "GET",
-                "url": "/api/file/download",
-                "params": params,
+                "url": f"{self.host}/api/file/manifest/{destination}",
+                "params": {"sha256": compare == "sha256"},
                 "headers": self._headers,
                 "timeout": 60.0,
             }
             response.raise_for_status()
-
-            # Ensure destination directory exists
-            destination.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write the file content
-            with open(destination, "wb") as f:
-                f.write(response.content)
-
-            return FileOperationResult(
-                success=True,
-                source_path=str(source),
-                destination_path=str(destination),
-                file_size=len(response.content),
-            )
-
+            remote_files = {item["path"]: item for item in response.json()}
+
+            for path in self._local_files(source, exclude):
+                relative_path = path.relative_to(source).as_posix()
+                remote = remote_files.get(relative_path)
+                if remote is not None and self._is_unchanged(path, remote, compare):
+                    result.unchanged += 1
+                    continue
+                upload = yield from self._file_upload_generator(
+                    path, destination / relative_path
+                )
+                if upload.success:
+                    result.uploaded.append(relative_path)
+                else:
+                    result.failed.append(upload)
         except Exception as e:
-            _logger.error(f"Remote file download failed: {e}")
-            return FileOperationResult(
-                success=False,
-                source_path=str(source),
-                destination_path=str(destination),
-                error=str(e),
-            )
+            _logger.error(f"Remote directory sync failed: {e}")
+            result.error = str(e)
+            return result
+
+        result.success = not result.failed
+        return result
+
+    def _local_files(self, root: Path, exclude: Sequence[str]) -> list[Path]:
+        files = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            relative_dir = Path(dirpath).relative_to(root)
+            dirnames[:] = [
+                name
+                for name in dirnames
+                if not self._is_excluded(relative_dir / name, exclude)
+            ]
+            for name in filenames:
+                path = Path(dirpath) / name
+                if path.is_symlink() or self._is_excluded(relative_dir / name, exclude):
+                    continue
+                files.append(path)
+        return files
+
+    def _is_excluded(self, relative_path: Path, exclude: Sequence[str]) -> bool:
+        return any(
+            fnmatch(relative_path.as_posix(), pattern)
+            or any(fnmatch(part, pattern) for part in relative_path.parts)
+            for pattern in exclude
+        )
+
+    def _is_unchanged(
+        self, path: Path, remote: dict[str, Any], compare: Literal["mtime", "sha256"]
+    ) -> bool:
+        stat = path.stat()
+        if stat.st_size != remote["size"]:
+            return False
+        if compare == "sha256":
+            with open(path, "rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest() == remote["sha256"]
+        return abs(stat.st_mtime - remote["mtime"]) <= _MTIME_TOLERANCE
 
     def _git_changes_generator(
         self,
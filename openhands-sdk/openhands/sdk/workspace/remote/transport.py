@@ -0,0 +1,179 @@
+"""Connection pools shared by the HTTP clients of remote workspaces.
+
+Each remote workspace has its own httpx client, for its base URL and API key,
+and by default a connection pool of its own. Clients of workspaces created
+with `share_connections=True` and the same `HTTPPoolConfig` send their
+requests through one shared transport instead. The transport pools keep-alive
+connections per host, so workspaces and conversations talking to the same
+agent server reuse each other's connections (and TLS sessions), but the limits
+then apply to all of them together: streamed command output and file
+transfers hold a connection for their whole duration, and may leave the other
+requests waiting for up to `pool_timeout`.
+
+Closing a client does not close the shared pool. Async pools are bound to an
+event loop, so there is one shared async transport per event loop.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class HTTPPoolConfig(BaseModel):
+    """Connection pool limits and timeouts of remote workspace clients."""
+
+    model_config = ConfigDict(frozen=True)
+
+    max_connections: int | None = Field(
+        default=100,
+        gt=0,
+        description="Maximum number of connections open at once (None: no limit)",
+    )
+    max_keepalive_connections: int | None = Field(
+        default=20,
+        ge=0,
+        description="Maximum number of idle connections kept open (None: no limit)",
+    )
+    keepalive_expiry: float | None = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds an idle connection is kept open (None: no expiry)",
+    )
+    http2: bool = Field(
+        default=False,
+        description=(
+            "Multiplex requests over HTTP/2 connections, with hosts supporting it. "
+            "Requires the h2 package (pip install httpx[http2])."
+        ),
+    )
+    connect_timeout: float = Field(
+        default=10.0, gt=0, description="Seconds to establish a connection"
+    )
+    read_timeout: float = Field(
+        default=60.0, gt=0, description="Seconds to wait for response data"
+    )
+    write_timeout: float = Field(
+        default=10.0, gt=0, description="Seconds to wait to send request data"
+    )
+    pool_timeout: float = Field(
+        default=10.0, gt=0, description="Seconds to wait for a pooled connection"
+    )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+_lock = threading.Lock()
+_transports: dict[HTTPPoolConfig, httpx.HTTPTransport] = {}
+_async_transports: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[HTTPPoolConfig, httpx.AsyncHTTPTransport]
+] = weakref.WeakKeyDictionary()
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """A client's handle on a shared transport; closing it keeps the pool."""
+
+    def __init__(self, config: HTTPPoolConfig) -> None:
+        self.config = config
+
+    @property
+    def transport(self) -> httpx.HTTPTransport:
+        with _lock:
+            transport = _transports.get(self.config)
+            if transport is None:
+                transport = create_transport(self.config)
+                _transports[self.config] = transport
+        return transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+    """A client's handle on the shared async transport of the running event
+    loop; closing it keeps the pool."""
+
+    def __init__(self, config: HTTPPoolConfig) -> None:
+        self.config = config
+
+    @property
+    def transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with _lock:
+            transports = _async_transports.setdefault(loop, {})
+            transport = transports.get(self.config)
+            if transport is None:
+                transport = create_async_transport(self.config)
+                transports[self.config] = transport
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _check_http2(config: HTTPPoolConfig) -> None:
+    # httpx only fails on the first request if h2 is missing
+    if config.http2 and importlib.util.find_spec("h2") is None:
+        raise ImportError(
+            "HTTP/2 requires the h2 package: install it with `pip install httpx[http2]`"
+        )
+
+
+def create_transport(config: HTTPPoolConfig) -> httpx.HTTPTransport:
+    """Return a new transport, with a pool of its own."""
+    _check_http2(config)
+    return httpx.HTTPTransport(limits=config.limits, http2=config.http2)
+
+
+def create_async_transport(config: HTTPPoolConfig) -> httpx.AsyncHTTPTransport:
+    """Return a new async transport, with a pool of its own."""
+    _check_http2(config)
+    return httpx.AsyncHTTPTransport(limits=config.limits, http2=config.http2)
+
+
+def shared_transport(config: HTTPPoolConfig) -> httpx.BaseTransport:
+    """Return a transport sending requests through the pool shared by all
+    clients with this configuration."""
+    _check_http2(config)
+    return _SharedTransport(config)
+
+
+def shared_async_transport(config: HTTPPoolConfig) -> httpx.AsyncBaseTransport:
+    """Return an async transport sending requests through the pool shared by
+    all async clients with this configuration, in the running event loop."""
+    _check_http2(config)
+    return _SharedAsyncTransport(config)
+
+
+def close_shared_transports() -> None:
+    """Close the connections of the shared sync pools, e.g. before exiting.
+    Pools are reopened on demand."""
+    with _lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()
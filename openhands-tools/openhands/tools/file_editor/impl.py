@@ -13,6 +13,7 @@ from openhands.tools.file_editor.definition import (
 )
 from openhands.tools.file_editor.editor import FileEditor
 from openhands.tools.file_editor.exceptions import ToolError
+from openhands.tools.utils.file_index import notify_file_changed
 
 
 # Module-global editor instance (lazily initialized in file_editor)
@@ -34,6 +35,10 @@ class FileEditorExecutor(ToolExecutor):
             else None
         )
 
+    def is_parallel_safe(self, action: FileEditorAction) -> bool:
+        """Viewing a file or directory only reads the file system."""
+        return action.command == "view"
+
     def __call__(
         self,
         action: FileEditorAction,
@@ -70,6 +75,9 @@ class FileEditorExecutor(ToolExecutor):
                 text=e.message, command=action.command, is_error=True
             )
         assert result is not None, "file_editor should always return a result"
+        if action.command != "view" and not result.is_error:
+            # Keep the file and content indexes of the workspace current
+            notify_file_changed(action.path)
         return result
 
 
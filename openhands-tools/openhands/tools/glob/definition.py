@@ -68,6 +68,7 @@ class GlobTool(ToolDefinition[GlobAction, GlobObservation]):
     def create(
         cls,
         conv_state: "ConversationState",
+        use_file_index: bool = False,
     ) -> Sequence["GlobTool"]:
         """Initialize GlobTool with a GlobExecutor.
 
@@ -75,6 +76,8 @@ class GlobTool(ToolDefinition[GlobAction, GlobObservation]):
             conv_state: Conversation state to get working directory from.
                          If provided, working_dir will be taken from
                          conv_state.workspace
+            use_file_index: Whether to use an in-memory index of the files of
+                            the working directory, built in the background
         """
         # Import here to avoid circular imports
         from openhands.tools.glob.impl import GlobExecutor
@@ -84,7 +87,7 @@ class GlobTool(ToolDefinition[GlobAction, GlobObservation]):
             raise ValueError(f"working_dir '{working_dir}' is not a valid directory")
 
         # Initialize the executor
-        executor = GlobExecutor(working_dir=working_dir)
+        executor = GlobExecutor(working_dir=working_dir, use_file_index=use_file_index)
 
         # Add working directory information to the tool description
         enhanced_description = (
@@ -17,6 +17,7 @@ from openhands.tools.utils import (
     _check_ripgrep_available,
     _log_ripgrep_fallback_warning,
 )
+from openhands.tools.utils.file_index import MAX_RESULTS, FileIndex, get_file_index
 
 
 class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
@@ -26,19 +27,31 @@ class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
     Python's glob module if ripgrep is not available:
     - Primary: Uses rg --files to list all files, filters by glob pattern with -g flag
     - Fallback: Uses Python's glob.glob() for pattern matching
+
+    With `use_file_index`, patterns are matched against an in-memory index of
+    the working directory when it can answer them, see `FileIndex`.
     """
 
-    def __init__(self, working_dir: str):
+    def __init__(self, working_dir: str, use_file_index: bool = False):
         """Initialize the glob executor.
 
         Args:
             working_dir: The working directory to use as the base for searches
+            use_file_index: Whether to answer searches from the file index of
+                the working directory, built in the background
         """
         self.working_dir: Path = Path(working_dir).resolve()
+        self.file_index: FileIndex | None = (
+            get_file_index(self.working_dir) if use_file_index else None
+        )
         self._ripgrep_available: bool = _check_ripgrep_available()
         if not self._ripgrep_available:
             _log_ripgrep_fallback_warning("glob", "Python glob module")
 
+    def is_parallel_safe(self, action: GlobAction) -> bool:  # noqa: ARG002
+        """Searches only read the file system."""
+        return True
+
     def __call__(
         self,
         action: GlobAction,
@@ -75,7 +88,14 @@ class GlobExecutor(ToolExecutor[GlobAction, GlobObservation]):
                     is_error=True,
                 )
 
-            if self._ripgrep_available:
+            indexed = (
+                self.file_index.glob(pattern, search_path)
+                if self.file_index is not None
+                else None
+            )
+            if indexed is not None:
+                files, truncated = indexed[:MAX_RESULTS], len(indexed) > MAX_RESULTS
+            elif self._ripgrep_available:
                 files, truncated = self._execute_with_ripgrep(pattern, search_path)
             else:
                 files, truncated = self._execute_with_glob(pattern, search_path)
@@ -70,6 +70,8 @@ class GrepTool(ToolDefinition[GrepAction, GrepObservation]):
     def create(
         cls,
         conv_state: "ConversationState",
+        use_file_index: bool = False,
+        use_content_index: bool = False,
     ) -> Sequence["GrepTool"]:
         """Initialize GrepTool with a GrepExecutor.
 
@@ -77,6 +79,11 @@ class GrepTool(ToolDefinition[GrepAction, GrepObservation]):
             conv_state: Conversation state to get working directory from.
                          If provided, working_dir will be taken from
                          conv_state.workspace
+            use_file_index: Whether to use an in-memory index of the files of
+                            the working directory, built in the background
+            use_content_index: Whether to prune searches with a trigram index
+                               of the contents of the working directory,
+                               built in the background
         """
         # Import here to avoid circular imports
         from openhands.tools.grep.impl import GrepExecutor
@@ -86,7 +93,11 @@ class GrepTool(ToolDefinition[GrepAction, GrepObservation]):
             raise ValueError(f"working_dir '{working_dir}' is not a valid directory")
 
         # Initialize the executor
-        executor = GrepExecutor(working_dir=working_dir)
+        executor = GrepExecutor(
+            working_dir=working_dir,
+            use_file_index=use_file_index,
+            use_content_index=use_content_index,
+        )
 
         # Add working directory information to the tool description
         enhanced_description = (
@@ -15,6 +15,12 @@ from openhands.tools.utils import (
     _check_ripgrep_available,
     _log_ripgrep_fallback_warning,
 )
+from openhands.tools.utils.file_index import MAX_RESULTS, FileIndex, get_file_index
+from openhands.tools.utils.trigram_index import TrigramIndex, get_trigram_index
+
+
+# Number of candidate files passed to each ripgrep command
+CANDIDATE_BATCH_SIZE = 1000
 
 
 class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
@@ -24,19 +30,47 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
     regular grep if ripgrep is not available:
     - Primary: Uses ripgrep with case-insensitive search and file listing
     - Fallback: Uses regular grep command with similar functionality
+
+    With `use_file_index`, matches are ordered with the modification times of
+    the file index of the working directory, so that ripgrep searches in
+    parallel instead of sorting files while walking them. With
+    `use_content_index`, only the files a trigram index of their contents
+    selects as candidates are searched, see `TrigramIndex`.
     """
 
-    def __init__(self, working_dir: str):
+    def __init__(
+        self,
+        working_dir: str,
+        use_file_index: bool = False,
+        use_content_index: bool = False,
+    ):
         """Initialize the grep executor.
 
         Args:
             working_dir: The working directory to use as the base for searches
+            use_file_index: Whether to order matches with the file index of
+                the working directory, built in the background
+            use_content_index: Whether to prune searches with a trigram index
+                of the working directory, built in the background. Implies
+                use_file_index.
         """
         self.working_dir: Path = Path(working_dir).resolve()
+        self.content_index: TrigramIndex | None = (
+            get_trigram_index(self.working_dir) if use_content_index else None
+        )
+        self.file_index: FileIndex | None = (
+            get_file_index(self.working_dir)
+            if use_file_index or use_content_index
+            else None
+        )
         self._ripgrep_available: bool = _check_ripgrep_available()
         if not self._ripgrep_available:
             _log_ripgrep_fallback_warning("grep", "regular grep command")
 
+    def is_parallel_safe(self, action: GrepAction) -> bool:  # noqa: ARG002
+        """Searches only read the file system."""
+        return True
+
     def __call__(
         self,
         action: GrepAction,
@@ -79,7 +113,16 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
                     is_error=True,
                 )
 
-            if self._ripgrep_available:
+            candidates = (
+                self.content_index.candidates(
+                    action.pattern, search_path, action.include
+                )
+                if self.content_index is not None
+                else None
+            )
+            if candidates is not None:
+                return self._execute_with_candidates(action, search_path, candidates)
+            elif self._ripgrep_available:
                 return self._execute_with_ripgrep(action, search_path)
             else:
                 return self._execute_with_grep(action, search_path)
@@ -138,15 +181,17 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
         self, action: GrepAction, search_path: Path
     ) -> GrepObservation:
         """Execute grep content search using ripgrep."""
-        # Build ripgrep command: rg -li pattern --sortr=modified
+        # Build ripgrep command: rg -li pattern [--sortr=modified]
         cmd = [
             "rg",
             "-l",  # files-with-matches
             "-i",  # ignore-case
             action.pattern,
             str(search_path),
-            "--sortr=modified",
         ]
+        # Sorting makes ripgrep single-threaded, the index sorts matches instead
+        if self.file_index is None:
+            cmd.append("--sortr=modified")
 
         # Apply include glob pattern if specified
         if action.include:
@@ -158,16 +203,70 @@ class GrepExecutor(ToolExecutor[GrepAction, GrepObservation]):
         )
 
         # Parse output into file paths
-        matches = []
-        if result.stdout:
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    matches.append(line)
-                    # Limit to first 100 files
-                    if len(matches) >= 100:
-                        break
+        if self.file_index is not None:
+            matches = self.file_index.sort_by_mtime(result.stdout.splitlines())
+            truncated = len(matches) > MAX_RESULTS
+            matches = matches[:MAX_RESULTS]
+        else:
+            matches = []
+            if result.stdout:
+                for line in result.stdout.strip().split("\n"):
+                    if line:
+                        matches.append(line)
+                        # Limit to first 100 files
+                        if len(matches) >= 100:
+                            break
+
+            truncated = len(matches) >= 100
 
-        truncated = len(matches) >= 100
+        output = self._format_output(
+            matches=matches,
+            pattern=action.pattern,
+            search_path=str(search_path),
+            include_pattern=action.include,
+            truncated=truncated,
+        )
+
+        return GrepObservation.from_text(
+            text=output,
+            matches=matches,
+            pattern=action.pattern,
+            search_path=str(search_path),
+            include_pattern=action.include,
+            truncated=truncated,
+        )
+
+    def _execute_with_candidates(
+        self, action: GrepAction, search_path: Path, candidates: list[str]
+    ) -> GrepObservation:
+        """Search the candidate files of the content index, using ripgrep or
+        Python regexes."""
+        matches = []
+        if self._ripgrep_available:
+            for start in range(0, len(candidates), CANDIDATE_BATCH_SIZE):
+                batch = candidates[start : start + CANDIDATE_BATCH_SIZE]
+                result = subprocess.run(
+                    ["rg", "-l", "-i", "-e", action.pattern, "--", *batch],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                    check=False,
+                )
+                matches.extend(line for line in result.stdout.splitlines() if line)
+        else:
+            regex = re.compile(action.pattern, re.IGNORECASE | re.MULTILINE)
+            for path in candidates:
+                try:
+                    with open(path, encoding="utf-8", errors="replace") as f:
+                        if regex.search(f.read()):
+                            matches.append(path)
+                except OSError:
+                    continue
+
+        assert self.file_index is not None
+        matches = self.file_index.sort_by_mtime(matches)
+        truncated = len(matches) > MAX_RESULTS
+        matches = matches[:MAX_RESULTS]
 
         output = self._format_output(
             matches=matches,
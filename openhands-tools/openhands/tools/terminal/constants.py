@@ -26,6 +26,9 @@ TIMEOUT_MESSAGE_TEMPLATE = (
 # How long to wait with no new output before considering it a no-change timeout
 NO_CHANGE_TIMEOUT_SECONDS = 30
 
-# How often to poll for new output in seconds
+# How often to poll for new output in seconds. Backends that watch the output
+# as it is produced return early when a prompt appears.
 POLL_INTERVAL = 0.5
+# How often backends watching the output for a prompt check for new output
+PROMPT_WATCH_INTERVAL = 0.01
 HISTORY_LIMIT = 10_000
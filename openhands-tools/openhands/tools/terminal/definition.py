@@ -231,6 +231,7 @@ class TerminalTool(ToolDefinition[TerminalAction, TerminalObservation]):
         terminal_type: Literal["tmux", "subprocess"] | None = None,
         shell_path: str | None = None,
         executor: ToolExecutor | None = None,
+        session_pool_size: int = 0,
     ) -> Sequence["TerminalTool"]:
         """Initialize TerminalTool with executor parameters.
 
@@ -247,6 +248,9 @@ class TerminalTool(ToolDefinition[TerminalAction, TerminalObservation]):
                          - On Unix-like: tmux if available, otherwise subprocess
             shell_path: Path to the shell binary (for subprocess terminal type only).
                        If None, will auto-detect bash from PATH.
+            session_pool_size: If positive, lease terminal sessions from a pool
+                       shared by the conversations of this workspace, keeping
+                       this many sessions initialized in the background.
         """
         # Import here to avoid circular imports
         from openhands.tools.terminal.impl import TerminalExecutor
@@ -263,6 +267,7 @@ class TerminalTool(ToolDefinition[TerminalAction, TerminalObservation]):
                 no_change_timeout_seconds=no_change_timeout_seconds,
                 terminal_type=terminal_type,
                 shell_path=shell_path,
+                session_pool_size=session_pool_size,
             )
 
         # Initialize the parent ToolDefinition with the executor
@@ -13,6 +13,10 @@ from openhands.tools.terminal.definition import (
     TerminalObservation,
 )
 from openhands.tools.terminal.terminal.factory import create_terminal_session
+from openhands.tools.terminal.terminal.session_pool import (
+    TerminalSessionPool,
+    get_session_pool,
+)
 from openhands.tools.terminal.terminal.terminal_session import TerminalSession
 
 
@@ -22,6 +26,7 @@ logger = get_logger(__name__)
 class TerminalExecutor(ToolExecutor[TerminalAction, TerminalObservation]):
     session: TerminalSession
     shell_path: str | None
+    session_pool: TerminalSessionPool | None
 
     def __init__(
         self,
@@ -30,6 +35,7 @@ class TerminalExecutor(ToolExecutor[TerminalAction, TerminalObservation]):
         no_change_timeout_seconds: int | None = None,
         terminal_type: Literal["tmux", "subprocess"] | None = None,
         shell_path: str | None = None,
+        session_pool_size: int = 0,
     ):
         """Initialize TerminalExecutor with auto-detected or specified session type.
 
@@ -42,16 +48,31 @@ class TerminalExecutor(ToolExecutor[TerminalAction, TerminalObservation]):
                          If None, auto-detect based on system capabilities
             shell_path: Path to the shell binary (for subprocess terminal type only).
                        If None, will auto-detect bash from PATH.
+            session_pool_size: If positive, lease sessions (initially and on
+                       reset) from the pool of this workspace, keeping this
+                       many sessions initialized in the background.
         """
         self.shell_path = shell_path
-        self.session = create_terminal_session(
-            work_dir=working_dir,
-            username=username,
-            no_change_timeout_seconds=no_change_timeout_seconds,
-            terminal_type=terminal_type,
-            shell_path=shell_path,
-        )
-        self.session.initialize()
+        self.session_pool = None
+        if session_pool_size > 0:
+            self.session_pool = get_session_pool(
+                working_dir,
+                username=username,
+                no_change_timeout_seconds=no_change_timeout_seconds,
+                terminal_type=terminal_type,
+                shell_path=shell_path,
+                size=session_pool_size,
+            )
+            self.session = self.session_pool.lease()
+        else:
+            self.session = create_terminal_session(
+                work_dir=working_dir,
+                username=username,
+                no_change_timeout_seconds=no_change_timeout_seconds,
+                terminal_type=terminal_type,
+                shell_path=shell_path,
+            )
+            self.session.initialize()
         logger.info(
             f"TerminalExecutor initialized with working_dir: {working_dir}, "
             f"username: {username}, "
@@ -106,14 +127,17 @@ class TerminalExecutor(ToolExecutor[TerminalAction, TerminalObservation]):
         original_no_change_timeout = self.session.no_change_timeout_seconds
 
         self.session.close()
-        self.session = create_terminal_session(
-            work_dir=original_work_dir,
-            username=original_username,
-            no_change_timeout_seconds=original_no_change_timeout,
-            terminal_type=None,  # Let it auto-detect like before
-            shell_path=self.shell_path,
-        )
-        self.session.initialize()
+        if self.session_pool is not None:
+            self.session = self.session_pool.lease()
+        else:
+            self.session = create_terminal_session(
+                work_dir=original_work_dir,
+                username=original_username,
+                no_change_timeout_seconds=original_no_change_timeout,
+                terminal_type=None,  # Let it auto-detect like before
+                shell_path=self.shell_path,
+            )
+            self.session.initialize()
 
         logger.info(
             f"Terminal session reset successfully with working_dir: {original_work_dir}"
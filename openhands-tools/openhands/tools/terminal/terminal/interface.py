@@ -1,9 +1,12 @@
 """Abstract interface for terminal backends."""
 
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
 
 from openhands.tools.terminal.constants import (
+    CMD_OUTPUT_PS1_END,
     NO_CHANGE_TIMEOUT_SECONDS,
 )
 from openhands.tools.terminal.definition import (
@@ -12,6 +15,39 @@ from openhands.tools.terminal.definition import (
 )
 
 
+class PromptWatcher:
+    """Detects PS1 prompts in terminal output received in chunks.
+
+    Backends feed their output to the watcher as it is produced, and
+    `wait_for_prompt` returns as soon as a prompt end marker appears, even
+    split across chunks.
+    """
+
+    MARKER = CMD_OUTPUT_PS1_END.strip()
+
+    def __init__(self) -> None:
+        self._tail = ""
+        self._seen = threading.Event()
+
+    def feed(self, text: str) -> None:
+        data = self._tail + text
+        if self.MARKER in data:
+            self._seen.set()
+        self._tail = data[-(len(self.MARKER) - 1) :]
+
+    def reset(self) -> None:
+        """Forget prompts seen so far."""
+        self._seen.clear()
+
+    def wait_for_prompt(self, timeout: float) -> bool:
+        """Wait until a prompt is seen, at most `timeout` seconds, and forget
+        it. Returns whether a prompt was seen."""
+        if self._seen.wait(timeout):
+            self._seen.clear()
+            return True
+        return False
+
+
 class TerminalInterface(ABC):
     """Abstract interface for terminal backends.
 
@@ -106,6 +142,27 @@ class TerminalInterface(ABC):
             True if a command is running, False otherwise.
         """
 
+    def wait_for_prompt(self, timeout: float) -> bool:
+        """Wait until a prompt may have been printed, at most `timeout` seconds.
+
+        Backends watching the output as it is produced return as soon as a PS1
+        prompt is printed (since the last call to this method or `send_keys`).
+        The default implementation just sleeps.
+
+        Returns:
+            True if a prompt was printed, False if unknown or timed out.
+        """
+        time.sleep(timeout)
+        return False
+
+    def is_alive(self) -> bool:
+        """Check if the terminal is initialized and its shell still running.
+
+        The default implementation only checks the terminal is initialized
+        and not closed.
+        """
+        return self._initialized and not self._closed
+
     @property
     def initialized(self) -> bool:
         """Check if the terminal is initialized."""
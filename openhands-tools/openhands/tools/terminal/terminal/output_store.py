@@ -0,0 +1,69 @@
+"""Bounded store of terminal output lines."""
+
+import os
+from collections import deque
+from collections.abc import Iterable
+
+from openhands.tools.terminal.constants import HISTORY_LIMIT
+
+
+class OutputStore:
+    """Ring buffer of the last `max_lines` lines of terminal output.
+
+    Lines evicted from the ring are appended to `spill_path`, if set, so that
+    the output of very long sessions stays available without being kept in
+    memory or re-read on every screen read.
+    """
+
+    def __init__(
+        self, max_lines: int = HISTORY_LIMIT, spill_path: str | None = None
+    ) -> None:
+        self.max_lines = max_lines
+        self.spill_path = spill_path
+        self._lines: deque[str] = deque()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def lines(self) -> list[str]:
+        return list(self._lines)
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """Append lines, evicting the oldest ones past `max_lines`."""
+        self._lines.extend(lines)
+        overflow = len(self._lines) - self.max_lines
+        if overflow > 0:
+            self._spill(self._lines.popleft() for _ in range(overflow))
+
+    def evict(self) -> None:
+        """Evict all lines, e.g. when output following them was lost."""
+        self._spill(self._lines)
+        self._lines.clear()
+
+    def clear(self) -> None:
+        """Drop all lines without spilling them."""
+        self._lines.clear()
+
+    def read_spilled(self) -> str:
+        """Return the lines evicted so far."""
+        if self.spill_path is None or not os.path.exists(self.spill_path):
+            return ""
+        with open(self.spill_path, encoding="utf-8") as f:
+            return f.read()
+
+    def close(self) -> None:
+        """Drop all lines and remove the spill file."""
+        self._lines.clear()
+        if self.spill_path is not None:
+            try:
+                os.remove(self.spill_path)
+            except FileNotFoundError:
+                pass
+
+    def _spill(self, lines: Iterable[str]) -> None:
+        if self.spill_path is None:
+            # Consume the lines, which may be popped by the iterable
+            deque(lines, maxlen=0)
+            return
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            f.writelines(f"{line}\n" for line in lines)
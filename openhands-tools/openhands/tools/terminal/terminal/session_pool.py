@@ -0,0 +1,322 @@
+"""Pools of pre-initialized terminal sessions.
+
+Starting a terminal session (tmux or a PTY shell, then its PS1 prompt) takes
+from a fraction of a second to seconds, which new conversations and terminal
+resets otherwise wait for. A `TerminalSessionPool` keeps sessions for one
+workspace initialized in the background, so they can be leased at once.
+
+Leased sessions are owned by their lessee, which closes them: sessions are
+never returned to the pool, as commands change their state (environment,
+working directory, running processes).
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from openhands.sdk.logger import get_logger
+from openhands.tools.terminal.definition import TerminalAction
+from openhands.tools.terminal.terminal.factory import create_terminal_session
+from openhands.tools.terminal.terminal.terminal_session import TerminalSession
+
+
+logger = get_logger(__name__)
+
+
+class TerminalSessionPoolStats(BaseModel):
+    """Statistics of a terminal session pool."""
+
+    leases: int = Field(default=0, description="Sessions leased")
+    warm_leases: int = Field(
+        default=0, description="Sessions leased already initialized"
+    )
+    sessions_started: int = Field(default=0, description="Sessions initialized")
+    startup_seconds: float = Field(
+        default=0.0, description="Time spent initializing sessions"
+    )
+    startup_seconds_saved: float = Field(
+        default=0.0,
+        description="Initialization time of the warm sessions leased, which "
+        "their lessees did not wait for",
+    )
+    health_check_failures: int = Field(
+        default=0, description="Idle sessions found unusable and replaced"
+    )
+    recycled: int = Field(
+        default=0, description="Idle sessions replaced for exceeding their max age"
+    )
+    idle: int = Field(default=0, description="Sessions ready to be leased")
+
+    @property
+    def mean_startup_seconds(self) -> float:
+        return (
+            self.startup_seconds / self.sessions_started
+            if self.sessions_started
+            else 0.0
+        )
+
+
+@dataclass
+class _IdleSession:
+    session: TerminalSession
+    started_at: float
+    startup_seconds: float
+    checked_at: float
+
+
+class TerminalSessionPool:
+    """Pool of pre-initialized terminal sessions for one workspace.
+
+    A background thread keeps `size` idle sessions initialized. Idle sessions
+    are checked with a no-op command every `health_check_interval` seconds,
+    and replaced once older than `max_idle_seconds`, e.g. to pick up changes
+    to the environment. `lease` returns an idle session if one is alive, and
+    initializes a new one otherwise.
+    """
+
+    def __init__(
+        self,
+        work_dir: str,
+        username: str | None = None,
+        no_change_timeout_seconds: int | None = None,
+        terminal_type: Literal["tmux", "subprocess"] | None = None,
+        shell_path: str | None = None,
+        size: int = 1,
+        health_check_interval: float = 60.0,
+        max_idle_seconds: float = 600.0,
+    ):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.work_dir = work_dir
+        self.username = username
+        self.no_change_timeout_seconds = no_change_timeout_seconds
+        self.terminal_type: Literal["tmux", "subprocess"] | None = terminal_type
+        self.shell_path = shell_path
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self.max_idle_seconds = max_idle_seconds
+        self._idle: deque[_IdleSession] = deque()
+        self._stats = TerminalSessionPoolStats()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._maintain, name="terminal-session-pool", daemon=True
+        )
+        self._thread.start()
+
+    def lease(self) -> TerminalSession:
+        """Return an initialized session, owned by the caller."""
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Terminal session pool is closed")
+                idle = self._idle.popleft() if self._idle else None
+                self._cond.notify_all()
+            if idle is None:
+                break
+            if self._is_alive(idle.session):
+                with self._cond:
+                    self._stats.leases += 1
+                    self._stats.warm_leases += 1
+                    self._stats.startup_seconds_saved += idle.startup_seconds
+                return idle.session
+            self._discard(idle.session, failed=True)
+
+        session, _ = self._start_session()
+        with self._cond:
+            self._stats.leases += 1
+        return session
+
+    def stats(self) -> TerminalSessionPoolStats:
+        with self._cond:
+            return self._stats.model_copy(update={"idle": len(self._idle)})
+
+    def close(self) -> None:
+        """Stop warming up sessions and close the idle ones."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for item in idle:
+            self._discard(item.session)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=10)
+
+    # ------------------------- Background maintenance -------------------------
+
+    def _maintain(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and not self._needs_work():
+                    self._cond.wait(timeout=self._next_check_delay())
+                if self._closed:
+                    return
+                due = self._pop_due_sessions()
+            for item in due:
+                self._check(item)
+            with self._cond:
+                missing = not self._closed and len(self._idle) < self.size
+            if missing:
+                try:
+                    session, startup_seconds = self._start_session()
+                except Exception as e:
+                    logger.error(f"Failed to warm up terminal session: {e}")
+                    with self._cond:
+                        # Retry later rather than spinning on a broken setup
+                        self._cond.wait(timeout=self.health_check_interval)
+                    continue
+                now = time.monotonic()
+                self._add_idle(_IdleSession(session, now, startup_seconds, now))
+
+    def _needs_work(self) -> bool:
+        now = time.monotonic()
+        return len(self._idle) < self.size or any(
+            self._is_due(item, now) for item in self._idle
+        )
+
+    def _is_due(self, item: _IdleSession, now: float) -> bool:
+        return (
+            now - item.checked_at >= self.health_check_interval
+            or now - item.started_at >= self.max_idle_seconds
+        )
+
+    def _next_check_delay(self) -> float | None:
+        if not self._idle:
+            return None
+        next_check = min(
+            min(
+                item.checked_at + self.health_check_interval,
+                item.started_at + self.max_idle_seconds,
+            )
+            for item in self._idle
+        )
+        return max(0.0, next_check - time.monotonic())
+
+    def _pop_due_sessions(self) -> list[_IdleSession]:
+        now = time.monotonic()
+        due = [item for item in self._idle if self._is_due(item, now)]
+        for item in due:
+            self._idle.remove(item)
+        return due
+
+    def _check(self, item: _IdleSession) -> None:
+        """Put a session back to the idle ones if healthy and not too old."""
+        if time.monotonic() - item.started_at >= self.max_idle_seconds:
+            with self._cond:
+                self._stats.recycled += 1
+            self._discard(item.session)
+        elif self._is_healthy(item.session):
+            item.checked_at = time.monotonic()
+            self._add_idle(item)
+        else:
+            self._discard(item.session, failed=True)
+
+    def _add_idle(self, item: _IdleSession) -> None:
+        with self._cond:
+            if not self._closed and len(self._idle) < self.size:
+                self._idle.append(item)
+                self._cond.notify_all()
+                return
+        self._discard(item.session)
+
+    # ------------------------- Sessions -------------------------
+
+    def _start_session(self) -> tuple[TerminalSession, float]:
+        start = time.monotonic()
+        session = create_terminal_session(
+            work_dir=self.work_dir,
+            username=self.username,
+            no_change_timeout_seconds=self.no_change_timeout_seconds,
+            terminal_type=self.terminal_type,
+            shell_path=self.shell_path,
+        )
+        session.initialize()
+        startup_seconds = time.monotonic() - start
+        with self._cond:
+            self._stats.sessions_started += 1
+            self._stats.startup_seconds += startup_seconds
+        logger.debug(f"Terminal session started in {startup_seconds:.2f}s")
+        return session, startup_seconds
+
+    def _is_alive(self, session: TerminalSession) -> bool:
+        return not session._closed and session.terminal.is_alive()
+
+    def _is_healthy(self, session: TerminalSession) -> bool:
+        """Check a session runs commands, with a no-op command."""
+        if not self._is_alive(session):
+            return False
+        try:
+            obs = session.execute(TerminalAction(command="true", timeout=10))
+        except Exception as e:
+            logger.warning(f"Terminal session health check failed: {e}")
+            return False
+        return obs.metadata.exit_code == 0
+
+    def _discard(self, session: TerminalSession, failed: bool = False) -> None:
+        if failed:
+            with self._cond:
+                self._stats.health_check_failures += 1
+        try:
+            session.close()
+        except Exception as e:
+            logger.debug(f"Failed to close terminal session: {e}")
+
+
+_pools: dict[tuple, TerminalSessionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_session_pool(
+    work_dir: str,
+    username: str | None = None,
+    no_change_timeout_seconds: int | None = None,
+    terminal_type: Literal["tmux", "subprocess"] | None = None,
+    shell_path: str | None = None,
+    size: int = 1,
+) -> TerminalSessionPool:
+    """Return the pool shared by the sessions of a workspace with these
+    settings, creating it if needed. The pool grows to `size` if smaller."""
+    key = (
+        os.path.abspath(work_dir),
+        username,
+        no_change_timeout_seconds,
+        terminal_type,
+        shell_path,
+    )
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = TerminalSessionPool(
+                work_dir,
+                username=username,
+                no_change_timeout_seconds=no_change_timeout_seconds,
+                terminal_type=terminal_type,
+                shell_path=shell_path,
+                size=size,
+            )
+            _pools[key] = pool
+        elif pool.size < size:
+            with pool._cond:
+                pool.size = size
+                pool._cond.notify_all()
+        return pool
+
+
+def close_session_pools() -> None:
+    """Close the shared pools and their idle sessions."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+# Idle tmux sessions would outlive the process
+atexit.register(close_session_pools)
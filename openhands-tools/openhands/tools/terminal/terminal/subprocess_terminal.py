@@ -21,6 +21,7 @@ from openhands.tools.terminal.constants import (
 )
 from openhands.tools.terminal.metadata import CmdOutputMetadata
 from openhands.tools.terminal.terminal import TerminalInterface
+from openhands.tools.terminal.terminal.interface import PromptWatcher
 
 
 logger = get_logger(__name__)
@@ -66,6 +67,7 @@ class SubprocessTerminal(TerminalInterface):
         self.output_lock = threading.Lock()
         self.reader_thread = None
         self._current_command_running = False
+        self._prompt_watcher = PromptWatcher()
         self.shell_path = shell_path
 
     # ------------------------- Lifecycle -------------------------
@@ -153,11 +155,13 @@ class SubprocessTerminal(TerminalInterface):
 
         # ===== Deterministic readiness (no blind sleeps) =====
         # 1) Single atomic init line: clear PROMPT_COMMAND, set PS2/PS1, print sentinel
-        sentinel = f"__OH_READY_{uuid.uuid4().hex}__"
+        token = uuid.uuid4().hex
+        sentinel = f"__OH_READY_{token}__"
         init_cmd = (
             f"export PROMPT_COMMAND='export PS1=\"{self.PS1}\"'; "
             f'export PS2=""; '
-            f'printf "{sentinel}"'
+            # Formatted, so the echo of the typed line does not contain it
+            f'printf "__OH_READY_%s__" {token}'
         ).encode("utf-8", "ignore")
 
         self._write_pty(init_cmd + ENTER)
@@ -251,6 +255,7 @@ class SubprocessTerminal(TerminalInterface):
                     with self.output_lock:
                         # Store one line per buffer item to make deque truncation work
                         self._add_text_to_buffer(text)
+                    self._prompt_watcher.feed(text)
                 except OSError:
                     # Would-block or FD closed
                     continue
@@ -371,6 +376,7 @@ class SubprocessTerminal(TerminalInterface):
         if append_eol:
             payload += ENTER
 
+        self._prompt_watcher.reset()
         self._write_pty(payload)
         self._current_command_running = self._current_command_running or (
             append_eol or payload.endswith(ENTER)
@@ -422,6 +428,10 @@ class SubprocessTerminal(TerminalInterface):
             except Exception:
                 pass
 
+    def wait_for_prompt(self, timeout: float) -> bool:
+        """Wait until the reader thread sees a prompt, at most `timeout` seconds."""
+        return self._prompt_watcher.wait_for_prompt(timeout)
+
     def interrupt(self) -> bool:
         """Send SIGINT to the PTY process group (fallback to signal-based interrupt)."""
         if not self._initialized or not self.process:
@@ -435,6 +445,14 @@ class SubprocessTerminal(TerminalInterface):
             logger.error(f"Failed to interrupt subprocess: {e}", exc_info=True)
             return False
 
+    def is_alive(self) -> bool:
+        """Check the shell process is still running."""
+        return (
+            super().is_alive()
+            and self.process is not None
+            and self.process.poll() is None
+        )
+
     def is_running(self) -> bool:
         """Heuristic: command running if not at PS1 prompt and process alive."""
         if not self._initialized or not self.process:
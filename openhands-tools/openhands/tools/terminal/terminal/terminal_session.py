@@ -498,5 +498,5 @@ class TerminalSession(TerminalSessionBase):
                     logger.debug(f"RETURNING OBSERVATION (hard-timeout): {obs}")
                     return obs
 
-            # Sleep before next check
-            time.sleep(POLL_INTERVAL)
+            # Wait before next check, or until the command's prompt is printed
+            self.terminal.wait_for_prompt(POLL_INTERVAL)
@@ -1,25 +1,54 @@
 """Tmux-based terminal backend implementation."""
 
 import os
+import shlex
+import tempfile
 import time
 import uuid
+import weakref
 
 import libtmux
 
 from openhands.sdk.logger import get_logger
-from openhands.tools.terminal.constants import HISTORY_LIMIT
+from openhands.tools.terminal.constants import (
+    CMD_OUTPUT_PS1_END,
+    HISTORY_LIMIT,
+    PROMPT_WATCH_INTERVAL,
+)
 from openhands.tools.terminal.metadata import CmdOutputMetadata
 from openhands.tools.terminal.terminal import TerminalInterface
+from openhands.tools.terminal.terminal.interface import PromptWatcher
+from openhands.tools.terminal.terminal.output_store import OutputStore
 
 
 logger = get_logger(__name__)
 
+# Size past which the pane output log is truncated once read
+PANE_LOG_TRUNCATE_SIZE = 1024 * 1024
+# Bytes read at most from the end of the pane log: the shell prints its prompt
+# last, before waiting for input, so earlier output need not be watched
+PANE_LOG_READ_SIZE = 64 * 1024
+# Line printed after captures, as tmux command output loses trailing blank lines
+_CAPTURE_END = "__OH_CAPTURE_END__"
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
 
 class TmuxTerminal(TerminalInterface):
     """Tmux-based terminal backend.
 
     This backend uses tmux to provide a persistent terminal session
     with full screen capture and history management capabilities.
+
+    With incremental capture, each screen read moves the lines tmux scrolled
+    into its history since the last read to an `OutputStore`, and only
+    captures these new lines and the visible screen, rather than the whole
+    history.
     """
 
     PS1: str
@@ -32,9 +61,28 @@ class TmuxTerminal(TerminalInterface):
         self,
         work_dir: str,
         username: str | None = None,
+        incremental_capture: bool = True,
+        output_spill_dir: str | None = None,
     ):
+        """
+        Args:
+            work_dir: Working directory of the shell
+            username: Optional user to run the shell as
+            incremental_capture: Capture only the output produced since the
+                last screen read, instead of the whole history
+            output_spill_dir: With incremental capture, directory of a file
+                keeping the lines scrolled out of the last HISTORY_LIMIT lines.
+                If None, these lines are dropped, as tmux does.
+        """
         super().__init__(work_dir, username)
         self.PS1 = CmdOutputMetadata.to_ps1_prompt()
+        self.incremental_capture = incremental_capture
+        self.output_spill_dir = output_spill_dir
+        self._output = OutputStore(HISTORY_LIMIT)
+        self._pane_log: str | None = None
+        self._pane_log_offset = 0
+        self._pane_log_cleanup: weakref.finalize | None = None
+        self._prompt_watcher = PromptWatcher()
 
     def initialize(self) -> None:
         """Initialize the tmux terminal session."""
@@ -81,15 +129,28 @@ class TmuxTerminal(TerminalInterface):
         self.pane = active_pane
         logger.debug(f"pane: {self.pane}; history_limit: {self.session.history_limit}")
         _initial_window.kill()
+        self._start_pane_log()
+        if self.incremental_capture and self.output_spill_dir is not None:
+            fd, self._output.spill_path = tempfile.mkstemp(
+                prefix="openhands-tmux-", suffix=".out", dir=self.output_spill_dir
+            )
+            os.close(fd)
 
         # Configure bash to use simple PS1 and disable PS2
         self.pane.send_keys(
             f'export PROMPT_COMMAND=\'export PS1="{self.PS1}"\'; export PS2=""'
         )
-        time.sleep(0.1)  # Wait for command to take effect
+        self._initialized: bool = True
+
+        # Wait for the shell, which may still be starting, to print our prompt
+        deadline = time.monotonic() + 10.0
+        while not self.read_screen().rstrip().endswith(CMD_OUTPUT_PS1_END.rstrip()):
+            if time.monotonic() >= deadline:
+                logger.warning("Prompt not visible after tmux terminal init")
+                break
+            self.wait_for_prompt(0.1)
 
         logger.debug(f"Tmux terminal initialized with work dir: {self.work_dir}")
-        self._initialized: bool = True
         self.clear_screen()
 
     def close(self) -> None:
@@ -102,8 +163,49 @@ class TmuxTerminal(TerminalInterface):
         except ImportError:
             # Python is shutting down, let the OS handle cleanup
             pass
+        if self._pane_log_cleanup is not None:
+            self._pane_log_cleanup()
+            self._pane_log = None
+        self._output.close()
         self._closed: bool = True
 
+    def _start_pane_log(self) -> None:
+        """Append the pane output to a log file, watched for prompts."""
+        fd, path = tempfile.mkstemp(prefix="openhands-tmux-", suffix=".log")
+        os.close(fd)
+        try:
+            self.pane.cmd("pipe-pane", "-o", f"cat >> {shlex.quote(path)}")
+        except Exception as e:
+            logger.warning(f"Failed to pipe tmux pane output, polling instead: {e}")
+            os.remove(path)
+            return
+        self._pane_log = path
+        self._pane_log_offset = 0
+        # Removed even if the terminal is never closed, at the latest on exit
+        self._pane_log_cleanup = weakref.finalize(self, _remove_file, path)
+
+    def _read_pane_log(self) -> None:
+        """Feed the end of the output appended to the pane log to the prompt
+        watcher, and truncate the log once large."""
+        if self._pane_log is None:
+            return
+        try:
+            with open(self._pane_log, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                start = max(self._pane_log_offset, size - PANE_LOG_READ_SIZE)
+                f.seek(start)
+                data = f.read(max(0, size - start))
+            self._pane_log_offset = size
+            if size >= PANE_LOG_TRUNCATE_SIZE:
+                # tmux appends to the file, so writes continue from its new end
+                os.truncate(self._pane_log, 0)
+                self._pane_log_offset = 0
+        except OSError as e:
+            logger.debug(f"Failed to read tmux pane log: {e}")
+            return
+        if data:
+            self._prompt_watcher.feed(data.decode("utf-8", errors="replace"))
+
     def send_keys(self, text: str, enter: bool = True) -> None:
         """Send text/keys to the tmux pane.
 
@@ -114,6 +216,8 @@ class TmuxTerminal(TerminalInterface):
         if not self._initialized or not isinstance(self.pane, libtmux.Pane):
             raise RuntimeError("Tmux terminal is not initialized")
 
+        self._read_pane_log()
+        self._prompt_watcher.reset()
         self.pane.send_keys(text, enter=enter)
 
     def read_screen(self) -> str:
@@ -125,23 +229,67 @@ class TmuxTerminal(TerminalInterface):
         if not self._initialized or not isinstance(self.pane, libtmux.Pane):
             raise RuntimeError("Tmux terminal is not initialized")
 
-        content = "\n".join(
-            map(
-                # avoid double newlines
-                lambda line: line.rstrip(),
-                self.pane.cmd("capture-pane", "-J", "-pS", "-").stdout,
-            )
-        )
+        if self.incremental_capture:
+            self._collect_history()
+        # The visible screen, and any line scrolled since collecting the history
+        lines = self.pane.cmd("capture-pane", "-J", "-pS", "-").stdout
+        # avoid double newlines
+        content = "\n".join(line.rstrip() for line in self._output.lines() + lines)
         return content
 
+    def read_spilled_output(self) -> str:
+        """Return the output lines spilled to disk (see `output_spill_dir`)."""
+        return self._output.read_spilled()
+
+    def _collect_history(self) -> None:
+        """Move the lines tmux scrolled into its history to the output store."""
+        size, limit = map(
+            int,
+            self.pane.cmd("display-message", "-p", "#{history_size} #{history_limit}")
+            .stdout[0]
+            .split(),
+        )
+        if size == 0:
+            # Capturing an empty history would capture the first visible line
+            return
+        if size >= limit - limit // 10:
+            # tmux drops its oldest tenth of lines once its history is full:
+            # the stored lines may not be followed by the new ones anymore
+            self._output.evict()
+        # Clear the history in the same tmux command, so no line scrolls between
+        target = ("-t", str(self.pane.pane_id))
+        lines = self.server.cmd(
+            *("capture-pane", "-p", "-J", "-S", "-", "-E", "-1", *target),
+            *(";", "clear-history", *target),
+            *(";", "display-message", "-p", *target, _CAPTURE_END),
+        ).stdout
+        self._output.extend(lines[: lines.index(_CAPTURE_END)])
+
     def clear_screen(self) -> None:
         """Clear the tmux pane screen and history."""
         if not self._initialized or not isinstance(self.pane, libtmux.Pane):
             raise RuntimeError("Tmux terminal is not initialized")
 
-        self.pane.send_keys("C-l", enter=False)
-        time.sleep(0.1)
+        self.send_keys("C-l", enter=False)
+        # Wait for the shell to redraw its prompt, then drop what scrolled off
+        self.wait_for_prompt(1.0 if self._pane_log is not None else 0.1)
         self.pane.cmd("clear-history")
+        self._output.clear()
+
+    def wait_for_prompt(self, timeout: float) -> bool:
+        """Wait until a prompt is appended to the pane log, at most `timeout`
+        seconds."""
+        if self._pane_log is None:
+            return super().wait_for_prompt(timeout)
+        deadline = time.monotonic() + timeout
+        while True:
+            self._read_pane_log()
+            if self._prompt_watcher.wait_for_prompt(0):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(PROMPT_WATCH_INTERVAL, remaining))
 
     def interrupt(self) -> bool:
         """Send interrupt signal (Ctrl+C) to the tmux pane.
@@ -158,6 +306,15 @@ class TmuxTerminal(TerminalInterface):
             logger.error(f"Failed to interrupt command: {e}", exc_info=True)
             return False
 
+    def is_alive(self) -> bool:
+        """Check the tmux pane of the shell still exists."""
+        if not super().is_alive():
+            return False
+        try:
+            return bool(self.pane.cmd("display-message", "-p", "#{pane_id}").stdout)
+        except Exception:
+            return False
+
     def is_running(self) -> bool:
         """Check if a command is currently running.
 
@@ -170,8 +327,6 @@ class TmuxTerminal(TerminalInterface):
         try:
             content = self.read_screen()
             # If the screen ends with our PS1 prompt, no command is running
-            from openhands.tools.terminal.constants import CMD_OUTPUT_PS1_END
-
             return not content.rstrip().endswith(CMD_OUTPUT_PS1_END.rstrip())
         except Exception:
             return False
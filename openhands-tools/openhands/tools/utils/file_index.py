@@ -0,0 +1,659 @@
+"""In-memory index of the files of a workspace, for the glob and grep tools.
+
+The index keeps the path, modification time and size of the files of a
+workspace, so glob queries and mtime ordering do not walk the whole tree on
+every call. It follows ripgrep's rules:
+
+- Hidden and ignored directories (.gitignore in git repositories, .ignore and
+  .rgignore files) are not walked, and symbolic links are skipped.
+- Hidden and ignored files are indexed but flagged, as globs may match them.
+- Globs without a slash match file names, others match paths relative to the
+  search path, with `**` matching any number of directories.
+
+The index is built in a background thread, and kept current by re-scanning
+the directories whose mtime changed since the last refresh, at most every
+`refresh_interval` seconds. Files modified in place do not change the mtime of
+their directory: `update` refreshes them, and the background thread rescans
+the whole tree every `full_rescan_interval` seconds, replacing the index once
+the scan is complete.
+"""
+
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from openhands.sdk.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+IGNORE_FILES = (".gitignore", ".ignore", ".rgignore")
+# Maximum number of results returned by queries, like the tools
+MAX_RESULTS = 100
+
+
+@lru_cache(maxsize=256)
+def glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a ripgrep-style glob to a regex matching relative paths."""
+    pattern = pattern.rstrip("/")
+    if pattern.startswith("/"):
+        pattern = pattern.lstrip("/")
+    elif "/" not in pattern:
+        pattern = f"**/{pattern}"
+    return re.compile(_translate(pattern))
+
+
+def _translate(pattern: str) -> str:
+    result = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            result.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            result.append(".*")
+            i += 2
+        elif c == "*":
+            result.append("[^/]*")
+            i += 1
+        elif c == "?":
+            result.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                result.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1 : end]
+            if body[0] in "!^":
+                body = "^" + body[1:]
+            result.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+            i = end + 1
+        elif c == "{":
+            depth, end = 0, i
+            for end in range(i, n):
+                depth += {"{": 1, "}": -1}.get(pattern[end], 0)
+                if depth == 0:
+                    break
+            if depth:
+                result.append(re.escape(c))
+                i += 1
+                continue
+            alternatives = _split_alternatives(pattern[i + 1 : end])
+            result.append(f"(?:{'|'.join(_translate(alt) for alt in alternatives)})")
+            i = end + 1
+        else:
+            result.append(re.escape(c))
+            i += 1
+    return "".join(result)
+
+
+def _split_alternatives(body: str) -> list[str]:
+    alternatives, depth, start = [], 0, 0
+    for i, c in enumerate(body):
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+        elif c == "," and depth == 0:
+            alternatives.append(body[start:i])
+            start = i + 1
+    alternatives.append(body[start:])
+    return alternatives
+
+
+@dataclass(frozen=True)
+class _IgnoreRule:
+    regex: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+
+
+def _parse_ignore_file(path: str) -> list[_IgnoreRule]:
+    """Parse the rules of a gitignore-style file."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated or line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        # Patterns with an inner slash are relative to the ignore file
+        anchored = "/" in line
+        line = line.lstrip("/")
+        regex = _translate(line if anchored else f"**/{line}")
+        rules.append(_IgnoreRule(re.compile(regex), negated, dir_only))
+    return rules
+
+
+def _is_ignored(
+    rules: list[tuple[str, list[_IgnoreRule]]], rel_path: str, is_dir: bool
+) -> bool:
+    """Apply the rules of the ignore files above a path, the last match wins."""
+    ignored = False
+    for base, base_rules in rules:
+        path = rel_path[len(base) + 1 :] if base else rel_path
+        for rule in base_rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.fullmatch(path):
+                ignored = not rule.negated
+    return ignored
+
+
+def _join(base: str, name: str) -> str:
+    return f"{base}/{name}" if base else name
+
+
+def _is_below(rel_path: str, base: str) -> bool:
+    return not base or rel_path.startswith(f"{base}/")
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    mtime: float
+    size: int
+    ignored: bool
+
+
+@dataclass
+class _DirState:
+    mtime_ns: int
+    ignore_mtimes: tuple[int | None, ...]
+    rules: list[tuple[str, list[_IgnoreRule]]]
+    files: set[str] = field(default_factory=set)
+    subdirs: set[str] = field(default_factory=set)
+
+
+@dataclass
+class _Tree:
+    files: dict[str, FileEntry] = field(default_factory=dict)
+    dirs: dict[str, _DirState] = field(default_factory=dict)
+    skipped_dirs: set[str] = field(default_factory=set)
+
+
+class FileIndexStats(BaseModel):
+    """Statistics of a file index."""
+
+    files: int = Field(default=0, description="Files indexed")
+    directories: int = Field(default=0, description="Directories walked")
+    skipped_directories: int = Field(
+        default=0, description="Hidden or ignored directories not walked"
+    )
+    build_seconds: float = Field(
+        default=0.0, description="Duration of the last full scan"
+    )
+    full_scans: int = Field(default=0, description="Full scans of the tree")
+    refreshes: int = Field(default=0, description="Incremental refreshes")
+    rescanned_directories: int = Field(
+        default=0, description="Directories rescanned by incremental refreshes"
+    )
+
+
+class FileIndex:
+    """Index of the files below `root`; see the module documentation."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        refresh_interval: float = 1.0,
+        full_rescan_interval: float = 300.0,
+    ):
+        self.root = Path(root).resolve()
+        self.refresh_interval = refresh_interval
+        self.full_rescan_interval = full_rescan_interval
+        self._tree = _Tree()
+        # Files updated during a full scan, None outside of full scans
+        self._scan_updates: set[str] | None = None
+        self._in_git_repo = False
+        self._stats = FileIndexStats()
+        self._lock = threading.RLock()
+        self._ready = threading.Event()
+        self._last_refresh = 0.0
+        self._listeners: list[Callable[[str], None]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        """Build the index in a background thread."""
+        threading.Thread(
+            target=self._build_in_background, name="file-index", daemon=True
+        ).start()
+
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """Call `listener` with the relative path of the files added, removed
+        or updated, including files rescanned but unchanged."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def stats(self) -> FileIndexStats:
+        with self._lock:
+            return self._stats.model_copy(
+                update={
+                    "files": len(self._tree.files),
+                    "directories": len(self._tree.dirs),
+                    "skipped_directories": len(self._tree.skipped_dirs),
+                }
+            )
+
+    # ------------------------- Queries -------------------------
+
+    def glob(self, pattern: str, search_path: str | Path) -> list[str] | None:
+        """Return the files below `search_path` matching a glob, most recently
+        modified first, or None if the index cannot answer the query."""
+        base = self._query_base(search_path)
+        if base is None:
+            return None
+        regex = glob_to_regex(pattern)
+        with self._lock:
+            if self._reaches_skipped_dir(pattern, base):
+                return None
+            matches = [
+                (entry.mtime, rel_path)
+                for rel_path, entry in self._tree.files.items()
+                if _is_below(rel_path, base)
+                and regex.fullmatch(self._relative(rel_path, base))
+            ]
+        matches.sort(reverse=True)
+        return [str(self.root / rel_path) for _, rel_path in matches]
+
+    def searched_files(
+        self, rel_paths: Iterable[str], search_path: str | Path, include: str | None
+    ) -> list[str] | None:
+        """Return the absolute paths of the files among `rel_paths` that
+        ripgrep searches below `search_path`: files matching `include` if set,
+        files neither hidden nor ignored otherwise. Return None if the index
+        cannot answer the query."""
+        base = self._query_base(search_path)
+        if base is None:
+            return None
+        regex = glob_to_regex(include) if include else None
+        with self._lock:
+            if include and self._reaches_skipped_dir(include, base):
+                return None
+            files = []
+            for rel_path in rel_paths:
+                entry = self._tree.files.get(rel_path)
+                if entry is None or not _is_below(rel_path, base):
+                    continue
+                if (
+                    regex.fullmatch(self._relative(rel_path, base))
+                    if regex is not None
+                    else not entry.ignored
+                ):
+                    files.append(str(self.root / rel_path))
+        return files
+
+    def get(self, rel_path: str) -> FileEntry | None:
+        """Return the entry of a file, by path relative to the root."""
+        with self._lock:
+            return self._tree.files.get(rel_path)
+
+    def paths(self) -> list[str]:
+        """Return the paths of the files indexed, relative to the root."""
+        with self._lock:
+            return list(self._tree.files)
+
+    def mtime(self, path: str | Path) -> float | None:
+        """Return the indexed modification time of a file."""
+        rel_path = self._relative_to_root(path)
+        with self._lock:
+            entry = self._tree.files.get(rel_path) if rel_path is not None else None
+        return entry.mtime if entry is not None else None
+
+    def sort_by_mtime(self, paths: list[str]) -> list[str]:
+        """Sort files by modification time, most recent first, using the
+        index and falling back to the file system for unindexed files."""
+
+        def mtime(path: str) -> float:
+            indexed = self.mtime(path)
+            if indexed is not None:
+                return indexed
+            try:
+                return os.stat(path).st_mtime
+            except OSError:
+                return 0.0
+
+        return sorted(paths, key=mtime, reverse=True)
+
+    def _reaches_skipped_dir(self, pattern: str, base: str) -> bool:
+        """Whether files in skipped directories may match a glob, as it
+        selects or names them."""
+        regex = glob_to_regex(pattern)
+        for rel_dir in self._tree.skipped_dirs:
+            if not _is_below(rel_dir, base):
+                continue
+            rel_to_base = self._relative(rel_dir, base)
+            if regex.fullmatch(rel_to_base) or pattern.lstrip("/").startswith(
+                f"{rel_to_base}/"
+            ):
+                return True
+        return False
+
+    def _query_base(self, search_path: str | Path) -> str | None:
+        """Refresh the index, and return the relative path of a search path
+        it covers."""
+        if not self.ready:
+            return None
+        self.refresh()
+        base = self._relative_to_root(search_path)
+        if base is None:
+            return None
+        with self._lock:
+            if base in self._tree.dirs:
+                return base
+        return None
+
+    def _relative_to_root(self, path: str | Path) -> str | None:
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.root / path
+        try:
+            rel_path = path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        return "" if rel_path == "." else rel_path
+
+    @staticmethod
+    def _relative(rel_path: str, base: str) -> str:
+        return rel_path[len(base) + 1 :] if base else rel_path
+
+    # ------------------------- Updates -------------------------
+
+    def refresh(self, force: bool = False) -> None:
+        """Rescan the directories changed since the last refresh."""
+        now = time.monotonic()
+        if not force and now - self._last_refresh < self.refresh_interval:
+            return
+        self._last_refresh = now
+        # The directories are statted without the lock, and only the changed
+        # ones rescanned with it
+        with self._lock:
+            self._stats.refreshes += 1
+            dirs = list(self._tree.dirs.items())
+        changed = [
+            (rel_dir, state) for rel_dir, state in dirs if self._changed(rel_dir, state)
+        ]
+        if not changed:
+            return
+        with self._lock:
+            for rel_dir, state in changed:
+                # Unless rescanned or removed with a parent rescanned before
+                if self._tree.dirs.get(rel_dir) is state:
+                    self._rescan_dir(rel_dir)
+
+    def _changed(self, rel_dir: str, state: _DirState) -> bool:
+        try:
+            mtime_ns = os.stat(self.root / rel_dir).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        return mtime_ns != state.mtime_ns or (
+            any(mtime is not None for mtime in state.ignore_mtimes)
+            and self._ignore_mtimes(rel_dir) != state.ignore_mtimes
+        )
+
+    def update(self, path: str | Path) -> None:
+        """Refresh a file, e.g. after modifying it in place."""
+        rel_path = self._relative_to_root(path)
+        if rel_path is None or not rel_path:
+            return
+        with self._lock:
+            if self._scan_updates is not None:
+                # Applied again to the tree of the full scan running
+                self._scan_updates.add(rel_path)
+            self._update(rel_path)
+
+    def _update(self, rel_path: str) -> None:
+        rel_dir, _, name = rel_path.rpartition("/")
+        state = self._tree.dirs.get(rel_dir)
+        if state is None:
+            return
+        if name in IGNORE_FILES:
+            self._rescan_dir(rel_dir)
+            return
+        try:
+            stat = os.stat(self.root / rel_path, follow_symlinks=False)
+        except OSError:
+            stat = None
+        if stat is None or not os.path.isfile(self.root / rel_path):
+            self._tree.files.pop(rel_path, None)
+            state.files.discard(name)
+        else:
+            ignored = name.startswith(".") or _is_ignored(state.rules, rel_path, False)
+            self._tree.files[rel_path] = FileEntry(stat.st_mtime, stat.st_size, ignored)
+            state.files.add(name)
+        self._notify([rel_path])
+
+    def _build_in_background(self) -> None:
+        try:
+            self._full_scan()
+        except Exception as e:
+            logger.error(f"Failed to index {self.root}: {e}", exc_info=True)
+        finally:
+            self._ready.set()
+        # Files modified in place are only seen by full scans
+        while True:
+            time.sleep(self.full_rescan_interval)
+            try:
+                self._full_scan()
+            except Exception as e:
+                logger.error(f"Failed to rescan {self.root}: {e}", exc_info=True)
+
+    def _full_scan(self) -> None:
+        """Scan the whole tree into a new one, replacing the current tree once
+        complete, so queries answered meanwhile use the current one."""
+        start = time.monotonic()
+        with self._lock:
+            self._scan_updates = set()
+        try:
+            self._in_git_repo = any(
+                (parent / ".git").exists() for parent in (self.root, *self.root.parents)
+            )
+            tree = _Tree()
+            self._scan_tree(tree, "", [])
+            with self._lock:
+                changed = [*(self._tree.files.keys() - tree.files.keys()), *tree.files]
+                self._tree = tree
+                # Edits made during the scan may not be in the new tree
+                for rel_path in self._scan_updates:
+                    self._update(rel_path)
+                self._last_refresh = time.monotonic()
+                self._stats.build_seconds = self._last_refresh - start
+                self._stats.full_scans += 1
+        finally:
+            with self._lock:
+                self._scan_updates = None
+        self._notify(changed)
+        logger.debug(
+            f"Indexed {len(tree.files)} files below {self.root} "
+            f"in {self._stats.build_seconds:.2f}s"
+        )
+
+    def _ignore_mtimes(self, rel_dir: str) -> tuple[int | None, ...]:
+        mtimes = []
+        for name in IGNORE_FILES:
+            try:
+                mtimes.append(os.stat(self.root / rel_dir / name).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _scan_tree(
+        self,
+        tree: _Tree,
+        rel_dir: str,
+        parent_rules: list[tuple[str, list[_IgnoreRule]]],
+    ) -> list[str]:
+        """Index a directory and the directories below it, returning the files
+        indexed."""
+        pending = [(rel_dir, parent_rules)]
+        files = []
+        while pending:
+            rel_dir, parent_rules = pending.pop()
+            new_subdirs = self._scan_dir(tree, rel_dir, parent_rules)
+            state = tree.dirs.get(rel_dir)
+            if state is None:
+                continue
+            files.extend(_join(rel_dir, name) for name in state.files)
+            pending.extend((subdir, state.rules) for subdir in new_subdirs)
+        return files
+
+    def _scan_dir(
+        self,
+        tree: _Tree,
+        rel_dir: str,
+        parent_rules: list[tuple[str, list[_IgnoreRule]]],
+        known_subdirs: set[str] | None = None,
+    ) -> list[str]:
+        """Index the entries of a directory, returning its subdirectories
+        to walk, other than `known_subdirs`."""
+        path = self.root / rel_dir
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            entries = list(os.scandir(path))
+        except OSError as e:
+            logger.debug(f"Failed to index {path}: {e}")
+            return []
+        ignore_mtimes = self._ignore_mtimes(rel_dir)
+        rules = list(parent_rules)
+        for name, mtime in zip(IGNORE_FILES, ignore_mtimes):
+            if mtime is not None and (name != ".gitignore" or self._in_git_repo):
+                rules.append((rel_dir, _parse_ignore_file(str(path / name))))
+        state = _DirState(mtime_ns, ignore_mtimes, rules)
+        tree.dirs[rel_dir] = state
+
+        new_subdirs = []
+        for entry in entries:
+            rel_path = _join(rel_dir, entry.name)
+            hidden = entry.name.startswith(".")
+            try:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    if hidden or _is_ignored(rules, rel_path, True):
+                        tree.skipped_dirs.add(rel_path)
+                        continue
+                    state.subdirs.add(entry.name)
+                    if known_subdirs is None or entry.name not in known_subdirs:
+                        new_subdirs.append(rel_path)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    ignored = hidden or _is_ignored(rules, rel_path, False)
+                    tree.files[rel_path] = FileEntry(
+                        stat.st_mtime, stat.st_size, ignored
+                    )
+                    state.files.add(entry.name)
+            except OSError:
+                continue
+        return new_subdirs
+
+    def _rescan_dir(self, rel_dir: str) -> None:
+        """Update the entries of a changed directory."""
+        tree = self._tree
+        self._stats.rescanned_directories += 1
+        old = tree.dirs.pop(rel_dir)
+        for name in old.files:
+            tree.files.pop(_join(rel_dir, name), None)
+        self._notify(_join(rel_dir, name) for name in old.files)
+        tree.skipped_dirs -= {
+            skipped
+            for skipped in tree.skipped_dirs
+            if skipped.rpartition("/")[0] == rel_dir
+        }
+        parent_rules = [rule for rule in old.rules if rule[0] != rel_dir]
+        if not (self.root / rel_dir).is_dir():
+            self._remove_tree(rel_dir, old)
+            return
+
+        rules_changed = self._ignore_mtimes(rel_dir) != old.ignore_mtimes
+        # Subdirectories are kept unless removed, or their rules changed
+        kept = set() if rules_changed else old.subdirs
+        new_subdirs = self._scan_dir(tree, rel_dir, parent_rules, known_subdirs=kept)
+        state = tree.dirs.get(rel_dir)
+        for name in old.subdirs:
+            if state is None or name not in state.subdirs or name not in kept:
+                subdir = _join(rel_dir, name)
+                if subdir in tree.dirs:
+                    self._remove_tree(subdir, tree.dirs.pop(subdir))
+        if state is None:
+            return
+        self._notify(_join(rel_dir, name) for name in state.files)
+        for subdir in new_subdirs:
+            self._notify(self._scan_tree(tree, subdir, state.rules))
+
+    def _notify(self, rel_paths: Iterable[str]) -> None:
+        if not self._listeners:
+            return
+        for rel_path in rel_paths:
+            for listener in self._listeners:
+                listener(rel_path)
+
+    def _remove_tree(self, rel_dir: str, state: _DirState) -> None:
+        tree = self._tree
+        for name in state.files:
+            tree.files.pop(_join(rel_dir, name), None)
+        self._notify(_join(rel_dir, name) for name in state.files)
+        for name in state.subdirs:
+            subdir = _join(rel_dir, name)
+            substate = tree.dirs.pop(subdir, None)
+            if substate is not None:
+                self._remove_tree(subdir, substate)
+        tree.skipped_dirs -= {
+            skipped
+            for skipped in tree.skipped_dirs
+            if skipped.startswith(f"{rel_dir}/")
+        }
+
+
+_indexes: dict[Path, FileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def notify_file_changed(path: str | Path) -> None:
+    """Update the indexes covering a file modified by a tool."""
+    path = Path(path).resolve()
+    with _indexes_lock:
+        indexes = [
+            index
+            for root, index in _indexes.items()
+            if index.ready and path.is_relative_to(root)
+        ]
+    for index in indexes:
+        index.update(path)
+
+
+def get_file_index(root: str | Path) -> FileIndex:
+    """Return the index of a workspace shared by its tools, starting to build
+    it if needed."""
+    root = Path(root).resolve()
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = FileIndex(root)
+            _indexes[root] = index
+            index.start()
+        return index
@@ -0,0 +1,370 @@
+"""Trigram index of the contents of a workspace, for the grep tool.
+
+The index maps each sequence of three characters (trigram) of the lowercased
+contents of the files of a `FileIndex` to the files containing it. Literal
+strings required by a regex are extracted from its syntax tree, and only the
+files containing all of their trigrams can match: searches verify these
+candidates instead of scanning the whole workspace.
+
+The index is built in a background thread once its file index is ready, then
+updated with the files the file index reports as changed, either when
+refreshed before queries or when tools like the file editor notify them.
+Files larger than `max_file_size` are not indexed, and always candidates;
+binary files (with a NUL byte in their first block, which ripgrep skips when
+searching directories) are never candidates.
+"""
+
+import queue
+import re
+
+# The parser of the re module, to extract the literals of regexes
+import re._constants as sre_constants  # type: ignore
+import re._parser as sre_parse  # type: ignore
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from openhands.sdk.logger import get_logger
+from openhands.tools.utils.file_index import FileIndex, get_file_index
+
+
+logger = get_logger(__name__)
+
+# Size of the block checked for NUL bytes, like ripgrep's binary detection
+BINARY_CHECK_SIZE = 8192
+# Maximum number of alternatives of the literal queries extracted from regexes
+MAX_QUERY_ALTERNATIVES = 16
+
+# A query is a disjunction of conjunctions of literal strings: a file may
+# match if it contains all the strings of one of the alternatives
+_Query = list[frozenset[str]]
+_UNCONSTRAINED: _Query = [frozenset()]
+
+
+def _flush(query: _Query, literal: str) -> _Query:
+    # Trigrams are only indexed within lines
+    literals = {line for line in literal.splitlines() if len(line) >= 3}
+    if not literals:
+        return query
+    return [alternative | literals for alternative in query]
+
+
+def _conjunction(left: _Query, right: _Query) -> _Query:
+    if right == _UNCONSTRAINED:
+        return left
+    if left == _UNCONSTRAINED:
+        return right
+    combined = [a | b for a in left for b in right]
+    # Dropping constraints keeps the query correct, only less selective
+    return combined if len(combined) <= MAX_QUERY_ALTERNATIVES else left
+
+
+def _sequence_query(items: sre_parse.SubPattern) -> _Query:
+    query, literal = _UNCONSTRAINED, ""
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            literal += chr(av).lower()
+            continue
+        query, literal = _flush(query, literal), ""
+        if op is sre_constants.SUBPATTERN:
+            query = _conjunction(query, _sequence_query(av[-1]))
+        elif op is sre_constants.ATOMIC_GROUP:
+            query = _conjunction(query, _sequence_query(av))
+        elif op in (
+            sre_constants.MAX_REPEAT,
+            sre_constants.MIN_REPEAT,
+            sre_constants.POSSESSIVE_REPEAT,
+        ):
+            if av[0] >= 1:
+                query = _conjunction(query, _sequence_query(av[2]))
+        elif op is sre_constants.BRANCH:
+            alternatives: _Query = []
+            for branch in av[1]:
+                branch_query = _sequence_query(branch)
+                if branch_query == _UNCONSTRAINED:
+                    alternatives = _UNCONSTRAINED
+                    break
+                alternatives.extend(branch_query)
+            if len(alternatives) <= MAX_QUERY_ALTERNATIVES:
+                query = _conjunction(query, alternatives)
+    return _flush(query, literal)
+
+
+def literal_query(pattern: str) -> list[frozenset[str]] | None:
+    """Return the literal strings a case-insensitive match of a regex
+    requires, as alternatives of lowercased strings that must all be present,
+    or None if the regex does not require any string of 3 characters."""
+    try:
+        query = _sequence_query(sre_parse.parse(pattern))
+    except (re.error, RecursionError, OverflowError):
+        return None
+    if any(not alternative for alternative in query):
+        return None
+    return query
+
+
+def _trigrams(text: str) -> set[str]:
+    # Repeated lines are common in source files, and their trigrams identical
+    text = "\n".join(set(text.splitlines()))
+    return set(map("".join, zip(text, text[1:], text[2:])))
+
+
+@dataclass(frozen=True)
+class _IndexedFile:
+    file_id: int
+    mtime: float
+    size: int
+
+
+class TrigramIndexStats(BaseModel):
+    """Statistics of a trigram index."""
+
+    files: int = Field(default=0, description="Files indexed")
+    unindexed_files: int = Field(
+        default=0, description="Files too large to be indexed, always searched"
+    )
+    binary_files: int = Field(default=0, description="Binary files, never searched")
+    indexed_bytes: int = Field(default=0, description="Size of the files indexed")
+    trigrams: int = Field(default=0, description="Distinct trigrams")
+    postings: int = Field(default=0, description="Entries of the trigram posting lists")
+    build_seconds: float = Field(
+        default=0.0, description="Duration of the initial build"
+    )
+    updates: int = Field(
+        default=0, description="Files indexed again after they changed"
+    )
+    queries: int = Field(default=0, description="Candidate queries answered")
+    candidates: int = Field(
+        default=0, description="Candidate files returned by queries"
+    )
+
+
+class TrigramIndex:
+    """Trigram index of the files of a `FileIndex`; see the module
+    documentation."""
+
+    def __init__(
+        self,
+        file_index: FileIndex,
+        max_file_size: int = 1024 * 1024,
+        max_candidates: int = 5000,
+    ):
+        self.file_index = file_index
+        self.max_file_size = max_file_size
+        self.max_candidates = max_candidates
+        self._postings: dict[str, set[int]] = {}
+        self._indexed: dict[str, _IndexedFile] = {}
+        self._paths: dict[int, str] = {}
+        self._next_id = 0
+        self._stale_ids = 0
+        self._unindexed: dict[str, _IndexedFile] = {}
+        self._binary: dict[str, _IndexedFile] = {}
+        # Files reported as changed, recorded without locks as the file index
+        # reports them with its own lock held
+        self._pending: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self._stats = TrigramIndexStats()
+        self._lock = threading.RLock()
+        # Serializes the processing of pending files; the file index is only
+        # called with this lock held, never with `_lock`
+        self._update_lock = threading.Lock()
+        self._ready = threading.Event()
+        file_index.add_listener(self._on_file_changed)
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        """Build the index in a background thread."""
+        threading.Thread(
+            target=self._build_in_background, name="trigram-index", daemon=True
+        ).start()
+
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def stats(self) -> TrigramIndexStats:
+        with self._lock:
+            return self._stats.model_copy(
+                update={
+                    "files": len(self._indexed),
+                    "unindexed_files": len(self._unindexed),
+                    "binary_files": len(self._binary),
+                    "trigrams": len(self._postings),
+                    "postings": sum(len(ids) for ids in self._postings.values()),
+                }
+            )
+
+    def candidates(
+        self, pattern: str, search_path: str | Path, include: str | None = None
+    ) -> list[str] | None:
+        """Return the files below `search_path` that may contain a match of
+        a regex, searched case-insensitively like ripgrep with an optional
+        include glob. Return None if the index cannot prune the search."""
+        if not self.ready:
+            return None
+        query = literal_query(pattern)
+        if query is None:
+            return None
+        # The file index reports the files changed when refreshed
+        self.file_index.refresh()
+        self._process_pending()
+        with self._lock:
+            rel_paths = set(self._unindexed)
+            for alternative in query:
+                rel_paths.update(
+                    self._paths[file_id]
+                    for file_id in self._lookup(alternative)
+                    if file_id in self._paths
+                )
+            self._stats.queries += 1
+        files = self.file_index.searched_files(rel_paths, search_path, include)
+        if files is None or len(files) > self.max_candidates:
+            return None
+        with self._lock:
+            self._stats.candidates += len(files)
+        return files
+
+    def _lookup(self, literals: frozenset[str]) -> set[int]:
+        trigrams = set().union(*(_trigrams(literal) for literal in literals))
+        postings = sorted(
+            (self._postings.get(trigram, set()) for trigram in trigrams), key=len
+        )
+        return set(postings[0]).intersection(*postings[1:])
+
+    # ------------------------- Updates -------------------------
+
+    def update(self, path: str | Path) -> None:
+        """Index a file again, e.g. after modifying it."""
+        self.file_index.update(path)
+
+    def _on_file_changed(self, rel_path: str) -> None:
+        self._pending.put(rel_path)
+
+    def _build_in_background(self) -> None:
+        start = time.monotonic()
+        try:
+            self.file_index.wait_until_ready()
+            for rel_path in self.file_index.paths():
+                self._pending.put(rel_path)
+            self._process_pending(is_build=True)
+        except Exception as e:
+            logger.error(
+                f"Failed to build trigram index of {self.file_index.root}: {e}",
+                exc_info=True,
+            )
+        finally:
+            with self._lock:
+                self._stats.build_seconds = time.monotonic() - start
+            self._ready.set()
+        logger.debug(
+            f"Indexed {len(self._indexed)} files of {self.file_index.root} "
+            f"in {self._stats.build_seconds:.2f}s"
+        )
+
+    def _process_pending(self, is_build: bool = False) -> None:
+        """Index the files reported as changed since the last update."""
+        with self._update_lock:
+            rel_paths = set()
+            while True:
+                try:
+                    rel_paths.add(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            if not rel_paths:
+                return
+            entries = {
+                rel_path: self.file_index.get(rel_path) for rel_path in rel_paths
+            }
+            for rel_path, entry in entries.items():
+                # While building, the lock is only held between files
+                with self._lock:
+                    indexed = (
+                        self._indexed.get(rel_path)
+                        or self._unindexed.get(rel_path)
+                        or self._binary.get(rel_path)
+                    )
+                    if (
+                        entry is not None
+                        and indexed is not None
+                        and (entry.mtime, entry.size) == (indexed.mtime, indexed.size)
+                    ):
+                        continue
+                    self._remove(rel_path)
+                    if entry is None:
+                        continue
+                    if not is_build:
+                        self._stats.updates += 1
+                self._index_file(rel_path, entry.mtime, entry.size)
+            with self._lock:
+                if self._stale_ids > len(self._paths):
+                    self._compact()
+
+    def _index_file(self, rel_path: str, mtime: float, size: int) -> None:
+        if size > self.max_file_size:
+            with self._lock:
+                self._unindexed[rel_path] = _IndexedFile(-1, mtime, size)
+            return
+        try:
+            with open(self.file_index.root / rel_path, "rb") as f:
+                data = f.read(self.max_file_size + 1)
+        except OSError:
+            return
+        if b"\0" in data[:BINARY_CHECK_SIZE]:
+            with self._lock:
+                self._binary[rel_path] = _IndexedFile(-1, mtime, size)
+            return
+        trigrams = _trigrams(data.decode("utf-8", errors="replace").lower())
+        size = len(data)
+        with self._lock:
+            file_id = self._next_id
+            self._next_id += 1
+            self._indexed[rel_path] = _IndexedFile(file_id, mtime, size)
+            self._paths[file_id] = rel_path
+            for trigram in trigrams:
+                ids = self._postings.get(trigram)
+                if ids is None:
+                    self._postings[trigram] = {file_id}
+                else:
+                    ids.add(file_id)
+            self._stats.indexed_bytes += size
+
+    def _remove(self, rel_path: str) -> None:
+        """Forget a file; its posting list entries are dropped when compacting."""
+        self._unindexed.pop(rel_path, None)
+        self._binary.pop(rel_path, None)
+        indexed = self._indexed.pop(rel_path, None)
+        if indexed is not None:
+            del self._paths[indexed.file_id]
+            self._stale_ids += 1
+            self._stats.indexed_bytes -= indexed.size
+
+    def _compact(self) -> None:
+        """Drop the ids of the files removed from the posting lists."""
+        live_ids = set(self._paths)
+        for trigram in list(self._postings):
+            ids = self._postings[trigram]
+            ids &= live_ids
+            if not ids:
+                del self._postings[trigram]
+        self._stale_ids = 0
+
+
+_indexes: dict[Path, TrigramIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_trigram_index(root: str | Path) -> TrigramIndex:
+    """Return the trigram index of a workspace shared by its tools, starting
+    to build it and its file index if needed."""
+    file_index = get_file_index(root)
+    with _indexes_lock:
+        index = _indexes.get(file_index.root)
+        if index is None:
+            index = TrigramIndex(file_index)
+            _indexes[file_index.root] = index
+            index.start()
+        return index
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Measure how long short commands take to return in each terminal backend
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from typing import Literal, get_args
+
+from openhands.tools.terminal.definition import TerminalAction
+from openhands.tools.terminal.terminal import create_terminal_session
+
+
+TerminalType = Literal["tmux", "subprocess"]
+TERMINAL_TYPES: list[TerminalType] = list(get_args(TerminalType))
+COMMANDS = ["true", "echo hello", "ls", "sleep 0.05", "python3 -c pass"]
+
+
+def benchmark(terminal_type: TerminalType, runs: int) -> list[float]:
+    with tempfile.TemporaryDirectory() as work_dir:
+        session = create_terminal_session(
+            work_dir=work_dir, terminal_type=terminal_type
+        )
+        session.initialize()
+        try:
+            latencies = []
+            for i in range(runs):
+                start = time.perf_counter()
+                session.execute(TerminalAction(command=COMMANDS[i % len(COMMANDS)]))
+                latencies.append(time.perf_counter() - start)
+            return latencies
+        finally:
+            session.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the latency of short commands per terminal backend"
+    )
+    parser.add_argument(
+        "--terminal-type",
+        action="append",
+        choices=TERMINAL_TYPES,
+        help="Backend to measure (default: all)",
+    )
+    parser.add_argument("--runs", type=int, default=20, help="Commands per backend")
+    args = parser.parse_args()
+    for terminal_type in args.terminal_type or TERMINAL_TYPES:
+        latencies = sorted(benchmark(terminal_type, args.runs))
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(
+            f"{terminal_type}: median {statistics.median(latencies) * 1000:.1f} ms, "
+            f"p95 {p95 * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms"
+        )
@@ -0,0 +1,76 @@
+import json
+import threading
+import time
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+
+class WebhookStandIn(ThreadingHTTPServer):
+    """Local HTTP server recording webhook posts.
+
+    The next `failures` requests are answered with HTTP 500, and every
+    request is answered after `delay` seconds.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _WebhookHandler)
+        self.requests: list[tuple[str, Message, Any]] = []
+        self.failures = 0
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    @property
+    def paths(self) -> list[str]:
+        return [path for path, _, _ in self.requests]
+
+    @property
+    def bodies(self) -> list[Any]:
+        return [body for _, _, body in self.requests]
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    server: WebhookStandIn  # type: ignore[assignment]
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        with server._lock:
+            server.requests.append((self.path, self.headers, json.loads(body)))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            failed = server.failures > 0
+            if failed:
+                server.failures -= 1
+        time.sleep(server.delay)
+        with server._lock:
+            server.in_flight -= 1
+        self.send_response(500 if failed else 200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def webhook_server():
+    """Start a local stand-in for a webhook service."""
+    server = WebhookStandIn()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,130 @@
+"""Tests for the in-memory bash event index."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from openhands.agent_server.bash_event_index import BashEventIndex
+from openhands.agent_server.bash_service import BashEventService
+from openhands.agent_server.models import BashEventSortOrder, ExecuteBashRequest
+
+
+def command_name(ts: int, event_id: str) -> str:
+    return f"20250101000{ts:03d}_BashCommand_{event_id}"
+
+
+def output_name(ts: int, command_id: str, event_id: str) -> str:
+    return f"20250101000{ts:03d}_BashOutput_{command_id}_{event_id}"
+
+
+@pytest.fixture
+def index() -> BashEventIndex:
+    index = BashEventIndex()
+    for i in range(5):
+        index.add(command_name(i * 10, f"c{i}"))
+        index.add(output_name(i * 10 + 1, f"c{i}", f"o{i}a"))
+        index.add(output_name(i * 10 + 2, f"c{i}", f"o{i}b"))
+    return index
+
+
+def test_get_by_id(index):
+    assert index.get("c3") == command_name(30, "c3")
+    assert index.get("o3b") == output_name(32, "c3", "o3b")
+    assert index.get("missing") is None
+    assert len(index) == 15
+
+
+def test_filters(index):
+    names, _ = index.search(kind="BashCommand")
+    assert names == [command_name(i * 10, f"c{i}") for i in range(5)]
+
+    names, _ = index.search(command_id="c2")
+    assert names == [output_name(21, "c2", "o2a"), output_name(22, "c2", "o2b")]
+    assert index.search(command_id="c2", kind="BashOutput")[0] == names
+    assert index.search(command_id="c2", kind="BashCommand")[0] == []
+    assert index.search(command_id="unknown")[0] == []
+
+    names, _ = index.search(
+        timestamp_gte="20250101000020", timestamp_lt="20250101000030"
+    )
+    assert names == [
+        command_name(20, "c2"),
+        output_name(21, "c2", "o2a"),
+        output_name(22, "c2", "o2b"),
+    ]
+
+
+def test_pagination(index):
+    seen = []
+    page_id = None
+    while True:
+        names, page_id = index.search(kind="BashOutput", page_id=page_id, limit=3)
+        seen.extend(names)
+        if page_id is None:
+            break
+    assert seen == index.search(kind="BashOutput", limit=100)[0]
+    assert len(seen) == 10
+
+
+def test_pagination_descending(index):
+    seen = []
+    page_id = None
+    while True:
+        names, page_id = index.search(page_id=page_id, limit=4, descending=True)
+        seen.extend(names)
+        if page_id is None:
+            break
+    assert seen == index.names()[::-1]
+
+
+def test_page_id_of_missing_file_resumes_in_order(index):
+    # A cursor still positions the page after the file it names was deleted
+    names, _ = index.search(page_id=command_name(15, "gone"), limit=2)
+    assert names == [command_name(20, "c2"), output_name(21, "c2", "o2a")]
+
+
+def test_scan(tmp_path):
+    (tmp_path / command_name(1, "c1")).write_text("{}")
+    (tmp_path / output_name(2, "c1", "o1")).write_text("{}")
+    (tmp_path / "unrelated.txt").write_text("")
+    (tmp_path / "subdir").mkdir()
+
+    index = BashEventIndex.scan(tmp_path)
+
+    assert index.names() == [command_name(1, "c1"), output_name(2, "c1", "o1")]
+    assert len(BashEventIndex.scan(tmp_path / "missing")) == 0
+
+
+@pytest.mark.asyncio
+async def test_service_indexes_existing_events_once():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bash_events_dir = Path(temp_dir) / "bash_events"
+        service = BashEventService(bash_events_dir=bash_events_dir)
+        results = await asyncio.gather(
+            *[
+                service.start_bash_command(
+                    ExecuteBashRequest(command=f"echo {i}", cwd="/tmp")
+                )
+                for i in range(3)
+            ]
+        )
+        await asyncio.gather(*[task for _, task in results])
+
+        # A new service (e.g. after a restart) picks up the events on disk
+        restarted = BashEventService(bash_events_dir=bash_events_dir)
+        async with restarted:
+            page = await restarted.search_bash_events(
+                sort_order=BashEventSortOrder.TIMESTAMP_DESC
+            )
+            assert len(page.items) == 6
+            command = results[0][0]
+            # Ids are accepted in hex and in canonical form
+            for event_id in (command.id.hex, str(command.id)):
+                event = await restarted.get_bash_event(event_id)
+                assert event is not None and event.id == command.id
+
+            # Files added behind the service's back are not rescanned
+            (bash_events_dir / command_name(1, "f" * 32)).write_text("{}")
+            assert await restarted.get_bash_event("f" * 32) is None
@@ -1,3 +1,4 @@
+import asyncio
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
@@ -1072,6 +1073,221 @@ class TestConversationServiceDeleteConversation:
             assert mock_rmtree.call_count == 1
 
 
+class TestConversationServiceLazyHydration:
+    """Test that stored conversations are only started when accessed."""
+
+    async def _create_stored_conversations(self, conversations_dir, workspace, n):
+        async with ConversationService(conversations_dir=conversations_dir) as service:
+            ids = []
+            for i in range(n):
+                request = StartConversationRequest(
+                    agent=Agent(llm=LLM(model="gpt-4", usage_id="test-llm"), tools=[]),
+                    workspace=LocalWorkspace(working_dir=workspace),
+                    confirmation_policy=NeverConfirm(),
+                )
+                info, _ = await service.start_conversation(request)
+                await service.update_conversation(
+                    info.id, UpdateConversationRequest(title=f"Conversation {i}")
+                )
+                ids.append(info.id)
+        return ids
+
+    @pytest.mark.asyncio
+    async def test_startup_does_not_start_conversations(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._create_stored_conversations(
+            conversations_dir, str(tmp_path), 3
+        )
+
+        async with ConversationService(conversations_dir=conversations_dir) as service:
+            assert service._event_services == {}
+            assert set(service._catalog) == set(ids)
+
+            # Listing and counting use persisted state without hydrating
+            page = await service.search_conversations()
+            assert {item.id for item in page.items} == set(ids)
+            assert {item.title for item in page.items} == {
+                f"Conversation {i}" for i in range(3)
+            }
+            assert await service.count_conversations() == 3
+            assert (
+                await service.count_conversations(ConversationExecutionStatus.IDLE) == 3
+            )
+            info = await service.get_conversation(ids[0])
+            assert info is not None and info.title == "Conversation 0"
+            assert service._event_services == {}
+
+            # Accessing the event service hydrates exactly that conversation
+            event_service = await service.get_event_service(ids[1])
+            assert event_service is not None
+            assert event_service.stored.title == "Conversation 1"
+            assert list(service._event_services) == [ids[1]]
+            assert await service.get_event_service(ids[1]) is event_service
+
+    @pytest.mark.asyncio
+    async def test_concurrent_access_hydrates_once(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        (conversation_id,) = await self._create_stored_conversations(
+            conversations_dir, str(tmp_path), 1
+        )
+
+        async with ConversationService(conversations_dir=conversations_dir) as service:
+            with patch.object(
+                service, "_start_event_service", wraps=service._start_event_service
+            ) as start:
+                results = await asyncio.gather(
+                    *[service.get_event_service(conversation_id) for _ in range(5)]
+                )
+            assert start.call_count == 1
+            assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_delete_dormant_conversation(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._create_stored_conversations(
+            conversations_dir, str(tmp_path), 2
+        )
+
+        async with ConversationService(conversations_dir=conversations_dir) as service:
+            assert await service.delete_conversation(ids[0])
+            assert not (conversations_dir / ids[0].hex).exists()
+            assert await service.get_conversation(ids[0]) is None
+            assert await service.count_conversations() == 1
+            assert service._event_services == {}
+
+    @pytest.mark.asyncio
+    async def test_persisted_state_cache_is_bounded(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._create_stored_conversations(
+            conversations_dir, str(tmp_path), 3
+        )
+
+        async with ConversationService(
+            conversations_dir=conversations_dir, persisted_state_cache_size=2
+        ) as service:
+            page = await service.search_conversations()
+            assert {item.id for item in page.items} == set(ids)
+            assert len(service._persisted_states) == 2
+            assert (
+                await service.count_conversations(ConversationExecutionStatus.IDLE) == 3
+            )
+            assert len(service._persisted_states) == 2
+
+    @pytest.mark.asyncio
+    async def test_listing_uses_catalog_status(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._create_stored_conversations(
+            conversations_dir, str(tmp_path), 3
+        )
+
+        async with ConversationService(conversations_dir=conversations_dir) as service:
+            assert all(
+                stored.execution_status == ConversationExecutionStatus.IDLE
+                for stored in service._catalog.values()
+            )
+            with patch.object(
+                ConversationState,
+                "load_persisted",
+                wraps=ConversationState.load_persisted,
+            ) as load_persisted:
+                assert (
+                    await service.count_conversations(ConversationExecutionStatus.IDLE)
+                    == 3
+                )
+                assert (
+                    await service.count_conversations(
+                        ConversationExecutionStatus.FINISHED
+                    )
+                    == 0
+                )
+                load_persisted.assert_not_called()
+
+                # Only the conversations on the requested page are loaded
+                page = await service.search_conversations(
+                    limit=1, execution_status=ConversationExecutionStatus.IDLE
+                )
+                assert len(page.items) == 1 and page.next_page_id is not None
+                assert load_persisted.call_count == 1
+            assert service._event_services == {}
+            assert set(service._catalog) == set(ids)
+
+    @pytest.mark.asyncio
+    async def test_delete_dormant_conversation_does_not_hydrate(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._create_stored_conversations(
+            conversations_dir, str(tmp_path), 1
+        )
+
+        async with ConversationService(conversations_dir=conversations_dir) as service:
+            subscriber = AsyncMock()
+            service._conversation_webhook_subscribers = [subscriber]
+            with patch(
+                "openhands.agent_server.conversation_service.EventService"
+            ) as event_service_cls:
+                assert await service.delete_conversation(ids[0])
+            event_service_cls.assert_not_called()
+            (conversation_info,) = subscriber.post_conversation_info.call_args.args
+            assert conversation_info.id == ids[0]
+            assert conversation_info.title == "Conversation 0"
+            assert not (conversations_dir / ids[0].hex).exists()
+
+    @pytest.mark.asyncio
+    async def test_delete_active_conversation_notifies_current_state(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._create_stored_conversations(
+            conversations_dir, str(tmp_path), 1
+        )
+
+        async with ConversationService(conversations_dir=conversations_dir) as service:
+            event_service = await service.get_event_service(ids[0])
+            assert event_service is not None
+            with (
+                patch.object(
+                    service, "_get_persisted_state", wraps=service._get_persisted_state
+                ) as get_persisted_state,
+                patch.object(
+                    event_service, "get_state", wraps=event_service.get_state
+                ) as get_state,
+            ):
+                assert await service.delete_conversation(ids[0])
+            get_persisted_state.assert_not_called()
+            get_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_evict_idle_conversations(self, tmp_path):
+        conversations_dir = tmp_path / "conversations"
+        ids = await self._create_stored_conversations(
+            conversations_dir, str(tmp_path), 2
+        )
+
+        async with ConversationService(
+            conversations_dir=conversations_dir, idle_ttl=60.0
+        ) as service:
+            for conversation_id in ids:
+                await service.get_event_service(conversation_id)
+            assert set(service._event_services) == set(ids)
+
+            # Nothing is idle yet
+            assert await service.evict_idle_conversations() == []
+
+            # Conversations with external subscribers are kept
+            subscriber = AsyncMock()
+            event_service = service._event_services[ids[1]]
+            await event_service.subscribe_to_events(subscriber)
+            for conversation_id in ids:
+                service._last_access[conversation_id] -= 120.0
+
+            assert await service.evict_idle_conversations() == [ids[0]]
+            assert list(service._event_services) == [ids[1]]
+            assert ids[0] in service._catalog
+
+            # Evicted conversations are still listed and hydrate again on access
+            assert await service.count_conversations() == 2
+            rehydrated = await service.get_event_service(ids[0])
+            assert rehydrated is not None
+            assert rehydrated.stored.title == "Conversation 0"
+
+
 class TestSafeRmtree:
     """Test cases for the _safe_rmtree helper function."""
 
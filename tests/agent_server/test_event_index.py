@@ -0,0 +1,208 @@
+import random
+
+import pytest
+
+from openhands.agent_server.event_index import EventIndex, event_kind
+from openhands.sdk import Message
+from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.event import Event
+from openhands.sdk.event.condenser import CondensationRequest
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io.memory import InMemoryFileStore
+
+
+MESSAGE_KIND = "openhands.sdk.event.llm_convertible.message.MessageEvent"
+
+
+def create_events(n: int, seed: int = 0) -> list[Event]:
+    rng = random.Random(seed)
+    events: list[Event] = []
+    for i in range(n):
+        # Few distinct timestamps so that ties and slight disorder are covered
+        timestamp = f"2025-01-01T10:{rng.randint(0, 9):02d}:00.000000"
+        if rng.random() < 0.7:
+            events.append(
+                MessageEvent(
+                    id=f"event{i}",
+                    source="user",
+                    llm_message=Message(role="user"),
+                    timestamp=timestamp,
+                )
+            )
+        else:
+            events.append(CondensationRequest(id=f"event{i}", timestamp=timestamp))
+    return events
+
+
+def brute_force(events, kind, gte, lt, descending):
+    matching = [
+        (e.timestamp, pos, e)
+        for pos, e in enumerate(events)
+        if (kind is None or event_kind(e) == kind)
+        and (gte is None or e.timestamp >= gte)
+        and (lt is None or e.timestamp < lt)
+    ]
+    matching.sort(key=lambda item: item[:2], reverse=descending)
+    return [e.id for _, _, e in matching]
+
+
+def collect_pages(index, events, limit, **kwargs):
+    ids: list[str] = []
+    cursor = None
+    while True:
+        positions, cursor = index.search(cursor=cursor, limit=limit, **kwargs)
+        ids.extend(events[pos].id for pos in positions)
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("kind", [None, MESSAGE_KIND])
+@pytest.mark.parametrize(
+    "gte,lt",
+    [
+        (None, None),
+        ("2025-01-01T10:03:00.000000", None),
+        (None, "2025-01-01T10:05:00.000000"),
+        ("2025-01-01T10:02:00.000000", "2025-01-01T10:07:00.000000"),
+    ],
+)
+def test_search_and_count_match_brute_force(descending, kind, gte, lt):
+    events = create_events(60)
+    index = EventIndex()
+    index.sync(events)
+
+    expected = brute_force(events, kind, gte, lt, descending)
+    assert index.count(kind=kind, timestamp_gte=gte, timestamp_lt=lt) == len(expected)
+    for limit in (1, 7, 100):
+        assert (
+            collect_pages(
+                index,
+                events,
+                limit,
+                kind=kind,
+                timestamp_gte=gte,
+                timestamp_lt=lt,
+                descending=descending,
+            )
+            == expected
+        )
+
+
+def test_sync_indexes_only_appended_events():
+    events = create_events(10)
+    index = EventIndex()
+    index.sync(events)
+
+    read: list[int] = []
+
+    class TrackingList(list):
+        def __getitem__(self, pos):
+            read.append(pos)
+            return super().__getitem__(pos)
+
+    tracked = TrackingList(events)
+    index.sync(tracked)
+    read.clear()
+    tracked.extend(create_events(15)[10:])
+    index.sync(tracked)
+    # The last event indexed is checked, then only the new events are read
+    assert read == list(range(9, 15))
+    assert index.count() == 15
+
+    # Counting does not touch the events at all
+    read.clear()
+    expected = brute_force(tracked, MESSAGE_KIND, None, None, False)
+    assert index.count(kind=MESSAGE_KIND) == len(expected)
+    assert read == []
+
+
+def test_sync_rebuilds_when_indexed_events_were_replaced():
+    events = create_events(10)
+    index = EventIndex()
+    index.sync(events)
+
+    # Same length, but the last event indexed is not the one in the sequence
+    events[9] = create_events(11, seed=1)[10]
+    index.sync(events)
+    assert collect_pages(index, events, 3) == brute_force(
+        events, None, None, None, False
+    )
+
+    # The sequence shrank below the events indexed
+    del events[5:]
+    index.sync(events)
+    assert len(index) == 5
+    assert collect_pages(index, events, 3) == brute_force(
+        events, None, None, None, False
+    )
+
+
+def test_sync_reads_stored_events_without_deserializing(monkeypatch):
+    fs = InMemoryFileStore()
+    log = EventLog(fs, cache_max_bytes=0)
+    events = create_events(10)
+    for event in events:
+        log.append(event)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("events were deserialized")
+
+    monkeypatch.setattr(EventLog, "__getitem__", fail)
+    index = EventIndex()
+    index.sync(log)
+    # Syncing again checks the last event indexed by id only
+    events += create_events(15)[10:]
+    for event in events[10:]:
+        log.append(event)
+    index.sync(log)
+    for kind in (None, MESSAGE_KIND):
+        assert index.count(kind=kind) == len(
+            brute_force(events, kind, None, None, False)
+        )
+
+
+def test_cursor_accepts_event_ids_and_ignores_unknown_values():
+    events = create_events(5)
+    index = EventIndex()
+    index.sync(events)
+    expected = brute_force(events, None, None, None, False)
+
+    positions, _ = index.search(cursor=expected[2], limit=100)
+    assert [events[pos].id for pos in positions] == expected[2:]
+
+    for cursor in ("invalid_event_id", "not base64!", "OTk6eA"):
+        positions, next_cursor = index.search(cursor=cursor, limit=100)
+        assert [events[pos].id for pos in positions] == expected
+        assert next_cursor is None
+
+
+def test_zero_limit_returns_cursor_to_first_event():
+    events = create_events(3)
+    index = EventIndex()
+    index.sync(events)
+
+    positions, cursor = index.search(limit=0)
+    assert positions == []
+    assert cursor is not None
+    positions, _ = index.search(cursor=cursor, limit=1)
+    assert events[positions[0]].id == brute_force(events, None, None, None, False)[0]
+
+
+def test_count_before_is_the_position_in_timestamp_order():
+    events = create_events(40)
+    index = EventIndex()
+    index.sync(events)
+    expected = brute_force(events, None, None, None, False)
+    messages = brute_force(events, MESSAGE_KIND, None, None, False)
+
+    for i, event_id in enumerate(expected):
+        assert index.count(before=event_id) == i
+        assert index.count(kind=MESSAGE_KIND, before=event_id) == sum(
+            1 for message_id in messages if expected.index(message_id) < i
+        )
+
+    _, cursor = index.search(limit=10, descending=True)
+    assert cursor is not None
+    assert index.count(before=cursor) == len(events) - 11
+    assert index.count(before="invalid_event_id") == 0
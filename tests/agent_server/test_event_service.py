@@ -1,6 +1,6 @@
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -710,6 +710,31 @@ class TestEventServiceSendMessage:
             # Verify run was called via executor since agent is idle
             mock_loop.run_in_executor.assert_any_call(None, conversation.run)
 
+    @pytest.mark.asyncio
+    async def test_send_message_with_async_agent_loop(self, event_service):
+        """Test that the async agent loop runs the conversation on the loop."""
+        conversation = MagicMock()
+        state = MagicMock()
+        state.execution_status = ConversationExecutionStatus.IDLE
+        state.__enter__ = MagicMock(return_value=state)
+        state.__exit__ = MagicMock(return_value=None)
+        conversation.state = state
+        conversation.send_message = MagicMock()
+        conversation.run = MagicMock()
+        conversation.arun = AsyncMock()
+
+        event_service._conversation = conversation
+        event_service.async_agent_loop = True
+        message = Message(role="user", content=[])
+
+        await event_service.send_message(message, run=True)
+        assert event_service._run_task is not None
+        await event_service._run_task
+
+        conversation.send_message.assert_called_once_with(message)
+        conversation.arun.assert_awaited_once()
+        conversation.run.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_send_message_with_different_message_types(self, event_service):
         """Test send_message with different message types."""
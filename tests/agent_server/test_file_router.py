@@ -0,0 +1,184 @@
+"""Tests for file_router.py endpoints."""
+
+import hashlib
+import os
+from email.utils import formatdate
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from openhands.agent_server.api import create_app
+from openhands.agent_server.config import Config
+from openhands.agent_server.models import TrajectoryArchiveFormat
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the FastAPI app without authentication."""
+    config = Config(session_api_keys=[])  # Disable authentication
+    return TestClient(create_app(config), raise_server_exceptions=False)
+
+
+def test_upload_sets_mtime(client, tmp_path):
+    target = tmp_path / "dir" / "file.txt"
+
+    response = client.post(
+        f"/api/file/upload/{target}",
+        files={"file": ("file.txt", b"hello world")},
+        data={"mtime": "1700000000.5"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["file_size"] == 11
+    assert target.read_bytes() == b"hello world"
+    assert target.stat().st_mtime == 1700000000.5
+
+
+def test_upload_resumes_at_offset(client, tmp_path):
+    target = tmp_path / "file.txt"
+    # A partial upload, with garbage past the offset the client resumes from
+    target.write_bytes(b"hello wxyz")
+
+    response = client.post(
+        f"/api/file/upload/{target}",
+        files={"file": ("file.txt", b"orld")},
+        data={"offset": "7"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["file_size"] == 11
+    assert target.read_bytes() == b"hello world"
+
+
+def test_upload_offset_past_end_of_file(client, tmp_path):
+    target = tmp_path / "file.txt"
+    target.write_bytes(b"abc")
+
+    response = client.post(
+        f"/api/file/upload/{target}",
+        files={"file": ("file.txt", b"def")},
+        data={"offset": "4"},
+    )
+
+    assert response.status_code == 400
+    assert target.read_bytes() == b"abc"
+
+
+def test_file_info(client, tmp_path):
+    target = tmp_path / "file.txt"
+    target.write_bytes(b"content")
+
+    response = client.get(f"/api/file/info/{target}", params={"sha256": True})
+
+    assert response.status_code == 200
+    info = response.json()
+    assert info["path"] == str(target)
+    assert info["size"] == 7
+    assert info["mtime"] == target.stat().st_mtime
+    assert info["sha256"] == hashlib.sha256(b"content").hexdigest()
+
+    response = client.get(f"/api/file/info/{target}")
+    assert response.json()["sha256"] is None
+    assert client.get(f"/api/file/info/{tmp_path / 'missing'}").status_code == 404
+    assert client.get(f"/api/file/info/{tmp_path}").status_code == 404
+
+
+def test_directory_manifest(client, tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"a")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_bytes(b"bb")
+    (tmp_path / "link.txt").symlink_to(tmp_path / "a.txt")
+
+    response = client.get(f"/api/file/manifest/{tmp_path}")
+
+    assert response.status_code == 200
+    manifest = sorted(response.json(), key=lambda item: item["path"])
+    assert [(item["path"], item["size"]) for item in manifest] == [
+        ("a.txt", 1),
+        ("sub/b.txt", 2),
+    ]
+    response = client.get(f"/api/file/manifest/{tmp_path / 'missing'}")
+    assert response.json() == []
+
+
+def test_download_range(client, tmp_path):
+    target = tmp_path / "file.txt"
+    target.write_bytes(b"hello world")
+
+    response = client.get(f"/api/file/download/{target}", headers={"Range": "bytes=6-"})
+
+    assert response.status_code == 206
+    assert response.content == b"world"
+
+
+def test_download_range_if_unchanged(client, tmp_path):
+    target = tmp_path / "file.txt"
+    target.write_bytes(b"hello world")
+    os.utime(target, (1_700_000_000, 1_700_000_000))
+    url = f"/api/file/download/{target}"
+    last_modified = formatdate(1_700_000_000, usegmt=True)
+
+    # Clients resuming a download send the modification time of the file the
+    # partial download came from
+    response = client.get(
+        url,
+        headers={
+            "Range": "bytes=6-",
+            "If-Range": formatdate(1_700_000_000, usegmt=True),
+        },
+    )
+    assert response.status_code == 206
+    assert response.headers["last-modified"] == last_modified
+
+    response = client.get(
+        url,
+        headers={
+            "Range": "bytes=6-",
+            "If-Range": formatdate(1_600_000_000, usegmt=True),
+        },
+    )
+    assert response.status_code == 200
+    assert response.content == b"hello world"
+
+
+def test_export_trajectory(client):
+    conversation_id = uuid4()
+    event_service = AsyncMock()
+    event_service.export_trajectory.return_value = (iter([b"ab", b"cd"]), "event-2")
+
+    with patch(
+        "openhands.agent_server.file_router.conversation_service.get_event_service",
+        AsyncMock(return_value=event_service),
+    ):
+        response = client.get(
+            f"/api/file/trajectory/{conversation_id}",
+            params={"format": "tar.gz", "since_event_id": "event-1"},
+        )
+
+    assert response.status_code == 200
+    assert response.content == b"abcd"
+    assert response.headers["x-last-event-id"] == "event-2"
+    assert response.headers["content-type"] == "application/gzip"
+    assert f"{conversation_id.hex}.tar.gz" in response.headers["content-disposition"]
+    event_service.export_trajectory.assert_awaited_once_with(
+        TrajectoryArchiveFormat.TAR_GZ, "event-1"
+    )
+
+
+def test_export_trajectory_not_found(client):
+    event_service = AsyncMock()
+    event_service.export_trajectory.side_effect = KeyError("unknown")
+
+    with patch(
+        "openhands.agent_server.file_router.conversation_service.get_event_service",
+        AsyncMock(side_effect=[None, event_service]),
+    ):
+        response = client.get(f"/api/file/download-trajectory/{uuid4()}")
+        assert response.status_code == 404
+
+        response = client.get(
+            f"/api/file/trajectory/{uuid4()}", params={"since_event_id": "unknown"}
+        )
+        assert response.status_code == 404
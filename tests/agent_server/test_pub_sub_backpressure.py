@@ -0,0 +1,195 @@
+"""Tests for per-subscriber queues and overflow policies in PubSub."""
+
+import asyncio
+
+import pytest
+
+from openhands.agent_server.pub_sub import OverflowPolicy, PubSub, Subscriber
+
+
+class Collector(Subscriber[tuple[str, int]]):
+    def __init__(self, gate: asyncio.Event | None = None):
+        self.events: list[tuple[str, int]] = []
+        self.gate = gate
+        self.closed = False
+
+    async def __call__(self, event):
+        if self.gate is not None:
+            await self.gate.wait()
+        self.events.append(event)
+
+    async def close(self):
+        self.closed = True
+
+
+def state_key(event: tuple[str, int]) -> str | None:
+    kind, _ = event
+    return kind if kind.startswith("state:") else None
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_delay_others():
+    gate = asyncio.Event()
+    pub_sub = PubSub[tuple[str, int]]()
+    slow = Collector(gate)
+    fast = Collector()
+    pub_sub.subscribe(slow)
+    pub_sub.subscribe(fast)
+
+    # Publishing returns immediately even though one subscriber is blocked
+    for i in range(5):
+        await asyncio.wait_for(pub_sub(("event", i)), timeout=0.1)
+    await asyncio.sleep(0.01)
+    assert fast.events == [("event", i) for i in range(5)]
+    assert slow.events == []
+
+    gate.set()
+    assert await pub_sub.flush(timeout=1)
+    assert slow.events == fast.events
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy():
+    gate = asyncio.Event()
+    pub_sub = PubSub[tuple[str, int]](max_queue_size=3)
+    subscriber = Collector(gate)
+    subscriber_id = pub_sub.subscribe(subscriber, OverflowPolicy.DROP_OLDEST)
+
+    await pub_sub(("event", 0))
+    await asyncio.sleep(0.01)  # event 0 is being delivered
+    for i in range(1, 7):
+        await pub_sub(("event", i))
+
+    (stats,) = pub_sub.stats()
+    assert stats.subscriber_id == subscriber_id
+    assert stats.queue_size == 3
+    assert stats.dropped == 3
+    assert stats.lag > 0
+
+    gate.set()
+    await pub_sub.flush(timeout=1)
+    assert subscriber.events == [("event", i) for i in (0, 4, 5, 6)]
+    (stats,) = pub_sub.stats()
+    assert stats.delivered == 4
+    assert stats.queue_size == 0
+    assert stats.lag == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_replaces_queued_state_updates():
+    gate = asyncio.Event()
+    pub_sub = PubSub[tuple[str, int]](max_queue_size=3, coalesce_key=state_key)
+    subscriber = Collector(gate)
+    pub_sub.subscribe(subscriber, OverflowPolicy.COALESCE)
+
+    await pub_sub(("event", 0))
+    await asyncio.sleep(0.01)
+    await pub_sub(("state:status", 1))
+    await pub_sub(("event", 2))
+    await pub_sub(("state:stats", 3))
+    # Queue is full: state updates replace the queued update for the same key
+    await pub_sub(("state:status", 4))
+    await pub_sub(("state:stats", 5))
+    # Not coalescable: the oldest event is dropped
+    await pub_sub(("event", 6))
+
+    gate.set()
+    await pub_sub.flush(timeout=1)
+    assert subscriber.events == [
+        ("event", 0),
+        ("event", 2),
+        ("state:stats", 5),
+        ("event", 6),
+    ]
+    (stats,) = pub_sub.stats()
+    assert stats.coalesced == 2
+    assert stats.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_closes_lagging_subscriber():
+    gate = asyncio.Event()
+    pub_sub = PubSub[tuple[str, int]](max_queue_size=2)
+    lagging = Collector(gate)
+    healthy = Collector()
+    pub_sub.subscribe(lagging, OverflowPolicy.DISCONNECT)
+    pub_sub.subscribe(healthy, OverflowPolicy.DISCONNECT)
+
+    for i in range(5):
+        await pub_sub(("event", i))
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+
+    assert lagging.closed
+    assert len(pub_sub) == 1
+    assert healthy.events == [("event", i) for i in range(5)]
+    gate.set()
+
+
+@pytest.mark.asyncio
+async def test_block_policy_is_the_default_and_never_drops():
+    gate = asyncio.Event()
+    pub_sub = PubSub[tuple[str, int]](max_queue_size=2)
+    subscriber = Collector(gate)
+    pub_sub.subscribe(subscriber)
+
+    await pub_sub(("event", 0))
+    await asyncio.sleep(0.01)  # event 0 is being delivered
+    for i in range(1, 3):
+        await asyncio.wait_for(pub_sub(("event", i)), timeout=0.1)
+
+    # Past the queue size, publishing waits for the subscriber
+    publish = asyncio.create_task(pub_sub(("event", 3)))
+    await asyncio.sleep(0.01)
+    assert not publish.done()
+
+    gate.set()
+    await asyncio.wait_for(publish, timeout=1)
+    assert await pub_sub.flush(timeout=1)
+    assert subscriber.events == [("event", i) for i in range(4)]
+    (stats,) = pub_sub.stats()
+    assert stats.overflow_policy == OverflowPolicy.BLOCK
+    assert stats.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_releases_blocked_publishers():
+    pub_sub = PubSub[tuple[str, int]](max_queue_size=1)
+    subscriber_id = pub_sub.subscribe(Collector(asyncio.Event()))
+    for i in range(2):
+        await pub_sub(("event", i))
+    await asyncio.sleep(0.01)
+
+    publish = asyncio.create_task(pub_sub(("event", 2)))
+    await asyncio.sleep(0.01)
+    assert not publish.done()
+    pub_sub.unsubscribe(subscriber_id)
+    await asyncio.wait_for(publish, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_close_delivers_queued_events_before_closing():
+    pub_sub = PubSub[tuple[str, int]]()
+    subscriber = Collector()
+    pub_sub.subscribe(subscriber)
+    for i in range(3):
+        await pub_sub(("event", i))
+
+    await pub_sub.close()
+    assert subscriber.events == [("event", i) for i in range(3)]
+    assert subscriber.closed
+    assert len(pub_sub) == 0
+
+
+@pytest.mark.asyncio
+async def test_send_to_single_subscriber():
+    pub_sub = PubSub[tuple[str, int]]()
+    first = Collector()
+    second = Collector()
+    first_id = pub_sub.subscribe(first)
+    pub_sub.subscribe(second)
+
+    assert await pub_sub.send_to(first_id, ("event", 0))
+    await pub_sub.flush(timeout=1)
+    assert first.events == [("event", 0)]
+    assert second.events == []
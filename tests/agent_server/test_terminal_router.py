@@ -1,5 +1,7 @@
 """Tests for bash_router.py endpoints."""
 
+import gzip
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -89,3 +91,50 @@ async def test_clear_all_bash_events_integration(test_bash_service):
     # Verify events are gone
     page_after = await test_bash_service.search_bash_events()
     assert len(page_after.items) == 0
+
+
+def test_stream_bash_command(test_bash_service):
+    """Test the streaming endpoint returns the command and its output as NDJSON."""
+    with patch(
+        "openhands.agent_server.bash_router.bash_event_service", test_bash_service
+    ):
+        config = Config(session_api_keys=[])  # Disable authentication
+        client = TestClient(create_app(config))
+        with client.stream(
+            "POST",
+            "/api/bash/stream_bash_command",
+            json={"command": "echo hello", "cwd": "/tmp"},
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    command_id = lines[0]["id"]
+    assert lines[0]["kind"] == "BashCommand"
+    assert all(line["command_id"] == command_id for line in lines[1:])
+    assert "".join(line["stdout"] or "" for line in lines[1:]) == "hello\n"
+    assert lines[-1]["exit_code"] == 0
+
+
+def test_get_output_blob(test_bash_service):
+    """Test output blobs are served as gzip files, and unknown names are 404."""
+    name = f"{'a' * 32}_stdout.gz"
+    blobs_dir = test_bash_service.bash_events_dir / "output_blobs"
+    blobs_dir.mkdir(parents=True)
+    (blobs_dir / name).write_bytes(gzip.compress(b"spilled output"))
+
+    with patch(
+        "openhands.agent_server.bash_router.bash_event_service", test_bash_service
+    ):
+        config = Config(session_api_keys=[])  # Disable authentication
+        client = TestClient(create_app(config))
+        response = client.get(f"/api/bash/output_blobs/{name}")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert gzip.decompress(response.content) == b"spilled output"
+
+        assert (
+            client.get(f"/api/bash/output_blobs/{'b' * 32}_stdout.gz").status_code
+            == 404
+        )
+        assert client.get("/api/bash/output_blobs/secrets.txt").status_code == 404
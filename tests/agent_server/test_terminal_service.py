@@ -1,14 +1,21 @@
 """Comprehensive tests for BashEventService bash command execution."""
 
 import asyncio
+import gzip
 import tempfile
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from openhands.agent_server import bash_service as bash_service_module
 from openhands.agent_server.bash_service import BashEventService
-from openhands.agent_server.models import BashCommand, BashOutput, ExecuteBashRequest
+from openhands.agent_server.models import (
+    BashCommand,
+    BashOutput,
+    BashOutputChunk,
+    ExecuteBashRequest,
+)
 from openhands.agent_server.pub_sub import Subscriber
 
 
@@ -255,6 +262,85 @@ async def test_large_output_chunking(bash_service):
     assert len(total_stdout) > 1000  # Should have substantial output
 
 
+@pytest.mark.asyncio
+async def test_stream_bash_command(bash_service):
+    """Test that streamed output arrives while the command is still running."""
+    import time
+
+    collector = EventCollector()
+    await bash_service.subscribe_to_events(collector)
+
+    request = ExecuteBashRequest(
+        command="echo first; sleep 1; echo second >&2; exit 3", cwd="/tmp"
+    )
+    start_time = time.time()
+    items = []
+    first_output_time = None
+    async for item in bash_service.stream_bash_command(request):
+        if isinstance(item, BashOutputChunk) and first_output_time is None:
+            first_output_time = time.time() - start_time
+        items.append(item)
+
+    command = items[0]
+    assert isinstance(command, BashCommand)
+    chunks = items[1:]
+    assert all(isinstance(chunk, BashOutputChunk) for chunk in chunks)
+    assert all(chunk.command_id == command.id for chunk in chunks)
+    assert "".join(c.stdout or "" for c in chunks) == "first\n"
+    assert "".join(c.stderr or "" for c in chunks) == "second\n"
+    assert chunks[-1].exit_code == 3
+    assert all(c.exit_code is None for c in chunks[:-1])
+
+    # The first line is delivered before the command finishes sleeping
+    assert first_output_time is not None and first_output_time < 0.5
+
+    # The events are still persisted and published as usual
+    assert [c.id for c in collector.commands] == [command.id]
+    assert collector.outputs[-1].exit_code == 3
+    assert command.id not in bash_service._live_outputs
+
+
+@pytest.mark.asyncio
+async def test_stream_bash_command_does_not_split_characters(bash_service, monkeypatch):
+    """Characters split across reads are decoded whole in the live stream."""
+    monkeypatch.setattr(bash_service_module, "_READ_SIZE", 1)
+    request = ExecuteBashRequest(command="printf 'caf\\303\\251 \\342\\202\\254'")
+
+    chunks = [
+        item
+        async for item in bash_service.stream_bash_command(request)
+        if isinstance(item, BashOutputChunk)
+    ]
+
+    assert "".join(c.stdout or "" for c in chunks) == "café €"
+
+
+@pytest.mark.asyncio
+async def test_stream_bash_command_bounds_pending_output(bash_service, monkeypatch):
+    """A slow client holds back the command, and one going away releases it."""
+    monkeypatch.setattr(bash_service_module, "_READ_SIZE", 1)
+    monkeypatch.setattr(bash_service_module, "MAX_LIVE_OUTPUT_CHUNKS", 2)
+    collector = EventCollector()
+    await bash_service.subscribe_to_events(collector)
+    request = ExecuteBashRequest(command="seq 1 1000")
+
+    stream = bash_service.stream_bash_command(request)
+    command = await anext(stream)
+    await anext(stream)
+    await asyncio.sleep(0.2)
+    assert bash_service._live_outputs[command.id].qsize() <= 2
+    assert not collector.outputs
+    await stream.aclose()
+
+    async def finished():
+        while not collector.outputs or collector.outputs[-1].exit_code is None:
+            await asyncio.sleep(0.05)
+
+    await asyncio.wait_for(finished(), timeout=10)
+    assert collector.outputs[-1].exit_code == 0
+    assert command.id not in bash_service._live_outputs
+
+
 @pytest.mark.asyncio
 async def test_concurrent_commands(bash_service):
     """Test multiple concurrent bash commands."""
@@ -488,3 +574,78 @@ async def test_search_pagination(bash_service):
     page1_ids = {event.id for event in page1.items}
     page2_ids = {event.id for event in page2.items}
     assert len(page1_ids.intersection(page2_ids)) == 0  # No overlap
+
+
+@pytest.mark.asyncio
+async def test_pending_output_is_flushed_after_interval(bash_service, monkeypatch):
+    """Test that output is published while a quiet command is still running."""
+    monkeypatch.setattr(bash_service_module, "OUTPUT_FLUSH_INTERVAL", 0.1)
+    collector = EventCollector()
+    await bash_service.subscribe_to_events(collector)
+
+    request = ExecuteBashRequest(command="echo first; sleep 1; echo second")
+    _, task = await bash_service.start_bash_command(request)
+    await asyncio.sleep(0.6)
+
+    # The first line was published without waiting for the command to finish
+    assert [output.stdout for output in collector.outputs] == ["first\n"]
+    assert collector.outputs[0].exit_code is None
+
+    await task
+    assert [output.stdout for output in collector.outputs] == ["first\n", "second\n"]
+    assert [output.order for output in collector.outputs] == [0, 1]
+    assert collector.outputs[-1].exit_code == 0
+
+
+@pytest.mark.asyncio
+async def test_chunks_do_not_split_characters(bash_service, monkeypatch):
+    """Test that multi-byte characters split across chunks are decoded intact."""
+    monkeypatch.setattr(bash_service_module, "MAX_CONTENT_CHAR_LENGTH", 5)
+    collector = EventCollector()
+    await bash_service.subscribe_to_events(collector)
+
+    text = "héllo wörld ünïcode"
+    _, task = await bash_service.start_bash_command(
+        ExecuteBashRequest(command=f"printf '{text}'")
+    )
+    await task
+
+    assert len(collector.outputs) > 1
+    assert "".join(output.stdout or "" for output in collector.outputs) == text
+
+
+@pytest.mark.asyncio
+async def test_large_output_spills_to_compressed_blob(bash_service, monkeypatch):
+    """Test that output past the inline limit is written to a gzip blob."""
+    monkeypatch.setattr(bash_service_module, "MAX_CONTENT_CHAR_LENGTH", 1000)
+    monkeypatch.setattr(bash_service_module, "MAX_INLINE_OUTPUT_LENGTH", 3000)
+    collector = EventCollector()
+    await bash_service.subscribe_to_events(collector)
+
+    command, task = await bash_service.start_bash_command(
+        ExecuteBashRequest(command="seq 1 20000; echo done >&2")
+    )
+    await task
+
+    final = collector.outputs[-1]
+    assert final.exit_code == 0
+    assert final.stdout is None and final.stdout_blob is not None
+    assert final.stderr == "done\n" and final.stderr_blob is None
+    inline = "".join(output.stdout or "" for output in collector.outputs)
+    assert len(inline) == 3000
+
+    blob_path = bash_service.get_output_blob_path(final.stdout_blob)
+    assert blob_path is not None
+    with gzip.open(blob_path, "rt") as f:
+        spilled = f.read()
+    expected = "".join(f"{i}\n" for i in range(1, 20001))
+    assert inline + spilled == expected
+
+    # The persisted event references the blob too
+    stored = await bash_service.get_bash_event(final.id.hex)
+    assert isinstance(stored, BashOutput)
+    assert stored.stdout_blob == final.stdout_blob
+
+    assert bash_service.get_output_blob_path("../../etc/passwd") is None
+    await bash_service.clear_all_events()
+    assert bash_service.get_output_blob_path(final.stdout_blob) is None
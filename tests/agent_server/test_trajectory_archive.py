@@ -0,0 +1,115 @@
+"""Tests for streaming trajectory archives."""
+
+import io
+import json
+import tarfile
+import zipfile
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from openhands.agent_server.event_service import EventService
+from openhands.agent_server.models import StoredConversation, TrajectoryArchiveFormat
+from openhands.sdk import LLM, Agent, Message, TextContent
+from openhands.sdk.security.confirmation_policy import NeverConfirm
+from openhands.sdk.workspace import LocalWorkspace
+
+
+def read_zip(chunks) -> dict[str, bytes]:
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def read_tar(chunks) -> dict[str, bytes]:
+    with tarfile.open(fileobj=io.BytesIO(b"".join(chunks)), mode="r:gz") as archive:
+        result = {}
+        for member in archive.getmembers():
+            file = archive.extractfile(member)
+            assert file is not None
+            result[member.name] = file.read()
+        return result
+
+
+def event_names(members: dict[str, bytes], prefix: str) -> list[str]:
+    return sorted(
+        name.removeprefix(f"{prefix}/events/")
+        for name in members
+        if name.startswith(f"{prefix}/events/")
+    )
+
+
+@pytest.fixture(params=[False, True], ids=["event_files", "event_journal"])
+async def event_service(request, tmp_path):
+    stored = StoredConversation(
+        id=uuid4(),
+        agent=Agent(llm=LLM(model="gpt-4", usage_id="test-llm"), tools=[]),
+        workspace=LocalWorkspace(working_dir=str(tmp_path / "workspace")),
+        confirmation_policy=NeverConfirm(),
+        created_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
+        updated_at=datetime(2025, 1, 1, 12, 30, 0, tzinfo=UTC),
+    )
+    service = EventService(
+        stored=stored,
+        conversations_dir=tmp_path / "conversations",
+        event_journal=request.param,
+    )
+    await service.start()
+    return service
+
+
+async def send_messages(service: EventService, *texts: str) -> None:
+    for text in texts:
+        await service.send_message(
+            Message(role="user", content=[TextContent(text=text)])
+        )
+
+
+@pytest.mark.asyncio
+async def test_export_trajectory_zip(event_service):
+    await send_messages(event_service, "first", "second")
+    events = event_service.get_conversation().state.events
+    prefix = event_service.stored.id.hex
+
+    chunks, last_event_id = await event_service.export_trajectory()
+    members = read_zip(chunks)
+
+    assert last_event_id == events[-1].id
+    assert f"{prefix}/base_state.json" in members
+    # Events are exported one file each, whatever the storage backend
+    assert event_names(members, prefix) == [
+        f"event-{idx:05d}-{event.id}.json" for idx, event in enumerate(events)
+    ]
+    name = f"{prefix}/events/event-00000-{events[0].id}.json"
+    assert json.loads(members[name])["id"] == events[0].id
+
+
+@pytest.mark.asyncio
+async def test_export_trajectory_since_event(event_service):
+    await send_messages(event_service, "first")
+    _, last_event_id = await event_service.export_trajectory()
+    await send_messages(event_service, "second", "third")
+    events = event_service.get_conversation().state.events
+    prefix = event_service.stored.id.hex
+    start = len(events) - 2
+
+    chunks, new_last_event_id = await event_service.export_trajectory(
+        TrajectoryArchiveFormat.TAR_GZ, since_event_id=last_event_id
+    )
+    members = read_tar(chunks)
+
+    assert new_last_event_id == events[-1].id
+    assert event_names(members, prefix) == [
+        f"event-{idx:05d}-{events[idx].id}.json" for idx in range(start, len(events))
+    ]
+    assert f"{prefix}/base_state.json" in members
+
+    # Nothing new since the last event
+    chunks, _ = await event_service.export_trajectory(since_event_id=new_last_event_id)
+    assert event_names(read_zip(chunks), prefix) == []
+
+
+@pytest.mark.asyncio
+async def test_export_trajectory_unknown_event(event_service):
+    with pytest.raises(KeyError):
+        await event_service.export_trajectory(since_event_id="unknown")
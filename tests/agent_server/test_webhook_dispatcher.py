@@ -0,0 +1,205 @@
+import asyncio
+import json
+
+import pytest
+
+from openhands.agent_server.config import WebhookSpec
+from openhands.agent_server.webhook_dispatcher import WebhookDispatcher
+
+
+def make_events(start: int, count: int) -> list[dict]:
+    return [{"id": f"event{i}"} for i in range(start, start + count)]
+
+
+class _Event:
+    """Minimal event exposing the pydantic serialization API."""
+
+    def __init__(self, data: dict):
+        self.data = data
+
+    def model_dump(self):
+        return self.data
+
+    def model_dump_json(self):
+        return json.dumps(self.data)
+
+
+def wrap(events: list[dict]) -> list[_Event]:
+    return [_Event(e) for e in events]
+
+
+@pytest.fixture
+def spec(webhook_server):
+    return WebhookSpec(
+        base_url=webhook_server.url,
+        event_buffer_size=2,
+        num_retries=1,
+        retry_delay=0,
+        headers={"Authorization": "Bearer token"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_uses_one_pooled_client(webhook_server, spec):
+    dispatcher = WebhookDispatcher()
+    for i in range(3):
+        await dispatcher.post_events(
+            spec, f"{spec.base_url}/events/{i}", wrap(make_events(i, 1)), {}
+        )
+        await dispatcher.flush()
+    client = dispatcher._client
+    assert client is not None
+    await dispatcher.post_json(spec, f"{spec.base_url}/conversations", b"{}", {})
+    await dispatcher.flush()
+    assert dispatcher._client is client
+    assert len(webhook_server.requests) == 4
+    await dispatcher.close()
+    assert dispatcher._client is None
+
+
+@pytest.mark.asyncio
+async def test_batches_queued_behind_slow_webhook_are_merged(webhook_server, spec):
+    webhook_server.delay = 0.2
+    dispatcher = WebhookDispatcher()
+    url = f"{spec.base_url}/events/conversation"
+
+    for i in range(0, 10, 2):
+        await dispatcher.post_events(spec, url, wrap(make_events(i, 2)), {})
+    await dispatcher.flush()
+
+    # The first batch is sent alone; the rest queue up and are merged up to
+    # MAX_BATCH_FACTOR * event_buffer_size events per post, in order
+    assert [len(body) for body in webhook_server.bodies] == [2, 8]
+    assert [e["id"] for body in webhook_server.bodies for e in body] == [
+        e["id"] for e in make_events(0, 10)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_per_destination(webhook_server, spec):
+    webhook_server.delay = 0.1
+    dispatcher = WebhookDispatcher(max_concurrency_per_destination=2)
+
+    for i in range(6):
+        await dispatcher.post_events(
+            spec, f"{spec.base_url}/events/{i}", wrap(make_events(i, 1)), {}
+        )
+    await dispatcher.flush()
+
+    assert len(webhook_server.requests) == 6
+    assert webhook_server.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_outbox_survives_restart(webhook_server, spec, tmp_path):
+    outbox_dir = tmp_path / "outbox"
+    url = f"{spec.base_url}/events/conversation"
+
+    webhook_server.failures = 100
+    dispatcher = WebhookDispatcher(outbox_dir=outbox_dir, session_api_key="key")
+    await dispatcher.post_events(spec, url, wrap(make_events(0, 2)), {})
+    await dispatcher.post_json(spec, f"{spec.base_url}/conversations", b"{}", {})
+    await dispatcher.close()
+    assert len(list(outbox_dir.iterdir())) == 2
+
+    # Restart: recovered payloads are delivered and removed from the outbox
+    webhook_server.failures = 0
+    webhook_server.requests.clear()
+    dispatcher = WebhookDispatcher(outbox_dir=outbox_dir, session_api_key="key")
+    assert await dispatcher.recover([spec]) == 2
+    await dispatcher.close()
+
+    assert sorted(webhook_server.paths) == ["/conversations", "/events/conversation"]
+    assert make_events(0, 2) in webhook_server.bodies
+    for _, headers, _ in webhook_server.requests:
+        assert headers["Authorization"] == "Bearer token"
+        assert headers["X-Session-API-Key"] == "key"
+    assert list(outbox_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_outbox_entries_for_removed_webhooks_are_discarded(
+    webhook_server, spec, tmp_path
+):
+    outbox_dir = tmp_path / "outbox"
+    webhook_server.failures = 100
+    dispatcher = WebhookDispatcher(outbox_dir=outbox_dir)
+    await dispatcher.post_json(spec, f"{spec.base_url}/conversations", b"{}", {})
+    await dispatcher.close()
+
+    other = WebhookSpec(base_url="http://127.0.0.1:9")
+    dispatcher = WebhookDispatcher(outbox_dir=outbox_dir)
+    assert await dispatcher.recover([other]) == 0
+    assert list(outbox_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_publishing_does_not_wait_for_delivery(webhook_server, spec):
+    webhook_server.delay = 0.5
+    dispatcher = WebhookDispatcher()
+    url = f"{spec.base_url}/events/conversation"
+
+    await asyncio.wait_for(
+        dispatcher.post_events(spec, url, wrap(make_events(0, 2)), {}), timeout=0.25
+    )
+    await dispatcher.close()
+    assert len(webhook_server.requests) == 1
+
+
+async def wait_for_requests(webhook_server, count: int, timeout: float = 5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while len(webhook_server.requests) < count:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.02)
+
+
+def delivered_ids(webhook_server) -> list[str]:
+    return [e["id"] for body in webhook_server.bodies for e in body]
+
+
+@pytest.mark.asyncio
+async def test_failed_payloads_are_retried_on_a_timer(webhook_server, spec):
+    webhook_server.failures = 100
+    dispatcher = WebhookDispatcher(
+        max_failed_payloads_per_destination=2, retry_backoff=0.2
+    )
+    url = f"{spec.base_url}/events/conversation"
+    for i in range(4):
+        await dispatcher.post_events(spec, url, wrap(make_events(i, 1)), {})
+    await dispatcher.flush()
+    assert url in dispatcher._retries
+
+    # Without an outbox, only the most recent payloads are held
+    webhook_server.failures = 0
+    webhook_server.requests.clear()
+    await wait_for_requests(webhook_server, 1)
+    await dispatcher.flush()
+    assert delivered_ids(webhook_server) == ["event2", "event3"]
+    assert not dispatcher._failed and not dispatcher._retries
+    assert not dispatcher._backoff
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_payloads_beyond_limit_are_retried_from_outbox(
+    webhook_server, spec, tmp_path
+):
+    outbox_dir = tmp_path / "outbox"
+    webhook_server.failures = 100
+    dispatcher = WebhookDispatcher(
+        outbox_dir=outbox_dir, max_failed_payloads_per_destination=1, retry_backoff=0.2
+    )
+    url = f"{spec.base_url}/events/conversation"
+    for i in range(3):
+        await dispatcher.post_events(spec, url, wrap(make_events(i, 1)), {})
+    await dispatcher.flush()
+    assert url not in dispatcher._failed
+    assert len(list(outbox_dir.iterdir())) == 3
+
+    webhook_server.failures = 0
+    webhook_server.requests.clear()
+    await wait_for_requests(webhook_server, 3)
+    await dispatcher.flush()
+    assert delivered_ids(webhook_server) == ["event0", "event1", "event2"]
+    assert list(outbox_dir.iterdir()) == []
+    await dispatcher.close()
@@ -6,12 +6,12 @@ without dependencies on the openhands.sdk module.
 """
 
 import asyncio
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
-import httpx
 import pytest
 from pydantic import SecretStr, ValidationError
 
@@ -20,6 +20,7 @@ from openhands.agent_server.conversation_service import WebhookSubscriber
 from openhands.agent_server.event_service import EventService
 from openhands.agent_server.models import StoredConversation
 from openhands.agent_server.utils import utc_now
+from openhands.agent_server.webhook_dispatcher import WebhookDispatcher
 from openhands.sdk import LLM, Agent
 from openhands.sdk.event.llm_convertible import MessageEvent
 from openhands.sdk.llm.message import Message, TextContent
@@ -53,10 +54,10 @@ def mock_event_service():
 
 
 @pytest.fixture
-def webhook_spec():
-    """Create a WebhookSpec for testing."""
+def webhook_spec(webhook_server):
+    """Create a WebhookSpec posting to the local webhook stand-in."""
     return WebhookSpec(
-        base_url="https://example.com",
+        base_url=webhook_server.url,
         event_buffer_size=3,
         headers={"Content-Type": "application/json", "Authorization": "Bearer token"},
         num_retries=2,
@@ -296,23 +297,15 @@ class TestWebhookSubscriberPostEvents:
     """Test cases for WebhookSubscriber._post_events method."""
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_post_events_success(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
         """Test successful posting of events."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -324,40 +317,31 @@ class TestWebhookSubscriberPostEvents:
 
         await subscriber._post_events()
 
-        # Verify HTTP request was made correctly
-        expected_url = f"https://example.com/events/{sample_conversation_id.hex}"
-        mock_client.request.assert_called_once_with(
-            method="POST",
-            url=expected_url,
-            json=[event.model_dump() for event in sample_events[:3]],
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer token",
-            },
-            timeout=30.0,
-        )
-
-        # Verify queue is cleared
+        # Verify queue is cleared as soon as the events are handed off
         assert subscriber.queue == []
 
+        await subscriber.dispatcher.flush()
+
+        # Verify HTTP request was made correctly
+        assert webhook_server.paths == [f"/events/{sample_conversation_id.hex}"]
+        _, headers, body = webhook_server.requests[0]
+        assert body == [
+            json.loads(event.model_dump_json()) for event in sample_events[:3]
+        ]
+        assert headers["Content-Type"] == "application/json"
+        assert headers["Authorization"] == "Bearer token"
+        assert headers["X-Session-API-Key"] is None
+
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_post_events_with_session_api_key(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
         """Test posting events with session API key."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -369,25 +353,17 @@ class TestWebhookSubscriberPostEvents:
         subscriber.queue = sample_events[:2]
 
         await subscriber._post_events()
+        await subscriber.dispatcher.flush()
 
         # Verify session API key is added to headers
-        expected_headers = {
-            "Content-Type": "application/json",
-            "Authorization": "Bearer token",
-            "X-Session-API-Key": "test_session_key",
-        }
-        expected_url = f"https://example.com/events/{sample_conversation_id.hex}"
-        mock_client.request.assert_called_once_with(
-            method="POST",
-            url=expected_url,
-            json=[event.model_dump() for event in sample_events[:2]],
-            headers=expected_headers,
-            timeout=30.0,
-        )
+        _, headers, body = webhook_server.requests[0]
+        assert headers["Authorization"] == "Bearer token"
+        assert headers["X-Session-API-Key"] == "test_session_key"
+        assert len(body) == 2
 
     @pytest.mark.asyncio
     async def test_post_events_empty_queue(
-        self, mock_event_service, webhook_spec, sample_conversation_id
+        self, webhook_server, mock_event_service, webhook_spec, sample_conversation_id
     ):
         """Test posting events with empty queue."""
         subscriber = WebhookSubscriber(
@@ -397,121 +373,95 @@ class TestWebhookSubscriberPostEvents:
         )
 
         # Should return early without making HTTP request
-        with patch("httpx.AsyncClient") as mock_client_class:
-            await subscriber._post_events()
-            mock_client_class.assert_not_called()
+        await subscriber._post_events()
+        await subscriber.dispatcher.flush()
+        assert webhook_server.requests == []
 
     @pytest.mark.asyncio
     async def test_post_events_http_error_with_retries(
-        self, mock_event_service, webhook_spec, sample_events, sample_conversation_id
+        self,
+        webhook_server,
+        mock_event_service,
+        webhook_spec,
+        sample_events,
+        sample_conversation_id,
     ):
         """Test HTTP error handling with retry logic."""
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
-            spec=webhook_spec,
+            spec=webhook_spec.model_copy(update={"retry_delay": 0}),
         )
 
         # Add events to queue
         subscriber.queue = sample_events[:2]
 
-        # Track retry attempts
-        retry_attempts = []
-        sleep_calls = []
-
-        # Mock the HTTP client and sleep
-        async def mock_request(*args, **kwargs):
-            retry_attempts.append(len(retry_attempts) + 1)
-            if len(retry_attempts) <= 2:  # Fail first two attempts
-                raise httpx.HTTPStatusError(
-                    "Server Error", request=MagicMock(), response=MagicMock()
-                )
-            # Third attempt succeeds - return a mock response
-            response = AsyncMock()
-            response.raise_for_status.return_value = None
-            return response
-
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.request = mock_request
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            with patch("asyncio.sleep", side_effect=mock_sleep):
-                await subscriber._post_events()
-
-        # Verify retries were attempted
-        assert len(retry_attempts) == 3
-        assert len(sleep_calls) == 2  # Sleep between retries
-        assert all(delay == webhook_spec.retry_delay for delay in sleep_calls)
+        # Fail first two attempts
+        webhook_server.failures = 2
+        await subscriber._post_events()
+        await subscriber.dispatcher.flush()
 
-        # Verify queue is cleared after success
+        # Verify retries were attempted and the third attempt succeeded
+        assert len(webhook_server.requests) == 3
         assert subscriber.queue == []
+        assert subscriber.dispatcher._failed == {}
 
     @pytest.mark.asyncio
     async def test_post_events_max_retries_exceeded(
-        self, mock_event_service, webhook_spec, sample_events, sample_conversation_id
+        self,
+        webhook_server,
+        mock_event_service,
+        webhook_spec,
+        sample_events,
+        sample_conversation_id,
     ):
         """Test behavior when max retries are exceeded."""
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
-            spec=webhook_spec,
+            spec=webhook_spec.model_copy(update={"retry_delay": 0}),
+            dispatcher=WebhookDispatcher(retry_backoff=0.2),
         )
 
         # Add events to queue
-        original_events = sample_events[:2]
-        subscriber.queue = original_events.copy()
-
-        # Track retry attempts
-        retry_attempts = []
-        sleep_calls = []
-
-        # Mock the HTTP client to always fail
-        async def mock_request(*args, **kwargs):
-            retry_attempts.append(len(retry_attempts) + 1)
-            raise httpx.HTTPStatusError(
-                "Server Error", request=MagicMock(), response=MagicMock()
-            )
+        subscriber.queue = sample_events[:2]
 
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
+        # Always fail
+        webhook_server.failures = 100
+        await subscriber._post_events()
+        await subscriber.dispatcher.flush()
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.request = mock_request
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        # Verify all retries were attempted (num_retries + 1 = 3 total attempts)
+        assert len(webhook_server.requests) == 3
 
-            with patch("asyncio.sleep", side_effect=mock_sleep):
-                await subscriber._post_events()
+        # Later events queue up behind the failed ones, which are retried in
+        # order by a timer
+        webhook_server.failures = 0
+        subscriber.queue = sample_events[2:3]
+        await subscriber._post_events()
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 3
 
-        # Verify all retries were attempted (num_retries + 1 = 3 total attempts)
-        assert len(retry_attempts) == 3
-        assert len(sleep_calls) == 2
+        for _ in range(250):
+            if len(webhook_server.requests) == 4:
+                break
+            await asyncio.sleep(0.02)
+        await subscriber.dispatcher.close()
 
-        # Verify events are re-queued after failure
-        assert len(subscriber.queue) == 2
-        assert subscriber.queue == original_events
+        assert len(webhook_server.requests) == 4
+        assert [event["id"] for event in webhook_server.bodies[-1]] == [
+            event.id for event in sample_events[:3]
+        ]
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_post_events_handles_events_without_model_dump(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_conversation_id,
     ):
         """Test posting events that don't have model_dump method."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -526,19 +476,10 @@ class TestWebhookSubscriberPostEvents:
         subscriber.queue = [event_without_model_dump]
 
         await subscriber._post_events()
+        await subscriber.dispatcher.flush()
 
         # Verify __dict__ is used when model_dump is not available
-        expected_url = f"https://example.com/events/{sample_conversation_id.hex}"
-        mock_client.request.assert_called_once_with(
-            method="POST",
-            url=expected_url,
-            json=[{"type": "test", "data": "value"}],
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer token",
-            },
-            timeout=30.0,
-        )
+        assert webhook_server.bodies == [[{"type": "test", "data": "value"}]]
 
 
 class TestWebhookSubscriberCloseMethod:
@@ -593,23 +534,15 @@ class TestWebhookSubscriberIntegration:
     """Integration test cases for WebhookSubscriber."""
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_full_workflow(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
         """Test complete workflow from event addition to posting."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -629,7 +562,8 @@ class TestWebhookSubscriberIntegration:
         assert len(subscriber.queue) == 0  # Queue should be cleared
 
         # Verify HTTP request was made
-        mock_client.request.assert_called_once()
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 1
 
         # Add more events and close
         await subscriber(sample_events[3])
@@ -640,26 +574,22 @@ class TestWebhookSubscriberIntegration:
         assert len(subscriber.queue) == 0  # Queue should be cleared after close
 
         # Verify HTTP request was made again during close
-        assert mock_client.request.call_count == 2
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 2
+        assert [event["id"] for body in webhook_server.bodies for event in body] == [
+            event.id for event in sample_events
+        ]
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_concurrent_event_processing(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
         """Test handling concurrent event additions."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -672,107 +602,88 @@ class TestWebhookSubscriberIntegration:
 
         # With buffer size 3, we should have posted once and have 2 events remaining
         assert len(subscriber.queue) == 2
-        mock_client.request.assert_called_once()
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 1
 
         # Close to post remaining events
         await subscriber.close()
         assert len(subscriber.queue) == 0
-        assert mock_client.request.call_count == 2
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 2
 
 
 class TestWebhookSubscriberErrorHandling:
     """Test cases for error handling in WebhookSubscriber."""
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_network_error_handling(
         self,
-        mock_client_class,
         mock_event_service,
-        webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
         """Test handling of network errors."""
-        # Setup mock client to raise network error
-        mock_client = AsyncMock()
-        mock_client.request.side_effect = httpx.NetworkError("Connection failed")
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
+        # Nothing listens on port 9 (discard) of localhost
+        spec = WebhookSpec(base_url="http://127.0.0.1:9", num_retries=2, retry_delay=0)
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
-            spec=webhook_spec,
+            spec=spec,
         )
 
         subscriber.queue = sample_events[:2]
 
-        with patch("asyncio.sleep") as mock_sleep:
-            await subscriber._post_events()
-
-        # Verify retries were attempted
-        assert mock_client.request.call_count == 3  # num_retries + 1
-        assert mock_sleep.call_count == 2
+        await subscriber._post_events()
+        await subscriber.dispatcher.flush()
 
-        # Events should be re-queued after failure
-        assert len(subscriber.queue) == 2
+        # Events are kept for a later retry
+        (failed,) = subscriber.dispatcher._failed.values()
+        assert [len(delivery.items or []) for delivery in failed] == [2]
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_timeout_error_handling(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
         """Test handling of timeout errors."""
-        # Setup mock client to raise timeout error
-        mock_client = AsyncMock()
-        mock_client.request.side_effect = httpx.TimeoutException("Request timed out")
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
+        webhook_server.delay = 0.5
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
-            spec=webhook_spec,
+            spec=webhook_spec.model_copy(update={"retry_delay": 0}),
         )
 
         subscriber.queue = sample_events[:1]
 
-        with patch("asyncio.sleep") as mock_sleep:
+        with patch("openhands.agent_server.webhook_dispatcher.WEBHOOK_TIMEOUT", 0.1):
             await subscriber._post_events()
+            await subscriber.dispatcher.flush()
 
         # Verify retries were attempted
-        assert mock_client.request.call_count == 3
-        assert mock_sleep.call_count == 2
+        assert len(webhook_server.requests) == 3
 
-        # Events should be re-queued after failure
-        assert len(subscriber.queue) == 1
+        # Events are kept for a later retry
+        (failed,) = subscriber.dispatcher._failed.values()
+        assert len(failed) == 1
 
 
 class TestWebhookSubscriberFlushDelay:
     """Test cases for flush_delay functionality in WebhookSubscriber."""
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_flush_delay_triggers_post(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_event,
         sample_conversation_id,
     ):
         """Test that flush_delay triggers posting after the specified delay."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -787,27 +698,20 @@ class TestWebhookSubscriberFlushDelay:
         await asyncio.sleep(webhook_spec.flush_delay + 0.05)
 
         # Verify HTTP request was made and queue is cleared
-        mock_client.request.assert_called_once()
         assert len(subscriber.queue) == 0
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 1
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_flush_delay_not_reset_on_new_event(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
         """Test that flush_delay timer is NOT reset when new events are added."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -829,27 +733,20 @@ class TestWebhookSubscriberFlushDelay:
         await asyncio.sleep(webhook_spec.flush_delay / 2 + 0.05)
 
         # Should have posted since timer was not reset
-        mock_client.request.assert_called_once()
         assert len(subscriber.queue) == 0
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 1
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_flush_delay_cancelled_on_buffer_full(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
         """Test that flush_delay timer is cancelled when buffer becomes full."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -865,33 +762,27 @@ class TestWebhookSubscriberFlushDelay:
         await subscriber(sample_events[2])
 
         # Verify immediate post happened
-        mock_client.request.assert_called_once()
         assert len(subscriber.queue) == 0
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 1
 
         # Wait for flush_delay to ensure timer was cancelled
         await asyncio.sleep(webhook_spec.flush_delay + 0.05)
 
         # Should not have made additional requests
-        assert mock_client.request.call_count == 1
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 1
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_flush_delay_cancelled_on_close(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_event,
         sample_conversation_id,
     ):
         """Test that flush_delay timer is cancelled when subscriber is closed."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -906,21 +797,23 @@ class TestWebhookSubscriberFlushDelay:
         await subscriber.close()
 
         # Verify close triggered post
-        mock_client.request.assert_called_once()
         assert len(subscriber.queue) == 0
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 1
 
         # Wait for flush_delay to ensure timer was cancelled
         await asyncio.sleep(webhook_spec.flush_delay + 0.05)
 
         # Should not have made additional requests
-        assert mock_client.request.call_count == 1
+        await subscriber.dispatcher.flush()
+        assert len(webhook_server.requests) == 1
 
     @pytest.mark.asyncio
     async def test_flush_delay_no_post_when_queue_empty(
-        self, mock_event_service, webhook_spec, sample_conversation_id
+        self, webhook_server, mock_event_service, webhook_spec, sample_conversation_id
     ):
         """Test that flush_delay doesn't trigger post when queue is empty."""
-        WebhookSubscriber(
+        subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
             spec=webhook_spec,
@@ -930,27 +823,19 @@ class TestWebhookSubscriberFlushDelay:
         await asyncio.sleep(webhook_spec.flush_delay + 0.05)
 
         # Should not have made any HTTP requests
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client_class.assert_not_called()
+        await subscriber.dispatcher.flush()
+        assert webhook_server.requests == []
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_flush_delay_triggers_on_timer(
         self,
-        mock_client_class,
+        webhook_server,
         mock_event_service,
         webhook_spec,
         sample_event,
         sample_conversation_id,
     ):
         """Test that flush_delay timer triggers HTTP request."""
-        # Setup mock client to succeed
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -965,17 +850,17 @@ class TestWebhookSubscriberFlushDelay:
         await asyncio.sleep(webhook_spec.flush_delay + 0.05)
 
         # Verify request was made and queue is cleared
-        mock_client.request.assert_called_once()
         assert len(subscriber.queue) == 0
+        await subscriber.dispatcher.flush()
+        assert webhook_server.bodies == [[json.loads(sample_event.model_dump_json())]]
 
 
 class TestConversationWebhookSubscriber:
     """Test cases for ConversationWebhookSubscriber class."""
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_post_conversation_info_success(
-        self, mock_client_class, webhook_spec, mock_event_service
+        self, webhook_server, webhook_spec, mock_event_service
     ):
         """Test successful posting of conversation info."""
         from openhands.agent_server.conversation_service import (
@@ -984,13 +869,6 @@ class TestConversationWebhookSubscriber:
         from openhands.agent_server.models import ConversationInfo
         from openhands.sdk.conversation.state import ConversationExecutionStatus
 
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = ConversationWebhookSubscriber(
             spec=webhook_spec,
         )
@@ -1006,23 +884,18 @@ class TestConversationWebhookSubscriber:
         )
 
         await subscriber.post_conversation_info(conversation_info)
+        await subscriber.dispatcher.flush()
 
         # Verify HTTP request was made correctly
-        mock_client.request.assert_called_once_with(
-            method="POST",
-            url="https://example.com/conversations",
-            json=conversation_info.model_dump(mode="json"),
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer token",
-            },
-            timeout=30.0,
-        )
+        assert webhook_server.paths == ["/conversations"]
+        _, headers, body = webhook_server.requests[0]
+        assert body == conversation_info.model_dump(mode="json")
+        assert headers["Content-Type"] == "application/json"
+        assert headers["Authorization"] == "Bearer token"
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
     async def test_post_conversation_info_with_session_api_key(
-        self, mock_client_class, webhook_spec, mock_event_service
+        self, webhook_server, webhook_spec, mock_event_service
     ):
         """Test posting conversation info with session API key."""
         from openhands.agent_server.conversation_service import (
@@ -1031,13 +904,6 @@ class TestConversationWebhookSubscriber:
         from openhands.agent_server.models import ConversationInfo
         from openhands.sdk.conversation.state import ConversationExecutionStatus
 
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.raise_for_status.return_value = None
-        mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
         subscriber = ConversationWebhookSubscriber(
             spec=webhook_spec,
             session_api_key="test_session_key",
@@ -1054,24 +920,16 @@ class TestConversationWebhookSubscriber:
         )
 
         await subscriber.post_conversation_info(conversation_info)
+        await subscriber.dispatcher.flush()
 
         # Verify session API key is added to headers
-        expected_headers = {
-            "Content-Type": "application/json",
-            "Authorization": "Bearer token",
-            "X-Session-API-Key": "test_session_key",
-        }
-        mock_client.request.assert_called_once_with(
-            method="POST",
-            url="https://example.com/conversations",
-            json=conversation_info.model_dump(mode="json"),
-            headers=expected_headers,
-            timeout=30.0,
-        )
+        _, headers, _ = webhook_server.requests[0]
+        assert headers["Authorization"] == "Bearer token"
+        assert headers["X-Session-API-Key"] == "test_session_key"
 
     @pytest.mark.asyncio
     async def test_post_conversation_info_http_error_with_retries(
-        self, webhook_spec, mock_event_service
+        self, webhook_server, webhook_spec, mock_event_service
     ):
         """Test HTTP error handling with retry logic for conversation webhooks."""
         from openhands.agent_server.conversation_service import (
@@ -1081,7 +939,7 @@ class TestConversationWebhookSubscriber:
         from openhands.sdk.conversation.state import ConversationExecutionStatus
 
         subscriber = ConversationWebhookSubscriber(
-            spec=webhook_spec,
+            spec=webhook_spec.model_copy(update={"retry_delay": 0}),
         )
 
         # Create sample conversation info
@@ -1094,37 +952,14 @@ class TestConversationWebhookSubscriber:
             execution_status=ConversationExecutionStatus.FINISHED,
         )
 
-        # Track retry attempts
-        retry_attempts = []
-        sleep_calls = []
-
-        # Mock the HTTP client and sleep
-        async def mock_request(*args, **kwargs):
-            retry_attempts.append(len(retry_attempts) + 1)
-            if len(retry_attempts) <= 2:  # Fail first two attempts
-                raise httpx.HTTPStatusError(
-                    "Server Error", request=MagicMock(), response=MagicMock()
-                )
-            # Third attempt succeeds - return a mock response
-            response = AsyncMock()
-            response.raise_for_status.return_value = None
-            return response
-
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.request = mock_request
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            with patch("asyncio.sleep", side_effect=mock_sleep):
-                await subscriber.post_conversation_info(conversation_info)
+        # Fail first two attempts
+        webhook_server.failures = 2
+        await subscriber.post_conversation_info(conversation_info)
+        await subscriber.dispatcher.flush()
 
         # Verify retries were attempted
-        assert len(retry_attempts) == 3
-        assert len(sleep_calls) == 2  # Sleep between retries
-        assert all(delay == webhook_spec.retry_delay for delay in sleep_calls)
+        assert webhook_server.paths == ["/conversations"] * 3
+        assert subscriber.dispatcher._failed == {}
 
 
 class TestWebhookSubscriberTimerBehavior:
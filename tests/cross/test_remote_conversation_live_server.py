@@ -91,9 +91,17 @@ def server_env(
     monkeypatch.delenv("SESSION_API_KEY", raising=False)
 
     # Build app after env is set
+    from openhands.agent_server import bash_router, sockets
     from openhands.agent_server.api import create_app
+    from openhands.agent_server.bash_service import BashEventService
     from openhands.agent_server.config import Config
 
+    # The bash event service is created on import, with the default config:
+    # keep its events out of the working directory
+    bash_event_service = BashEventService(bash_events_dir=tmp_path / "bash_events")
+    monkeypatch.setattr(bash_router, "bash_event_service", bash_event_service)
+    monkeypatch.setattr(sockets, "bash_event_service", bash_event_service)
+
     cfg_obj = Config.model_validate_json(cfg_file.read_text())
 
     app = create_app(cfg_obj)
@@ -428,6 +436,48 @@ def test_file_upload_endpoint_with_live_server(server_env, tmp_path: Path):
     )
 
 
+def test_file_transfer_resume_and_sync_with_live_server(server_env, tmp_path: Path):
+    """Resumed transfers and directory sync through the live server only send
+    what is missing or changed."""
+    workspace = RemoteWorkspace(
+        host=server_env["host"],
+        working_dir=str(tmp_path),
+        file_transfer_chunk_size=1024,
+    )
+    content = bytes(range(256)) * 40
+    source = tmp_path / "local" / "data.bin"
+    source.parent.mkdir()
+    source.write_bytes(content)
+    remote_dir = tmp_path / "remote"
+    remote_dir.mkdir()
+
+    # An interrupted upload is resumed from where it stopped
+    (remote_dir / "data.bin").write_bytes(content[:3000])
+    result = workspace.file_upload(source, remote_dir / "data.bin", resume=True)
+    assert result.success is True, result.error
+    assert (remote_dir / "data.bin").read_bytes() == content
+
+    # An interrupted download is resumed from where it stopped
+    downloaded = tmp_path / "downloaded.bin"
+    downloaded.write_bytes(content[:5000])
+    result = workspace.file_download(remote_dir / "data.bin", downloaded, resume=True)
+    assert result.success is True, result.error
+    assert downloaded.read_bytes() == content
+
+    # Only the files changed since the last sync are uploaded again
+    (source.parent / "other.txt").write_text("other")
+    result = workspace.sync_directory(source.parent, remote_dir)
+    assert result.success is True, result.error
+    assert result.uploaded == ["other.txt"]
+    assert result.unchanged == 1
+
+    (source.parent / "other.txt").write_text("changed")
+    result = workspace.sync_directory(source.parent, remote_dir, compare="sha256")
+    assert result.uploaded == ["other.txt"]
+    assert result.unchanged == 1
+    assert (remote_dir / "other.txt").read_text() == "changed"
+
+
 def test_conversation_stats_with_live_server(
     server_env, monkeypatch: pytest.MonkeyPatch
 ):
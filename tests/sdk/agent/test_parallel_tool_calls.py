@@ -0,0 +1,310 @@
+"""Tests for the concurrent execution of parallel-safe tool calls."""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from litellm import ChatCompletionMessageToolCall
+from litellm.types.utils import (
+    Choices,
+    Function,
+    Message as LiteLLMMessage,
+    ModelResponse,
+)
+from pydantic import SecretStr
+
+from openhands.sdk.agent import Agent
+from openhands.sdk.conversation import Conversation
+from openhands.sdk.conversation.exceptions import ConversationRunError
+from openhands.sdk.conversation.impl.local_conversation import LocalConversation
+from openhands.sdk.event import ObservationEvent
+from openhands.sdk.llm import LLM, ImageContent, Message, TextContent
+from openhands.sdk.tool import (
+    Action,
+    Observation,
+    Tool,
+    ToolDefinition,
+    ToolExecutor,
+    register_tool,
+)
+
+
+class ParallelSleepAction(Action):
+    name: str
+    seconds: float
+    read_only: bool = True
+    fail: bool = False
+
+
+class ParallelSleepObservation(Observation):
+    name: str
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.name)]
+
+
+class ParallelSleepExecutor(
+    ToolExecutor[ParallelSleepAction, ParallelSleepObservation]
+):
+    """Records when each call runs, and on which thread."""
+
+    calls: ClassVar[dict[str, tuple[float, float, int]]] = {}
+
+    def is_parallel_safe(self, action: ParallelSleepAction) -> bool:
+        return action.read_only
+
+    def __call__(self, action: ParallelSleepAction, conversation=None):
+        start = time.monotonic()
+        time.sleep(action.seconds)
+        self.calls[action.name] = (start, time.monotonic(), threading.get_ident())
+        if action.fail:
+            raise RuntimeError(f"{action.name} failed")
+        return ParallelSleepObservation(name=action.name)
+
+
+class AsyncParallelSleepExecutor(ParallelSleepExecutor):
+    async def acall(self, action: ParallelSleepAction, conversation=None):
+        start = time.monotonic()
+        await asyncio.sleep(action.seconds)
+        self.calls[action.name] = (start, time.monotonic(), threading.get_ident())
+        if action.fail:
+            raise RuntimeError(f"{action.name} failed")
+        return ParallelSleepObservation(name=action.name)
+
+
+class ParallelSleepTool(ToolDefinition[ParallelSleepAction, ParallelSleepObservation]):
+    name: ClassVar[str] = "parallel_sleep_tool"
+
+    @classmethod
+    def create(cls, conv_state=None, **params) -> Sequence["ParallelSleepTool"]:
+        executor = AsyncParallelSleepExecutor() if params.get("native_async") else None
+        return [
+            cls(
+                description="Sleeps",
+                action_type=ParallelSleepAction,
+                observation_type=ParallelSleepObservation,
+                executor=executor or ParallelSleepExecutor(),
+            )
+        ]
+
+
+register_tool(ParallelSleepTool.name, ParallelSleepTool)
+
+
+# (name, seconds, read_only): the first three calls run concurrently, the
+# fourth alone, then the last two concurrently
+CALLS = [
+    ("a", 0.3, True),
+    ("b", 0.1, True),
+    ("c", 0.0, True),
+    ("d", 0.0, False),
+    ("e", 0.1, True),
+    ("f", 0.0, True),
+]
+
+
+def tool_calls_response(
+    calls: Sequence[tuple[str, float, bool]] = CALLS, failing: str | None = None
+) -> ModelResponse:
+    tool_calls = [
+        ChatCompletionMessageToolCall(
+            id=f"call_{name}",
+            type="function",
+            function=Function(
+                name=ParallelSleepTool.name,
+                arguments=json.dumps(
+                    {
+                        "name": name,
+                        "seconds": seconds,
+                        "read_only": read_only,
+                        "fail": name == failing,
+                    }
+                ),
+            ),
+        )
+        for name, seconds, read_only in calls
+    ]
+    return ModelResponse(
+        id="response_action",
+        choices=[
+            Choices(
+                message=LiteLLMMessage(
+                    role="assistant", content="Sleeping", tool_calls=tool_calls
+                )
+            )
+        ],
+        created=0,
+        model="test-model",
+        object="chat.completion",
+    )
+
+
+def message_response() -> ModelResponse:
+    return ModelResponse(
+        id="response_msg",
+        choices=[Choices(message=LiteLLMMessage(role="assistant", content="Done"))],
+        created=0,
+        model="test-model",
+        object="chat.completion",
+    )
+
+
+def make_conversation(
+    tmp_path, max_parallel_tool_calls: int, native_async: bool = False
+) -> LocalConversation:
+    llm = LLM(
+        model="gpt-4o-mini",
+        api_key=SecretStr("test-key"),
+        usage_id="test-llm",
+        num_retries=1,
+    )
+    agent = Agent(
+        llm=llm,
+        tools=[
+            Tool(name=ParallelSleepTool.name, params={"native_async": native_async})
+        ],
+        max_parallel_tool_calls=max_parallel_tool_calls,
+    )
+    conversation = Conversation(agent=agent, workspace=str(tmp_path), visualizer=None)
+    assert isinstance(conversation, LocalConversation)
+    conversation.send_message(Message(role="user", content=[TextContent(text="Hi")]))
+    ParallelSleepExecutor.calls.clear()
+    return conversation
+
+
+def observed_names(conversation: LocalConversation) -> list[str]:
+    return [
+        event.observation.name
+        for event in conversation.state.events
+        if isinstance(event, ObservationEvent)
+        and isinstance(event.observation, ParallelSleepObservation)
+    ]
+
+
+def overlap(first: str, second: str) -> bool:
+    start1, end1, _ = ParallelSleepExecutor.calls[first]
+    start2, end2, _ = ParallelSleepExecutor.calls[second]
+    return start1 < end2 and start2 < end1
+
+
+def assert_batched_execution() -> None:
+    assert overlap("a", "b") and overlap("a", "c")
+    assert not any(overlap("d", other) for other in "abcef")
+    assert overlap("e", "f")
+    assert not overlap("a", "e")
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_parallel_safe_calls_run_concurrently_in_order(mock_completion, tmp_path):
+    mock_completion.side_effect = [tool_calls_response(), message_response()]
+    conversation = make_conversation(tmp_path, max_parallel_tool_calls=4)
+
+    conversation.run()
+
+    assert_batched_execution()
+    # Observations follow the order of the calls, not of their completion
+    assert observed_names(conversation) == [name for name, _, _ in CALLS]
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_calls_run_sequentially_by_default(mock_completion, tmp_path):
+    mock_completion.side_effect = [tool_calls_response(), message_response()]
+    conversation = make_conversation(tmp_path, max_parallel_tool_calls=1)
+
+    conversation.run()
+
+    assert not overlap("a", "b")
+    assert observed_names(conversation) == [name for name, _, _ in CALLS]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("native_async", [False, True])
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_async_parallel_calls(mock_acompletion, native_async, tmp_path):
+    mock_acompletion.side_effect = [tool_calls_response(), message_response()]
+    conversation = make_conversation(
+        tmp_path, max_parallel_tool_calls=4, native_async=native_async
+    )
+
+    await conversation.arun()
+
+    assert_batched_execution()
+    assert observed_names(conversation) == [name for name, _, _ in CALLS]
+    # Native async executors run on the event loop, others in worker threads
+    loop_thread = threading.get_ident()
+    on_loop = [
+        thread == loop_thread for _, _, thread in ParallelSleepExecutor.calls.values()
+    ]
+    assert all(on_loop) if native_async else not any(on_loop)
+
+
+# Three calls run concurrently; the first fails before the others finish
+FAILING_BATCH = [("a", 0.0, True), ("b", 0.1, True), ("c", 0.2, True)]
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_failed_parallel_call_keeps_other_observations(mock_completion, tmp_path):
+    mock_completion.side_effect = [
+        tool_calls_response(FAILING_BATCH, failing="a"),
+        message_response(),
+    ]
+    conversation = make_conversation(tmp_path, max_parallel_tool_calls=4)
+
+    with pytest.raises(ConversationRunError, match="a failed"):
+        conversation.run()
+
+    assert set(ParallelSleepExecutor.calls) == {"a", "b", "c"}
+    assert observed_names(conversation) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("native_async", [False, True])
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_async_failed_parallel_call_keeps_other_observations(
+    mock_acompletion, native_async, tmp_path
+):
+    mock_acompletion.side_effect = [
+        tool_calls_response(FAILING_BATCH, failing="a"),
+        message_response(),
+    ]
+    conversation = make_conversation(
+        tmp_path, max_parallel_tool_calls=4, native_async=native_async
+    )
+
+    with pytest.raises(ConversationRunError, match="a failed"):
+        await conversation.arun()
+
+    assert set(ParallelSleepExecutor.calls) == {"a", "b", "c"}
+    assert observed_names(conversation) == ["b", "c"]
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_parallel_calls_reuse_the_conversation_pool(mock_completion, tmp_path):
+    mock_completion.side_effect = [
+        tool_calls_response(),
+        message_response(),
+        tool_calls_response(),
+        message_response(),
+    ]
+    conversation = make_conversation(tmp_path, max_parallel_tool_calls=4)
+
+    with patch(
+        "openhands.sdk.conversation.impl.local_conversation.ThreadPoolExecutor",
+        wraps=ThreadPoolExecutor,
+    ) as pool_class:
+        conversation.run()
+        conversation.send_message("Again")
+        conversation.run()
+
+    assert pool_class.call_count == 1
+    pool = conversation.tool_call_pool
+    conversation.close()
+    with pytest.raises(RuntimeError):
+        pool.submit(time.sleep, 0)
@@ -0,0 +1,191 @@
+"""Tests that IncrementalView produces the same result as View.from_events()."""
+
+import random
+
+import pytest
+
+from openhands.sdk.context.view import IncrementalView, View
+from openhands.sdk.event.base import Event
+from openhands.sdk.event.condenser import (
+    Condensation,
+    CondensationRequest,
+    CondensationSummaryEvent,
+)
+from openhands.sdk.event.llm_convertible import (
+    ActionEvent,
+    MessageEvent,
+    ObservationEvent,
+)
+from openhands.sdk.llm import Message, MessageToolCall, TextContent
+from openhands.sdk.mcp.definition import MCPToolAction, MCPToolObservation
+
+
+def message_event(content: str) -> MessageEvent:
+    return MessageEvent(
+        llm_message=Message(role="user", content=[TextContent(text=content)]),
+        source="user",
+    )
+
+
+def action_event(llm_response_id: str, tool_call_id: str) -> ActionEvent:
+    return ActionEvent(
+        thought=[TextContent(text="Test thought")],
+        action=MCPToolAction(data={}),
+        tool_name="test_tool",
+        tool_call_id=tool_call_id,
+        tool_call=MessageToolCall(
+            id=tool_call_id, name="test_tool", arguments="{}", origin="completion"
+        ),
+        llm_response_id=llm_response_id,
+        source="agent",
+    )
+
+
+def observation_event(tool_call_id: str) -> ObservationEvent:
+    return ObservationEvent(
+        observation=MCPToolObservation.from_text(text="ok", tool_name="test_tool"),
+        tool_name="test_tool",
+        tool_call_id=tool_call_id,
+        action_id="action_event_id",
+        source="environment",
+    )
+
+
+def view_signature(view: View) -> tuple:
+    """Comparable summary of a view; summary events get fresh ids per build."""
+    return (
+        [
+            ("summary", e.summary)
+            if isinstance(e, CondensationSummaryEvent)
+            else (type(e).__name__, e.id)
+            for e in view.events
+        ],
+        view.unhandled_condensation_request,
+        [c.id for c in view.condensations],
+    )
+
+
+def assert_equivalent_at_every_prefix(events: list[Event]) -> None:
+    incremental = IncrementalView()
+    for i, event in enumerate(events):
+        incremental.append(event)
+        expected = View.from_events(events[: i + 1])
+        assert view_signature(incremental.get_view()) == view_signature(expected)
+
+
+def test_incremental_view_plain_messages() -> None:
+    events: list[Event] = [message_event(f"Event {i}") for i in range(5)]
+    view = IncrementalView(events).get_view()
+    assert view.events == events
+
+
+def test_incremental_view_condensation_with_summary() -> None:
+    messages: list[Event] = [message_event(f"Event {i}") for i in range(6)]
+    events: list[Event] = [
+        *messages[:4],
+        Condensation(
+            forgotten_event_ids=[e.id for e in messages[1:3]],
+            summary="Summary of events 1-2",
+            summary_offset=1,
+            llm_response_id="condensation_response_1",
+        ),
+        *messages[4:],
+    ]
+    assert_equivalent_at_every_prefix(events)
+
+    view = IncrementalView(events).get_view()
+    assert isinstance(view.summary_event, CondensationSummaryEvent)
+    assert view.summary_event.summary == "Summary of events 1-2"
+
+
+def test_incremental_view_condensation_requests() -> None:
+    events: list[Event] = [
+        message_event("Event 0"),
+        CondensationRequest(),
+        message_event("Event 1"),
+        Condensation(forgotten_event_ids=[], llm_response_id="condensation_1"),
+        message_event("Event 2"),
+        CondensationRequest(),
+    ]
+    assert_equivalent_at_every_prefix(events)
+    assert IncrementalView(events).get_view().unhandled_condensation_request
+
+
+def test_incremental_view_batch_atomicity() -> None:
+    action_1 = action_event("response_1", "call_1")
+    action_2 = action_event("response_1", "call_2")
+    events: list[Event] = [
+        message_event("User message"),
+        action_1,
+        action_2,
+        observation_event("call_1"),
+        observation_event("call_2"),
+        Condensation(
+            forgotten_event_ids=[action_1.id],
+            llm_response_id="condensation_1",
+        ),
+    ]
+    assert_equivalent_at_every_prefix(events)
+    view = IncrementalView(events).get_view()
+    assert [type(e) for e in view.events] == [MessageEvent]
+
+
+def test_incremental_view_filters_unmatched_tool_calls() -> None:
+    events: list[Event] = [
+        message_event("User message"),
+        action_event("response_1", "call_1"),
+        observation_event("call_1"),
+        action_event("response_2", "call_2"),
+        observation_event("orphan_call"),
+    ]
+    assert_equivalent_at_every_prefix(events)
+
+
+def test_incremental_view_sync_only_reads_new_events() -> None:
+    events: list[Event] = [message_event(f"Event {i}") for i in range(3)]
+    incremental = IncrementalView(events)
+    assert len(incremental) == 3
+
+    events.append(message_event("Event 3"))
+    incremental.sync(events)
+    assert len(incremental) == 4
+    assert incremental.get_view().events == events
+
+    with pytest.raises(ValueError, match="only support appends"):
+        incremental.sync(events[:2])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_view_matches_from_events_randomized(seed: int) -> None:
+    rng = random.Random(seed)
+    events: list[Event] = []
+    pending_calls: list[str] = []
+    for step in range(80):
+        choice = rng.random()
+        if choice < 0.3:
+            events.append(message_event(f"Message {step}"))
+        elif choice < 0.55:
+            response_id = f"response_{step}"
+            for j in range(rng.randint(1, 3)):
+                call_id = f"call_{step}_{j}"
+                events.append(action_event(response_id, call_id))
+                pending_calls.append(call_id)
+        elif choice < 0.75 and pending_calls:
+            call_id = pending_calls.pop(rng.randrange(len(pending_calls)))
+            events.append(observation_event(call_id))
+        elif choice < 0.8:
+            events.append(CondensationRequest())
+        elif events:
+            forgotten = rng.sample(
+                [e.id for e in events], k=min(len(events), rng.randint(0, 5))
+            )
+            with_summary = rng.random() < 0.5
+            events.append(
+                Condensation(
+                    forgotten_event_ids=forgotten,
+                    summary=f"Summary {step}" if with_summary else None,
+                    summary_offset=rng.randint(0, 4) if with_summary else None,
+                    llm_response_id=f"condensation_{step}",
+                )
+            )
+    assert_equivalent_at_every_prefix(events)
@@ -0,0 +1,254 @@
+"""Tests for the async agent loop (LocalConversation.arun / Agent.astep)."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Sequence
+from typing import ClassVar
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from litellm import ChatCompletionMessageToolCall
+from litellm.types.utils import (
+    Choices,
+    Function,
+    Message as LiteLLMMessage,
+    ModelResponse,
+)
+from pydantic import SecretStr
+
+from openhands.sdk.agent import Agent
+from openhands.sdk.conversation import Conversation
+from openhands.sdk.conversation.exceptions import ConversationRunError
+from openhands.sdk.conversation.impl.local_conversation import LocalConversation
+from openhands.sdk.conversation.state import ConversationExecutionStatus
+from openhands.sdk.event import MessageEvent, ObservationEvent
+from openhands.sdk.llm import LLM, ImageContent, Message, TextContent
+from openhands.sdk.tool import (
+    Action,
+    Observation,
+    Tool,
+    ToolDefinition,
+    ToolExecutor,
+    register_tool,
+)
+
+
+class AsyncLoopAction(Action):
+    command: str
+
+
+class AsyncLoopObservation(Observation):
+    result: str
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.result)]
+
+
+class ThreadRecordingExecutor(ToolExecutor[AsyncLoopAction, AsyncLoopObservation]):
+    threads: ClassVar[list[int]] = []
+    # Whether the state lock was held by any thread while the tool ran
+    state_locked: ClassVar[list[bool]] = []
+
+    def __call__(self, action: AsyncLoopAction, conversation=None):
+        ThreadRecordingExecutor.threads.append(threading.get_ident())
+        if conversation is not None:
+            ThreadRecordingExecutor.state_locked.append(conversation.state.locked())
+        return AsyncLoopObservation(result=f"Executed: {action.command}")
+
+
+class AsyncLoopTool(ToolDefinition[AsyncLoopAction, AsyncLoopObservation]):
+    name: ClassVar[str] = "async_loop_tool"
+
+    @classmethod
+    def create(cls, conv_state=None, **params) -> Sequence["AsyncLoopTool"]:
+        return [
+            cls(
+                description="A test tool",
+                action_type=AsyncLoopAction,
+                observation_type=AsyncLoopObservation,
+                executor=ThreadRecordingExecutor(),
+            )
+        ]
+
+
+register_tool(AsyncLoopTool.name, AsyncLoopTool)
+
+
+def tool_call_response() -> ModelResponse:
+    return ModelResponse(
+        id="response_action",
+        choices=[
+            Choices(
+                message=LiteLLMMessage(
+                    role="assistant",
+                    content="Running the tool",
+                    tool_calls=[
+                        ChatCompletionMessageToolCall(
+                            id="call_1",
+                            type="function",
+                            function=Function(
+                                name=AsyncLoopTool.name,
+                                arguments='{"command": "ls"}',
+                            ),
+                        )
+                    ],
+                )
+            )
+        ],
+        created=0,
+        model="test-model",
+        object="chat.completion",
+    )
+
+
+def message_response(text: str = "Task completed") -> ModelResponse:
+    return ModelResponse(
+        id="response_msg",
+        choices=[Choices(message=LiteLLMMessage(role="assistant", content=text))],
+        created=0,
+        model="test-model",
+        object="chat.completion",
+    )
+
+
+def make_conversation(tmp_path) -> LocalConversation:
+    llm = LLM(
+        model="gpt-4o-mini",
+        api_key=SecretStr("test-key"),
+        usage_id="test-llm",
+        num_retries=1,
+    )
+    agent = Agent(llm=llm, tools=[Tool(name=AsyncLoopTool.name)])
+    conversation = Conversation(agent=agent, workspace=str(tmp_path), visualizer=None)
+    assert isinstance(conversation, LocalConversation)
+    conversation.send_message(Message(role="user", content=[TextContent(text="Hi")]))
+    return conversation
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+@patch("openhands.sdk.llm.llm.litellm_completion")
+async def test_arun_executes_tools_off_the_event_loop(
+    mock_completion, mock_acompletion, tmp_path
+):
+    mock_acompletion.side_effect = [tool_call_response(), message_response()]
+    ThreadRecordingExecutor.threads.clear()
+    conversation = make_conversation(tmp_path)
+
+    await conversation.arun()
+
+    mock_completion.assert_not_called()
+    assert mock_acompletion.call_count == 2
+    assert conversation.state.execution_status == ConversationExecutionStatus.FINISHED
+    observations = [
+        e for e in conversation.state.events if isinstance(e, ObservationEvent)
+    ]
+    assert len(observations) == 1
+    assert ThreadRecordingExecutor.threads
+    assert threading.get_ident() not in ThreadRecordingExecutor.threads
+    last = conversation.state.events[-1]
+    assert isinstance(last, MessageEvent) and last.source == "agent"
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_conversations_run_concurrently_on_one_loop(mock_acompletion, tmp_path):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_completion(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return message_response()
+
+    mock_acompletion.side_effect = slow_completion
+    conversations = [make_conversation(tmp_path / str(i)) for i in range(10)]
+
+    await asyncio.gather(*[c.arun() for c in conversations])
+
+    assert max_in_flight == 10
+    for conversation in conversations:
+        assert (
+            conversation.state.execution_status == ConversationExecutionStatus.FINISHED
+        )
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_arun_errors_set_error_status(mock_acompletion, tmp_path):
+    mock_acompletion.side_effect = ValueError("boom")
+    conversation = make_conversation(tmp_path)
+
+    with pytest.raises(ConversationRunError) as exc_info:
+        await conversation.arun()
+
+    assert str(conversation.id) in str(exc_info.value)
+    assert conversation.state.execution_status == ConversationExecutionStatus.ERROR
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_arun_releases_state_lock_while_awaiting_llm(mock_acompletion, tmp_path):
+    conversation = make_conversation(tmp_path)
+
+    async def completion(**kwargs):
+        if mock_acompletion.call_count > 1:
+            return message_response()
+        # Another coroutine of the loop can take the state lock meanwhile
+        assert not conversation.state.locked()
+        conversation.pause()
+        return tool_call_response()
+
+    mock_acompletion.side_effect = completion
+    await conversation.arun()
+
+    # The action returned after the pause is pending, not executed
+    assert conversation.state.execution_status == ConversationExecutionStatus.PAUSED
+    assert not any(isinstance(e, ObservationEvent) for e in conversation.state.events)
+
+    await conversation.arun()
+    assert conversation.state.execution_status == ConversationExecutionStatus.FINISHED
+    observations = [
+        e for e in conversation.state.events if isinstance(e, ObservationEvent)
+    ]
+    assert len(observations) == 1
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_arun_waits_for_state_lock_without_blocking_loop(
+    mock_acompletion, tmp_path
+):
+    conversation = make_conversation(tmp_path)
+    mock_acompletion.side_effect = [tool_call_response(), message_response()]
+    ThreadRecordingExecutor.state_locked.clear()
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with conversation.state:
+            held.set()
+            release.wait(2)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    held.wait(5)
+    run = asyncio.create_task(conversation.arun())
+    start = time.monotonic()
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+    # The loop kept running while arun waited for the lock
+    assert time.monotonic() - start < 1.0
+    assert not run.done()
+    release.set()
+    await asyncio.wait_for(run, timeout=10)
+    holder.join()
+
+    assert conversation.state.execution_status == ConversationExecutionStatus.FINISHED
+    # The lock is released while tools run, not only while awaiting the LLM
+    assert ThreadRecordingExecutor.state_locked == [False]
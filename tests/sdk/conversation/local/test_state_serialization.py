@@ -547,3 +547,97 @@ def test_conversation_with_agent_different_llm_config():
         new_dump = new_conversation._state.model_dump(mode="json", exclude={"agent"})
 
         assert new_dump == original_state_dump
+
+
+def _delta_state(temp_dir: str, delta_state: bool = True) -> ConversationState:
+    llm = LLM(model="gpt-4o-mini", api_key=SecretStr("test-key"), usage_id="test-llm")
+    return ConversationState.create(
+        id=uuid.UUID("12345678-1234-5678-9abc-123456789010"),
+        agent=Agent(llm=llm, tools=[]),
+        workspace=LocalWorkspace(working_dir="/tmp"),
+        persistence_dir=temp_dir,
+        delta_state=delta_state,
+    )
+
+
+def test_delta_state_keeps_hot_fields_apart():
+    """With delta persistence, hot field changes do not rewrite the base state."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state = _delta_state(temp_dir)
+        base_file = Path(temp_dir) / "base_state.json"
+        hot_file = Path(temp_dir) / "hot_state.json"
+        base_text = base_file.read_text()
+        assert "execution_status" not in json.loads(base_text)
+        assert "agent" not in json.loads(hot_file.read_text())
+
+        state.execution_status = ConversationExecutionStatus.RUNNING
+
+        assert base_file.read_text() == base_text
+        assert json.loads(hot_file.read_text())["execution_status"] == "running"
+
+        # Cold fields still go to the base state
+        state.max_iterations = 42
+        assert json.loads(base_file.read_text())["max_iterations"] == 42
+
+        loaded = ConversationState.load_persisted(temp_dir)
+        assert loaded is not None
+        assert loaded.execution_status == ConversationExecutionStatus.RUNNING
+        assert loaded.max_iterations == 42
+
+
+def test_delta_state_defers_writes_in_block():
+    """Changes in a deferred_persistence block are saved once, at its end."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state = _delta_state(temp_dir)
+        hot_file = Path(temp_dir) / "hot_state.json"
+        written = []
+        write_atomic = state._fs.write_atomic
+
+        def recording_write_atomic(path, contents):
+            written.append(path)
+            write_atomic(path, contents)
+
+        state._fs.write_atomic = recording_write_atomic
+        with state.deferred_persistence():
+            with state.deferred_persistence():
+                state.execution_status = ConversationExecutionStatus.RUNNING
+                state.execution_status = ConversationExecutionStatus.FINISHED
+            state.activated_knowledge_skills = ["skill"]
+            assert written == []
+            assert json.loads(hot_file.read_text())["execution_status"] == "idle"
+
+        assert written == ["hot_state.json"]
+        hot = json.loads(hot_file.read_text())
+        assert hot["execution_status"] == "finished"
+        assert hot["activated_knowledge_skills"] == ["skill"]
+
+
+def test_delta_state_resume():
+    """Delta persisted conversations resume with their latest hot fields, and
+    keep delta persistence when reopened without asking for it."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state = _delta_state(temp_dir)
+        state.execution_status = ConversationExecutionStatus.PAUSED
+
+        resumed = _delta_state(temp_dir, delta_state=False)
+
+        assert resumed.execution_status == ConversationExecutionStatus.PAUSED
+        resumed.execution_status = ConversationExecutionStatus.FINISHED
+        hot = json.loads((Path(temp_dir) / "hot_state.json").read_text())
+        assert hot["execution_status"] == "finished"
+
+
+def test_delta_state_enabled_on_existing_conversation():
+    """Conversations persisted as a whole can switch to delta persistence."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state = _delta_state(temp_dir, delta_state=False)
+        state.execution_status = ConversationExecutionStatus.PAUSED
+        assert not (Path(temp_dir) / "hot_state.json").exists()
+
+        resumed = _delta_state(temp_dir)
+        resumed.max_iterations = 10
+
+        loaded = ConversationState.load_persisted(temp_dir)
+        assert loaded is not None
+        assert loaded.execution_status == ConversationExecutionStatus.PAUSED
+        assert loaded.max_iterations == 10
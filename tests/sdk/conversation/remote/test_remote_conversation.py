@@ -11,6 +11,7 @@ from openhands.sdk.agent import Agent
 from openhands.sdk.conversation.impl.remote_conversation import RemoteConversation
 from openhands.sdk.conversation.secret_registry import SecretValue
 from openhands.sdk.conversation.visualizer import DefaultConversationVisualizer
+from openhands.sdk.event import MessageEvent
 from openhands.sdk.llm import LLM, Message, TextContent
 from openhands.sdk.security.confirmation_policy import AlwaysConfirm
 from openhands.sdk.workspace import RemoteWorkspace
@@ -623,6 +624,43 @@ class TestRemoteConversation:
         call_args = mock_ws_client.call_args
         assert "callback" in call_args[1]  # Should have a callback parameter
 
+    @patch(
+        "openhands.sdk.conversation.impl.remote_conversation.WebSocketCallbackClient"
+    )
+    def test_remote_conversation_dispatches_events_missed_on_connect(
+        self, mock_ws_client
+    ):
+        """Events fetched on (re)connection are passed to the callbacks."""
+        mock_client_instance = self.setup_mock_client()
+        callback_calls = []
+        conversation = RemoteConversation(
+            agent=self.agent,
+            workspace=self.workspace,
+            callbacks=[callback_calls.append],
+        )
+        missed = MessageEvent(
+            id="missed-event",
+            source="agent",
+            llm_message=Message(role="assistant", content=[TextContent(text="hi")]),
+        )
+        default_request = mock_client_instance.request.side_effect
+
+        def request_side_effect(method, url, **kwargs):
+            if method == "GET" and url.endswith("/events/search"):
+                return self.create_mock_events_response([missed.model_dump()])
+            return default_request(method, url, **kwargs)
+
+        mock_client_instance.request.side_effect = request_side_effect
+
+        mock_ws_client.call_args.kwargs["on_connect"]()
+        # Events already fetched are not dispatched again
+        mock_ws_client.call_args.kwargs["on_connect"]()
+        # Nor when the websocket forwards them too
+        mock_ws_client.call_args.kwargs["callback"](missed)
+
+        assert [event.id for event in callback_calls] == ["missed-event"]
+        assert [event.id for event in conversation.state.events] == ["missed-event"]
+
     @patch(
         "openhands.sdk.conversation.impl.remote_conversation.WebSocketCallbackClient"
     )
@@ -1,6 +1,6 @@
 """Tests for RemoteEventsList."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import Mock
 
 import httpx
@@ -177,3 +177,148 @@ def test_remote_events_list_empty(mock_client, conversation_id):
 
     with pytest.raises(IndexError):
         _ = events_list[0]
+
+
+class FakeEventsServer:
+    """Serves the events search and count endpoints over a list of events."""
+
+    def __init__(self, events: list[Event]):
+        self.events = events
+        self.requests: list[tuple[str, dict]] = []
+
+    def request(self, method, url, params=None, **kwargs):
+        params = params or {}
+        self.requests.append((url, params))
+        response = Mock()
+        response.status_code = 200
+        if url.endswith("/count"):
+            before = params.get("timestamp__lt")
+            events = self.events
+            if "before_id" in params:
+                ids = [event.id for event in events]
+                events = events[: ids.index(params["before_id"])]
+            response.json.return_value = sum(
+                1 for event in events if not before or event.timestamp < before
+            )
+            return response
+        events = self.events
+        if params.get("sort_order") == "TIMESTAMP_DESC":
+            events = events[::-1]
+        ids = [event.id for event in events]
+        page_id = params.get("page_id")
+        start = ids.index(page_id) if page_id in ids else 0
+        limit = params.get("limit", 100)
+        page = events[start : start + limit]
+        next_page_id = ids[start + limit] if start + limit < len(ids) else None
+        response.json.return_value = {
+            "items": [event.model_dump() for event in page],
+            "next_page_id": next_page_id,
+        }
+        return response
+
+
+def create_mock_events(start: int, stop: int) -> list[Event]:
+    """Create events with distinct, increasing timestamps."""
+    return [
+        create_mock_event(f"event-{i:04d}").model_copy(
+            update={
+                "timestamp": (datetime(2025, 1, 1) + timedelta(seconds=i)).isoformat()
+            }
+        )
+        for i in range(start, stop)
+    ]
+
+
+def test_remote_events_list_sync_fetches_new_events_only(conversation_id):
+    server = FakeEventsServer(create_mock_events(0, 150))
+    events_list = RemoteEventsList(server, conversation_id)  # type: ignore[arg-type]
+    server.events += create_mock_events(150, 160)
+    server.requests.clear()
+
+    new_events = events_list.sync()
+
+    assert [e.id for e in new_events] == [e.id for e in server.events[150:]]
+    assert [e.id for e in events_list] == [e.id for e in server.events]
+    assert server.requests == [
+        (
+            f"/api/conversations/{conversation_id}/events/search",
+            {"limit": 100, "page_id": "event-0149"},
+        )
+    ]
+
+
+def test_remote_events_list_cache(conversation_id, tmp_path):
+    server = FakeEventsServer(create_mock_events(0, 5))
+    RemoteEventsList(server, conversation_id, cache_dir=tmp_path)  # type: ignore[arg-type]
+    server.events += create_mock_events(5, 8)
+    server.requests.clear()
+
+    events_list = RemoteEventsList(server, conversation_id, cache_dir=tmp_path)  # type: ignore[arg-type]
+    events_list.add_event(create_mock_event("event-0008"))
+
+    assert len(events_list) == 9
+    assert len(server.requests) == 1
+    assert server.requests[0][1]["page_id"] == "event-0004"
+    cached = (tmp_path / f"{conversation_id}.jsonl").read_text().splitlines()
+    assert [Event.model_validate_json(line).id for line in cached] == [
+        f"event-{i:04d}" for i in range(9)
+    ]
+
+
+def test_remote_events_list_stale_or_truncated_cache(conversation_id, tmp_path):
+    cache_file = tmp_path / f"{conversation_id}.jsonl"
+    cache_file.write_text(
+        create_mock_event("unknown").model_dump_json() + '\n{"truncated'
+    )
+    server = FakeEventsServer(create_mock_events(0, 3))
+
+    events_list = RemoteEventsList(server, conversation_id, cache_dir=tmp_path)  # type: ignore[arg-type]
+
+    assert [e.id for e in events_list] == ["event-0000", "event-0001", "event-0002"]
+    assert len(cache_file.read_text().splitlines()) == 3
+
+
+def test_remote_events_list_lazy_paging(conversation_id, tmp_path):
+    server = FakeEventsServer(create_mock_events(0, 250))
+
+    events_list = RemoteEventsList(
+        server,  # type: ignore[arg-type]
+        conversation_id,
+        cache_dir=tmp_path,
+        lazy=True,
+    )
+
+    # Only the latest page and the count of older events are fetched
+    assert len(server.requests) == 2
+    assert len(events_list) == 250
+    assert events_list[-1].id == "event-0249"
+    assert events_list[150].id == "event-0150"
+    assert len(server.requests) == 2
+    # Partial lists are not cached
+    assert not (tmp_path / f"{conversation_id}.jsonl").exists()
+
+    assert [e.id for e in events_list[120:160]] == [
+        f"event-{i:04d}" for i in range(120, 160)
+    ]
+    assert len(server.requests) == 3
+    assert events_list[0].id == "event-0000"
+    assert [e.id for e in events_list] == [e.id for e in server.events]
+    assert len((tmp_path / f"{conversation_id}.jsonl").read_text().splitlines()) == 250
+
+
+def test_remote_events_list_lazy_paging_with_shared_timestamps(conversation_id):
+    # Events appended within the same clock tick share their timestamp
+    timestamp = datetime(2025, 1, 1).isoformat()
+    server = FakeEventsServer(
+        [
+            event.model_copy(update={"timestamp": timestamp})
+            for event in create_mock_events(0, 150)
+        ]
+    )
+
+    events_list = RemoteEventsList(server, conversation_id, lazy=True)  # type: ignore[arg-type]
+
+    assert len(events_list) == 150
+    assert events_list[49].id == "event-0049"
+    assert events_list[50].id == "event-0050"
+    assert [e.id for e in events_list] == [e.id for e in server.events]
@@ -124,3 +124,33 @@ def test_websocket_client_callback_invocation(mock_event):
 
     assert len(callback_events) == 1
     assert callback_events[0].id == mock_event.id
+
+
+@pytest.mark.asyncio
+async def test_websocket_client_calls_on_connect_before_events(mock_event):
+    """on_connect runs on connection, before any event is forwarded."""
+    calls = []
+    client = WebSocketCallbackClient(
+        host="http://localhost:8000",
+        conversation_id="test-conv-id",
+        callback=lambda event: calls.append(event.id),
+        on_connect=lambda: calls.append("connect"),
+    )
+
+    class FakeConnection:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            client._stop.set()
+
+        async def __aiter__(self):
+            yield mock_event.model_dump_json()
+
+    with patch(
+        "openhands.sdk.conversation.impl.remote_conversation.websockets.connect",
+        return_value=FakeConnection(),
+    ):
+        await client._client_loop()
+
+    assert calls == ["connect", "test-event-id"]
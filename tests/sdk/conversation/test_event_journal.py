@@ -0,0 +1,183 @@
+"""Tests for the segmented event journal backend."""
+
+import os
+import uuid
+
+import pytest
+from pydantic import SecretStr
+
+from openhands.sdk import Agent
+from openhands.sdk.conversation.event_journal import JournalEventLog
+from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.persistence_const import (
+    EVENTS_JOURNAL_DIR,
+    JOURNAL_INDEX_FILE,
+)
+from openhands.sdk.conversation.state import ConversationState
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import LocalFileStore
+from openhands.sdk.llm import LLM, Message, TextContent
+from openhands.sdk.workspace import LocalWorkspace
+
+
+def create_test_event(i: int, content: str = "Test content") -> MessageEvent:
+    return MessageEvent(
+        id=f"{i:08x}-0000-0000-0000-000000000000",
+        llm_message=Message(role="user", content=[TextContent(text=content)]),
+        source="user",
+    )
+
+
+@pytest.fixture
+def fs(tmp_path) -> LocalFileStore:
+    return LocalFileStore(str(tmp_path))
+
+
+def journal_dir(fs: LocalFileStore) -> str:
+    return fs.get_full_path(EVENTS_JOURNAL_DIR)
+
+
+def test_journal_append_and_reopen(fs):
+    log = JournalEventLog(fs)
+    events = [create_test_event(i, f"Event {i}") for i in range(20)]
+    for event in events:
+        log.append(event)
+    log.flush()
+
+    reopened = JournalEventLog(fs, cache_max_bytes=0)
+    assert len(reopened) == 20
+    assert [e.id for e in reopened] == [e.id for e in events]
+    assert reopened[7] == events[7]
+    assert reopened[-1] == events[-1]
+    assert reopened.get_index(events[12].id) == 12
+    assert reopened.get_id(3) == events[3].id
+
+    # Journal does not create per-event files
+    assert sorted(os.listdir(journal_dir(fs))) == [
+        JOURNAL_INDEX_FILE,
+        "segment-000000.jsonl",
+    ]
+
+
+def test_journal_records_are_length_prefixed_json_lines(fs):
+    log = JournalEventLog(fs)
+    event = create_test_event(0)
+    log.append(event)
+
+    with open(os.path.join(journal_dir(fs), "segment-000000.jsonl"), "rb") as f:
+        record = f.read()
+    payload = event.model_dump_json(exclude_none=True).encode()
+    assert record == b"%d " % len(payload) + payload + b"\n"
+
+
+def test_journal_rolls_segments(fs):
+    log = JournalEventLog(fs, segment_max_bytes=1024)
+    events = [create_test_event(i, "x" * 200) for i in range(10)]
+    for event in events:
+        log.append(event)
+
+    segments = [n for n in os.listdir(journal_dir(fs)) if n.startswith("segment-")]
+    assert len(segments) > 1
+
+    reopened = JournalEventLog(fs, cache_max_bytes=0, segment_max_bytes=1024)
+    assert [e.id for e in reopened] == [e.id for e in events]
+    reopened.append(create_test_event(10))
+    assert len(JournalEventLog(fs)) == 11
+
+
+def test_journal_duplicate_id_rejected(fs):
+    log = JournalEventLog(fs)
+    log.append(create_test_event(0))
+    with pytest.raises(ValueError, match="already exists at index 0"):
+        log.append(create_test_event(0))
+    assert len(JournalEventLog(fs)) == 1
+
+
+def test_journal_recovers_records_missing_from_index(fs):
+    log = JournalEventLog(fs)
+    for i in range(5):
+        log.append(create_test_event(i))
+
+    # Simulate a crash after the segment write but before the index write
+    index_path = os.path.join(journal_dir(fs), JOURNAL_INDEX_FILE)
+    with open(index_path, "rb") as f:
+        index = f.read()
+    os.truncate(index_path, len(index) * 3 // 5)
+
+    reopened = JournalEventLog(fs, cache_max_bytes=0)
+    assert [e.id for e in reopened] == [create_test_event(i).id for i in range(5)]
+    assert len(JournalEventLog(fs)) == 5
+
+
+def test_journal_truncates_torn_tail_record(fs):
+    log = JournalEventLog(fs)
+    for i in range(3):
+        log.append(create_test_event(i))
+
+    segment_path = os.path.join(journal_dir(fs), "segment-000000.jsonl")
+    with open(segment_path, "ab") as f:
+        f.write(b'500 {"id": "partial')
+
+    reopened = JournalEventLog(fs)
+    assert len(reopened) == 3
+    reopened.append(create_test_event(3))
+    assert [e.id for e in JournalEventLog(fs, cache_max_bytes=0)] == [
+        create_test_event(i).id for i in range(4)
+    ]
+
+
+def test_journal_drops_index_entries_past_segment_end(fs):
+    log = JournalEventLog(fs)
+    for i in range(3):
+        log.append(create_test_event(i))
+
+    segment_path = os.path.join(journal_dir(fs), "segment-000000.jsonl")
+    os.truncate(segment_path, os.path.getsize(segment_path) - 10)
+
+    reopened = JournalEventLog(fs, cache_max_bytes=0)
+    assert len(reopened) == 2
+    assert [e.id for e in reopened] == [create_test_event(i).id for i in range(2)]
+
+
+def test_journal_migrates_per_file_events(fs):
+    legacy = EventLog(fs)
+    events = [create_test_event(i, f"Legacy {i}") for i in range(4)]
+    for event in events:
+        legacy.append(event)
+
+    journal = JournalEventLog(fs, cache_max_bytes=0)
+    assert [e.id for e in journal] == [e.id for e in events]
+    assert journal[2] == events[2]
+
+    # Migration happens once; later appends go to the journal only
+    journal.append(create_test_event(4))
+    assert len(JournalEventLog(fs)) == 5
+    assert len(EventLog(fs)) == 4
+
+
+def test_conversation_state_uses_journal(tmp_path):
+    agent = Agent(
+        llm=LLM(model="gpt-4o-mini", api_key=SecretStr("test-key"), usage_id="llm"),
+        tools=[],
+    )
+    conversation_id = uuid.uuid4()
+    state = ConversationState.create(
+        id=conversation_id,
+        agent=agent,
+        workspace=LocalWorkspace(working_dir=str(tmp_path)),
+        persistence_dir=str(tmp_path / "conv"),
+        event_journal=True,
+    )
+    assert isinstance(state.events, JournalEventLog)
+    state.events.append(create_test_event(0))
+    state.events.flush()
+
+    # Resuming detects the journal even without the flag
+    resumed = ConversationState.create(
+        id=conversation_id,
+        agent=agent,
+        workspace=LocalWorkspace(working_dir=str(tmp_path)),
+        persistence_dir=str(tmp_path / "conv"),
+    )
+    assert isinstance(resumed.events, JournalEventLog)
+    assert [e.id for e in resumed.events] == [create_test_event(0).id]
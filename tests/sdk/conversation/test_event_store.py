@@ -147,7 +147,7 @@ def test_event_log_get_index_and_get_id():
 def test_event_log_missing_event_file():
     """Test behavior when event file is missing."""
     fs = InMemoryFileStore()
-    log = EventLog(fs)
+    log = EventLog(fs, cache_max_bytes=0)
 
     event = create_test_event("test-event", "Content")
     log.append(event)
@@ -255,7 +255,7 @@ def test_event_log_file_store_exceptions():
 def test_event_log_iteration_with_missing_files():
     """Test iteration behavior when some files are missing."""
     fs = InMemoryFileStore()
-    log = EventLog(fs)
+    log = EventLog(fs, cache_max_bytes=0)
 
     # Add events
     events = [
@@ -280,7 +280,7 @@ def test_event_log_iteration_with_missing_files():
 def test_event_log_iteration_backfills_missing_mappings():
     """Test that iteration fails when mappings are missing."""
     fs = InMemoryFileStore()
-    log = EventLog(fs)
+    log = EventLog(fs, cache_max_bytes=0)
 
     # Add an event through normal append
     event = create_test_event("manual-event", "Manual event")
@@ -343,3 +343,122 @@ def test_event_log_large_index_formatting():
 
     assert log.get_index("large-index-event") == 99999
     assert log.get_id(99999) == "large-index-event"
+
+
+class CountingFileStore(InMemoryFileStore):
+    """InMemoryFileStore that records how many reads were performed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def read(self, path: str) -> str:
+        self.reads += 1
+        return super().read(path)
+
+
+def _scannable_id(i: int) -> str:
+    """Event id matching EVENT_NAME_RE so a reopened log can index it."""
+    return f"{i:08x}-0000-0000-0000-000000000000"
+
+
+def test_event_log_cache_serves_appended_events_without_reads():
+    """Appended events are written through to the cache."""
+    fs = CountingFileStore()
+    log = EventLog(fs)
+
+    ids = [_scannable_id(i) for i in range(10)]
+    for event_id in ids:
+        log.append(create_test_event(event_id))
+
+    assert [e.id for e in log] == ids
+    assert log[3].id == ids[3]
+    assert [e.id for e in log[2:5]] == ids[2:5]
+    assert fs.reads == 0
+
+    # Data is still persisted for a fresh log
+    reopened = EventLog(fs)
+    assert [e.id for e in reopened] == ids
+
+
+def test_event_log_cache_populated_on_read():
+    """Events read from storage are cached for subsequent access."""
+    fs = CountingFileStore()
+    writer = EventLog(fs)
+    for i in range(5):
+        writer.append(create_test_event(_scannable_id(i)))
+
+    log = EventLog(fs)
+    list(log)
+    assert fs.reads == 5
+
+    list(log)
+    log[-1]
+    assert fs.reads == 5
+
+
+def test_event_log_cache_respects_memory_budget():
+    """The cache evicts least recently used events to stay within budget."""
+    fs = CountingFileStore()
+    event_size = len(create_test_event("event-0").model_dump_json(exclude_none=True))
+    log = EventLog(fs, cache_max_bytes=event_size * 3)
+
+    for i in range(6):
+        log.append(create_test_event(f"event-{i}"))
+
+    assert len(log._cache) == 3
+    assert log._cache.size_bytes <= event_size * 3
+
+    # The hot tail is served from memory, the cold prefix from storage
+    assert [e.id for e in log[3:]] == ["event-3", "event-4", "event-5"]
+    assert fs.reads == 0
+    assert log[0].id == "event-0"
+    assert fs.reads == 1
+
+
+def test_event_log_cache_scan_keeps_hot_tail():
+    """A full scan over a history larger than the budget keeps recent events."""
+    fs = CountingFileStore()
+    event_size = len(create_test_event("event-0").model_dump_json(exclude_none=True))
+    log = EventLog(fs, cache_max_bytes=event_size * 3)
+
+    for i in range(6):
+        log.append(create_test_event(f"event-{i}"))
+
+    assert len(list(log)) == 6
+    assert fs.reads == 3
+
+    assert len(list(log)) == 6
+    assert fs.reads == 6
+
+
+def test_event_log_cache_scan_of_reopened_log_caches_recent_events():
+    """Scanning a reopened log larger than the budget caches its recent part."""
+    fs = CountingFileStore()
+    ids = [_scannable_id(i) for i in range(6)]
+    event_size = len(create_test_event(ids[0]).model_dump_json(exclude_none=True))
+    writer = EventLog(fs, cache_max_bytes=0)
+    for event_id in ids:
+        writer.append(create_test_event(event_id))
+
+    log = EventLog(fs, cache_max_bytes=event_size * 3)
+    assert [event.id for event in log] == ids
+    assert fs.reads == 6
+    assert sorted(log._cache._entries) == [3, 4, 5]
+
+    # Later scans only read the cold prefix again
+    assert len(list(log)) == 6
+    assert fs.reads == 9
+    assert sorted(log._cache._entries) == [3, 4, 5]
+
+
+def test_event_log_cache_disabled():
+    """A zero budget disables caching entirely."""
+    fs = CountingFileStore()
+    log = EventLog(fs, cache_max_bytes=0)
+    log.append(create_test_event("event-0"))
+
+    assert log[0].id == "event-0"
+    assert log[0].id == "event-0"
+    assert fs.reads == 2
+    assert len(log._cache) == 0
@@ -0,0 +1,88 @@
+"""Tests for LocalFileStore atomic writes and existence checks."""
+
+import os
+import threading
+
+import pytest
+
+from openhands.sdk.io import InMemoryFileStore
+from openhands.sdk.io.local import LocalFileStore
+
+
+def test_write_atomic_replaces_contents_and_leaves_no_temp_files(tmp_path):
+    store = LocalFileStore(str(tmp_path))
+
+    store.write_atomic("state/base.json", "first")
+    store.write_atomic("state/base.json", b"second")
+
+    assert store.read("state/base.json") == "second"
+    assert os.listdir(tmp_path / "state") == ["base.json"]
+
+
+def test_write_atomic_fsyncs_before_replacing(tmp_path, monkeypatch):
+    store = LocalFileStore(str(tmp_path))
+    calls: list[str] = []
+    fsync, replace = os.fsync, os.replace
+
+    def recording_fsync(fd):
+        calls.append("fsync")
+        fsync(fd)
+
+    def recording_replace(src, dst):
+        calls.append("replace")
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "fsync", recording_fsync)
+    monkeypatch.setattr(os, "replace", recording_replace)
+
+    store.write_atomic("base.json", "contents")
+
+    assert calls == ["fsync", "replace"]
+
+
+def test_concurrent_write_atomic_never_exposes_partial_writes(tmp_path):
+    store = LocalFileStore(str(tmp_path))
+    payloads = [str(i) * 100_000 for i in range(8)]
+    errors: list[BaseException] = []
+
+    def write(payload: str) -> None:
+        try:
+            for _ in range(10):
+                store.write_atomic("base.json", payload)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(p,)) for p in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert store.read("base.json") in payloads
+    assert os.listdir(tmp_path) == ["base.json"]
+
+
+def test_write_atomic_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    store = LocalFileStore(str(tmp_path))
+    store.write_atomic("base.json", "old")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+
+    with pytest.raises(OSError, match="disk full"):
+        store.write_atomic("base.json", "new")
+    assert store.read("base.json") == "old"
+    assert os.listdir(tmp_path) == ["base.json"]
+
+
+@pytest.mark.parametrize("local", [True, False])
+def test_exists(tmp_path, local):
+    store = LocalFileStore(str(tmp_path)) if local else InMemoryFileStore()
+
+    assert not store.exists("dir/file.json")
+    store.write("dir/file.json", "{}")
+    assert store.exists("dir/file.json")
+    assert not store.exists("dir/other.json")
@@ -663,6 +663,43 @@ def test_llm_openhands_provider_rewrite(default_llm):
     assert all(isinstance(msg, dict) for msg in formatted)
 
 
+def test_format_messages_for_llm_does_not_mutate_messages():
+    """Caching breakpoints and flags are applied without touching the input."""
+    llm = LLM(
+        model="claude-sonnet-4-5-20250514",
+        api_key=SecretStr("test_key"),
+        usage_id="test-llm",
+        caching_prompt=True,
+    )
+    assert llm.is_caching_prompt_active()
+    messages = [
+        Message(role="system", content=[TextContent(text="System")]),
+        Message(role="user", content=[TextContent(text="First")]),
+        Message(role="assistant", content=[TextContent(text="Answer")]),
+        Message(
+            role="user", content=[TextContent(text="Second"), TextContent(text="End")]
+        ),
+    ]
+    before = [m.model_dump() for m in messages]
+
+    formatted = llm.format_messages_for_llm(messages)
+
+    assert [m.model_dump() for m in messages] == before
+    cached = [
+        (i, j)
+        for i, message in enumerate(formatted)
+        for j, item in enumerate(message["content"])
+        if "cache_control" in item
+    ]
+    assert cached == [(0, 0), (3, 1)]
+
+    # Breakpoints are recomputed per call rather than accumulated
+    messages.append(Message(role="user", content=[TextContent(text="Third")]))
+    formatted = llm.format_messages_for_llm(messages)
+    assert "cache_control" not in formatted[3]["content"][1]
+    assert formatted[4]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+
 def test_metrics_copy():
     """Test that metrics can be copied correctly."""
     original = Metrics(model_name="test-model")
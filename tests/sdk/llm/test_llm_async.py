@@ -0,0 +1,211 @@
+"""Tests for the async LLM path (LLM.acompletion / LLM.aresponses)."""
+
+import asyncio
+import threading
+import time
+import types
+from unittest.mock import AsyncMock, patch
+
+import litellm
+import pytest
+from litellm.exceptions import RateLimitError
+from litellm.types.llms.openai import ResponseAPIUsage, ResponsesAPIResponse
+from openai.types.responses.response_output_message import ResponseOutputMessage
+from openai.types.responses.response_output_text import ResponseOutputText
+from pydantic import SecretStr
+
+from openhands.sdk.llm import LLM, Message, TextContent
+from openhands.sdk.llm.exceptions import LLMNoResponseError
+from tests.conftest import create_mock_litellm_response
+from tests.sdk.llm.test_llm_completion import _MockTool, create_mock_response
+
+
+def make_llm(model: str = "gpt-4o", **kwargs) -> LLM:
+    return LLM(
+        model=model,
+        api_key=SecretStr("test_key"),
+        usage_id="test-llm",
+        num_retries=2,
+        retry_min_wait=0,
+        retry_max_wait=0,
+        **kwargs,
+    )
+
+
+MESSAGES = [Message(role="user", content=[TextContent(text="Hello")])]
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_basic(mock_acompletion):
+    mock_acompletion.return_value = create_mock_litellm_response("Hi there")
+    llm = make_llm()
+
+    response = await llm.acompletion(MESSAGES)
+
+    assert response.message.content[0] == TextContent(text="Hi there")
+    assert response.metrics.accumulated_token_usage is not None
+    assert llm.metrics.accumulated_token_usage is not None
+    assert llm.metrics.accumulated_token_usage.prompt_tokens == 10
+    kwargs = mock_acompletion.call_args.kwargs
+    assert kwargs["model"] == "gpt-4o"
+    assert kwargs["api_key"] == "test_key"
+    assert [m["role"] for m in kwargs["messages"]] == ["user"]
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_retries(mock_acompletion):
+    mock_acompletion.side_effect = [
+        RateLimitError("rate limited", llm_provider="openai", model="gpt-4o"),
+        create_mock_litellm_response("Recovered"),
+    ]
+    llm = make_llm()
+
+    response = await llm.acompletion(MESSAGES)
+
+    assert response.message.content[0] == TextContent(text="Recovered")
+    assert mock_acompletion.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_empty_choices_raise_after_retries(mock_acompletion):
+    empty = create_mock_litellm_response("unused")
+    empty.choices = []
+    mock_acompletion.return_value = empty
+    llm = make_llm()
+
+    with pytest.raises(LLMNoResponseError):
+        await llm.acompletion(MESSAGES)
+    assert mock_acompletion.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_mocks_function_calling(mock_acompletion):
+    mock_acompletion.return_value = create_mock_response(
+        "I'll help you with that.\n"
+        "<function=test_tool>\n"
+        "<parameter=param>test_value</parameter>\n"
+        "</function>"
+    )
+    llm = make_llm(native_tool_calling=False)
+
+    response = await llm.acompletion(MESSAGES, tools=list(_MockTool.create()))
+
+    assert response.message.tool_calls is not None
+    assert response.message.tool_calls[0].name == "test_tool"
+    assert mock_acompletion.call_args.kwargs.get("tools") is None
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletions_run_concurrently_on_one_loop(mock_acompletion):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_completion(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return create_mock_litellm_response("ok")
+
+    mock_acompletion.side_effect = slow_completion
+    llm = make_llm()
+
+    responses = await asyncio.gather(*[llm.acompletion(MESSAGES) for _ in range(20)])
+
+    assert len(responses) == 20
+    assert max_in_flight == 20
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_concurrent_acompletions_see_their_own_modify_params(mock_acompletion):
+    seen: list[tuple[str, bool]] = []
+
+    async def slow_completion(**kwargs):
+        await asyncio.sleep(0.05)
+        seen.append((kwargs["model"], litellm.modify_params))
+        return create_mock_litellm_response("ok")
+
+    mock_acompletion.side_effect = slow_completion
+    modify = make_llm(model="gpt-4o", modify_params=True)
+    keep = make_llm(model="gpt-4o-mini", modify_params=False)
+    default = litellm.modify_params
+
+    await asyncio.gather(modify.acompletion(MESSAGES), keep.acompletion(MESSAGES))
+
+    assert sorted(seen) == [("gpt-4o", True), ("gpt-4o-mini", False)]
+    assert litellm.modify_params == default
+    assert type(litellm) is types.ModuleType
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_concurrent_completions_in_threads_see_their_own_modify_params(
+    mock_completion,
+):
+    seen: list[tuple[str, bool]] = []
+
+    def slow_completion(**kwargs):
+        time.sleep(0.05)
+        seen.append((kwargs["model"], litellm.modify_params))
+        return create_mock_litellm_response("ok")
+
+    mock_completion.side_effect = slow_completion
+    llms = [
+        make_llm(model="gpt-4o", modify_params=True),
+        make_llm(model="gpt-4o-mini", modify_params=False),
+    ] * 3
+    default = litellm.modify_params
+
+    threads = [
+        threading.Thread(target=llm.completion, args=(MESSAGES,)) for llm in llms
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(seen) == [("gpt-4o", True)] * 3 + [("gpt-4o-mini", False)] * 3
+    assert litellm.modify_params == default
+
+
+@pytest.mark.asyncio
+@patch("openhands.sdk.llm.llm.litellm_aresponses", new_callable=AsyncMock)
+async def test_aresponses_basic(mock_aresponses):
+    msg = ResponseOutputMessage.model_construct(
+        id="m1",
+        type="message",
+        role="assistant",
+        status="completed",
+        content=[ResponseOutputText(type="output_text", text="ok", annotations=[])],
+    )
+    mock_aresponses.return_value = ResponsesAPIResponse(
+        id="resp123",
+        created_at=0,
+        output=[msg],
+        usage=ResponseAPIUsage(input_tokens=0, output_tokens=0, total_tokens=0),
+        parallel_tool_calls=False,
+        tool_choice="auto",
+        top_p=None,
+        tools=[],
+        instructions="",
+        status="completed",
+    )
+    llm = make_llm(model="gpt-5-mini")
+
+    response = await llm.aresponses(
+        [
+            Message(role="system", content=[TextContent(text="Be brief")]),
+            *MESSAGES,
+        ]
+    )
+
+    assert response.message.content[0] == TextContent(text="ok")
+    kwargs = mock_aresponses.call_args.kwargs
+    assert kwargs["instructions"] == "Be brief"
+    assert kwargs["model"] == "gpt-5-mini"
@@ -3,7 +3,13 @@
 import pytest
 from pydantic import ValidationError
 
-from openhands.sdk.llm.utils.metrics import Cost, Metrics, ResponseLatency, TokenUsage
+from openhands.sdk.llm.utils.metrics import (
+    Cost,
+    LatencyHistogram,
+    Metrics,
+    ResponseLatency,
+    TokenUsage,
+)
 
 
 def test_cost_creation_valid():
@@ -824,3 +830,102 @@ def test_metrics_diff_current_only_not_none():
     assert diff.accumulated_token_usage.completion_tokens == 8
     assert diff.accumulated_token_usage.cache_read_tokens == 2
     assert diff.accumulated_token_usage.cache_write_tokens == 1
+
+
+def test_metrics_records_are_bounded():
+    metrics = Metrics(model_name="gpt-4", max_records=3)
+    for i in range(10):
+        metrics.add_cost(1.0)
+        metrics.add_response_latency(float(i), f"r{i}")
+        metrics.add_token_usage(1, 2, 0, 0, 100, f"r{i}")
+
+    assert [lat.response_id for lat in metrics.response_latencies] == [
+        "r7",
+        "r8",
+        "r9",
+    ]
+    assert len(metrics.costs) == 3
+    assert len(metrics.token_usages) == 3
+    # Aggregates cover every call, not only the records kept
+    assert metrics.accumulated_cost == 10.0
+    assert metrics.latency_histogram.count == 10
+    assert metrics.token_usage_count == 10
+    usage = metrics.token_usage_by_model["gpt-4"]
+    assert (usage.prompt_tokens, usage.completion_tokens) == (10, 20)
+
+
+def test_latency_histogram_quantiles():
+    histogram = LatencyHistogram()
+    for i in range(1, 1001):
+        histogram.add(i / 100)
+
+    assert histogram.count == 1000
+    assert histogram.mean == pytest.approx(5.005)
+    assert histogram.max_latency == 10.0
+    for q, exact in ((0.5, 5.0), (0.9, 9.0), (0.99, 9.9)):
+        assert histogram.quantile(q) == pytest.approx(exact, rel=0.1)
+    assert histogram.quantile(1.0) == 10.0
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+def test_metrics_merge_and_diff_aggregates():
+    metrics = Metrics(model_name="a")
+    metrics.add_response_latency(1.0, "r1")
+    metrics.add_token_usage(5, 5, 0, 0, 100, "r1")
+    baseline = metrics.deep_copy()
+    other = Metrics(model_name="b")
+    other.add_response_latency(2.0, "r2")
+    other.add_token_usage(7, 3, 0, 0, 100, "r2")
+
+    metrics.merge(other)
+
+    assert metrics.latency_histogram.count == 2
+    assert set(metrics.token_usage_by_model) == {"a", "b"}
+    diff = metrics.diff(baseline)
+    assert diff.latency_histogram.count == 1
+    assert diff.latency_histogram.total == 2.0
+    assert [lat.response_id for lat in diff.response_latencies] == ["r2"]
+    assert diff.token_usage_count == 1
+    assert set(diff.token_usage_by_model) == {"b"}
+    assert diff.get()["response_latency_summary"]["count"] == 1
+
+
+def test_metrics_diff_per_model_usage_of_trimmed_records():
+    metrics = Metrics(model_name="gpt-4", max_records=2)
+    metrics.add_token_usage(1, 1, 0, 0, 100, "r0")
+    baseline = metrics.deep_copy()
+    for i in range(5):
+        metrics.add_token_usage(1, 2, 0, 0, 100, f"r{i + 1}")
+
+    diff = metrics.diff(baseline)
+
+    assert len(diff.token_usages) == 2
+    assert diff.token_usage_by_model["gpt-4"].prompt_tokens == 5
+    assert diff.token_usage_by_model["gpt-4"].completion_tokens == 10
+
+
+def test_metrics_summarizes_records_persisted_without_aggregates():
+    metrics = Metrics.model_validate(
+        {
+            "model_name": "gpt-4",
+            "max_records": 1,
+            "response_latencies": [
+                {"model": "gpt-4", "latency": 1.0, "response_id": "r1"},
+                {"model": "gpt-4", "latency": 3.0, "response_id": "r2"},
+            ],
+            "token_usages": [
+                {"model": "gpt-4", "prompt_tokens": 4, "response_id": "r1"},
+                {"model": "gpt-4", "prompt_tokens": 6, "response_id": "r2"},
+            ],
+        }
+    )
+
+    assert metrics.latency_histogram.count == 2
+    assert metrics.latency_histogram.total == 4.0
+    assert metrics.token_usage_count == 2
+    assert metrics.token_usage_by_model["gpt-4"].prompt_tokens == 10
+    assert [usage.response_id for usage in metrics.token_usages] == ["r2"]
+    # Round-trips without summarizing the records again
+    restored = Metrics.model_validate_json(metrics.model_dump_json())
+    assert restored.latency_histogram == metrics.latency_histogram
+    assert restored.token_usage_count == 2
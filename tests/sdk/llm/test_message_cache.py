@@ -0,0 +1,154 @@
+"""Tests for memoized message conversion and serialization."""
+
+from unittest.mock import patch
+
+from pydantic import SecretStr
+
+from openhands.sdk.event.base import LLMConvertibleEvent
+from openhands.sdk.event.llm_convertible import MessageEvent, SystemPromptEvent
+from openhands.sdk.llm import LLM, Message, TextContent
+from openhands.sdk.llm.utils.message_cache import MessageCache
+
+
+def make_history(n: int) -> list[LLMConvertibleEvent]:
+    events: list[LLMConvertibleEvent] = [
+        SystemPromptEvent(
+            source="agent", system_prompt=TextContent(text="System"), tools=[]
+        )
+    ]
+    for i in range(n):
+        role = "user" if i % 2 == 0 else "assistant"
+        events.append(
+            MessageEvent(
+                source="user" if role == "user" else "agent",
+                llm_message=Message(role=role, content=[TextContent(text=f"m{i}")]),
+            )
+        )
+    return events
+
+
+def make_llm(**kwargs) -> LLM:
+    return LLM(
+        model="claude-sonnet-4-5-20250514",
+        api_key=SecretStr("test_key"),
+        usage_id="test-llm",
+        **kwargs,
+    )
+
+
+def test_events_to_messages_reuses_messages():
+    events = make_history(4)
+    first = LLMConvertibleEvent.events_to_messages(events)
+    second = LLMConvertibleEvent.events_to_messages(events)
+    assert all(a is b for a, b in zip(first, second))
+
+    # An event recreated with the same id is converted again
+    copy = events[1].model_copy()
+    third = LLMConvertibleEvent.events_to_messages([events[0], copy])
+    assert third[0] is first[0]
+    assert third[1] is not first[1]
+    assert third[1] == first[1]
+
+
+def test_only_new_and_breakpoint_messages_are_serialized():
+    llm = make_llm(caching_prompt=True)
+    events = make_history(6)
+    messages = LLMConvertibleEvent.events_to_messages(events)
+    uncached = [m.model_copy() for m in messages]
+
+    with patch.object(
+        Message, "to_chat_dict", autospec=True, side_effect=Message.to_chat_dict
+    ) as to_chat_dict:
+        formatted = llm.format_messages_for_llm(messages)
+        assert to_chat_dict.call_count == len(messages)
+        # Messages not built from events are never memoized
+        assert formatted == llm.format_messages_for_llm(uncached)
+
+        to_chat_dict.reset_mock()
+        events += make_history(1)[1:]
+        messages = LLMConvertibleEvent.events_to_messages(events)
+        formatted = llm.format_messages_for_llm(messages)
+
+    # Only the new message, the two breakpoints (system prompt and last user
+    # message) and the previous breakpoint, which was never memoized, are
+    # serialized; the rest of the history comes from the cache
+    serialized = {id(call.args[0]) for call in to_chat_dict.call_args_list}
+    assert serialized == {id(messages[0]), id(messages[5]), id(messages[-1])}
+    assert formatted == llm.format_messages_for_llm([m.model_copy() for m in messages])
+    # The breakpoint moved to the new last user message
+    assert "cache_control" not in formatted[5]["content"][-1]
+    assert formatted[-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_cached_payloads_depend_on_flags():
+    events = make_history(2)
+    messages = LLMConvertibleEvent.events_to_messages(events)
+    list_formatted = make_llm(force_string_serializer=False).format_messages_for_llm(
+        messages
+    )
+    string_formatted = make_llm(force_string_serializer=True).format_messages_for_llm(
+        messages
+    )
+    assert isinstance(list_formatted[1]["content"], list)
+    assert string_formatted[1]["content"] == "m0"
+
+
+def test_formatted_dicts_can_be_modified_by_callers():
+    llm = make_llm()
+    messages = LLMConvertibleEvent.events_to_messages(make_history(2))
+    formatted = llm.format_messages_for_llm(messages)
+    formatted[2]["role"] = "user"
+    assert llm.format_messages_for_llm(messages)[2]["role"] == "assistant"
+
+
+def test_nested_payload_contents_can_be_modified_by_callers():
+    llm = make_llm()
+    messages = LLMConvertibleEvent.events_to_messages(make_history(2))
+    formatted = llm.format_messages_for_llm(messages)
+    formatted[2]["content"][0]["text"] = "changed"
+    formatted[2]["content"].append({"type": "text", "text": "extra"})
+    again = llm.format_messages_for_llm(messages)
+    assert again[2]["content"] == [{"type": "text", "text": "m1"}]
+
+
+def test_message_cache_is_bounded_by_bytes():
+    events = make_history(3)[1:]
+    # Each message holds 2 characters, counted for the message and its event
+    cache = MessageCache(max_bytes=8)
+    for event in events:
+        cache.get_message((event.id,), (event,), event.to_llm_message)
+    assert len(cache) == 2
+    assert cache.size_bytes == 8
+
+    # Memoized payloads count as well
+    message = cache.get_message((events[2].id,), (events[2],), events[2].to_llm_message)
+    cache.get_payload(message, "flags", lambda: {"content": "m2"})
+    assert len(cache) == 1
+    assert cache.size_bytes == 6
+
+    # Messages larger than the budget are not cached
+    cache = MessageCache(max_bytes=3)
+    cache.get_message((events[0].id,), (events[0],), events[0].to_llm_message)
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_message_cache_is_bounded():
+    cache = MessageCache(max_entries=2)
+    events = make_history(3)
+    messages = [cache.get_message((e.id,), (e,), e.to_llm_message) for e in events[:3]]
+    assert len(cache) == 2
+    assert cache.misses == 3
+
+    # The oldest entry was evicted, the most recent ones are hits
+    assert cache.get_message((events[2].id,), (events[2],), events[2].to_llm_message)
+    assert cache.hits == 1
+    rebuilt = cache.get_message((events[0].id,), (events[0],), events[0].to_llm_message)
+    assert rebuilt is not messages[0]
+    assert cache.misses == 4
+
+    # Payloads of evicted messages are no longer memoized
+    calls = []
+    for _ in range(2):
+        cache.get_payload(messages[1], "flags", lambda: calls.append(1) or {})
+    assert len(calls) == 2
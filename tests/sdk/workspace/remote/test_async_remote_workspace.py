@@ -1,13 +1,20 @@
 """Unit tests for AsyncRemoteWorkspace class."""
 
 import asyncio
+import json
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 
-from openhands.sdk.workspace.models import CommandResult, FileOperationResult
+from openhands.sdk.workspace.models import (
+    CommandOutputChunk,
+    CommandResult,
+    DirectorySyncResult,
+    FileOperationResult,
+)
 from openhands.sdk.workspace.remote.async_remote_workspace import AsyncRemoteWorkspace
 
 
@@ -102,15 +109,80 @@ async def test_async_execute_method():
     mock_client.request.assert_called_once_with(method="GET", url="http://test.com")
 
 
+def _stream_transport(lines: list[dict], status_code: int = 200):
+    """Mock agent server streaming the given items as newline delimited JSON."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        content = b"".join(json.dumps(line).encode() + b"\n" for line in lines)
+        return httpx.Response(status_code, content=content)
+
+    return httpx.MockTransport(handler), requests
+
+
+@pytest.mark.asyncio
+async def test_async_execute_command():
+    """Test execute_command collects the streamed output."""
+    workspace = AsyncRemoteWorkspace(
+        host="http://localhost:8000", working_dir="workspace"
+    )
+    transport, requests = _stream_transport(
+        [
+            {"kind": "BashCommand", "id": "cmd-1", "command": "echo hello"},
+            {"command_id": "cmd-1", "stdout": "hel"},
+            {"command_id": "cmd-1", "stdout": "lo\n"},
+            {"command_id": "cmd-1", "exit_code": 0},
+        ]
+    )
+    workspace._client = httpx.AsyncClient(transport=transport)
+
+    result = await workspace.execute_command("echo hello", cwd="/tmp", timeout=30.0)
+
+    assert result == CommandResult(
+        command="echo hello",
+        exit_code=0,
+        stdout="hello\n",
+        stderr="",
+        timeout_occurred=False,
+    )
+    assert requests[0].url.path == "/api/bash/stream_bash_command"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_command_yields_chunks():
+    """Test stream_command is an async iterator over the output chunks."""
+    workspace = AsyncRemoteWorkspace(
+        host="http://localhost:8000", working_dir="workspace", api_key="secret"
+    )
+    transport, requests = _stream_transport(
+        [
+            {"command_id": "cmd-1", "stdout": "step 1\n"},
+            {"command_id": "cmd-1", "exit_code": 1, "stderr": "failed"},
+        ]
+    )
+    workspace._client = httpx.AsyncClient(transport=transport)
+
+    chunks = [chunk async for chunk in workspace.stream_command("make")]
+
+    assert chunks == [
+        CommandOutputChunk(stdout="step 1\n"),
+        CommandOutputChunk(stderr="failed", exit_code=1),
+    ]
+    assert requests[0].headers["X-Session-API-Key"] == "secret"
+
+
 @pytest.mark.asyncio
 @patch(
     "openhands.sdk.workspace.remote.async_remote_workspace.AsyncRemoteWorkspace._execute"
 )
-async def test_async_execute_command(mock_execute):
-    """Test execute_command method calls _execute with correct generator."""
+async def test_async_execute_command_falls_back_to_polling(mock_execute):
+    """Test execute_command polls agent servers without the streaming endpoint."""
     workspace = AsyncRemoteWorkspace(
         host="http://localhost:8000", working_dir="workspace"
     )
+    transport, _ = _stream_transport([], status_code=404)
+    workspace._client = httpx.AsyncClient(transport=transport)
 
     expected_result = CommandResult(
         command="echo hello",
@@ -159,30 +231,100 @@ async def test_async_file_upload(mock_execute):
     assert hasattr(generator_arg, "__next__")
 
 
+# Modification time of the files served by _download_transport
+REMOTE_MTIME = 1_700_000_000
+REMOTE_LAST_MODIFIED = "Tue, 14 Nov 2023 22:13:20 GMT"
+
+
+def _download_transport(content: bytes):
+    """Mock agent server serving `content` for any download, with ranges."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        headers = {"last-modified": REMOTE_LAST_MODIFIED}
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if range_header is None or (
+            if_range is not None and if_range != REMOTE_LAST_MODIFIED
+        ):
+            return httpx.Response(200, content=content, headers=headers)
+        start = int(range_header.removeprefix("bytes=").rstrip("-"))
+        if start >= len(content):
+            return httpx.Response(
+                416, headers={"content-range": f"bytes */{len(content)}"}
+            )
+        return httpx.Response(206, content=content[start:], headers=headers)
+
+    return httpx.MockTransport(handler), requests
+
+
+@pytest.mark.asyncio
+async def test_async_file_download(temp_dir):
+    """Test file_download streams the file to disk."""
+    workspace = AsyncRemoteWorkspace(
+        host="http://localhost:8000",
+        working_dir="workspace",
+        file_transfer_chunk_size=3,
+    )
+    transport, requests = _download_transport(b"downloaded content")
+    workspace._client = httpx.AsyncClient(transport=transport)
+    destination = temp_dir / "nested" / "file.txt"
+
+    result = await workspace.file_download("/remote/file.txt", destination)
+
+    assert result == FileOperationResult(
+        success=True,
+        source_path="/remote/file.txt",
+        destination_path=str(destination),
+        file_size=18,
+    )
+    assert destination.read_bytes() == b"downloaded content"
+    assert requests[0].url == "http://localhost:8000/api/file/download//remote/file.txt"
+
+
+@pytest.mark.asyncio
+async def test_async_file_download_resume(temp_dir):
+    """Test file_download resumes a partial download with a range request."""
+    workspace = AsyncRemoteWorkspace(
+        host="http://localhost:8000", working_dir="workspace"
+    )
+    transport, requests = _download_transport(b"downloaded content")
+    workspace._client = httpx.AsyncClient(transport=transport)
+    destination = temp_dir / "file.txt"
+    destination.write_bytes(b"download")
+    os.utime(destination, (REMOTE_MTIME, REMOTE_MTIME))
+
+    result = await workspace.file_download("/remote/file.txt", destination, resume=True)
+
+    assert result.success is True
+    assert destination.read_bytes() == b"downloaded content"
+    assert destination.stat().st_mtime == REMOTE_MTIME
+    assert requests[0].headers["range"] == "bytes=8-"
+
+    # Resuming a complete download leaves the file as is
+    result = await workspace.file_download("/remote/file.txt", destination, resume=True)
+    assert result.success is True
+    assert destination.read_bytes() == b"downloaded content"
+
+
 @pytest.mark.asyncio
 @patch(
     "openhands.sdk.workspace.remote.async_remote_workspace.AsyncRemoteWorkspace._execute"
 )
-async def test_async_file_download(mock_execute):
-    """Test file_download method calls _execute with correct generator."""
+async def test_async_sync_directory(mock_execute):
+    """Test sync_directory calls _execute with the sync generator."""
     workspace = AsyncRemoteWorkspace(
         host="http://localhost:8000", working_dir="workspace"
     )
-
-    expected_result = FileOperationResult(
-        success=True,
-        source_path="/remote/file.txt",
-        destination_path="/local/file.txt",
-        file_size=100,
+    expected_result = DirectorySyncResult(
+        success=True, source_path="/local", destination_path="/remote"
     )
     mock_execute.return_value = expected_result
 
-    result = await workspace.file_download("/remote/file.txt", "/local/file.txt")
+    result = await workspace.sync_directory("/local", "/remote", compare="sha256")
 
     assert result == expected_result
-    mock_execute.assert_called_once()
-
-    # Verify the generator was created correctly
     generator_arg = mock_execute.call_args[0][0]
     assert hasattr(generator_arg, "__next__")
 
@@ -194,24 +336,17 @@ async def test_async_execute_command_with_path_objects():
         host="http://localhost:8000", working_dir="workspace"
     )
 
-    with patch.object(workspace, "_execute") as mock_execute:
-        expected_result = CommandResult(
-            command="ls",
-            exit_code=0,
-            stdout="file1.txt\n",
-            stderr="",
-            timeout_occurred=False,
-        )
-        mock_execute.return_value = expected_result
+    transport, requests = _stream_transport([{"command_id": "c", "exit_code": 0}])
+    workspace._client = httpx.AsyncClient(transport=transport)
 
-        result = await workspace.execute_command("ls", cwd=Path("/tmp/test"))
+    result = await workspace.execute_command("ls", cwd=Path("/tmp/test"))
 
-        assert result == expected_result
-        mock_execute.assert_called_once()
+    assert result.exit_code == 0
+    assert json.loads(requests[0].content)["cwd"] == "/tmp/test"
 
 
 @pytest.mark.asyncio
-async def test_async_file_operations_with_path_objects():
+async def test_async_file_operations_with_path_objects(temp_dir):
     """Test file operations work with Path objects."""
     workspace = AsyncRemoteWorkspace(
         host="http://localhost:8000", working_dir="workspace"
@@ -232,11 +367,14 @@ async def test_async_file_operations_with_path_objects():
         )
         assert result == expected_result
 
-        # Test download with Path objects
-        result = await workspace.file_download(
-            Path("/remote/file.txt"), Path("/local/file.txt")
-        )
-        assert result == expected_result
+    # Test download with Path objects
+    transport, _ = _download_transport(b"content")
+    workspace._client = httpx.AsyncClient(transport=transport)
+    result = await workspace.file_download(
+        Path("/remote/file.txt"), temp_dir / "file.txt"
+    )
+    assert result.success is True
+    assert result.source_path == "/remote/file.txt"
 
 
 def test_async_inheritance():
@@ -334,11 +472,26 @@ async def test_async_execute_multiple_yields():
 
 
 @pytest.mark.asyncio
-async def test_async_concurrent_operations():
+async def test_async_concurrent_operations(temp_dir):
     """Test that multiple async operations can run concurrently."""
     workspace = AsyncRemoteWorkspace(
         host="http://localhost:8000", working_dir="workspace"
     )
+    command_transport, _ = _stream_transport(
+        [{"command_id": "c", "stdout": "test\n"}, {"command_id": "c", "exit_code": 0}]
+    )
+    download_transport, _ = _download_transport(b"downloaded")
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if "/api/file/download/" in str(request.url):
+            response = download_transport.handle_request(request)
+        else:
+            response = command_transport.handle_request(request)
+        await response.aread()
+        return response
+
+    workspace._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    destination = temp_dir / "file2.txt"
 
     with patch.object(workspace, "_execute") as mock_execute:
         # Mock different results for different operations
@@ -358,17 +511,17 @@ async def test_async_concurrent_operations():
         download_result = FileOperationResult(
             success=True,
             source_path="/remote/file2.txt",
-            destination_path="/local/file2.txt",
-            file_size=75,
+            destination_path=str(destination),
+            file_size=10,
         )
 
-        mock_execute.side_effect = [command_result, upload_result, download_result]
+        mock_execute.return_value = upload_result
 
         # Run operations concurrently
         tasks = [
             workspace.execute_command("echo test"),
             workspace.file_upload("/local/file1.txt", "/remote/file1.txt"),
-            workspace.file_download("/remote/file2.txt", "/local/file2.txt"),
+            workspace.file_download("/remote/file2.txt", destination),
         ]
 
         results = await asyncio.gather(*tasks)
@@ -376,4 +529,4 @@ async def test_async_concurrent_operations():
         assert results[0] == command_result
         assert results[1] == upload_result
         assert results[2] == download_result
-        assert mock_execute.call_count == 3
+        assert mock_execute.call_count == 1
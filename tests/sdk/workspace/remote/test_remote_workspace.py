@@ -1,12 +1,19 @@
 """Unit tests for RemoteWorkspace class."""
 
+import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import httpx
 import pytest
 
-from openhands.sdk.workspace.models import CommandResult, FileOperationResult
+from openhands.sdk.workspace.models import (
+    CommandOutputChunk,
+    CommandResult,
+    DirectorySyncResult,
+    FileOperationResult,
+)
 from openhands.sdk.workspace.remote.base import RemoteWorkspace
 
 
@@ -92,10 +99,91 @@ def test_execute_method():
     mock_client.request.assert_called_once_with(method="GET", url="http://test.com")
 
 
+def _stream_transport(lines: list[dict], status_code: int = 200):
+    """Mock agent server streaming the given items as newline delimited JSON."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        content = iter([json.dumps(line).encode() + b"\n" for line in lines])
+        return httpx.Response(status_code, content=content)
+
+    return httpx.MockTransport(handler), requests
+
+
+def test_execute_command():
+    """Test execute_command collects the streamed output."""
+    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+    transport, requests = _stream_transport(
+        [
+            {"kind": "BashCommand", "id": "cmd-1", "command": "echo hello"},
+            {"command_id": "cmd-1", "stdout": "hel"},
+            {"command_id": "cmd-1", "stdout": "lo\n", "stderr": "warn"},
+            {"command_id": "cmd-1", "exit_code": 0},
+        ]
+    )
+    workspace._client = httpx.Client(transport=transport)
+
+    result = workspace.execute_command("echo hello", cwd="/tmp", timeout=30.0)
+
+    assert result == CommandResult(
+        command="echo hello",
+        exit_code=0,
+        stdout="hello\n",
+        stderr="warn",
+        timeout_occurred=False,
+    )
+    assert len(requests) == 1
+    assert requests[0].url.path == "/api/bash/stream_bash_command"
+    assert json.loads(requests[0].content) == {
+        "command": "echo hello",
+        "timeout": 30,
+        "cwd": "/tmp",
+    }
+
+
+def test_stream_command_yields_chunks():
+    """Test stream_command yields each chunk as it is received."""
+    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+    transport, _ = _stream_transport(
+        [
+            {"kind": "BashCommand", "id": "cmd-1", "command": "make"},
+            {"command_id": "cmd-1", "stdout": "step 1\n"},
+            {"command_id": "cmd-1", "stderr": "step 2\n"},
+            {"command_id": "cmd-1", "exit_code": 2},
+        ]
+    )
+    workspace._client = httpx.Client(transport=transport)
+
+    chunks = list(workspace.stream_command("make"))
+
+    assert chunks == [
+        CommandOutputChunk(stdout="step 1\n"),
+        CommandOutputChunk(stderr="step 2\n"),
+        CommandOutputChunk(exit_code=2),
+    ]
+
+
+def test_execute_command_stream_without_exit_code_times_out():
+    """Test a stream ending before the exit code is reported as a timeout."""
+    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+    transport, _ = _stream_transport([{"command_id": "cmd-1", "stdout": "partial"}])
+    workspace._client = httpx.Client(transport=transport)
+
+    result = workspace.execute_command("sleep 100", timeout=1.0)
+
+    assert result.exit_code == -1
+    assert result.timeout_occurred
+    assert result.stdout == "partial"
+    assert "timed out" in result.stderr
+
+
 @patch("openhands.sdk.workspace.remote.base.RemoteWorkspace._execute")
-def test_execute_command(mock_execute):
-    """Test execute_command method calls _execute with correct generator."""
+def test_execute_command_falls_back_to_polling(mock_execute):
+    """Test execute_command polls agent servers without the streaming endpoint."""
     workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+    transport, _ = _stream_transport([], status_code=404)
+    workspace._client = httpx.Client(transport=transport)
 
     expected_result = CommandResult(
         command="echo hello",
@@ -139,25 +227,145 @@ def test_file_upload(mock_execute):
     assert hasattr(generator_arg, "__next__")
 
 
-@patch("openhands.sdk.workspace.remote.base.RemoteWorkspace._execute")
-def test_file_download(mock_execute):
-    """Test file_download method calls _execute with correct generator."""
-    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+# Modification time of the files served by _download_transport
+REMOTE_MTIME = 1_700_000_000
+REMOTE_LAST_MODIFIED = "Tue, 14 Nov 2023 22:13:20 GMT"
 
-    expected_result = FileOperationResult(
+
+def _download_transport(content: bytes):
+    """Mock agent server serving `content` for any download, with ranges."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        headers = {"last-modified": REMOTE_LAST_MODIFIED}
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if range_header is None or (
+            if_range is not None and if_range != REMOTE_LAST_MODIFIED
+        ):
+            return httpx.Response(200, content=content, headers=headers)
+        start = int(range_header.removeprefix("bytes=").rstrip("-"))
+        if start >= len(content):
+            return httpx.Response(
+                416, headers={"content-range": f"bytes */{len(content)}"}
+            )
+        return httpx.Response(206, content=content[start:], headers=headers)
+
+    return httpx.MockTransport(handler), requests
+
+
+def test_file_download(temp_dir):
+    """Test file_download streams the file to disk."""
+    workspace = RemoteWorkspace(
+        host="http://localhost:8000", working_dir="/tmp", file_transfer_chunk_size=3
+    )
+    transport, requests = _download_transport(b"downloaded content")
+    workspace._client = httpx.Client(transport=transport)
+    destination = temp_dir / "nested" / "file.txt"
+
+    result = workspace.file_download("/remote/file.txt", destination)
+
+    assert result == FileOperationResult(
         success=True,
         source_path="/remote/file.txt",
-        destination_path="/local/file.txt",
-        file_size=100,
+        destination_path=str(destination),
+        file_size=18,
+    )
+    assert destination.read_bytes() == b"downloaded content"
+    assert requests[0].url == "http://localhost:8000/api/file/download//remote/file.txt"
+    assert "range" not in requests[0].headers
+
+
+def test_file_download_resume(temp_dir):
+    """Test file_download resumes a partial download with a range request."""
+    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+    transport, requests = _download_transport(b"downloaded content")
+    workspace._client = httpx.Client(transport=transport)
+    destination = temp_dir / "file.txt"
+    destination.write_bytes(b"download")
+    os.utime(destination, (REMOTE_MTIME, REMOTE_MTIME))
+
+    result = workspace.file_download("/remote/file.txt", destination, resume=True)
+
+    assert result.success is True
+    assert result.file_size == 18
+    assert destination.read_bytes() == b"downloaded content"
+    assert destination.stat().st_mtime == REMOTE_MTIME
+    assert requests[0].headers["range"] == "bytes=8-"
+    assert requests[0].headers["if-range"] == REMOTE_LAST_MODIFIED
+
+    # Resuming a complete download leaves the file as is
+    result = workspace.file_download("/remote/file.txt", destination, resume=True)
+    assert result.success is True
+    assert destination.read_bytes() == b"downloaded content"
+    assert len(requests) == 2
+
+    # Without resume, the file is downloaded again
+    workspace.file_download("/remote/file.txt", destination)
+    assert destination.read_bytes() == b"downloaded content"
+    assert "range" not in requests[2].headers
+
+
+def test_file_download_resume_of_changed_remote_file(temp_dir):
+    """Test file_download starts over when the remote file changed since the
+    partial download."""
+    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+    transport, requests = _download_transport(b"downloaded content")
+    workspace._client = httpx.Client(transport=transport)
+    destination = temp_dir / "file.txt"
+    destination.write_bytes(b"outdated")
+    os.utime(destination, (REMOTE_MTIME - 60, REMOTE_MTIME - 60))
+
+    result = workspace.file_download("/remote/file.txt", destination, resume=True)
+
+    assert result.success is True
+    assert destination.read_bytes() == b"downloaded content"
+    assert len(requests) == 1
+
+
+def test_file_download_resume_local_file_too_long(temp_dir):
+    """Test file_download starts over when the local file is longer."""
+    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+    transport, requests = _download_transport(b"short")
+    workspace._client = httpx.Client(transport=transport)
+    destination = temp_dir / "file.txt"
+    destination.write_bytes(b"a much longer file")
+    os.utime(destination, (REMOTE_MTIME, REMOTE_MTIME))
+
+    result = workspace.file_download("/remote/file.txt", destination, resume=True)
+
+    assert result.success is True
+    assert destination.read_bytes() == b"short"
+    assert len(requests) == 2
+
+
+def test_file_download_http_error(temp_dir):
+    """Test file_download reports HTTP errors."""
+    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+    workspace._client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(404))
+    )
+
+    result = workspace.file_download("/remote/missing.txt", temp_dir / "file.txt")
+
+    assert result.success is False
+    assert result.error is not None and "404" in result.error
+    assert not (temp_dir / "file.txt").exists()
+
+
+@patch("openhands.sdk.workspace.remote.base.RemoteWorkspace._execute")
+def test_sync_directory(mock_execute):
+    """Test sync_directory calls _execute with the sync generator."""
+    workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
+    expected_result = DirectorySyncResult(
+        success=True, source_path="/local", destination_path="/remote"
     )
     mock_execute.return_value = expected_result
 
-    result = workspace.file_download("/remote/file.txt", "/local/file.txt")
+    result = workspace.sync_directory("/local", "/remote", exclude=[".git"])
 
     assert result == expected_result
-    mock_execute.assert_called_once()
-
-    # Verify the generator was created correctly
     generator_arg = mock_execute.call_args[0][0]
     assert hasattr(generator_arg, "__next__")
 
@@ -166,23 +374,16 @@ def test_execute_command_with_path_objects():
     """Test execute_command works with Path objects for cwd."""
     workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
 
-    with patch.object(workspace, "_execute") as mock_execute:
-        expected_result = CommandResult(
-            command="ls",
-            exit_code=0,
-            stdout="file1.txt\n",
-            stderr="",
-            timeout_occurred=False,
-        )
-        mock_execute.return_value = expected_result
+    transport, requests = _stream_transport([{"command_id": "c", "exit_code": 0}])
+    workspace._client = httpx.Client(transport=transport)
 
-        result = workspace.execute_command("ls", cwd=Path("/tmp/test"))
+    result = workspace.execute_command("ls", cwd=Path("/tmp/test"))
 
-        assert result == expected_result
-        mock_execute.assert_called_once()
+    assert result.exit_code == 0
+    assert json.loads(requests[0].content)["cwd"] == "/tmp/test"
 
 
-def test_file_operations_with_path_objects():
+def test_file_operations_with_path_objects(temp_dir):
     """Test file operations work with Path objects."""
     workspace = RemoteWorkspace(host="http://localhost:8000", working_dir="/tmp")
 
@@ -201,11 +402,12 @@ def test_file_operations_with_path_objects():
         )
         assert result == expected_result
 
-        # Test download with Path objects
-        result = workspace.file_download(
-            Path("/remote/file.txt"), Path("/local/file.txt")
-        )
-        assert result == expected_result
+    # Test download with Path objects
+    transport, _ = _download_transport(b"content")
+    workspace._client = httpx.Client(transport=transport)
+    result = workspace.file_download(Path("/remote/file.txt"), temp_dir / "file.txt")
+    assert result.success is True
+    assert result.source_path == "/remote/file.txt"
 
 
 def test_context_manager_protocol():
@@ -1,7 +1,9 @@
 """Unit tests for RemoteWorkspaceMixin class."""
 
+import hashlib
+import os
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock, patch
 
 import httpx
 
@@ -358,141 +360,243 @@ def test_file_upload_generator_file_not_found():
         )
 
 
-def test_file_upload_generator_http_error():
+def test_file_upload_generator_http_error(temp_file):
     """Test _file_upload_generator handles HTTP errors."""
     mixin = RemoteWorkspaceMixinHelper(
         host="http://localhost:8000", working_dir="workspace"
     )
 
-    with patch("builtins.open", mock_open(read_data="test content")):
-        upload_response = Mock()
-        upload_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Upload failed", request=Mock(), response=Mock()
-        )
+    upload_response = Mock()
+    upload_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "Upload failed", request=Mock(), response=Mock()
+    )
 
-        generator = mixin._file_upload_generator("/local/file.txt", "/remote/file.txt")
+    generator = mixin._file_upload_generator(temp_file, "/remote/file.txt")
 
-        # Get upload request
-        next(generator)
+    # Get upload request
+    next(generator)
 
-        # Send failing response
-        try:
-            generator.send(upload_response)
-            assert False, "Generator should have stopped"
-        except StopIteration as e:
-            result = e.value
-            assert result.success is False
-            assert "Upload failed" in result.error
+    # Send failing response
+    try:
+        generator.send(upload_response)
+        assert False, "Generator should have stopped"
+    except StopIteration as e:
+        result = e.value
+        assert result.success is False
+        assert "Upload failed" in result.error
 
 
-def test_file_download_generator_basic_flow(temp_dir):
-    """Test _file_download_generator basic successful flow."""
+def test_file_upload_generator_resume(temp_dir):
+    """Test _file_upload_generator sends only the part missing remotely."""
     mixin = RemoteWorkspaceMixinHelper(
-        host="http://localhost:8000", api_key="test-key", working_dir="workspace"
+        host="http://localhost:8000",
+        working_dir="workspace",
+        file_transfer_chunk_size=4,
     )
+    source = temp_dir / "file.txt"
+    source.write_bytes(b"0123456789")
 
-    # Mock successful response
-    download_response = Mock()
-    download_response.raise_for_status = Mock()
-    download_response.content = b"downloaded content"
+    generator = mixin._file_upload_generator(source, "/remote/file.txt", resume=True)
 
-    destination = temp_dir / "downloaded_file.txt"
-    generator = mixin._file_download_generator("/remote/file.txt", destination)
+    info_kwargs = next(generator)
+    assert info_kwargs["method"] == "GET"
+    assert info_kwargs["url"] == "http://localhost:8000/api/file/info//remote/file.txt"
+    assert info_kwargs["params"] == {"sha256": True}
 
-    # Get download request
-    download_kwargs = next(generator)
-    assert download_kwargs["method"] == "GET"
-    assert download_kwargs["url"] == "/api/file/download"
-    assert download_kwargs["params"]["file_path"] == "/remote/file.txt"
-    assert download_kwargs["headers"] == {"X-Session-API-Key": "test-key"}
+    info_response = Mock(status_code=200)
+    info_response.json.return_value = {
+        "path": "/remote/file.txt",
+        "size": 6,
+        "sha256": hashlib.sha256(b"012345").hexdigest(),
+    }
+    upload_kwargs = generator.send(info_response)
+    assert upload_kwargs["data"]["offset"] == "6"
+    assert float(upload_kwargs["data"]["mtime"]) == source.stat().st_mtime
 
-    # Send response and get result
+    # The file is sent from the offset, in chunks of the configured size
+    content = upload_kwargs["files"]["file"][1]
+    assert content.read(65536) == b"6789"
+    content.seek(0)
+    assert content.tell() == 0
+    assert content.read(65536) == b"6789"
+
+    upload_response = Mock()
+    upload_response.json.return_value = {"success": True, "file_size": 10}
     try:
-        generator.send(download_response)
+        generator.send(upload_response)
         assert False, "Generator should have stopped"
     except StopIteration as e:
-        result = e.value
-        assert isinstance(result, FileOperationResult)
-        assert result.success is True
-        assert result.source_path == "/remote/file.txt"
-        assert result.destination_path == str(destination)
-        assert result.file_size == len(b"downloaded content")
+        assert e.value.success is True
+        assert e.value.file_size == 10
 
-        # Verify file was written
-        assert destination.exists()
-        assert destination.read_bytes() == b"downloaded content"
 
-
-def test_file_download_generator_with_path_objects(temp_dir):
-    """Test _file_download_generator works with Path objects."""
+def test_file_upload_generator_resume_of_different_remote_file(temp_dir):
+    """Test _file_upload_generator starts over when the remote file is not a
+    prefix of the local file."""
     mixin = RemoteWorkspaceMixinHelper(
         host="http://localhost:8000", working_dir="workspace"
     )
+    source = temp_dir / "file.txt"
+    source.write_bytes(b"0123456789")
 
-    download_response = Mock()
-    download_response.raise_for_status = Mock()
-    download_response.content = b"test content"
-
-    destination = temp_dir / "test_file.txt"
-    generator = mixin._file_download_generator(Path("/remote/file.txt"), destination)
+    generator = mixin._file_upload_generator(source, "/remote/file.txt", resume=True)
+    next(generator)
+    info_response = Mock(status_code=200)
+    info_response.json.return_value = {
+        "path": "/remote/file.txt",
+        "size": 6,
+        "sha256": hashlib.sha256(b"abcdef").hexdigest(),
+    }
+    upload_kwargs = generator.send(info_response)
 
-    download_kwargs = next(generator)
-    assert download_kwargs["params"]["file_path"] == "/remote/file.txt"
+    assert upload_kwargs["data"]["offset"] == "0"
+    assert upload_kwargs["files"]["file"][1].read(65536) == b"0123456789"
 
 
-def test_file_download_generator_creates_directories(temp_dir):
-    """Test _file_download_generator creates parent directories."""
+def test_file_upload_generator_resume_without_remote_file(temp_dir):
+    """Test _file_upload_generator uploads from the start when nothing exists."""
     mixin = RemoteWorkspaceMixinHelper(
         host="http://localhost:8000", working_dir="workspace"
     )
+    source = temp_dir / "file.txt"
+    source.write_bytes(b"content")
 
-    download_response = Mock()
-    download_response.raise_for_status = Mock()
-    download_response.content = b"test content"
+    generator = mixin._file_upload_generator(source, "/remote/file.txt", resume=True)
+    next(generator)
+    upload_kwargs = generator.send(Mock(status_code=404))
 
-    # Nested path that doesn't exist
-    destination = temp_dir / "nested" / "dirs" / "file.txt"
-    generator = mixin._file_download_generator("/remote/file.txt", destination)
+    assert upload_kwargs["data"]["offset"] == "0"
 
-    next(generator)
 
+def test_file_download_request(temp_dir):
+    """Test _file_download_request asks for the rest of a partial download."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", api_key="test-key", working_dir="workspace"
+    )
+    destination = temp_dir / "file.txt"
+
+    request = mixin._file_download_request(Path("/remote/file.txt"), destination, 0)
+    assert request["method"] == "GET"
+    assert request["url"] == "http://localhost:8000/api/file/download//remote/file.txt"
+    assert request["headers"] == {"X-Session-API-Key": "test-key"}
+
+    # The rest is only sent if the remote file is the one the partial
+    # download came from
+    destination.write_bytes(b"0123456789")
+    os.utime(destination, (1_700_000_000, 1_700_000_000))
+    request = mixin._file_download_request(Path("/remote/file.txt"), destination, 10)
+    assert request["headers"]["Range"] == "bytes=10-"
+    assert request["headers"]["If-Range"] == "Tue, 14 Nov 2023 22:13:20 GMT"
+    # The default headers are left untouched
+    assert "Range" not in mixin._headers
+
+
+def test_sync_directory_generator(temp_dir):
+    """Test _sync_directory_generator uploads only missing and changed files."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace"
+    )
+    (temp_dir / "same.txt").write_text("same")
+    (temp_dir / "changed.txt").write_text("changed")
+    (temp_dir / "sub").mkdir()
+    (temp_dir / "sub" / "new.txt").write_text("new")
+    (temp_dir / "node_modules").mkdir()
+    (temp_dir / "node_modules" / "skipped.js").write_text("")
+    (temp_dir / "skipped.pyc").write_text("")
+    same_mtime = (temp_dir / "same.txt").stat().st_mtime
+
+    generator = mixin._sync_directory_generator(
+        temp_dir, "/remote/dir", exclude=["node_modules", "*.pyc"]
+    )
+
+    manifest_kwargs = next(generator)
+    assert (
+        manifest_kwargs["url"] == "http://localhost:8000/api/file/manifest//remote/dir"
+    )
+    assert manifest_kwargs["params"] == {"sha256": False}
+
+    manifest_response = Mock()
+    manifest_response.json.return_value = [
+        {"path": "same.txt", "size": 4, "mtime": same_mtime},
+        {"path": "changed.txt", "size": 7, "mtime": same_mtime - 100},
+    ]
+    uploaded = []
+    kwargs = generator.send(manifest_response)
     try:
-        generator.send(download_response)
+        while True:
+            uploaded.append(kwargs["data"]["destination_path"])
+            upload_response = Mock()
+            upload_response.json.return_value = {"success": True}
+            kwargs = generator.send(upload_response)
     except StopIteration as e:
         result = e.value
-        assert result.success is True
 
-        # Verify directories were created
-        assert destination.parent.exists()
-        assert destination.exists()
+    assert sorted(uploaded) == ["/remote/dir/changed.txt", "/remote/dir/sub/new.txt"]
+    assert result.success is True
+    assert sorted(result.uploaded) == ["changed.txt", "sub/new.txt"]
+    assert result.unchanged == 1
 
 
-def test_file_download_generator_http_error():
-    """Test _file_download_generator handles HTTP errors."""
+def test_sync_directory_generator_compares_hashes(temp_dir):
+    """Test _sync_directory_generator compares content hashes when asked to."""
     mixin = RemoteWorkspaceMixinHelper(
         host="http://localhost:8000", working_dir="workspace"
     )
+    (temp_dir / "a.txt").write_text("aaaa")
+    (temp_dir / "b.txt").write_text("bbbb")
+
+    generator = mixin._sync_directory_generator(temp_dir, "/remote", compare="sha256")
+
+    assert next(generator)["params"] == {"sha256": True}
+    manifest_response = Mock()
+    manifest_response.json.return_value = [
+        # Modification times differ, but a.txt has the same content
+        {
+            "path": "a.txt",
+            "size": 4,
+            "mtime": 0,
+            "sha256": hashlib.sha256(b"aaaa").hexdigest(),
+        },
+        {
+            "path": "b.txt",
+            "size": 4,
+            "mtime": 0,
+            "sha256": hashlib.sha256(b"aaab").hexdigest(),
+        },
+    ]
+    upload_kwargs = generator.send(manifest_response)
+    assert upload_kwargs["data"]["destination_path"] == "/remote/b.txt"
+
+    upload_response = Mock()
+    upload_response.json.return_value = {"success": False, "error": "disk full"}
+    try:
+        generator.send(upload_response)
+        assert False, "Generator should have stopped"
+    except StopIteration as e:
+        result = e.value
+        assert result.success is False
+        assert result.unchanged == 1
+        assert [f.error for f in result.failed] == ["disk full"]
 
-    download_response = Mock()
-    download_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-        "File not found", request=Mock(), response=Mock()
-    )
 
-    generator = mixin._file_download_generator(
-        "/remote/nonexistent.txt", "/local/file.txt"
+def test_sync_directory_generator_manifest_error(temp_dir):
+    """Test _sync_directory_generator reports a failure to list remote files."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace"
+    )
+    manifest_response = Mock()
+    manifest_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "Forbidden", request=Mock(), response=Mock()
     )
 
-    # Get download request
+    generator = mixin._sync_directory_generator(temp_dir, "/remote")
     next(generator)
-
-    # Send failing response
     try:
-        generator.send(download_response)
+        generator.send(manifest_response)
         assert False, "Generator should have stopped"
     except StopIteration as e:
-        result = e.value
-        assert result.success is False
-        assert "File not found" in result.error
+        assert e.value.success is False
+        assert e.value.error == "Forbidden"
 
 
 def test_multiple_bash_output_events():
@@ -545,6 +649,42 @@ def test_multiple_bash_output_events():
         assert result.exit_code == 0
 
 
+@patch("openhands.sdk.workspace.remote.remote_workspace_mixin.time")
+def test_events_seen_in_earlier_polls_are_not_repeated(mock_time):
+    """Test that output returned again by a later poll is only appended once."""
+    mixin = RemoteWorkspaceMixinHelper(
+        host="http://localhost:8000", working_dir="workspace"
+    )
+    mock_time.time.return_value = 0
+
+    start_response = Mock()
+    start_response.raise_for_status = Mock()
+    start_response.json.return_value = {"id": "cmd-123"}
+
+    first = {"id": "e1", "kind": "BashOutput", "stdout": "chunk 1\n"}
+    poll_response_1 = Mock()
+    poll_response_1.raise_for_status = Mock()
+    poll_response_1.json.return_value = {"items": [first]}
+    poll_response_2 = Mock()
+    poll_response_2.raise_for_status = Mock()
+    poll_response_2.json.return_value = {
+        "items": [
+            first,
+            {"id": "e2", "kind": "BashOutput", "stdout": "chunk 2\n", "exit_code": 0},
+        ]
+    }
+
+    generator = mixin._execute_command_generator("build", None, 30.0)
+    next(generator)
+    generator.send(start_response)
+    generator.send(poll_response_1)
+    try:
+        generator.send(poll_response_2)
+        assert False, "Generator should have stopped"
+    except StopIteration as e:
+        assert e.value.stdout == "chunk 1\nchunk 2\n"
+
+
 def test_non_bash_output_events_ignored():
     """Test that non-BashOutput events are ignored during polling."""
     mixin = RemoteWorkspaceMixinHelper(
@@ -0,0 +1,110 @@
+"""Tests for the connection pools shared by remote workspace clients."""
+
+import asyncio
+import importlib.util
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from openhands.sdk.workspace import HTTPPoolConfig, RemoteWorkspace
+from openhands.sdk.workspace.remote import close_shared_transports
+from openhands.sdk.workspace.remote.async_remote_workspace import AsyncRemoteWorkspace
+from openhands.sdk.workspace.remote.transport import (
+    shared_async_transport,
+    shared_transport,
+)
+
+
+def pool_of(client: httpx.Client | httpx.AsyncClient):
+    return client._transport.transport  # type: ignore[attr-defined]
+
+
+def test_workspaces_share_pool_per_config():
+    workspaces = [
+        RemoteWorkspace(
+            host=f"http://host-{i}:8000",
+            working_dir="/workspace",
+            share_connections=True,
+        )
+        for i in range(3)
+    ]
+    other = RemoteWorkspace(
+        host="http://host-0:8000",
+        working_dir="/workspace",
+        http_pool=HTTPPoolConfig(max_connections=5, read_timeout=5.0),
+        share_connections=True,
+    )
+
+    pools = {id(pool_of(workspace.client)) for workspace in workspaces}
+    assert len(pools) == 1
+    assert pool_of(other.client) is not pool_of(workspaces[0].client)
+    # Clients keep their own base URL, headers and timeouts
+    assert workspaces[1].client.base_url == "http://host-1:8000"
+    assert other.client.timeout.read == 5.0
+
+
+def test_closing_client_keeps_shared_pool():
+    first = RemoteWorkspace(
+        host="http://localhost:8000", working_dir="/workspace", share_connections=True
+    )
+    second = RemoteWorkspace(
+        host="http://localhost:8000", working_dir="/workspace", share_connections=True
+    )
+    pool = pool_of(first.client)
+
+    with patch.object(pool, "close") as close:
+        first.client.close()
+        close.assert_not_called()
+    assert pool_of(second.client) is pool
+
+    close_shared_transports()
+    # A new pool is opened for clients of the closed one
+    assert pool_of(second.client) is not pool
+
+
+def test_workspaces_have_own_pool_by_default():
+    first = RemoteWorkspace(host="http://localhost:8000", working_dir="/workspace")
+    second = RemoteWorkspace(host="http://localhost:8000", working_dir="/workspace")
+
+    assert isinstance(first.client._transport, httpx.HTTPTransport)
+    assert first.client._transport is not second.client._transport
+
+
+def test_async_pool_shared_per_event_loop():
+    workspaces = [
+        AsyncRemoteWorkspace(
+            host=f"http://host-{i}:8000",
+            working_dir="/workspace",
+            share_connections=True,
+        )
+        for i in range(2)
+    ]
+
+    async def pools():
+        return [pool_of(workspace.client) for workspace in workspaces]
+
+    first_loop = asyncio.run(pools())
+    second_loop = asyncio.run(pools())
+
+    assert first_loop[0] is first_loop[1]
+    assert second_loop[0] is second_loop[1]
+    assert first_loop[0] is not second_loop[0]
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("h2") is not None, reason="h2 is installed"
+)
+def test_http2_requires_h2():
+    config = HTTPPoolConfig(http2=True)
+
+    with pytest.raises(ImportError):
+        shared_transport(config)
+    with pytest.raises(ImportError):
+        shared_async_transport(config)
+    with pytest.raises(ImportError):
+        RemoteWorkspace(
+            host="http://localhost:8000",
+            working_dir="/workspace",
+            http_pool=config,
+        ).client
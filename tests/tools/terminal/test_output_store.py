@@ -0,0 +1,136 @@
+"""Tests for the terminal output store and incremental tmux screen capture."""
+
+import gc
+import os
+import time
+
+import pytest
+
+from openhands.tools.terminal.constants import CMD_OUTPUT_PS1_END
+from openhands.tools.terminal.terminal import tmux_terminal
+from openhands.tools.terminal.terminal.output_store import OutputStore
+from openhands.tools.terminal.terminal.tmux_terminal import TmuxTerminal
+
+
+def test_output_store_spills_evicted_lines(tmp_path):
+    spill_path = tmp_path / "spill.out"
+    store = OutputStore(max_lines=3, spill_path=str(spill_path))
+
+    store.extend(["a", "b"])
+    store.extend(["c", "d", "e"])
+    assert store.lines() == ["c", "d", "e"]
+    assert store.read_spilled() == "a\nb\n"
+
+    store.evict()
+    assert len(store) == 0
+    assert store.read_spilled() == "a\nb\nc\nd\ne\n"
+
+    store.extend(["f"])
+    store.clear()
+    assert store.lines() == []
+    assert store.read_spilled() == "a\nb\nc\nd\ne\n"
+
+    store.close()
+    assert not spill_path.exists()
+
+
+def test_output_store_without_spill_drops_lines():
+    store = OutputStore(max_lines=2)
+
+    store.extend(["a", "b", "c"])
+
+    assert store.lines() == ["b", "c"]
+    assert store.read_spilled() == ""
+
+
+def run_until_prompt(terminal: TmuxTerminal, command: str) -> str:
+    terminal.send_keys(command)
+    deadline = time.monotonic() + 30
+    # Reading while the command runs moves its output to the store in steps
+    screen = terminal.read_screen()
+    while not screen.rstrip().endswith(CMD_OUTPUT_PS1_END.rstrip()):
+        assert time.monotonic() < deadline
+        terminal.wait_for_prompt(0.05)
+        screen = terminal.read_screen()
+    return screen
+
+
+@pytest.mark.parametrize("incremental_capture", [True, False])
+def test_tmux_capture_of_long_output(tmp_path, incremental_capture):
+    terminal = TmuxTerminal(str(tmp_path), incremental_capture=incremental_capture)
+    terminal.initialize()
+    try:
+        # Longer than the 1000 visible rows, with blank lines
+        screen = run_until_prompt(
+            terminal, "for i in $(seq 1 3000); do echo line$i; echo; done"
+        )
+        lines = [line for line in screen.split("\n") if line.startswith("line")]
+        assert lines == [f"line{i}" for i in range(1, 3001)]
+        assert "line3000\n\nline" not in screen
+        assert "line2999\n\nline3000" in screen
+
+        terminal.clear_screen()
+        assert "line" not in terminal.read_screen()
+    finally:
+        terminal.close()
+
+
+def test_tmux_incremental_capture_spills_to_disk(tmp_path):
+    terminal = TmuxTerminal(str(tmp_path), output_spill_dir=str(tmp_path))
+    terminal.initialize()
+    terminal._output.max_lines = 500
+    try:
+        screen = run_until_prompt(
+            terminal, "for i in $(seq 1 3000); do echo line$i; sleep 0.0005; done"
+        )
+        spilled = terminal.read_spilled_output()
+
+        assert "line1\n" not in screen
+        # Reads in small steps lose no line between spilled and stored ones
+        lines = [
+            line for line in (spilled + screen).split("\n") if line.startswith("line")
+        ]
+        assert lines == [f"line{i}" for i in range(1, 3001)]
+    finally:
+        terminal.close()
+    assert list(tmp_path.glob("openhands-tmux-*.out")) == []
+
+
+def test_tmux_pane_log_reads_tail_and_stays_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(tmux_terminal, "PANE_LOG_TRUNCATE_SIZE", 64 * 1024)
+    monkeypatch.setattr(tmux_terminal, "PANE_LOG_READ_SIZE", 1024)
+    terminal = TmuxTerminal(str(tmp_path))
+    terminal.initialize()
+    fed: list[int] = []
+    feed = terminal._prompt_watcher.feed
+    monkeypatch.setattr(
+        terminal._prompt_watcher,
+        "feed",
+        lambda text: (fed.append(len(text)), feed(text)),
+    )
+    try:
+        terminal.send_keys("seq 1 100000")
+        deadline = time.monotonic() + 30
+        while not terminal.wait_for_prompt(0.05):
+            assert time.monotonic() < deadline
+
+        assert terminal._pane_log is not None
+        assert os.path.getsize(terminal._pane_log) < 64 * 1024
+        assert max(fed) <= 1024
+    finally:
+        terminal.close()
+
+
+def test_tmux_pane_log_removed_without_close(tmp_path):
+    terminal = TmuxTerminal(str(tmp_path))
+    terminal.initialize()
+    pane_log = terminal._pane_log
+    assert pane_log is not None and os.path.exists(pane_log)
+    session = terminal.session
+
+    del terminal
+    gc.collect()
+
+    assert not os.path.exists(pane_log)
+    if session.server.has_session(session.name or ""):
+        session.kill()
@@ -0,0 +1,105 @@
+"""Tests for pools of pre-initialized terminal sessions."""
+
+import os
+import signal
+import time
+
+import pytest
+
+from openhands.tools.terminal.definition import TerminalAction
+from openhands.tools.terminal.impl import TerminalExecutor
+from openhands.tools.terminal.terminal.session_pool import (
+    TerminalSessionPool,
+    close_session_pools,
+    get_session_pool,
+)
+
+
+def wait_until(condition, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = TerminalSessionPool(str(tmp_path), terminal_type="subprocess")
+    yield pool
+    pool.close()
+
+
+def test_lease_warm_session(pool, tmp_path):
+    wait_until(lambda: pool.stats().idle == 1)
+
+    session = pool.lease()
+    try:
+        obs = session.execute(TerminalAction(command="pwd"))
+        assert str(tmp_path) in obs.text
+    finally:
+        session.close()
+
+    stats = pool.stats()
+    assert stats.leases == stats.warm_leases == 1
+    assert stats.startup_seconds_saved > 0
+    # The pool warms up a replacement
+    wait_until(lambda: pool.stats().idle == 1)
+    assert pool.stats().sessions_started == 2
+
+
+def test_dead_idle_session_replaced(pool):
+    wait_until(lambda: pool.stats().idle == 1)
+    process = pool._idle[0].session.terminal.process  # type: ignore[attr-defined]
+    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+    process.wait()
+
+    session = pool.lease()
+    try:
+        assert session.execute(TerminalAction(command="true")).metadata.exit_code == 0
+    finally:
+        session.close()
+
+    stats = pool.stats()
+    assert stats.health_check_failures == 1
+    assert stats.warm_leases == 0
+
+
+def test_idle_sessions_checked_and_recycled(tmp_path):
+    pool = TerminalSessionPool(
+        str(tmp_path),
+        terminal_type="subprocess",
+        health_check_interval=0.1,
+        max_idle_seconds=1.0,
+    )
+    try:
+        wait_until(lambda: pool.stats().recycled >= 1)
+        wait_until(lambda: pool.stats().idle == 1)
+        assert pool.stats().health_check_failures == 0
+    finally:
+        pool.close()
+    assert pool.stats().idle == 0
+
+
+def test_executor_leases_from_shared_pool(tmp_path):
+    # Warm the pool first, so the executor's initial lease is warm too
+    pool = get_session_pool(str(tmp_path), terminal_type="subprocess")
+    wait_until(lambda: pool.stats().idle == 1)
+    executor = TerminalExecutor(
+        str(tmp_path), terminal_type="subprocess", session_pool_size=1
+    )
+    try:
+        assert executor.session_pool is pool
+        executor(TerminalAction(command="export POOL_VAR=leased"))
+        wait_until(lambda: pool.stats().idle == 1)
+        before = pool.stats()
+
+        obs = executor(TerminalAction(command="echo value:$POOL_VAR", reset=True))
+
+        assert "value:leased" not in obs.text
+        assert "value:" in obs.text
+        after = pool.stats()
+        assert after.leases - before.leases == 1
+        assert after.warm_leases - before.warm_leases == 1
+    finally:
+        executor.close()
+        close_session_pools()
@@ -17,6 +17,7 @@ import pytest
 
 from openhands.sdk import TextContent
 from openhands.sdk.logger import get_logger
+from openhands.tools.terminal.constants import POLL_INTERVAL
 from openhands.tools.terminal.definition import (
     TerminalAction,
     TerminalObservation,
@@ -981,3 +982,22 @@ def test_bash_remove_prefix(terminal_type):
             assert "git remote -v" not in obs.text
         finally:
             session.close()
+
+
+@parametrize_terminal_types
+def test_short_command_returns_on_prompt(tmp_path, terminal_type):
+    session = create_terminal_session(work_dir=tmp_path, terminal_type=terminal_type)
+    session.initialize()
+    try:
+        session.execute(TerminalAction(command="true"))
+        # A command outlasting the first output check: the session returns when
+        # its prompt is printed rather than at the next poll
+        start = time.monotonic()
+        obs = session.execute(TerminalAction(command="sleep 0.1; echo done"))
+        elapsed = time.monotonic() - start
+
+        assert "done" in obs.text
+        assert obs.metadata.exit_code == 0
+        assert elapsed < POLL_INTERVAL
+    finally:
+        session.close()
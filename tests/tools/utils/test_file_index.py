@@ -0,0 +1,203 @@
+"""Tests for the workspace file index."""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from openhands.tools.glob import GlobAction
+from openhands.tools.glob.impl import GlobExecutor
+from openhands.tools.grep import GrepAction
+from openhands.tools.grep.impl import GrepExecutor
+from openhands.tools.utils import _check_ripgrep_available
+from openhands.tools.utils.file_index import FileIndex, glob_to_regex
+
+
+def _write(root: Path, files: dict[str, str]) -> None:
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def _build(root: Path) -> FileIndex:
+    index = FileIndex(root, refresh_interval=0.0)
+    index.start()
+    assert index.wait_until_ready(timeout=10)
+    return index
+
+
+def _relative(index: FileIndex, paths: list[str] | None) -> set[str]:
+    assert paths is not None
+    return {Path(path).relative_to(index.root).as_posix() for path in paths}
+
+
+@pytest.mark.parametrize(
+    "pattern, matches, non_matches",
+    [
+        ("*.py", ["a.py", "src/a.py"], ["a.pyc", "src/a.txt"]),
+        ("src/*.py", ["src/a.py"], ["a.py", "src/sub/a.py"]),
+        ("src/**/*.py", ["src/a.py", "src/sub/a.py"], ["lib/src/a.py"]),
+        ("**/test_*.{py,md}", ["test_a.py", "a/test_b.md"], ["test_c.txt"]),
+        ("file[0-9].txt", ["file1.txt", "d/file2.txt"], ["fileA.txt"]),
+        ("/top.py", ["top.py"], ["sub/top.py"]),
+    ],
+)
+def test_glob_to_regex(pattern, matches, non_matches):
+    regex = glob_to_regex(pattern)
+    for path in matches:
+        assert regex.fullmatch(path), path
+    for path in non_matches:
+        assert not regex.fullmatch(path), path
+
+
+def test_file_index_glob_orders_by_mtime(tmp_path):
+    _write(tmp_path, {"old.py": "", "src/new.py": "", "src/readme.md": ""})
+    os.utime(tmp_path / "old.py", (1000, 1000))
+    index = _build(tmp_path)
+
+    files = index.glob("*.py", tmp_path)
+    assert files == [str(tmp_path / "src/new.py"), str(tmp_path / "old.py")]
+    assert index.glob("*.py", tmp_path / "src") == [str(tmp_path / "src/new.py")]
+    assert index.stats().files == 3
+
+
+def test_file_index_honors_gitignore_in_git_repos(tmp_path):
+    _write(
+        tmp_path,
+        {
+            ".gitignore": "build/\n*.log\n!keep.log\n",
+            "app.py": "",
+            "debug.log": "",
+            "keep.log": "",
+            "build/out.py": "",
+            ".hidden/secret.py": "",
+        },
+    )
+    index = _build(tmp_path)
+    # .gitignore files only apply in git repositories, like with ripgrep
+    assert _relative(index, index.glob("*.py", tmp_path)) == {"app.py", "build/out.py"}
+    assert _relative(index, index.glob("*.log", tmp_path)) == {"debug.log", "keep.log"}
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    index = _build(tmp_path)
+    assert _relative(index, index.glob("*.py", tmp_path)) == {"app.py"}
+    # Ignored files are flagged, but still match globs like with ripgrep
+    assert _relative(index, index.glob("*.log", tmp_path)) == {"debug.log", "keep.log"}
+    assert index._tree.files["debug.log"].ignored
+    assert not index._tree.files["keep.log"].ignored
+    # Globs matching skipped directories need a walk of the file system
+    assert index.glob("build/*", tmp_path) is None
+    assert index.glob("*.py", tmp_path / "build") is None
+    assert index.glob("*.py", tmp_path.parent) is None
+
+
+def test_file_index_refreshes_changed_directories(tmp_path):
+    _write(tmp_path, {"a.py": "", "src/b.py": "", "src/deep/c.py": ""})
+    index = _build(tmp_path)
+
+    _write(tmp_path, {"src/deep/d.py": "", "new/e.py": ""})
+    (tmp_path / "a.py").unlink()
+    assert _relative(index, index.glob("*.py", tmp_path)) == {
+        "src/b.py",
+        "src/deep/c.py",
+        "src/deep/d.py",
+        "new/e.py",
+    }
+
+    (tmp_path / ".ignore").write_text("deep/\n")
+    assert _relative(index, index.glob("*.py", tmp_path)) == {"src/b.py", "new/e.py"}
+
+    (tmp_path / ".ignore").write_text("new/\n")
+    assert _relative(index, index.glob("*.py", tmp_path)) == {
+        "src/b.py",
+        "src/deep/c.py",
+        "src/deep/d.py",
+    }
+    assert index.stats().full_scans == 1
+
+
+def test_file_index_update_picks_up_in_place_edits(tmp_path):
+    _write(tmp_path, {"a.py": "", "b.py": ""})
+    os.utime(tmp_path / "a.py", (1000, 1000))
+    os.utime(tmp_path / "b.py", (2000, 2000))
+    index = _build(tmp_path)
+    assert index.glob("*.py", tmp_path) == [
+        str(tmp_path / "b.py"),
+        str(tmp_path / "a.py"),
+    ]
+
+    os.utime(tmp_path / "a.py", (3000, 3000))
+    index.update(tmp_path / "a.py")
+    assert index.mtime(tmp_path / "a.py") == 3000
+    assert index.sort_by_mtime([str(tmp_path / "b.py"), str(tmp_path / "a.py")]) == [
+        str(tmp_path / "a.py"),
+        str(tmp_path / "b.py"),
+    ]
+
+
+def test_file_index_full_rescan_runs_in_background(tmp_path):
+    _write(tmp_path, {"a.py": "", "b.py": ""})
+    os.utime(tmp_path / "a.py", (1000, 1000))
+    os.utime(tmp_path / "b.py", (2000, 2000))
+    index = FileIndex(tmp_path, refresh_interval=0.0, full_rescan_interval=0.1)
+    index.start()
+    assert index.wait_until_ready(timeout=10)
+
+    # Edited in place without notifying the index
+    os.utime(tmp_path / "a.py", (3000, 3000))
+    deadline = time.monotonic() + 10
+    while index.mtime(tmp_path / "a.py") != 3000:
+        assert time.monotonic() < deadline
+        # Queries during full scans use the current index
+        assert _relative(index, index.glob("*.py", tmp_path)) == {"a.py", "b.py"}
+        time.sleep(0.01)
+    assert index.stats().full_scans >= 2
+    assert index.glob("*.py", tmp_path) == [
+        str(tmp_path / "a.py"),
+        str(tmp_path / "b.py"),
+    ]
+
+
+@pytest.mark.skipif(not _check_ripgrep_available(), reason="ripgrep not available")
+@pytest.mark.parametrize("pattern", ["*.py", "**/*.md", "*", "*.{py,txt}"])
+def test_file_index_glob_consistent_with_ripgrep(tmp_path, pattern):
+    _write(
+        tmp_path,
+        {
+            ".gitignore": "ignored/\n*.tmp\n",
+            "a.py": "",
+            "b.txt": "",
+            "c.tmp": "",
+            "src/d.py": "",
+            "src/e.md": "",
+            "ignored/f.py": "",
+            ".hidden/g.py": "",
+        },
+    )
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    index = _build(tmp_path)
+    executor = GlobExecutor(working_dir=str(tmp_path))
+    expected, _ = executor._execute_with_ripgrep(pattern, tmp_path)
+    assert set(index.glob(pattern, tmp_path) or []) == set(expected)
+
+
+def test_executors_use_file_index(tmp_path):
+    _write(tmp_path, {"a.py": "needle", "src/b.py": "needle", "c.md": "needle"})
+    os.utime(tmp_path / "a.py", (1000, 1000))
+
+    glob_executor = GlobExecutor(working_dir=str(tmp_path), use_file_index=True)
+    assert glob_executor.file_index is not None
+    assert glob_executor.file_index.wait_until_ready(timeout=10)
+    obs = glob_executor(GlobAction(pattern="**/*.py"))
+    assert not obs.is_error
+    assert obs.files == [str(tmp_path / "src/b.py"), str(tmp_path / "a.py")]
+
+    grep_executor = GrepExecutor(working_dir=str(tmp_path), use_file_index=True)
+    assert grep_executor.file_index is glob_executor.file_index
+    obs = grep_executor(GrepAction(pattern="needle", include="*.py"))
+    assert not obs.is_error
+    assert obs.matches[-1] == str(tmp_path / "a.py")
+    assert set(obs.matches) == {str(tmp_path / "src/b.py"), str(tmp_path / "a.py")}
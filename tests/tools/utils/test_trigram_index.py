@@ -0,0 +1,194 @@
+"""Tests for the trigram content index."""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from openhands.tools.file_editor import FileEditorAction
+from openhands.tools.file_editor.impl import FileEditorExecutor
+from openhands.tools.grep import GrepAction
+from openhands.tools.grep.impl import GrepExecutor
+from openhands.tools.utils.file_index import FileIndex
+from openhands.tools.utils.trigram_index import TrigramIndex, literal_query
+
+
+def _write(root: Path, files: dict[str, str | bytes]) -> None:
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+
+
+def _build(root: Path, **kwargs) -> TrigramIndex:
+    file_index = FileIndex(root, refresh_interval=0.0)
+    index = TrigramIndex(file_index, **kwargs)
+    file_index.start()
+    index.start()
+    assert index.wait_until_ready(timeout=10)
+    return index
+
+
+def _names(paths: list[str] | None) -> set[str]:
+    assert paths is not None
+    return {Path(path).name for path in paths}
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("needle", [{"needle"}]),
+        ("Needle", [{"needle"}]),
+        (r"def \w+\(self", [{"def ", "(self"}]),
+        # The alternatives are merged into "ba[rz]", of only two literals
+        ("foo(bar|baz)+qux", [{"foo", "qux"}]),
+        ("class (Foo|Bar)Tool", [{"class ", "foo", "tool"}, {"class ", "bar", "tool"}]),
+        (r"first line\nsecond", [{"first line", "second"}]),
+        ("abc?", None),
+        ("(needle)?", None),
+        ("needle|x", None),
+        (".*", None),
+    ],
+)
+def test_literal_query(pattern, expected):
+    query = literal_query(pattern)
+    if expected is None:
+        assert query is None
+    else:
+        assert query == [frozenset(alternative) for alternative in expected]
+
+
+def test_trigram_index_candidates(tmp_path):
+    _write(
+        tmp_path,
+        {
+            "a.py": "def find_needle(haystack): ...",
+            "b.py": "NEEDLE = 1",
+            "c.md": "no match here",
+            "sub/d.py": "needles everywhere",
+            "data.bin": b"needle\0binary",
+            "large.txt": "x" * 200,
+        },
+    )
+    index = _build(tmp_path, max_file_size=100)
+
+    # Large files are always candidates, binary files never
+    assert _names(index.candidates("needle", tmp_path)) == {
+        "a.py",
+        "b.py",
+        "d.py",
+        "large.txt",
+    }
+    assert _names(index.candidates("needle", tmp_path, "*.py")) == {
+        "a.py",
+        "b.py",
+        "d.py",
+    }
+    assert _names(index.candidates("needle", tmp_path / "sub")) == {"d.py"}
+    assert _names(index.candidates("find_(needle|thread)", tmp_path)) == {
+        "a.py",
+        "large.txt",
+    }
+    # Regexes without literals cannot be pruned
+    assert index.candidates("n.e", tmp_path) is None
+
+    stats = index.stats()
+    assert stats.files == 4
+    assert stats.unindexed_files == 1
+    assert stats.binary_files == 1
+    assert stats.trigrams > 0
+    assert stats.postings >= stats.trigrams
+
+
+def test_trigram_index_updates_changed_files(tmp_path):
+    _write(tmp_path, {"a.py": "needle", "b.py": "hay"})
+    index = _build(tmp_path)
+    assert _names(index.candidates("needle", tmp_path)) == {"a.py"}
+
+    _write(tmp_path, {"new.py": "needle"})
+    (tmp_path / "a.py").unlink()
+    assert _names(index.candidates("needle", tmp_path)) == {"new.py"}
+
+    # Files edited in place are reported by the tools modifying them
+    (tmp_path / "b.py").write_text("more hay and a needle")
+    os.utime(tmp_path / "b.py", (1000, 1000))
+    index.update(tmp_path / "b.py")
+    assert _names(index.candidates("needle", tmp_path)) == {"new.py", "b.py"}
+    assert index.stats().updates == 2
+
+
+def test_trigram_index_build_with_concurrent_edits(tmp_path):
+    _write(tmp_path, {f"f{i}.py": "hay" for i in range(300)})
+    file_index = FileIndex(tmp_path, refresh_interval=0.0)
+    file_index.start()
+    assert file_index.wait_until_ready(timeout=10)
+    index = TrigramIndex(file_index)
+    stop = threading.Event()
+    edited: list[str] = []
+
+    def edit() -> None:
+        # Each update notifies the trigram index with the file index lock held
+        for i in range(300):
+            if stop.is_set():
+                break
+            path = tmp_path / f"f{i}.py"
+            path.write_text("needle")
+            os.utime(path, (2000 + i, 2000 + i))
+            file_index.update(path)
+            edited.append(path.name)
+            if i % 50 == 0:
+                file_index.refresh(force=True)
+
+    editor = threading.Thread(target=edit)
+    index.start()
+    editor.start()
+    try:
+        assert index.wait_until_ready(timeout=30)
+        editor.join(timeout=30)
+        assert not editor.is_alive()
+    finally:
+        stop.set()
+
+    assert _names(index.candidates("needle", tmp_path)) == set(edited)
+
+
+def test_grep_executor_uses_content_index(tmp_path):
+    _write(
+        tmp_path,
+        {
+            "a.py": "import needle",
+            "b.py": "import hay",
+            "src/c.py": "NEEDLE = True",
+            "src/d.md": "needle in docs",
+        },
+    )
+    executor = GrepExecutor(working_dir=str(tmp_path), use_content_index=True)
+    assert executor.content_index is not None
+    assert executor.content_index.wait_until_ready(timeout=10)
+
+    for action, expected in (
+        (GrepAction(pattern="needle"), {"a.py", "c.py", "d.md"}),
+        (GrepAction(pattern="needle", include="*.py"), {"a.py", "c.py"}),
+        (GrepAction(pattern=r"import (needle|hay)"), {"a.py", "b.py"}),
+    ):
+        obs = executor(action)
+        assert not obs.is_error
+        assert _names(obs.matches) == expected
+    assert executor.content_index.stats().queries == 3
+
+    # Edits of the file editor are indexed
+    editor = FileEditorExecutor(workspace_root=str(tmp_path))
+    editor(
+        FileEditorAction(
+            command="str_replace",
+            path=str(tmp_path / "b.py"),
+            old_str="import hay",
+            new_str="import needle",
+        )
+    )
+    obs = executor(GrepAction(pattern="import needle"))
+    assert _names(obs.matches) == {"a.py", "b.py"}